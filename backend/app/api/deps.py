@@ -7,6 +7,7 @@ from app.models.authsystem.user import User
 from app.core.config import settings
 from app.db.session import SessionLocal
 from app.core.security import security_utils, oauth2_scheme
+from app.core.revocation import token_revocation
 from app.core.ws.manager import ConnectionManager, job_update_manager
 from app.crud.authsystem.user import crud_user
 from inspect import isawaitable
@@ -29,6 +30,8 @@ async def get_current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    if token_revocation.is_revoked(token):
+        raise credentials_exception
     try:
         payload = jwt.decode(
             token,
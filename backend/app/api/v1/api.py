@@ -14,13 +14,13 @@ from app.api.v1.endpoints.job import (
     mud_pump_detail, trajectory, time_sheet, tally, tally_item,
     slot, seal_assembly, job_parameter, tubular, tubular_type, 
     well,well_shape, well_type, installation_type, settings,
-    activity
+    activity, hydraulics, torque_drag, casing_design, sensor_data, alerts
 )
 
 # Import Rig System Routers
 from app.api.v1.endpoints.rig import (
     rig, rig_equipment, rig_type, well_control_equipment, mud_pump,
-    contractor, rotary_equipment
+    contractor, rotary_equipment, tank
 )
 
 # Import Logistics System Routers
@@ -28,6 +28,10 @@ from app.api.v1.endpoints.logistic import (
     backload, delivery_ticket, purchase_order
 )
 
+# Import Sync and Task Queue Routers
+from app.api.v1.endpoints.sync import sync
+from app.api.v1.endpoints import tasks
+
 # Create main API router
 api_router = APIRouter()
 
@@ -53,6 +57,11 @@ api_router.include_router(production.router, prefix="/productions", tags=["produ
 api_router.include_router(mud_pump_detail.router, prefix="/mud-pump-details", tags=["mud-pump-details"])
 api_router.include_router(mud_equipment_detail.router, prefix="/mud-equipment-details", tags=["mud-equipment-details"])
 api_router.include_router(trajectory.router, prefix="/trajectories", tags=["trajectories"])
+api_router.include_router(hydraulics.router, prefix="/hydraulics", tags=["hydraulics"])
+api_router.include_router(torque_drag.router, prefix="/torque-drag", tags=["torque-drag"])
+api_router.include_router(casing_design.router, prefix="/casing-design", tags=["casing-design"])
+api_router.include_router(sensor_data.router, prefix="/sensor-data", tags=["sensor-data"])
+api_router.include_router(alerts.router, prefix="/alerts", tags=["alerts"])
 api_router.include_router(time_sheet.router, prefix="/time-sheets", tags=["time-sheets"])
 api_router.include_router(tally.router, prefix="/tallies", tags=["tallies"])
 api_router.include_router(tally_item.router, prefix="/tally-items", tags=["tally-items"])
@@ -76,8 +85,13 @@ api_router.include_router(well_control_equipment.router, prefix="/well-control-e
 api_router.include_router(mud_pump.router, prefix="/mud-pumps", tags=["mud-pumps"])
 api_router.include_router(contractor.router, prefix="/contractors", tags=["contractors"])
 api_router.include_router(rotary_equipment.router, prefix="/rotary-equipment", tags=["rotary-equipment"])
+api_router.include_router(tank.router, prefix="/tanks", tags=["tanks"])
 
 # Include Logistics System Routers
 api_router.include_router(backload.router, prefix="/backloads", tags=["backloads"])
 api_router.include_router(delivery_ticket.router, prefix="/delivery-tickets", tags=["delivery-tickets"])
-api_router.include_router(purchase_order.router, prefix="/purchase-orders", tags=["purchase-orders"])
\ No newline at end of file
+api_router.include_router(purchase_order.router, prefix="/purchase-orders", tags=["purchase-orders"])
+
+# Include Sync and Task Queue Routers
+api_router.include_router(sync.router, tags=["sync"])
+api_router.include_router(tasks.router, prefix="/tasks", tags=["tasks"])
@@ -1,5 +1,5 @@
 # File: backend/app/api/v1/endpoints/auth/password_reset.pyfrom fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app.crud.authsystem.password_reset import crud_password_reset
@@ -10,7 +10,7 @@ from app.schemas.authsystem.password_reset import (
 )
 from app.core.deps import get_db
 from app.core.security import get_password_hash, validate_password_strength
-from app.core.email import send_password_reset_email
+from app.core.task_queue import enqueue_task
 from datetime import datetime
 import logging
 
@@ -20,7 +20,6 @@ router = APIRouter()
 @router.post("/request-reset")
 async def request_password_reset(
     email: str,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """Request password reset token"""
@@ -37,11 +36,12 @@ async def request_password_reset(
         reset_token = await crud_password_reset.create_reset_token(db=db, user_id=user.id)
         logger.info(f"Reset token created for user: {user.id}")
 
-        # Send email in background
-        background_tasks.add_task(
-            send_password_reset_email,
-            email=email,
-            reset_token=reset_token.token
+        # Send email from the task queue workers
+        await run_in_threadpool(
+            enqueue_task,
+            "email.password_reset",
+            {"email": email, "reset_token": reset_token.token},
+            priority=5
         )
         logger.info(f"Reset email queued for sending to: {email}")
 
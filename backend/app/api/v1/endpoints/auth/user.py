@@ -1,5 +1,5 @@
 # File: backend/app/api/v1/endpoints/auth/user.py
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import List, Optional
@@ -15,10 +15,7 @@ from app.crud.authsystem.user import crud_user
 from app.crud.authsystem.password_reset import crud_password_reset
 from app.schemas.authsystem.user import UserResponse, UserCreate, UserUpdate
 from app.schemas.authsystem.password_reset import PasswordResetCreate
-from app.core.email import (
-    send_verification_email,
-    send_password_reset_email
-)
+from app.core.task_queue import enqueue_task
 
 router = APIRouter(
     # prefix="/auth",
@@ -28,7 +25,6 @@ router = APIRouter(
 @router.post("/", response_model=UserResponse)
 async def create_user(
     user_in: UserCreate,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """Create new user"""
@@ -53,10 +49,11 @@ async def create_user(
     user = await crud_user.update(db=db, db_obj=user, obj_in=user_update)
     
     # Send verification email
-    background_tasks.add_task(
-        send_verification_email,
-        email=user.email,
-        verification_token=verification_token
+    await run_in_threadpool(
+        enqueue_task,
+        "email.verification",
+        {"email": user.email, "verification_token": verification_token},
+        priority=5
     )
     
     return user
@@ -107,7 +104,6 @@ async def verify_email(
 
 @router.post("/send-verification")
 async def send_verification(
-    background_tasks: BackgroundTasks,
     current_user: UserResponse = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -122,10 +118,12 @@ async def send_verification(
     user_update = UserUpdate(verification_token=verification_token)
     await crud_user.update(db=db, db_obj=current_user, obj_in=user_update)
     
-    background_tasks.add_task(
-        send_verification_email,
-        email=current_user.email,
-        token=verification_token
+    await run_in_threadpool(
+        enqueue_task,
+        "email.verification",
+        {"email": current_user.email, "verification_token": verification_token},
+        priority=5,
+        dedup_key=f"email.verification:{current_user.id}"
     )
     
     return {"message": "Verification email sent"}
@@ -133,7 +131,6 @@ async def send_verification(
 @router.post("/forgot-password")
 async def forgot_password(
     email: str,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """Initiate password reset process"""
@@ -148,10 +145,11 @@ async def forgot_password(
         user_id=user.id
     )
     
-    background_tasks.add_task(
-        send_password_reset_email,
-        email=user.email,
-        token=reset_token.token
+    await run_in_threadpool(
+        enqueue_task,
+        "email.password_reset",
+        {"email": user.email, "reset_token": reset_token.token},
+        priority=5
     )
     
     return {"message": "If email exists, password reset instructions will be sent"}
@@ -287,4 +287,4 @@ async def update_last_activity(
 ):
     """Update last activity timestamp"""
     await crud_user_session.update_last_activity(db=db, session_id=current_session.id)
-    return {"message": "Activity timestamp updated"}
\ No newline at end of file
+    return {"message": "Activity timestamp updated"}
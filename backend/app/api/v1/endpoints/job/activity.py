@@ -1,9 +1,11 @@
 # File: backend/app/api/v1/endpoints/job/activity.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 from app.crud.jobsystem.activity import crud_activity
+from app.crud.jobsystem.job_log import crud_job_log
+from app.core.downsampling import event_timeline
 from app.schemas.jobsystem.activity import (
     ActivityResponse as Activity, ActivityCreate, ActivityUpdate
 )
@@ -57,4 +59,45 @@ async def update_activity(
     activity = await crud_activity.get(db=db, id=activity_id)
     if not activity:
         raise HTTPException(status_code=404, detail="Daily report not found")
-    return await crud_activity.update(db=db, db_obj=activity, obj_in=activity_in)
\ No newline at end of file
+    return await crud_activity.update(db=db, db_obj=activity, obj_in=activity_in)
+
+@router.get("/job/{job_id}/timeline")
+async def get_activity_timeline(
+    job_id: str,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    buckets: int = Query(200, ge=1, le=5000, description="Number of time buckets, e.g. the chart width"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Activity counts per time bucket and type instead of every row"""
+    rows = await crud_activity.get_timeline_rows(
+        db=db, job_id=job_id, start_date=start_date, end_date=end_date
+    )
+    if not rows:
+        return {"t": [], "total": [], "by_category": {}}
+    return event_timeline(
+        [r[0] for r in rows], [r[1] for r in rows],
+        start_date or rows[0][0], end_date or rows[-1][0], buckets
+    )
+
+@router.get("/job/{job_id}/log-timeline")
+async def get_job_log_timeline(
+    job_id: str,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    buckets: int = Query(200, ge=1, le=5000, description="Number of time buckets, e.g. the chart width"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Job log entry counts and summed duration per time bucket and activity type"""
+    rows = await crud_job_log.get_timeline_rows(
+        db=db, job_id=job_id, start_date=start_date, end_date=end_date
+    )
+    if not rows:
+        return {"t": [], "total": [], "weight": [], "by_category": {}}
+    return event_timeline(
+        [r[0] for r in rows], [r[1] for r in rows],
+        start_date or rows[0][0], end_date or rows[-1][0], buckets,
+        weights=[r[2] for r in rows]
+    )
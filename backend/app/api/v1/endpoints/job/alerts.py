@@ -0,0 +1,67 @@
+# File: backend/app/api/v1/endpoints/job/alerts.py
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from typing import List
+from dataclasses import asdict
+from uuid import UUID
+
+from app.core.alerts import AlertRule, get_alert_engine
+from app.core.deps import get_current_user
+from app.schemas.jobsystem.alert import (
+    ActiveAlertResponse, AlertEventResponse, AlertRuleCreate, AlertRuleResponse
+)
+from app.schemas.authsystem.user import UserResponse as User
+
+router = APIRouter()
+
+@router.get("/rules", response_model=List[AlertRuleResponse])
+async def get_alert_rules(
+    current_user: User = Depends(get_current_user)
+):
+    """Get all operational-limit alert rules"""
+    return [asdict(rule) for rule in get_alert_engine().rules]
+
+@router.put("/rules/{rule_id}", response_model=AlertRuleResponse)
+async def put_alert_rule(
+    rule_id: str,
+    rule_in: AlertRuleCreate,
+    current_user: User = Depends(get_current_user)
+):
+    """Create or replace an alert rule"""
+    if rule_in.id != rule_id:
+        raise HTTPException(status_code=400, detail="Rule id does not match the path")
+    try:
+        rule = AlertRule(**rule_in.model_dump())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    await run_in_threadpool(get_alert_engine().upsert_rule, rule)
+    return asdict(rule)
+
+@router.delete("/rules/{rule_id}")
+async def delete_alert_rule(
+    rule_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Delete an alert rule"""
+    if not await run_in_threadpool(get_alert_engine().delete_rule, rule_id):
+        raise HTTPException(status_code=404, detail="Alert rule not found")
+    return {"message": "Alert rule deleted successfully"}
+
+@router.get("/job/{job_id}/active", response_model=List[ActiveAlertResponse])
+async def get_active_alerts(
+    job_id: UUID,
+    current_user: User = Depends(get_current_user)
+):
+    """Get the rules currently in alert for a job"""
+    return get_alert_engine().active_alerts(job_id)
+
+@router.get("/job/{job_id}/recent", response_model=List[AlertEventResponse])
+async def get_recent_alerts(
+    job_id: UUID,
+    current_user: User = Depends(get_current_user)
+):
+    """Get the latest alert transitions of a job, oldest first"""
+    return [
+        {"job_id": str(event.job_id), "timestamp": event.timestamp, "data": event.data}
+        for event in get_alert_engine().recent(job_id)
+    ]
@@ -0,0 +1,52 @@
+# File: backend/app/api/v1/endpoints/job/casing_design.py
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from app.api.v1.endpoints.job.hydraulics import gradient_points
+from app.core.domain.calculations.casing_design import (
+    CasingDesignEngine, CasingString, casing_strings_from_tubulars
+)
+from app.core.domain.calculations.pressure_profile import minimum_curvature_tvd
+from app.core.units.validators import OperationalLimits
+from app.crud.jobsystem.trajectory import crud_trajectory
+from app.crud.jobsystem.tubular import crud_tubular
+from app.schemas.jobsystem.casing_design import CasingDesignRequest, CasingDesignResponse
+from app.core.deps import get_db, get_current_user
+from app.schemas.authsystem.user import UserResponse as User
+
+router = APIRouter()
+
+@router.post("/wellbore/{wellbore_id}", response_model=CasingDesignResponse)
+async def check_casing_design(
+    wellbore_id: str,
+    request: CasingDesignRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Burst, collapse and tension safety factors vs depth for every casing/liner string"""
+    if request.strings:
+        strings = [CasingString(**s.model_dump()) for s in request.strings]
+    else:
+        tubulars = await crud_tubular.get_by_wellbore(db=db, wellbore_id=wellbore_id)
+        strings = casing_strings_from_tubulars(tubulars)
+
+    surveys = await crud_trajectory.get_by_wellbore(db=db, wellbore_id=wellbore_id)
+    trajectory = None
+    if surveys:
+        md = [s.measured_depth for s in surveys]
+        trajectory = (md, minimum_curvature_tvd(md, [s.inclination for s in surveys], [s.azimuth for s in surveys]))
+
+    minimum = request.minimum_safety_factor
+    if minimum is None:
+        minimum = OperationalLimits.MIN_CASING_SAFETY_FACTOR.value
+    try:
+        engine = CasingDesignEngine(strings, request.mud_weight, trajectory, request.grid_step)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    result = engine.check(
+        pore_gradient=gradient_points(request.pore_gradient),
+        fracture_gradient=gradient_points(request.fracture_gradient),
+        collapse_gradient=gradient_points(request.collapse_gradient),
+        minimum_safety_factor=minimum,
+        gas_gradient=request.gas_gradient
+    )
+    return result.to_dict()
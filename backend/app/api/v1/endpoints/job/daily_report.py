@@ -4,9 +4,12 @@ from sqlalchemy.orm import Session
 from typing import List
 from datetime import datetime
 from app.crud.jobsystem.daily_report import crud_daily_report
+from app.crud.jobsystem.job import crud_job
 from app.schemas.jobsystem.daily_report import (
-    DailyReportResponse as DailyReport, DailyReportCreate, DailyReportUpdate
+    DailyReportResponse as DailyReport, DailyReportCreate, DailyReportUpdate,
+    DailyReportReminderCreate, DailyReportReminderResponse
 )
+from app.core.background import send_daily_report_reminders
 from app.core.deps import get_db, get_current_user
 from app.schemas.authsystem.user import UserResponse as User
 
@@ -57,4 +60,24 @@ async def update_daily_report(
     report = await crud_daily_report.get(db=db, id=report_id)
     if not report:
         raise HTTPException(status_code=404, detail="Daily report not found")
-    return await crud_daily_report.update(db=db, db_obj=report, obj_in=report_in)
\ No newline at end of file
+    return await crud_daily_report.update(db=db, db_obj=report, obj_in=report_in)
+
+@router.post("/job/{job_id}/reminders", response_model=DailyReportReminderResponse)
+async def send_report_reminders(
+    job_id: str,
+    reminder_in: DailyReportReminderCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Queue a daily report reminder for every crew member on the job"""
+    job = await crud_job.get(db=db, id=job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    queued = await send_daily_report_reminders(
+        crew=[member.model_dump() for member in reminder_in.crew],
+        job_name=job.job_name,
+        job_id=job.id,
+        report_date=reminder_in.report_date.isoformat(),
+        due_time=reminder_in.due_time
+    )
+    return {"queued": queued}
@@ -3,12 +3,22 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
 from app.crud.jobsystem.fluid import crud_fluid
-from app.schemas.jobsystem.fluid import FluidResponse as Fluid, FluidCreate, FluidUpdate
+from app.schemas.jobsystem.fluid import (
+    FluidResponse as Fluid, FluidCreate, FluidUpdate, FluidRheologyResponse, FluidBatchCreate
+)
+from app.schemas.base import BatchImportResponse
+from app.core.units.validators import FluidBatchValidator, MudWeight, column_to_unit, select_rows
+from app.core.domain.calculations.rheology import rheology_service
+from app.core.alerts import FLUID_CHANNELS, get_alert_engine
 from app.core.deps import get_db, get_current_user
 from app.schemas.authsystem.user import UserResponse as User
 
 router = APIRouter()
 
+async def _check_limits(db: Session, fluid) -> None:
+    values = {channel: getattr(fluid, channel) for channel in FLUID_CHANNELS}
+    await get_alert_engine().observe_wellbore(db, fluid.wellbore_id, values, fluid.report_date)
+
 @router.post("/", response_model=Fluid)
 async def create_fluid(
     fluid_in: FluidCreate,
@@ -16,7 +26,34 @@ async def create_fluid(
     current_user: User = Depends(get_current_user)
 ):
     """Create new fluid"""
-    return await crud_fluid.create(db=db, obj_in=fluid_in)
+    fluid = await crud_fluid.create(db=db, obj_in=fluid_in)
+    await _check_limits(db, fluid)
+    return fluid
+
+@router.post("/batch", response_model=BatchImportResponse)
+async def batch_create_fluids(
+    batch_in: FluidBatchCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Import mud checks; invalid checks are rejected per row and reported"""
+    columns = batch_in.model_dump(exclude={"wellbore_id", "mud_weight_unit", "all_or_nothing"})
+    n = len(batch_in.mud_weight)
+    if any(len(c) != n for c in columns.values()):
+        raise HTTPException(status_code=400, detail="Fluid columns must have the same length")
+    result = FluidBatchValidator.validate(columns, batch_in.mud_weight_unit)
+    if batch_in.all_or_nothing and result.invalid.any():
+        raise HTTPException(status_code=422, detail=result.report(inserted=0))
+    columns["mud_weight"], _ = column_to_unit(batch_in.mud_weight, MudWeight, batch_in.mud_weight_unit, "ppg")
+    rows = select_rows(columns, result.valid, wellbore_id=batch_in.wellbore_id)
+    inserted = await crud_fluid.create_many(db=db, rows=rows)
+    # Same limit checks as single fluid writes, one pass per channel for the whole batch
+    await get_alert_engine().observe_wellbore_many(
+        db, batch_in.wellbore_id,
+        [row["report_date"] for row in rows],
+        {channel: [row[channel] for row in rows] for channel in FLUID_CHANNELS}
+    )
+    return result.report(inserted)
 
 @router.get("/wellbore/{wellbore_id}", response_model=List[Fluid])
 async def get_fluids_by_wellbore(
@@ -41,6 +78,28 @@ async def get_fluids_by_type(
         fluid_type=fluid_type
     )
 
+@router.get("/wellbore/{wellbore_id}/rheology", response_model=List[FluidRheologyResponse])
+async def get_rheology_by_wellbore(
+    wellbore_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get Bingham, Power-Law and Herschel-Bulkley fits for every fluid of a wellbore"""
+    fits = await crud_fluid.get_rheology_by_wellbore(db=db, wellbore_id=wellbore_id)
+    return [{"fluid_id": fluid_id, **fit.to_dict()} for fluid_id, fit in fits.items()]
+
+@router.get("/{fluid_id}/rheology", response_model=FluidRheologyResponse)
+async def get_fluid_rheology(
+    fluid_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get rheology model fits for a fluid"""
+    fluid = await crud_fluid.get(db=db, id=fluid_id)
+    if not fluid:
+        raise HTTPException(status_code=404, detail="Fluid not found")
+    return {"fluid_id": fluid.id, **rheology_service.fit_fluid(fluid).to_dict()}
+
 @router.put("/{fluid_id}", response_model=Fluid)
 async def update_fluid(
     fluid_id: str,
@@ -52,4 +111,6 @@ async def update_fluid(
     fluid = await crud_fluid.get(db=db, id=fluid_id)
     if not fluid:
         raise HTTPException(status_code=404, detail="Fluid not found")
-    return await crud_fluid.update(db=db, db_obj=fluid, obj_in=fluid_in)
+    fluid = await crud_fluid.update(db=db, db_obj=fluid, obj_in=fluid_in)
+    await _check_limits(db, fluid)
+    return fluid
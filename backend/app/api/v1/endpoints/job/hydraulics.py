@@ -0,0 +1,303 @@
+# File: backend/app/api/v1/endpoints/job/hydraulics.py
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app.core.domain.calculations.hydraulics import (
+    BitNozzles, FluidProperties, HydraulicsEngine,
+    conduits_from_tubulars, tubular_kind
+)
+from app.core.domain.calculations.fluid_train import FluidStage, FluidTrainSimulator
+from app.core.domain.calculations.pressure_profile import (
+    geometry_version, minimum_curvature_tvd, pressure_profile_engine
+)
+from app.core.domain.calculations.pumps import (
+    GALLONS_PER_BBL, PumpConfiguration, RunningPump, normalized_efficiency, pump_model_service
+)
+from app.core.domain.calculations.sections import section_builder
+from app.core.domain.calculations.surge_swab import RunningComponent, SurgeSwabEngine
+from app.core.domain.calculations.volumes import volume_service
+from app.core.units.validators import OperationalLimits
+from app.crud.jobsystem.fluid import crud_fluid
+from app.crud.jobsystem.trajectory import crud_trajectory
+from app.crud.jobsystem.mud_pump_detail import crud_mud_pump_detail
+from app.crud.rigsystem.mud_pump import crud_mud_pump
+from app.crud.jobsystem.tubular import crud_tubular
+from app.schemas.jobsystem.hydraulics import (
+    FluidTrainRequest, FluidTrainResponse, GradientPoint, HydraulicsFluid,
+    HydraulicsRequest, HydraulicsResponse, LagRequest, LagResponse,
+    PressureProfileRequest, PressureProfileResponse, PumpSetup,
+    SurgeSwabRequest, SurgeSwabResponse
+)
+from app.core.deps import get_db, get_current_user
+from app.schemas.authsystem.user import UserResponse as User
+
+router = APIRouter()
+
+async def resolve_fluid(
+    db: Session, fluid: Optional[HydraulicsFluid], fluid_id: Optional[str]
+) -> FluidProperties:
+    """Fluid properties from an inline description or a stored fluid report"""
+    if fluid is not None:
+        return FluidProperties(
+            density=fluid.mud_weight,
+            plastic_viscosity=fluid.plastic_viscosity,
+            yield_point=fluid.yield_point
+        )
+    if fluid_id is not None:
+        fluid_row = await crud_fluid.get(db=db, id=fluid_id)
+        if not fluid_row:
+            raise HTTPException(status_code=404, detail="Fluid not found")
+        return FluidProperties.from_fluid(fluid_row)
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Either fluid or fluid_id is required"
+    )
+
+async def resolve_pump_configuration(db: Session, pump: PumpSetup) -> PumpConfiguration:
+    """Pump configuration from a mud pump record, with inline values taking precedence"""
+    liner_size, stroke_length = pump.liner_size, pump.stroke_length
+    efficiency, pump_type = pump.efficiency, pump.pump_type
+    if pump.mud_pump_id is not None:
+        mud_pump = await crud_mud_pump.get(db=db, id=pump.mud_pump_id)
+        if not mud_pump:
+            raise HTTPException(status_code=404, detail="Mud pump not found")
+        liner_size = liner_size or mud_pump.liner_size
+        stroke_length = stroke_length or mud_pump.stroke_length
+        efficiency = efficiency or mud_pump.efficiency
+        pump_type = pump_type or mud_pump.pump_type
+    if not liner_size or not stroke_length:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="liner_size and stroke_length are required to compute pump output"
+        )
+    return PumpConfiguration(
+        liner_size=liner_size,
+        stroke_length=stroke_length,
+        efficiency=normalized_efficiency(efficiency),
+        pump_type=(pump_type or "triplex").lower()
+    )
+
+async def resolve_pump_output(db: Session, pump: Optional[PumpSetup]) -> Optional[float]:
+    """Pump output (bbl/stk) from an explicit value, a mud pump record or an inline setup"""
+    if pump is None:
+        return None
+    if pump.output_per_stroke:
+        return pump.output_per_stroke
+    return (await resolve_pump_configuration(db, pump)).output_per_stroke
+
+def gradient_points(points: List[GradientPoint]):
+    if not points:
+        return None
+    return [p.md for p in points], [p.gradient for p in points]
+
+@router.post("/wellbore/{wellbore_id}", response_model=HydraulicsResponse)
+async def calculate_hydraulics(
+    wellbore_id: str,
+    request: HydraulicsRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Calculate circulating pressure losses for a wellbore over a range of flow rates"""
+    fluid = await resolve_fluid(db, request.fluid, request.fluid_id)
+
+    tubulars = await crud_tubular.get_by_wellbore(db=db, wellbore_id=wellbore_id)
+    geometry = section_builder.build(tubulars, version=geometry_version(tubulars)).flow_geometry()
+    if not geometry.pipe_sections:
+        raise HTTPException(status_code=404, detail="No drillstring found for wellbore")
+
+    if request.total_flow_area:
+        nozzles = BitNozzles(request.total_flow_area)
+    elif request.nozzles:
+        nozzles = BitNozzles.from_sizes(request.nozzles)
+    else:
+        nozzles = None
+
+    engine = HydraulicsEngine(geometry, fluid, nozzles, request.surface_case)
+    result = engine.calculate(request.flow_rates).to_dict()
+    if request.tvd:
+        result["ecd"] = engine.ecd_at_bit(request.flow_rates, request.tvd).tolist()
+    return result
+
+@router.post("/wellbore/{wellbore_id}/pressure-profile", response_model=PressureProfileResponse)
+async def calculate_pressure_profile(
+    wellbore_id: str,
+    request: PressureProfileRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Hydrostatic, circulating pressure and ECD at every survey station vs pore/frac gradients"""
+    fluid = await resolve_fluid(db, request.fluid, request.fluid_id)
+
+    tubulars = await crud_tubular.get_by_wellbore(db=db, wellbore_id=wellbore_id)
+    surveys = await crud_trajectory.get_by_wellbore(db=db, wellbore_id=wellbore_id)
+    if not surveys:
+        raise HTTPException(status_code=404, detail="No trajectory found for wellbore")
+
+    md = [s.measured_depth for s in surveys]
+    tvd = minimum_curvature_tvd(md, [s.inclination for s in surveys], [s.azimuth for s in surveys])
+    sections = section_builder.build(tubulars, version=geometry_version(tubulars))
+    engine = HydraulicsEngine(sections.flow_geometry(), fluid)
+    profile = pressure_profile_engine.calculate(
+        engine,
+        request.flow_rate,
+        md,
+        tvd,
+        version=geometry_version(tubulars, surveys),
+        pore_gradient=gradient_points(request.pore_gradient),
+        fracture_gradient=gradient_points(request.fracture_gradient),
+        margin=request.margin
+    )
+    return profile.to_dict()
+
+@router.post("/wellbore/{wellbore_id}/surge-swab", response_model=SurgeSwabResponse)
+async def calculate_surge_swab(
+    wellbore_id: str,
+    request: SurgeSwabRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Surge/swab pressure matrix over depths and running speeds, with maximum safe speeds"""
+    fluid = await resolve_fluid(db, request.fluid, request.fluid_id)
+
+    tubulars = await crud_tubular.get_by_wellbore(db=db, wellbore_id=wellbore_id)
+    hole, _ = conduits_from_tubulars(tubulars, total_depth=max(request.depths))
+
+    if request.string:
+        string = [RunningComponent(c.name, c.length, c.outer_diameter, c.inner_diameter) for c in request.string]
+    else:
+        drillstring = sorted(
+            (t for t in tubulars if tubular_kind(t) == "drillstring"),
+            key=lambda t: t.end_depth or 0.0,
+            reverse=True
+        )
+        string = [
+            RunningComponent(
+                getattr(t, "component_type", None) or "String",
+                (t.end_depth or 0.0) - (t.start_depth or 0.0),
+                t.outer_diameter or 0.0,
+                t.inner_diameter or 0.0
+            )
+            for t in drillstring
+        ]
+
+    surveys = await crud_trajectory.get_by_wellbore(db=db, wellbore_id=wellbore_id)
+    trajectory = None
+    if surveys:
+        md = [s.measured_depth for s in surveys]
+        trajectory = (md, minimum_curvature_tvd(md, [s.inclination for s in surveys], [s.azimuth for s in surveys]))
+
+    try:
+        engine = SurgeSwabEngine(
+            hole, string, fluid,
+            closed_end=request.closed_end,
+            clinging_factor=request.clinging_factor,
+            trajectory=trajectory
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    margin = request.margin
+    if margin is None:
+        margin = OperationalLimits.MIN_SURGE_SAFETY_MARGIN.value
+    result = engine.calculate(
+        request.depths,
+        request.speeds,
+        pore_gradient=gradient_points(request.pore_gradient),
+        fracture_gradient=gradient_points(request.fracture_gradient),
+        margin=margin
+    )
+    return result.to_dict()
+
+@router.post("/wellbore/{wellbore_id}/fluid-train", response_model=FluidTrainResponse)
+async def simulate_fluid_train(
+    wellbore_id: str,
+    request: FluidTrainRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Interface depths and bottom-hole hydrostatics while pumping a train of fluids"""
+    initial_density = request.initial_density
+    if initial_density is None:
+        if request.fluid_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Either initial_density or fluid_id is required"
+            )
+        initial_density = (await resolve_fluid(db, None, request.fluid_id)).density
+    output_per_stroke = await resolve_pump_output(db, request.pump)
+
+    tubulars = await crud_tubular.get_by_wellbore(db=db, wellbore_id=wellbore_id)
+    surveys = await crud_trajectory.get_by_wellbore(db=db, wellbore_id=wellbore_id)
+    volumes = volume_service.volumes(tubulars, version=geometry_version(tubulars))
+    trajectory = None
+    if surveys:
+        md = [s.measured_depth for s in surveys]
+        trajectory = (md, minimum_curvature_tvd(md, [s.inclination for s in surveys], [s.azimuth for s in surveys]))
+
+    try:
+        simulator = FluidTrainSimulator(volumes, initial_density, trajectory)
+        result = simulator.simulate(
+            [FluidStage(s.name, s.volume, s.density) for s in request.stages],
+            pumped_volume=request.pumped_volume or None,
+            steps=request.steps,
+            output_per_stroke=output_per_stroke
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return result.to_dict()
+
+@router.post("/wellbore/{wellbore_id}/lag", response_model=LagResponse)
+async def calculate_lag(
+    wellbore_id: str,
+    request: LagRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Pump output, strokes/time for volumes, bottoms-up lag per depth and lag depth per pumping time"""
+    pumps = [
+        RunningPump(await resolve_pump_configuration(db, p), p.spm) for p in request.pumps
+    ]
+    if request.report_id is not None:
+        for detail in await crud_mud_pump_detail.get_active_pumps(db=db, report_id=request.report_id):
+            mud_pump = await crud_mud_pump.get(db=db, id=detail.mud_pump_id)
+            if not mud_pump or not detail.circulation_rate:
+                continue
+            try:
+                pumps.append(RunningPump(PumpConfiguration.from_mud_pump(mud_pump), detail.circulation_rate))
+            except ValueError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if not pumps:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No pumps given")
+
+    tubulars = await crud_tubular.get_by_wellbore(db=db, wellbore_id=wellbore_id)
+    volumes = volume_service.volumes(tubulars, version=geometry_version(tubulars))
+    try:
+        flow_rate = pump_model_service.flow_rate(pumps)
+        lag = pump_model_service.lag(pumps, volumes, request.depths)
+        strokes, _ = pump_model_service.strokes_for_volume(pumps, request.volumes)
+        time = pump_model_service.time_for_volume(pumps, request.volumes)
+        lag_depth = pump_model_service.lag_depth(pumps, volumes, request.minutes)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return {
+        "flow_rate": flow_rate,
+        "flow_rate_gpm": flow_rate * GALLONS_PER_BBL,
+        "pumps": [
+            {
+                "output_per_stroke": p.configuration.output_per_stroke,
+                "spm": p.spm,
+                "flow_rate": p.configuration.output_per_stroke * p.spm,
+            }
+            for p in pumps
+        ],
+        "depths": request.depths,
+        "lag_volume": lag["lag_volume"].tolist(),
+        "lag_strokes": lag["lag_strokes"].tolist(),
+        "lag_time": lag["lag_time"].tolist(),
+        "volumes": request.volumes,
+        "strokes": strokes.tolist(),
+        "time": time.tolist(),
+        "minutes": request.minutes,
+        "lag_depth": lag_depth.tolist(),
+    }
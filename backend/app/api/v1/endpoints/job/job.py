@@ -1,10 +1,12 @@
 # File: backend/app/api/api_v1/endpoints/job/job.py
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import List
 from app.crud.jobsystem.job import crud_job
 from app.schemas.jobsystem.job import JobResponse, JobCreate, JobUpdate, JobView
 from app.core.deps import get_db
+from app.core.task_queue import enqueue_task
 
 router = APIRouter()
 
@@ -14,7 +16,12 @@ async def create_job(
     db: Session = Depends(get_db)
 ):
     """Create new job"""
-    return await crud_job.create(db=db, obj_in=job_in)
+    job = await crud_job.create(db=db, obj_in=job_in)
+    # Notification email goes out from a task queue worker
+    await run_in_threadpool(
+        enqueue_task, "notify.job_created", {"job_id": str(job.id)}, dedup_key=f"notify.job_created:{job.id}"
+    )
+    return job
 
 @router.get("/", response_model=List[JobView])
 async def read_jobs(
@@ -6,11 +6,20 @@ from app.crud.jobsystem.mud_pump_detail import crud_mud_pump_detail
 from app.schemas.jobsystem.mud_pump_detail import (
     MudPumpDetailResponse, MudPumpDetailCreate, MudPumpDetailUpdate
 )
+from app.crud.jobsystem.daily_report import crud_daily_report
+from app.core.alerts import get_alert_engine
 from app.core.deps import get_db, get_current_user
 from app.schemas.authsystem.user import UserResponse as User
 
 router = APIRouter()
 
+async def _check_limits(db: Session, pump) -> None:
+    report = await crud_daily_report.get(db=db, id=pump.report_id)
+    if report is not None:
+        await get_alert_engine().observe_wellbore(
+            db, report.wellbore_id, {"circulation_rate": pump.circulation_rate}, report.report_date
+        )
+
 @router.post("/", response_model=MudPumpDetailResponse)
 async def create_mud_pump(
     *,
@@ -19,7 +28,9 @@ async def create_mud_pump(
     current_user: User = Depends(get_current_user)
 ):
     """Create new mud pump detail"""
-    return await crud_mud_pump_detail.create(db=db, obj_in=pump_in)
+    pump = await crud_mud_pump_detail.create(db=db, obj_in=pump_in)
+    await _check_limits(db, pump)
+    return pump
 
 @router.get("/report/{report_id}", response_model=List[MudPumpDetailResponse])
 async def get_pumps_by_report(
@@ -51,4 +62,6 @@ async def update_mud_pump(
     pump = await crud_mud_pump_detail.get(db=db, id=pump_id)
     if not pump:
         raise HTTPException(status_code=404, detail="Mud pump not found")
-    return await crud_mud_pump_detail.update(db=db, db_obj=pump, obj_in=pump_in)
\ No newline at end of file
+    pump = await crud_mud_pump_detail.update(db=db, db_obj=pump, obj_in=pump_in)
+    await _check_limits(db, pump)
+    return pump
@@ -0,0 +1,155 @@
+# File: backend/app/api/v1/endpoints/job/sensor_data.py
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, WebSocket, WebSocketDisconnect, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import datetime
+from uuid import UUID
+import asyncio
+import logging
+
+from app.core.deps import get_db, get_current_user, get_current_session
+from app.core.ingestion import FrameError, IngestBackpressure, get_ingestion_service, parse_frames
+from app.core.timeseries import get_timeseries_store
+from app.core.downsampling import DOWNSAMPLE_METHODS, get_rollup_service
+from app.schemas.authsystem.user import UserResponse as User
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+@router.post("/jobs/{job_id}/frames")
+async def ingest_frames(
+    job_id: UUID,
+    request: Request,
+    wait: bool = Query(False, description="Respond only once the frames are written to storage"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Ingest a batch of sensor frames (JSON, msgpack or line protocol by
+    Content-Type). Responds 429 when the ingestion buffer is full.
+    """
+    service = get_ingestion_service()
+    try:
+        frames = parse_frames(str(job_id), await request.body(), request.headers.get("content-type"))
+    except FrameError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    seq, acks = 0, []
+    for accepted, frame in enumerate(frames):
+        try:
+            seq, ack = service.submit(frame, want_ack=wait)
+        except IngestBackpressure as e:
+            # Frames before this one are buffered; the client resends from accepted_frames
+            return JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={"detail": f"Ingestion buffer full: {str(e)}", "accepted_frames": accepted, "seq": seq},
+                headers={"Retry-After": "1"}
+            )
+        if ack is not None:
+            acks.append(ack)
+
+    written = None
+    if acks:
+        try:
+            written = sum(await asyncio.gather(*acks))
+        except Exception as e:
+            raise HTTPException(status_code=503, detail=f"Sensor data could not be stored: {str(e)}")
+    return {
+        "seq": seq,
+        "frames": len(frames),
+        "samples": sum(f.samples for f in frames),
+        "written": written,
+        "flushed_seq": service.flushed_seq,
+    }
+
+@router.websocket("/jobs/{job_id}/ws")
+async def ingest_websocket(
+    websocket: WebSocket,
+    job_id: UUID,
+    token: str = Query(...),
+    db: Session = Depends(get_db)
+):
+    """
+    Stream sensor frames: binary messages are msgpack, text messages are JSON
+    or line protocol. Every message is acknowledged with its sequence number;
+    when the buffer is full the server stops reading until there is space.
+    """
+    try:
+        await get_current_user(await get_current_session(token=token, db=db), db=db)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    service = get_ingestion_service()
+    await websocket.accept()
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            if message.get("bytes") is not None:
+                body, content_type = message["bytes"], "application/msgpack"
+            else:
+                text = message.get("text") or ""
+                body = text.encode()
+                content_type = "application/json" if text.lstrip()[:1] in ("{", "[") else "text/plain"
+            try:
+                frames = parse_frames(str(job_id), body, content_type)
+            except FrameError as e:
+                await websocket.send_json({"type": "error", "detail": str(e)})
+                continue
+            seq = 0
+            for frame in frames:
+                seq = await service.put(frame)
+            await websocket.send_json({
+                "type": "ack",
+                "seq": seq,
+                "samples": sum(f.samples for f in frames),
+                "flushed_seq": service.flushed_seq,
+            })
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(f"Sensor ingestion WebSocket error: {str(e)}")
+        await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+
+@router.get("/jobs/{job_id}/channels")
+async def get_job_channels(
+    job_id: UUID,
+    current_user: User = Depends(get_current_user)
+):
+    """Stored sensor channels of a job with point counts and time span"""
+    store = get_timeseries_store()
+    return await run_in_threadpool(store.stats, str(job_id))
+
+@router.get("/jobs/{job_id}/channels/{channel}/series")
+async def get_channel_series(
+    job_id: UUID,
+    channel: str,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    points: int = Query(1000, ge=3, le=20000, description="Target number of points, e.g. the chart width in pixels"),
+    method: str = Query("minmax", description="minmax, avg or lttb"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Downsampled channel data for charts. Buckets come from the 1 s / 1 min /
+    1 h rollups when the range allows, so long ranges never scan raw data.
+    """
+    if method not in DOWNSAMPLE_METHODS:
+        raise HTTPException(status_code=400, detail=f"method must be one of {', '.join(DOWNSAMPLE_METHODS)}")
+    try:
+        return await run_in_threadpool(
+            get_rollup_service().query, str(job_id), channel, start, end, points, method
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/ingestion/stats")
+async def get_ingestion_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """Ingestion buffer and throughput counters for this process"""
+    return get_ingestion_service().snapshot()
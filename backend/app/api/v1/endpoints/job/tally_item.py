@@ -3,7 +3,11 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
 from app.crud.jobsystem.tally_item import crud_tally_item
-from app.schemas.jobsystem.tally_item import TallyItemResponse as TallyItem, TallyItemCreate, TallyItemUpdate
+from app.schemas.jobsystem.tally_item import (
+    TallyItemResponse as TallyItem, TallyItemCreate, TallyItemUpdate, TallyItemBatchCreate
+)
+from app.schemas.base import BatchImportResponse
+from app.core.units.validators import TallyBatchValidator, select_rows
 from app.core.deps import get_db, get_current_user
 from app.schemas.authsystem.user import UserResponse as User
 
@@ -19,6 +23,31 @@ async def create_tally_item(
     """Create new tally item"""
     return await crud_tally_item.create(db=db, obj_in=item_in)
 
+@router.post("/tally/{tally_id}/batch", response_model=BatchImportResponse)
+async def batch_create_tally_items(
+    tally_id: str,
+    batch_in: TallyItemBatchCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Import tally joints; invalid joints are rejected per row and reported"""
+    columns = batch_in.model_dump(exclude={"all_or_nothing"})
+    n = len(batch_in.length_value)
+    if columns["inner_diameter_value"] is None:
+        columns["inner_diameter_value"] = [None] * n
+    if any(isinstance(c, list) and len(c) != n for c in columns.values()):
+        raise HTTPException(status_code=400, detail="Tally columns must have the same length")
+    result = TallyBatchValidator.validate(
+        batch_in.length_value, batch_in.outer_diameter_value, columns["inner_diameter_value"],
+        batch_in.weight_per_unit_value, batch_in.length_unit, batch_in.outer_diameter_unit,
+        batch_in.inner_diameter_unit, batch_in.weight_per_unit_unit
+    )
+    if batch_in.all_or_nothing and result.invalid.any():
+        raise HTTPException(status_code=422, detail=result.report(inserted=0))
+    rows = select_rows(columns, result.valid, tally_id=tally_id)
+    inserted = await crud_tally_item.create_many(db=db, rows=rows)
+    return result.report(inserted)
+
 @router.get("/tally/{tally_id}", response_model=List[TallyItem])
 async def get_items_by_tally(
     tally_id: str,
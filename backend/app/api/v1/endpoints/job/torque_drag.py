@@ -0,0 +1,127 @@
+# File: backend/app/api/v1/endpoints/job/torque_drag.py
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.core.domain.calculations.buckling import BucklingEngine
+from app.core.domain.calculations.hydraulics import conduits_from_tubulars
+from app.core.domain.calculations.torque_drag import (
+    StringComponent, TorqueDragEngine, string_components_from_tubulars
+)
+from app.crud.jobsystem.fluid import crud_fluid
+from app.crud.jobsystem.trajectory import crud_trajectory
+from app.crud.jobsystem.tubular import crud_tubular
+from app.schemas.jobsystem.torque_drag import (
+    BucklingRequest, BucklingResponse, TorqueDragRequest, TorqueDragResponse
+)
+from app.core.deps import get_db, get_current_user
+from app.schemas.authsystem.user import UserResponse as User
+
+router = APIRouter()
+
+async def resolve_mud_weight(db: Session, mud_weight: Optional[float], fluid_id: Optional[str]) -> float:
+    """Mud weight given inline or taken from a stored fluid report"""
+    if mud_weight is not None:
+        return mud_weight
+    if fluid_id is not None:
+        fluid = await crud_fluid.get(db=db, id=fluid_id)
+        if not fluid:
+            raise HTTPException(status_code=404, detail="Fluid not found")
+        return fluid.mud_weight
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Either mud_weight or fluid_id is required"
+    )
+
+@router.post("/wellbore/{wellbore_id}", response_model=TorqueDragResponse)
+async def calculate_torque_drag(
+    wellbore_id: str,
+    request: TorqueDragRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Soft-string hook loads and torques for a set of friction factors and operating modes"""
+    mud_weight = await resolve_mud_weight(db, request.mud_weight, request.fluid_id)
+
+    surveys = await crud_trajectory.get_by_wellbore(db=db, wellbore_id=wellbore_id)
+    if len(surveys) < 2:
+        raise HTTPException(status_code=404, detail="No trajectory found for wellbore")
+
+    if request.string:
+        string = [
+            StringComponent(c.name, c.length, c.outer_diameter, c.inner_diameter, c.weight)
+            for c in request.string
+        ]
+    else:
+        tubulars = await crud_tubular.get_by_wellbore(db=db, wellbore_id=wellbore_id)
+        string = string_components_from_tubulars(tubulars)
+
+    try:
+        engine = TorqueDragEngine(
+            [s.measured_depth for s in surveys],
+            [s.inclination for s in surveys],
+            [s.azimuth for s in surveys],
+            string,
+            mud_weight
+        )
+        result = engine.calculate(
+            request.friction_factors,
+            modes=request.modes,
+            bit_depths=request.bit_depths or None,
+            weight_on_bit=request.weight_on_bit,
+            bit_torque=request.bit_torque,
+            block_weight=request.block_weight
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return result.to_dict()
+
+@router.post("/wellbore/{wellbore_id}/buckling", response_model=BucklingResponse)
+async def calculate_buckling(
+    wellbore_id: str,
+    request: BucklingRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Sinusoidal/helical buckling check at every survey station, with depth intervals at risk"""
+    mud_weight = await resolve_mud_weight(db, request.mud_weight, request.fluid_id)
+
+    surveys = await crud_trajectory.get_by_wellbore(db=db, wellbore_id=wellbore_id)
+    if len(surveys) < 2:
+        raise HTTPException(status_code=404, detail="No trajectory found for wellbore")
+    md = [s.measured_depth for s in surveys]
+    inclination = [s.inclination for s in surveys]
+    bit_depth = request.bit_depth or md[-1]
+
+    tubulars = await crud_tubular.get_by_wellbore(db=db, wellbore_id=wellbore_id)
+    if request.tubular_ids:
+        selected = set(request.tubular_ids)
+        string_rows = [t for t in tubulars if t.id in selected]
+        hole_rows = [t for t in tubulars if t.id not in selected]
+        string = string_components_from_tubulars(string_rows, kinds=("drillstring", "casing", "liner"))
+    else:
+        hole_rows = tubulars
+        string = string_components_from_tubulars(tubulars)
+    if request.string:
+        string = [
+            StringComponent(c.name, c.length, c.outer_diameter, c.inner_diameter, c.weight)
+            for c in request.string
+        ]
+    hole, _ = conduits_from_tubulars(hole_rows, total_depth=bit_depth)
+
+    try:
+        engine = BucklingEngine(md, inclination, string, hole, mud_weight, bit_depth=bit_depth)
+        tension = None
+        if request.friction_factors:
+            loads = TorqueDragEngine(
+                md, inclination, [s.azimuth for s in surveys], string, mud_weight
+            ).calculate(
+                request.friction_factors,
+                modes=request.modes,
+                bit_depths=[bit_depth],
+                weight_on_bit=request.weight_on_bit
+            )
+            tension = loads.tension
+        result = engine.check(tension, weight_on_bit=request.weight_on_bit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return result.to_dict()
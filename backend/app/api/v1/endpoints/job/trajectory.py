@@ -1,9 +1,18 @@
 # File: backend/app/api/v1/endpoints/wellbore/trajectory.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.crud.jobsystem.trajectory import crud_trajectory
-from app.schemas.jobsystem.trajectory import TrajectoryResponse as Trajectory, TrajectoryCreate, TrajectoryUpdate
+from app.schemas.jobsystem.trajectory import (
+    TrajectoryResponse as Trajectory, TrajectoryCreate, TrajectoryUpdate, TrajectoryBatchCreate,
+    SurveyImportResponse, SurveyImportProgressResponse
+)
+from app.schemas.base import BatchImportResponse
+from app.core.units.validators import Depth, SurveyBatchValidator, column_to_unit, select_rows
+from app.core.domain.calculations.pressure_profile import minimum_curvature
+from app.core.survey_import import (
+    SurveyFileError, SurveyImporter, get_import_progress, start_import, survey_format
+)
 from app.core.deps import get_db, get_current_user
 from app.schemas.authsystem.user import UserResponse as User
 
@@ -19,6 +28,92 @@ async def create_trajectory(
     """Create new trajectory point"""
     return await crud_trajectory.create(db=db, obj_in=trajectory_in)
 
+@router.post("/wellbore/{wellbore_id}/batch", response_model=BatchImportResponse)
+async def batch_create_trajectory(
+    wellbore_id: str,
+    batch_in: TrajectoryBatchCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Import survey stations; invalid stations are rejected per row and reported"""
+    if not len(batch_in.measured_depth) == len(batch_in.inclination) == len(batch_in.azimuth):
+        raise HTTPException(status_code=400, detail="Survey columns must have the same length")
+    result = SurveyBatchValidator.validate(
+        batch_in.measured_depth, batch_in.inclination, batch_in.azimuth, batch_in.depth_unit
+    )
+    if batch_in.all_or_nothing and result.invalid.any():
+        raise HTTPException(status_code=422, detail=result.report(inserted=0))
+    md_ft, _ = column_to_unit(batch_in.measured_depth, Depth, batch_in.depth_unit, "ft")
+    rows = select_rows(
+        {"measured_depth": md_ft, "inclination": batch_in.inclination, "azimuth": batch_in.azimuth},
+        result.valid,
+        wellbore_id=wellbore_id
+    )
+    inserted = await crud_trajectory.create_many(db=db, rows=rows)
+    return result.report(inserted)
+
+@router.post("/wellbore/{wellbore_id}/import", response_model=SurveyImportResponse)
+async def import_survey_file(
+    wellbore_id: str,
+    file: UploadFile = File(..., description="CSV, LAS 2.0 or xlsx survey"),
+    depth_unit: Optional[str] = Query(None, description="Override the depth unit found in the file (ft or m)"),
+    replace: bool = Query(False, description="Replace the wellbore's survey instead of appending to it"),
+    import_id: Optional[str] = Query(None, description="Id to poll progress under /imports/{import_id}"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Stream a survey file into the wellbore trajectory. Stations are read,
+    validated and positioned in chunks and inserted in one transaction;
+    invalid stations are rejected per row and reported.
+    """
+    try:
+        importer = SurveyImporter(survey_format(file.filename, file.content_type), depth_unit=depth_unit)
+    except SurveyFileError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if not replace:
+        existing = await crud_trajectory.get_by_wellbore(db=db, wellbore_id=wellbore_id)
+        if existing:
+            # Appended stations continue the stored survey
+            tvd, north, east, _ = minimum_curvature(
+                [s.measured_depth for s in existing], [s.inclination for s in existing], [s.azimuth for s in existing]
+            )
+            last = existing[-1]
+            importer.seed(last.measured_depth, last.inclination, last.azimuth,
+                          position=(float(tvd[-1]), float(north[-1]), float(east[-1])))
+
+    progress = start_import(import_id, file.filename, getattr(file, "size", None))
+    try:
+        inserted = await crud_trajectory.import_stations(
+            db=db,
+            wellbore_id=wellbore_id,
+            chunks=importer.stations(file, progress, wellbore_id=wellbore_id),
+            replace=replace
+        )
+    except SurveyFileError as e:
+        progress.fail(str(e))
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException as e:
+        progress.fail(str(e.detail))
+        raise
+    except Exception as e:
+        progress.fail(str(e))
+        raise
+    progress.finish(inserted)
+    return {"import_id": progress.import_id, **importer.report(inserted)}
+
+@router.get("/imports/{import_id}", response_model=SurveyImportProgressResponse)
+async def get_survey_import_progress(
+    import_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Progress of a running or recent survey import"""
+    progress = get_import_progress(import_id)
+    if progress is None:
+        raise HTTPException(status_code=404, detail="Survey import not found")
+    return progress.to_dict()
+
 @router.get("/wellbore/{wellbore_id}", response_model=List[Trajectory])
 async def get_trajectory_by_wellbore(
     wellbore_id: str,
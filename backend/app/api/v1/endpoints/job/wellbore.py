@@ -3,8 +3,14 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
+from app.core.domain.calculations.pressure_profile import geometry_version
+from app.core.domain.calculations.sections import section_builder
+from app.core.domain.calculations.volumes import volume_service
+from app.crud.jobsystem.tubular import crud_tubular
 from app.crud.jobsystem.wellbore import crud_wellbore
-from app.schemas.jobsystem.wellbore import WellboreResponse as Wellbore, WellboreCreate, WellboreUpdate
+from app.schemas.jobsystem.wellbore import (
+    WellboreResponse as Wellbore, WellboreCreate, WellboreUpdate, WellSectionResponse, WellVolumeResponse
+)
 from app.core.deps import get_db, get_current_user
 from app.schemas.authsystem.user import UserResponse as User
 
@@ -87,6 +93,45 @@ async def get_wellbore_summary(
         raise HTTPException(status_code=404, detail="Wellbore not found")
     return summary
 
+@router.get("/{wellbore_id}/sections", response_model=List[WellSectionResponse])
+async def get_wellbore_sections(
+    wellbore_id: str,
+    total_depth: Optional[float] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get the wellbore split into wall/string sections from surface to TD"""
+    tubulars = await crud_tubular.get_by_wellbore(db=db, wellbore_id=wellbore_id)
+    sections = section_builder.build(tubulars, total_depth=total_depth, version=geometry_version(tubulars))
+    return sections.to_dict()
+
+@router.get("/{wellbore_id}/volumes", response_model=WellVolumeResponse)
+async def get_wellbore_volumes(
+    wellbore_id: str,
+    total_depth: Optional[float] = None,
+    top: Optional[float] = None,
+    bottom: Optional[float] = None,
+    bit_depth: Optional[float] = None,
+    closed_end: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get hole, annular and string volumes, optionally between two depths or with the bit at a depth"""
+    tubulars = await crud_tubular.get_by_wellbore(db=db, wellbore_id=wellbore_id)
+    volumes = volume_service.volumes(tubulars, total_depth=total_depth, version=geometry_version(tubulars))
+    if not len(volumes.sections):
+        raise HTTPException(status_code=404, detail="No wellbore geometry found")
+    result = volumes.totals()
+    if top is not None or bottom is not None:
+        result["interval_volume"] = float(volumes.volume_between(
+            0.0 if top is None else top,
+            volumes.sections.total_depth if bottom is None else bottom
+        ))
+    if bit_depth is not None:
+        result["displacement_at_bit"] = float(volumes.displacement(bit_depth, closed_end=closed_end))
+        result["annular_volume_at_bit"] = float(volumes.annular_volume_at(bit_depth))
+    return result
+
 @router.put("/{wellbore_id}", response_model=Wellbore)
 async def update_wellbore(
     *,
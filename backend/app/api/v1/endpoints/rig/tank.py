@@ -0,0 +1,99 @@
+# File: backend/app/api/v1/endpoints/rig/tank.py
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from app.crud.rigsystem.tank import crud_tank
+from app.schemas.rigsystem.tank import (
+    StrappingTableResponse, PitVolumeStart, PitVolumeReadings,
+    PitVolumeBaseline, PitVolumeResponse
+)
+from app.core.deps import get_db, get_current_user
+from app.core.ws.manager import job_update_manager
+from app.core.domain.calculations.pit_volume import tank_strapping_table, pit_volume_service
+from app.schemas.authsystem.user import UserResponse as User
+
+router = APIRouter()
+
+def get_totalizer(rig_id: str):
+    totalizer = pit_volume_service.get(rig_id)
+    if totalizer is None:
+        raise HTTPException(status_code=404, detail="Pit volume monitoring not started for this rig")
+    return totalizer
+
+@router.get("/{tank_id}/strapping", response_model=StrappingTableResponse)
+async def get_strapping_table(
+    tank_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Strapping table (level to volume) of a tank"""
+    tank = await crud_tank.get(db=db, id=tank_id)
+    if not tank:
+        raise HTTPException(status_code=404, detail="Tank not found")
+    try:
+        table = tank_strapping_table(tank)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"tank_id": tank.id, **table.to_dict()}
+
+@router.post("/rig/{rig_id}/pit-volume/start", response_model=PitVolumeResponse)
+async def start_pit_volume(
+    rig_id: str,
+    start_in: PitVolumeStart,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Start (or restart) the pit volume totalizer for all tanks of a rig"""
+    tanks = await crud_tank.get_by_rig(db=db, rig_id=rig_id)
+    if not tanks:
+        raise HTTPException(status_code=404, detail="No tanks found for this rig")
+    try:
+        totalizer = pit_volume_service.start(
+            rig_id, tanks, start_in.job_id,
+            active=start_in.active_tanks,
+            gain_threshold=start_in.gain_threshold,
+            loss_threshold=start_in.loss_threshold,
+            user_id=str(current_user.id),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return totalizer.snapshot()
+
+@router.post("/rig/{rig_id}/pit-volume/readings", response_model=PitVolumeResponse)
+async def ingest_pit_readings(
+    rig_id: str,
+    readings_in: PitVolumeReadings,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Apply tank level readings and broadcast any gain/loss alert to the job.
+    The gain/loss baseline is taken once every active tank has reported.
+    """
+    totalizer = get_totalizer(rig_id)
+    try:
+        alerts = totalizer.ingest_many([(r.tank_id, r.level, r.timestamp) for r in readings_in.readings])
+    except KeyError as e:
+        raise HTTPException(status_code=400, detail=str(e.args[0]))
+    for alert in alerts:
+        await job_update_manager.broadcast_to_job(alert.job_id, alert)
+    return {**totalizer.snapshot(), "alerts": [alert.data for alert in alerts]}
+
+@router.post("/rig/{rig_id}/pit-volume/baseline", response_model=PitVolumeResponse)
+async def reset_pit_baseline(
+    rig_id: str,
+    baseline_in: PitVolumeBaseline,
+    current_user: User = Depends(get_current_user)
+):
+    """Reset the gain/loss baseline, optionally lining up a new active system"""
+    totalizer = get_totalizer(rig_id)
+    if baseline_in.active_tanks is not None:
+        totalizer.set_active(baseline_in.active_tanks)
+    totalizer.reset_baseline(baseline_in.volume)
+    return totalizer.snapshot()
+
+@router.get("/rig/{rig_id}/pit-volume", response_model=PitVolumeResponse)
+async def get_pit_volume(
+    rig_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Current tank volumes and active system gain/loss"""
+    return get_totalizer(rig_id).snapshot()
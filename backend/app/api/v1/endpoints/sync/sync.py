@@ -1,25 +1,27 @@
 # File: backend/app/api/v1/endpoints/sync/sync.py
-from fastapi import APIRouter, Depends, BackgroundTasks
-from sqlalchemy.orm import Session
-from app.core.deps import get_db
-from app.core.sync_manager import sync_manager
+from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
+from app.core.deps import get_current_admin_user
+from app.core.task_queue import enqueue_task
+from app.db.sync_manager import sync_manager
+from app.schemas.authsystem.user import UserResponse as User
 
 router = APIRouter()
 
 @router.post("/sync")
 async def sync_data(
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_admin_user)
 ):
     """Synchronize offline data with online database"""
-    background_tasks.add_task(sync_manager.sync_to_online, db)
-    return {"message": "Synchronization started"}
+    # Runs in a task queue worker; repeated requests share the pending sync task
+    task_id = await run_in_threadpool(
+        enqueue_task, "sync.synchronize", {}, priority=10, dedup_key="sync.synchronize"
+    )
+    return {"message": "Synchronization started", "task_id": task_id}
 
 @router.get("/sync/status")
-async def get_sync_status():
+async def get_sync_status(
+    current_user: User = Depends(get_current_admin_user)
+):
     """Get current synchronization status"""
-    pending = len([c for c in sync_manager.pending_changes if not c['synced']])
-    return {
-        "pending_changes": pending,
-        "is_online": sync_manager.db_manager.is_online
-    }
+    return sync_manager.get_status()
@@ -0,0 +1,38 @@
+# File: backend/app/api/v1/endpoints/tasks.py
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from app.core.deps import get_current_user, get_current_admin_user
+from app.core.task_queue import get_task_queue
+from app.schemas.authsystem.user import UserResponse as User
+
+router = APIRouter()
+
+@router.get("/stats", response_model=dict)
+async def get_task_stats(
+    current_user: User = Depends(get_current_admin_user)
+):
+    """Task counts per type and status"""
+    return await run_in_threadpool(get_task_queue().stats)
+
+@router.get("/{task_id}", response_model=dict)
+async def get_task(
+    task_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Get status and result of a queued task"""
+    task_info = await run_in_threadpool(get_task_queue().get, task_id)
+    if not task_info:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
+    return {
+        "id": task_info["id"],
+        "task_type": task_info["task_type"],
+        "status": task_info["status"],
+        "attempts": task_info["attempts"],
+        "result": task_info["result"],
+        "error": task_info["error"],
+        "created_at": task_info["created_at"],
+        "finished_at": task_info["finished_at"]
+    }
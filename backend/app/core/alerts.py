@@ -0,0 +1,346 @@
+# File: backend/app/core/alerts.py
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+import json
+import logging
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.units.validators import OperationalLimits
+from app.models.events import EventType, JobEvent
+
+logger = logging.getLogger(__name__)
+
+OFFLINE_DB_DIR = Path(__file__).resolve().parent.parent / "offline_db"
+
+RULE_KINDS = ("threshold", "rate", "window_avg")
+FLUID_CHANNELS = ("mud_weight", "funnel_viscosity", "plastic_viscosity", "yield_point",
+                  "gel_strength_10s", "gel_strength_10m", "pH")
+
+@dataclass(frozen=True)
+class AlertRule:
+    """
+    One limit on one channel. `rate` compares the change per minute over
+    the window, `window_avg` the mean over the window (seconds).
+    """
+    id: str
+    channel: str
+    kind: str = "threshold"
+    above: Optional[float] = None  # alert when the value exceeds this
+    below: Optional[float] = None  # alert when the value drops under this
+    window: float = 0.0  # s
+    deadband: float = 0.0  # the alert clears once back inside the limit by this much
+    job_id: Optional[str] = None  # None applies to every job
+    severity: str = "warning"
+    message: str = ""
+
+    def __post_init__(self):
+        if self.kind not in RULE_KINDS:
+            raise ValueError(f"Unknown rule kind: {self.kind}")
+        if self.above is None and self.below is None:
+            raise ValueError(f"Rule {self.id} has no limit")
+        if self.kind != "threshold" and self.window <= 0:
+            raise ValueError(f"Rule {self.id} needs a window")
+
+def default_rules() -> List[AlertRule]:
+    """Rules for the fleet-wide OperationalLimits"""
+    limits = OperationalLimits
+    return [
+        AlertRule("max_depth", "bit_depth", above=limits.MAX_DEPTH.value, severity="critical"),
+        AlertRule("max_pressure", "spp", above=limits.MAX_PRESSURE.value, deadband=250, severity="critical"),
+        AlertRule("max_temperature", "temperature", above=limits.MAX_TEMPERATURE.value, deadband=5),
+        AlertRule("max_mud_weight", "mud_weight", above=limits.MAX_MUD_WEIGHT.value, deadband=0.1),
+        AlertRule("max_dls", "dls", above=limits.MAX_DLS.value),
+        AlertRule("max_ecd", "ecd", above=limits.MAX_ECD.value, deadband=0.1, severity="critical"),
+        AlertRule("annular_velocity", "annular_velocity", above=limits.MAX_ANNULAR_VELOCITY.value,
+                  below=limits.MIN_ANNULAR_VELOCITY.value, window=60, kind="window_avg", deadband=10),
+        AlertRule("max_circulation_rate", "circulation_rate", above=limits.MAX_CIRCULATION_RATE.value, deadband=5),
+    ]
+
+class _RuleGroup:
+    """Rules of one channel sharing a derived signal (kind + window), as limit vectors"""
+
+    def __init__(self, kind: str, window: float, rules: Sequence[AlertRule]):
+        self.kind = kind
+        self.window_ms = int(window * 1000)
+        self.rules = list(rules)
+        self.above = np.array([np.inf if r.above is None else r.above for r in rules], dtype=float)
+        self.below = np.array([-np.inf if r.below is None else r.below for r in rules], dtype=float)
+        self.deadband = np.array([r.deadband for r in rules], dtype=float)
+        self.job_ids = [r.job_id for r in rules]
+
+    def rule_index(self, job_id: str) -> np.ndarray:
+        return np.array([i for i, j in enumerate(self.job_ids) if j is None or j == job_id], dtype=np.int64)
+
+class CompiledRules:
+    """Immutable rule set indexed by channel, then by derived signal"""
+
+    def __init__(self, rules: Iterable[AlertRule]):
+        self.rules: Dict[str, AlertRule] = {r.id: r for r in rules}
+        grouped: Dict[str, Dict[Tuple[str, float], List[AlertRule]]] = {}
+        for rule in self.rules.values():
+            grouped.setdefault(rule.channel, {}).setdefault((rule.kind, rule.window), []).append(rule)
+        self.channels: Dict[str, List[_RuleGroup]] = {
+            channel: [_RuleGroup(kind, window, rules) for (kind, window), rules in groups.items()]
+            for channel, groups in grouped.items()
+        }
+
+@dataclass
+class _GroupState:
+    rules: np.ndarray  # indices into the group's rules that apply to the job
+    active: np.ndarray  # bool per applicable rule
+    tail_t: np.ndarray = field(default_factory=lambda: np.empty(0, np.int64))
+    tail_v: np.ndarray = field(default_factory=lambda: np.empty(0, np.float64))
+
+def _derived(group: _RuleGroup, state: _GroupState, t: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """The signal a group compares: the value, a windowed mean or a rate per minute"""
+    if group.kind == "threshold":
+        return v
+    tt = np.concatenate((state.tail_t, t))
+    vv = np.concatenate((state.tail_v, v))
+    offset = state.tail_t.size
+    here = np.arange(offset, tt.size)
+    if group.kind == "window_avg":
+        cs = np.concatenate(([0.0], np.cumsum(vv)))
+        start = np.searchsorted(tt, tt[here] - group.window_ms, side="right")
+        x = (cs[here + 1] - cs[start]) / (here + 1 - start)
+    else:
+        start = np.searchsorted(tt, tt[here] - group.window_ms, side="left")
+        dt = (tt[here] - tt[start]) / 60000.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = np.where(dt > 0, (vv[here] - vv[start]) / dt, np.nan)
+    keep = tt > tt[-1] - group.window_ms
+    state.tail_t, state.tail_v = tt[keep], vv[keep]
+    return x
+
+def _transitions(x: np.ndarray, above: np.ndarray, below: np.ndarray, deadband: np.ndarray,
+                 active: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Alert state of every rule after each sample, with hysteresis, and the
+    samples where it changed. Vectorized over samples x rules: each sample
+    either sets, clears or holds the state, and holds are forward-filled.
+    """
+    xs = x[:, None]
+    set_ = (xs > above) | (xs < below)
+    clear = (xs <= above - deadband) & (xs >= below + deadband)
+    decision = np.where(set_, 1, np.where(clear, 0, -1))
+    rows = np.where(decision >= 0, np.arange(x.size)[:, None], -1)
+    last = np.maximum.accumulate(rows, axis=0)
+    columns = np.arange(above.size)[None, :]
+    state = np.where(last >= 0, decision[np.maximum(last, 0), columns] == 1, active[None, :])
+    previous = np.vstack((active[None, :], state[:-1]))
+    return state, state != previous
+
+def _event_time(ms: int) -> datetime:
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
+
+def _record_millis(when: datetime) -> int:
+    # Naive record timestamps are UTC
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return int(when.timestamp() * 1000)
+
+class AlertEngine:
+    """
+    Evaluates compiled limit rules against incoming measurements.
+
+    Each (job, channel) keeps the alert state of its rules and the samples
+    still inside the longest window, so a batch is evaluated without
+    looking back further. Only state changes produce events: one ALERT
+    when a limit is crossed and one when it clears, never one per sample.
+    """
+
+    def __init__(self, rules: Optional[Iterable[AlertRule]] = None,
+                 path: Optional[str] = None, history: int = 200):
+        self.path = Path(path) if path else None
+        if rules is None:
+            rules = self._load() if self.path and self.path.exists() else default_rules()
+        self._compiled = CompiledRules(rules)
+        self._states: Dict[Tuple[str, str], List[_GroupState]] = {}
+        self._recent: Dict[str, Deque[JobEvent]] = {}
+        self.history = history
+        self._lock = Lock()
+
+    # Rule management
+
+    @property
+    def rules(self) -> List[AlertRule]:
+        return list(self._compiled.rules.values())
+
+    def set_rules(self, rules: Iterable[AlertRule]) -> None:
+        """Recompile; alert states restart from inactive"""
+        compiled = CompiledRules(rules)
+        with self._lock:
+            self._compiled = compiled
+            self._states.clear()
+        self._save()
+
+    def upsert_rule(self, rule: AlertRule) -> None:
+        rules = {r.id: r for r in self.rules}
+        rules[rule.id] = rule
+        self.set_rules(rules.values())
+
+    def delete_rule(self, rule_id: str) -> bool:
+        rules = {r.id: r for r in self.rules}
+        if rules.pop(rule_id, None) is None:
+            return False
+        self.set_rules(rules.values())
+        return True
+
+    def _load(self) -> List[AlertRule]:
+        return [AlertRule(**data) for data in json.loads(self.path.read_text())]
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps([asdict(r) for r in self.rules], indent=2))
+        tmp.replace(self.path)
+
+    # Evaluation
+
+    def _job_states(self, job_id: str, channel: str, groups: List[_RuleGroup]) -> List[_GroupState]:
+        key = (job_id, channel)
+        states = self._states.get(key)
+        if states is None:
+            states = []
+            for group in groups:
+                index = group.rule_index(job_id)
+                states.append(_GroupState(index, np.zeros(index.size, dtype=bool)))
+            self._states[key] = states
+        return states
+
+    def evaluate(self, job_id: Any, channel: str, timestamps: np.ndarray, values: np.ndarray) -> List[JobEvent]:
+        """Evaluate a batch of increasing samples (epoch ms) of one channel"""
+        groups = self._compiled.channels.get(channel)
+        if not groups or timestamps.size == 0:
+            return []
+        job_id = str(job_id)
+        events: List[JobEvent] = []
+        with self._lock:
+            for group, state in zip(groups, self._job_states(job_id, channel, groups)):
+                if state.rules.size == 0:
+                    continue
+                x = _derived(group, state, timestamps, values)
+                active, changed = _transitions(
+                    x, group.above[state.rules], group.below[state.rules], group.deadband[state.rules], state.active
+                )
+                state.active = active[-1].copy()
+                for row, column in zip(*np.nonzero(changed)):
+                    rule = group.rules[state.rules[column]]
+                    events.append(self._event(job_id, rule, bool(active[row, column]),
+                                              int(timestamps[row]), float(x[row])))
+        return events
+
+    def observe(self, job_id: Any, values: Dict[str, Optional[float]],
+                timestamp: Optional[datetime] = None) -> List[JobEvent]:
+        """Evaluate one record (e.g. a fluid check)"""
+        return self.observe_many(job_id, [timestamp], {channel: [value] for channel, value in values.items()})
+
+    def observe_many(self, job_id: Any, timestamps: Sequence[Optional[datetime]],
+                     columns: Dict[str, Sequence[Optional[float]]]) -> List[JobEvent]:
+        """
+        Evaluate records given as columns, in time order. Missing values are
+        skipped; on a channel with windowed rules, so are records not newer
+        than the latest sample already in the window.
+        """
+        now = datetime.utcnow()
+        ms = np.array([_record_millis(when or now) for when in timestamps], dtype=np.int64)
+        order = np.argsort(ms, kind="stable")
+        ms = ms[order]
+        events = []
+        for channel, values in columns.items():
+            v = np.array([np.nan if value is None else float(value) for value in values], dtype=np.float64)[order]
+            keep = ~np.isnan(v)
+            # Keep the last record per timestamp
+            keep[:-1] &= ms[1:] != ms[:-1]
+            state = self._states.get((str(job_id), channel))
+            if state is not None:
+                latest = max((s.tail_t[-1] for s in state if s.tail_t.size), default=None)
+                if latest is not None:
+                    keep &= ms > latest
+            events.extend(self.evaluate(job_id, channel, ms[keep], v[keep]))
+        return events
+
+    def _event(self, job_id: str, rule: AlertRule, active: bool, ms: int, value: float) -> JobEvent:
+        limit = rule.above if rule.above is not None and (rule.below is None or value > rule.below) else rule.below
+        event = JobEvent(
+            type=EventType.ALERT,
+            job_id=UUID(job_id),
+            user_id="system",
+            timestamp=_event_time(ms),
+            data={
+                "rule_id": rule.id,
+                "channel": rule.channel,
+                "kind": rule.kind,
+                "state": "active" if active else "cleared",
+                "value": None if np.isnan(value) else value,
+                "limit": limit,
+                "severity": rule.severity,
+                "message": rule.message or f"{rule.channel} {rule.kind} outside limit",
+            }
+        )
+        self._recent.setdefault(job_id, deque(maxlen=self.history)).append(event)
+        return event
+
+    def active_alerts(self, job_id: Any) -> List[Dict[str, Any]]:
+        """Rules currently in alert for a job"""
+        job_id = str(job_id)
+        found = []
+        with self._lock:
+            for (job, channel), states in self._states.items():
+                if job != job_id:
+                    continue
+                for group, state in zip(self._compiled.channels.get(channel, []), states):
+                    for column in np.flatnonzero(state.active):
+                        rule = group.rules[state.rules[column]]
+                        found.append({"rule_id": rule.id, "channel": channel, "severity": rule.severity})
+        return found
+
+    def recent(self, job_id: Any) -> List[JobEvent]:
+        return list(self._recent.get(str(job_id), ()))
+
+    async def observe_wellbore(self, db: Any, wellbore_id: str, values: Dict[str, Optional[float]],
+                               timestamp: Optional[datetime] = None) -> List[JobEvent]:
+        """Evaluate a wellbore record (fluid check, pump rates) for every open job on its well and publish"""
+        columns = {channel: [value] for channel, value in values.items()}
+        return await self.observe_wellbore_many(db, wellbore_id, [timestamp], columns)
+
+    async def observe_wellbore_many(self, db: Any, wellbore_id: str, timestamps: Sequence[Optional[datetime]],
+                                    columns: Dict[str, Sequence[Optional[float]]]) -> List[JobEvent]:
+        """observe_wellbore for a batch of records given as columns"""
+        from app.crud.jobsystem.job import crud_job
+        events = []
+        try:
+            for job in await crud_job.get_open_by_wellbore(db=db, wellbore_id=wellbore_id):
+                events.extend(self.observe_many(job.id, timestamps, columns))
+        except Exception as e:
+            # Alerting never fails the write that triggered it
+            logger.error(f"Error evaluating alerts for wellbore {wellbore_id}: {str(e)}")
+        await self.publish(events)
+        return events
+
+    async def publish(self, events: Iterable[JobEvent]) -> None:
+        """Send alerts to the job's WebSocket clients"""
+        from app.core.ws.manager import job_update_manager
+        for event in events:
+            try:
+                await job_update_manager.broadcast_to_job(event.job_id, event)
+            except Exception as e:
+                logger.error(f"Error broadcasting alert {event.data.get('rule_id')}: {str(e)}")
+
+_alert_engine: Optional[AlertEngine] = None
+
+def get_alert_engine() -> AlertEngine:
+    """Process-wide alert engine; rules persist in ALERT_RULES_PATH"""
+    global _alert_engine
+    if _alert_engine is None:
+        _alert_engine = AlertEngine(path=settings.ALERT_RULES_PATH or str(OFFLINE_DB_DIR / "alert_rules.json"))
+    return _alert_engine
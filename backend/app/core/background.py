@@ -1,27 +1,47 @@
 # app/core/background.py
 from uuid import UUID
 from fastapi import BackgroundTasks
-from typing import List
-import smtplib
-from email.mime.text import MIMEText
+from typing import Dict, List
 from app.core.config import settings
-from app.models.session import UserSession
+from app.core.mail_queue import get_mail_queue
+from app.models.authsystem.user_session import UserSession
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 
 
 async def notify_job_creation(job_id: UUID):
     """Send notifications when a new job is created"""
-    # Email notification
-    message = MIMEText(f"New job created with ID: {job_id}")
-    message["Subject"] = "New Job Created"
-    message["From"] = settings.MAIL_FROM
-    message["To"] = settings.NOTIFICATION_EMAIL
+    # Email notification, delivered by the mail queue worker
+    if not settings.NOTIFICATION_EMAIL:
+        return
+    get_mail_queue().enqueue(
+        [settings.NOTIFICATION_EMAIL],
+        subject="New Job Created",
+        body=f"New job created with ID: {job_id}",
+        subtype="plain"
+    )
 
-    with smtplib.SMTP(settings.MAIL_SERVER, settings.MAIL_PORT) as server:
-        server.starttls()
-        server.login(settings.MAIL_USERNAME, settings.MAIL_PASSWORD)
-        server.send_message(message)
+async def send_daily_report_reminders(crew: List[Dict], job_name: str, job_id: UUID, report_date: str, due_time: str):
+    """
+    Queue a daily report reminder for every crew member.
+    Each member dict needs 'email' and 'name'; the whole fan-out goes out over one SMTP connection.
+    """
+    report_link = f"{settings.FRONTEND_URL}/jobs/{job_id}/daily-reports/new"
+    return get_mail_queue().enqueue_template(
+        "daily_report_reminder.html",
+        subject=f"Daily Report Reminder - {job_name}",
+        messages=[
+            (member["email"], {
+                "user_name": member.get("name") or "",
+                "job_name": job_name,
+                "job_id": str(job_id),
+                "report_date": report_date,
+                "due_time": due_time,
+                "report_link": report_link
+            })
+            for member in crew
+        ]
+    )
         
 # async def cleanup_expired_sessions(db: Session):
 #     """Cleanup expired and inactive sessions"""
@@ -29,4 +49,4 @@ async def notify_job_creation(job_id: UUID):
 #     db.query(UserSession).filter(
 #         (UserSession.expires_at < now) |
 #         (UserSession.last_activity < now - timedelta(minutes=30))
-#     ).update({"is_active": False
\ No newline at end of file
+#     ).update({"is_active": False
@@ -50,6 +50,32 @@ class Settings(BaseSettings):
     MAIL_USE_CREDENTIALS: bool = Field(True, description="Use SMTP authentication")
     MAIL_VALIDATE_CERTS: bool = Field(True, description="Validate SSL certificates")
     
+    NOTIFICATION_EMAIL: str = Field("", description="Recipient for job notifications")
+
+    # Outbound mail queue
+    MAIL_QUEUE_PATH: str = Field("", description="SQLite file for the outbound mail queue (empty = offline_db/mail_queue.db)")
+    MAIL_QUEUE_BATCH_SIZE: int = Field(50, description="Messages sent per SMTP batch")
+    MAIL_QUEUE_MAX_ATTEMPTS: int = Field(5, description="Delivery attempts before a message is marked dead")
+
+    # Durable task queue
+    TASK_QUEUE_PATH: str = Field("", description="SQLite file for the task queue (empty = offline_db/task_queue.db)")
+    TASK_WORKERS: int = Field(2, description="Number of task worker processes")
+
+    # Sensor time-series store
+    TIMESERIES_PATH: str = Field("", description="Directory for sensor time series (empty = offline_db/timeseries)")
+    TIMESERIES_CHUNK_SIZE: int = Field(4096, description="Points per compressed chunk")
+    TIMESERIES_RETENTION_DAYS: float = Field(0, description="Drop chunks older than this many days (0 = keep)")
+    TIMESERIES_MAX_JOB_BYTES: int = Field(0, description="Drop a job's oldest chunks above this size (0 = no limit)")
+    TIMESERIES_RETENTION_INTERVAL: float = Field(3600, description="Seconds between retention passes of the ingestion worker (0 = off)")
+
+    # Sensor ingestion buffer
+    INGEST_MAX_BUFFERED_SAMPLES: int = Field(1_000_000, description="Samples held in memory before ingestion applies backpressure")
+    INGEST_BATCH_SAMPLES: int = Field(50_000, description="Pending samples that trigger an early flush")
+    INGEST_FLUSH_INTERVAL: float = Field(0.5, description="Seconds between ingestion flushes")
+
+    # Operational-limit alerts
+    ALERT_RULES_PATH: str = Field("", description="JSON file of alert rules (empty = offline_db/alert_rules.json)")
+
     # Frontend URL
     FRONTEND_URL: str = Field("http://localhost:3000", description="Frontend application URL")
 
@@ -60,6 +86,10 @@ class Settings(BaseSettings):
     def SQLITE_DATABASE_URL(self) -> str:
         return f"sqlite:///{self.SQLITE_DB_PATH}"
     
+    # Rate limiting
+    RATE_LIMIT_REDIS_URL: str = Field("", description="Redis URL for shared rate limit counters (empty = per-process)")
+    RATE_LIMIT_MAX_KEYS: int = Field(100000, description="Maximum tracked client/route keys per process")
+
     # Additional Settings
     DEBUG: bool = Field(False, description="Debug mode")
 
@@ -7,6 +7,7 @@ from app.crud.authsystem.user import crud_user
 from app.schemas.authsystem.user_session import UserSessionResponse
 from app.schemas.authsystem.user import UserResponse
 from app.db.session import SessionLocal
+from app.core.revocation import token_revocation
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
@@ -22,6 +23,14 @@ async def get_current_session(
     db: Session = Depends(get_db)
 ) -> UserSessionResponse:
     """Get current active session from access token"""
+    # Revoked tokens are rejected before any database round trip
+    if token_revocation.is_revoked(token):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token"
+        )
+    # Tokens that pass still need their session row: it carries the user id, and
+    # is_active covers sessions ended without a revocation (e.g. expiry sweeps)
     session = await crud_user_session.get_by_token(db=db, token=token)
     if not session or not session.is_active:
         raise HTTPException(
@@ -0,0 +1,173 @@
+# core/domain/calculations/buckling.py
+
+from typing import Any, Dict, List, Optional, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+import numpy as np
+
+from .hydraulics import Conduit
+from .torque_drag import STEEL_DENSITY_PPG, StringComponent
+
+STEEL_YOUNGS_MODULUS = 30e6  # psi
+
+NONE = 0
+SINUSOIDAL = 1
+HELICAL = 2
+BUCKLING_MODES = {SINUSOIDAL: "sinusoidal", HELICAL: "helical"}
+
+@dataclass(frozen=True)
+class SectionProperties:
+    """Cross-section properties of a tubular (in, in2, in4)"""
+    outer_diameter: float
+    inner_diameter: float
+    steel_area: float
+    outer_area: float
+    inner_area: float
+    moment_of_inertia: float
+
+@lru_cache(maxsize=1024)
+def section_properties(outer_diameter: float, inner_diameter: float) -> SectionProperties:
+    """Section properties for an OD/ID pair, computed once per distinct tubular size"""
+    outer_area = np.pi / 4 * outer_diameter ** 2
+    inner_area = np.pi / 4 * inner_diameter ** 2
+    return SectionProperties(
+        outer_diameter=outer_diameter,
+        inner_diameter=inner_diameter,
+        steel_area=outer_area - inner_area,
+        outer_area=outer_area,
+        inner_area=inner_area,
+        moment_of_inertia=np.pi / 64 * (outer_diameter ** 4 - inner_diameter ** 4),
+    )
+
+@dataclass
+class BucklingResult:
+    md: np.ndarray
+    compression: np.ndarray  # lbf, positive in compression
+    sinusoidal_limit: np.ndarray  # lbf
+    helical_limit: np.ndarray  # lbf
+    status: np.ndarray  # NONE, SINUSOIDAL or HELICAL per station
+    intervals: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "md": self.md.tolist(),
+            "compression": self.compression.tolist(),
+            "sinusoidal_limit": self.sinusoidal_limit.tolist(),
+            "helical_limit": self.helical_limit.tolist(),
+            "status": [BUCKLING_MODES.get(int(s), "none") for s in self.status],
+            "intervals": self.intervals,
+        }
+
+class BucklingEngine:
+    """
+    Sinusoidal and helical buckling check at every survey station.
+
+    Critical loads use Dawson-Paslay (sinusoidal) and Chen-Cheatham
+    (helical, 2 sqrt 2 x sinusoidal) in inclined hole, floored by the
+    Lubinski vertical-hole limits 2.55 and 5.55 (E I w^2)^(1/3). Axial
+    load comes from a torque & drag tension profile when one is given,
+    otherwise from the buoyed weight below each station less WOB.
+    """
+
+    def __init__(self,
+                 md: Sequence[float],
+                 inclination: Sequence[float],
+                 string: Sequence[StringComponent],
+                 hole: Sequence[Conduit],
+                 mud_weight: float,
+                 bit_depth: Optional[float] = None,
+                 youngs_modulus: float = STEEL_YOUNGS_MODULUS):
+        if not string:
+            raise ValueError("String has no components")
+        hole = [c for c in hole if c.bottom > c.top and c.inner_diameter > 0]
+        if not hole:
+            raise ValueError("No hole or casing geometry")
+        self.md = np.asarray(md, dtype=float)
+        self.inc = np.radians(np.asarray(inclination, dtype=float))
+        self.bit_depth = self.md[-1] if bit_depth is None else float(bit_depth)
+        self.mud_weight = mud_weight
+
+        # Which component sits at each station, counted up from the bit
+        above_bit = self.bit_depth - self.md
+        self.in_string = above_bit >= 0
+        cumulative = np.cumsum([c.length for c in string])
+        index = np.minimum(np.searchsorted(cumulative, np.maximum(above_bit, 0.0), side="right"), len(string) - 1)
+
+        sections = [section_properties(c.outer_diameter, c.inner_diameter) for c in string]
+        self.outer_diameter = np.array([s.outer_diameter for s in sections])[index]
+        self.moment_of_inertia = np.array([s.moment_of_inertia for s in sections])[index]
+        buoyancy = 1.0 - mud_weight / STEEL_DENSITY_PPG
+        self.buoyed_weight = np.array([c.weight for c in string], dtype=float)[index] * buoyancy  # lb/ft
+
+        tops = np.array([c.top for c in hole])
+        bottoms = np.array([c.bottom for c in hole])
+        ids = np.array([c.inner_diameter for c in hole])
+        covering = (self.md[:, None] >= tops) & (self.md[:, None] <= bottoms)
+        hole_diameter = np.where(covering, ids, np.inf).min(axis=1)
+        self.hole_diameter = np.where(np.isfinite(hole_diameter), hole_diameter, ids[np.argmax(bottoms)])
+
+        self.sinusoidal_limit, self.helical_limit = self._critical_loads(youngs_modulus)
+
+    def _critical_loads(self, youngs_modulus: float):
+        ei = youngs_modulus * self.moment_of_inertia
+        w = self.buoyed_weight / 12.0  # lb/in
+        clearance = (self.hole_diameter - self.outer_diameter) / 2.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inclined = np.where(clearance > 0, 2.0 * np.sqrt(ei * w * np.sin(self.inc) / clearance), np.inf)
+        vertical = np.cbrt(ei * w ** 2)
+        sinusoidal = np.maximum(inclined, 2.55 * vertical)
+        helical = np.maximum(2.0 * np.sqrt(2.0) * inclined, 5.55 * vertical)
+        return sinusoidal, helical
+
+    def static_tension(self, weight_on_bit: float = 0.0) -> np.ndarray:
+        """Frictionless axial tension at each station: buoyed weight below it less WOB"""
+        seg_length = np.diff(self.md)
+        inc_avg = (self.inc[:-1] + self.inc[1:]) / 2
+        seg_covered = np.clip(self.bit_depth - self.md[:-1], 0.0, seg_length)
+        seg_weight = self.buoyed_weight[:-1] * seg_covered * np.cos(inc_avg)
+        below = np.concatenate((np.cumsum(seg_weight[::-1])[::-1], [0.0]))
+        return np.where(self.in_string, below - weight_on_bit, 0.0)
+
+    def check(self,
+              tension: Optional[np.ndarray] = None,
+              weight_on_bit: float = 0.0) -> BucklingResult:
+        """
+        Buckling status per station. tension may be (stations,) or carry
+        extra axes (e.g. friction factors x modes); the worst case is used.
+        """
+        if tension is None:
+            tension = self.static_tension(weight_on_bit)
+        tension = np.asarray(tension, dtype=float)
+        if tension.ndim > 1:
+            tension = tension.reshape(tension.shape[0], -1).min(axis=1)
+        compression = np.where(self.in_string, -tension, 0.0)
+
+        status = np.where(
+            compression > self.helical_limit, HELICAL,
+            np.where(compression > self.sinusoidal_limit, SINUSOIDAL, NONE)
+        )
+        return BucklingResult(
+            md=self.md,
+            compression=compression,
+            sinusoidal_limit=self.sinusoidal_limit,
+            helical_limit=self.helical_limit,
+            status=status,
+            intervals=self._intervals(status, compression),
+        )
+
+    def _intervals(self, status: np.ndarray, compression: np.ndarray) -> List[Dict[str, Any]]:
+        """Merge consecutive stations with the same non-zero status into depth intervals"""
+        intervals: List[Dict[str, Any]] = []
+        changes = np.flatnonzero(np.diff(status)) + 1
+        starts = np.concatenate(([0], changes))
+        ends = np.concatenate((changes, [status.size]))
+        for start, end in zip(starts, ends):
+            if status[start] == NONE:
+                continue
+            intervals.append({
+                "top": float(self.md[start]),
+                "bottom": float(self.md[end - 1]),
+                "mode": BUCKLING_MODES[int(status[start])],
+                "max_compression": float(compression[start:end].max()),
+            })
+        return intervals
@@ -0,0 +1,248 @@
+# core/domain/calculations/casing_design.py
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+import numpy as np
+
+from .hydraulics import tubular_kind
+from .pressure_profile import GradientInput, gradient_arrays
+from .torque_drag import STEEL_DENSITY_PPG
+from ...units.validators import OperationalLimits
+
+DEFAULT_GRID_STEP = 50.0  # ft
+GAS_GRADIENT = 0.1  # psi/ft
+SEAWATER_GRADIENT = 0.465  # psi/ft, external backup when no pore profile is given
+LOAD_CASES = ("burst", "collapse", "tension")
+
+@dataclass
+class CasingString:
+    """A casing or liner string with its ratings; missing ratings skip that check"""
+    name: str
+    top: float  # ft MD, hanger for liners
+    bottom: float  # ft MD, shoe
+    outer_diameter: float  # in
+    inner_diameter: float  # in
+    weight: float  # lb/ft in air
+    burst: Optional[float] = None  # psi
+    collapse: Optional[float] = None  # psi
+    yield_strength: Optional[float] = None  # psi, minimum yield of the pipe body
+
+    @property
+    def steel_area(self) -> float:
+        return np.pi / 4 * (self.outer_diameter ** 2 - self.inner_diameter ** 2)
+
+def casing_strings_from_tubulars(tubulars: Iterable[Any]) -> List[CasingString]:
+    """Casing and liner rows as design strings, shallowest shoe first"""
+    rows = sorted(
+        (t for t in tubulars if tubular_kind(t) in ("casing", "liner") and t.end_depth),
+        key=lambda t: t.end_depth
+    )
+    return [
+        CasingString(
+            name=f"{tubular_kind(t).title()} {t.outer_diameter or 0:g}in",
+            top=t.start_depth or 0.0,
+            bottom=t.end_depth,
+            outer_diameter=t.outer_diameter or 0.0,
+            inner_diameter=t.inner_diameter or 0.0,
+            weight=t.weight or 0.0,
+            burst=t.burst,
+            collapse=t.collapse,
+            yield_strength=t.yield_strength,
+        )
+        for t in rows
+    ]
+
+def _json_floats(values: np.ndarray) -> List[Optional[float]]:
+    return [float(v) if np.isfinite(v) else None for v in values]
+
+@dataclass
+class CasingDesignResult:
+    md: np.ndarray
+    tvd: np.ndarray
+    strings: List[str]
+    covered: np.ndarray  # (strings, depths)
+    loads: Dict[str, np.ndarray]  # load case -> (strings, depths), psi or lbf
+    safety_factors: Dict[str, np.ndarray]  # load case -> (strings, depths); inf without load, nan without rating
+    minimum_safety_factor: float
+    violations: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        strings = []
+        for s, name in enumerate(self.strings):
+            mask = self.covered[s]
+            entry: Dict[str, Any] = {
+                "name": name,
+                "md": self.md[mask].tolist(),
+                "tvd": self.tvd[mask].tolist(),
+            }
+            for case in LOAD_CASES:
+                sf = self.safety_factors[case][s, mask]
+                entry[f"{case}_load"] = self.loads[case][s, mask].tolist()
+                entry[f"{case}_safety_factor"] = _json_floats(sf)
+                rated = sf[~np.isnan(sf)]
+                entry[f"min_{case}_safety_factor"] = float(rated.min()) if rated.size and np.isfinite(rated.min()) else None
+            strings.append(entry)
+        return {
+            "minimum_safety_factor": self.minimum_safety_factor,
+            "strings": strings,
+            "violations": self.violations,
+        }
+
+class CasingDesignEngine:
+    """
+    Burst, collapse and tension safety factors versus depth for every
+    casing/liner string of a wellbore.
+
+    All strings share one depth grid, so every load case is a single
+    (strings x depths) array operation:
+      burst     gas to surface from the shoe, limited by fracture pressure
+                at the shoe, against a pore-pressure (or seawater) backup
+      collapse  full evacuation against the collapse gradient (pore
+                pressure, then mud hydrostatic, when none is given)
+      tension   buoyed hanging weight below each depth, rated at
+                yield strength x steel area
+    Pressures are gradient(md) x TVD, as in the pressure profile engine.
+    """
+
+    def __init__(self,
+                 strings: Sequence[CasingString],
+                 mud_weight: float,
+                 trajectory: Optional[Tuple[Sequence[float], Sequence[float]]] = None,
+                 grid_step: float = DEFAULT_GRID_STEP):
+        self.strings = [s for s in strings if s.bottom > s.top]
+        if not self.strings:
+            raise ValueError("No casing or liner strings to check")
+        self.mud_weight = mud_weight
+
+        tops = np.array([s.top for s in self.strings], dtype=float)
+        bottoms = np.array([s.bottom for s in self.strings], dtype=float)
+        grid = np.arange(0.0, bottoms.max() + grid_step, grid_step)
+        self.md = np.union1d(grid[grid <= bottoms.max()], np.concatenate((tops, bottoms)))
+        self.trajectory = None
+        if trajectory is not None:
+            md, tvd = (np.asarray(v, dtype=float) for v in trajectory)
+            if md.size >= 2:
+                self.trajectory = (md, tvd)
+        self.tvd = self._tvd(self.md)
+
+        self.tops = tops[:, None]
+        self.bottoms = bottoms[:, None]
+        self.covered = (self.md[None, :] >= self.tops) & (self.md[None, :] <= self.bottoms)
+        self.shoe_tvd = self._tvd(bottoms)[:, None]
+
+    def _tvd(self, md: np.ndarray) -> np.ndarray:
+        """TVD by interpolation along the survey, extrapolated on the last tangent"""
+        if self.trajectory is None:
+            return md
+        survey_md, survey_tvd = self.trajectory
+        tvd = np.interp(md, survey_md, survey_tvd)
+        span = survey_md[-1] - survey_md[-2]
+        slope = (survey_tvd[-1] - survey_tvd[-2]) / span if span > 0 else 1.0
+        return np.where(md > survey_md[-1], survey_tvd[-1] + (md - survey_md[-1]) * slope, tvd)
+
+    @staticmethod
+    def _rating(values: Sequence[Optional[float]]) -> np.ndarray:
+        return np.array([v if v else np.nan for v in values], dtype=float)[:, None]
+
+    def _pressure(self, profile: Optional[Tuple[np.ndarray, np.ndarray]], md: np.ndarray, tvd: np.ndarray):
+        if profile is None:
+            return None
+        return np.interp(md, *profile) * tvd
+
+    def loads(self,
+              pore_gradient: Optional[GradientInput] = None,
+              fracture_gradient: Optional[GradientInput] = None,
+              collapse_gradient: Optional[GradientInput] = None,
+              gas_gradient: float = GAS_GRADIENT) -> Dict[str, np.ndarray]:
+        """Burst and collapse (psi) and tension (lbf) loads, (strings, depths)"""
+        pore = gradient_arrays(pore_gradient)
+        frac = gradient_arrays(fracture_gradient)
+        collapse = gradient_arrays(collapse_gradient)
+        shoe_md = self.bottoms[:, 0]
+        shoe_tvd = self.shoe_tvd[:, 0]
+        mud = 0.052 * self.mud_weight
+
+        # Burst: gas column from the shoe, the shoe pressure capped by the formation
+        shoe_pressure = self._pressure(frac, shoe_md, shoe_tvd)
+        if shoe_pressure is None:
+            shoe_pressure = self._pressure(pore, shoe_md, shoe_tvd)
+        if shoe_pressure is None:
+            shoe_pressure = mud * shoe_tvd
+        internal = np.maximum(shoe_pressure[:, None] - gas_gradient * (self.shoe_tvd - self.tvd[None, :]), 0.0)
+        backup = self._pressure(pore, self.md, self.tvd)
+        if backup is None:
+            backup = SEAWATER_GRADIENT * self.tvd
+        burst = internal - backup[None, :]
+
+        # Collapse: evacuated string against the formation outside
+        external = self._pressure(collapse, self.md, self.tvd)
+        if external is None:
+            external = self._pressure(pore, self.md, self.tvd)
+        if external is None:
+            external = mud * self.tvd
+        collapse_load = np.broadcast_to(external, self.covered.shape).copy()
+
+        # Tension: buoyed weight hanging below each depth
+        buoyancy = 1.0 - self.mud_weight / STEEL_DENSITY_PPG
+        weight = np.array([s.weight for s in self.strings], dtype=float)[:, None] * buoyancy
+        tension = weight * np.maximum(self.shoe_tvd - self.tvd[None, :], 0.0)
+
+        return {
+            "burst": np.where(self.covered, burst, 0.0),
+            "collapse": np.where(self.covered, collapse_load, 0.0),
+            "tension": np.where(self.covered, tension, 0.0),
+        }
+
+    def check(self,
+              pore_gradient: Optional[GradientInput] = None,
+              fracture_gradient: Optional[GradientInput] = None,
+              collapse_gradient: Optional[GradientInput] = None,
+              minimum_safety_factor: float = OperationalLimits.MIN_CASING_SAFETY_FACTOR.value,
+              gas_gradient: float = GAS_GRADIENT) -> CasingDesignResult:
+        """Safety factors for every string and load case, and the intervals below the minimum"""
+        loads = self.loads(pore_gradient, fracture_gradient, collapse_gradient, gas_gradient)
+        ratings = {
+            "burst": self._rating([s.burst for s in self.strings]),
+            "collapse": self._rating([s.collapse for s in self.strings]),
+            "tension": self._rating([s.yield_strength for s in self.strings])
+                       * np.array([s.steel_area for s in self.strings])[:, None],
+        }
+
+        safety_factors: Dict[str, np.ndarray] = {}
+        violations: List[Dict[str, Any]] = []
+        for case in LOAD_CASES:
+            load = loads[case]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                sf = np.where(load > 0, ratings[case] / load, np.inf)
+            sf = np.where(np.isnan(ratings[case]), np.nan, sf)
+            safety_factors[case] = sf
+            failing = self.covered & (sf < minimum_safety_factor)
+            for s in np.flatnonzero(failing.any(axis=1)):
+                violations.extend(self._intervals(s, case, failing[s], sf[s]))
+
+        return CasingDesignResult(
+            md=self.md,
+            tvd=self.tvd,
+            strings=[s.name for s in self.strings],
+            covered=self.covered,
+            loads=loads,
+            safety_factors=safety_factors,
+            minimum_safety_factor=minimum_safety_factor,
+            violations=violations,
+        )
+
+    def _intervals(self, s: int, case: str, failing: np.ndarray, sf: np.ndarray) -> List[Dict[str, Any]]:
+        """Merge consecutive failing depths of one string and load case into intervals"""
+        edges = np.diff(np.concatenate(([0], failing.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        return [
+            {
+                "string": self.strings[s].name,
+                "load": case,
+                "top": float(self.md[start]),
+                "bottom": float(self.md[end - 1]),
+                "min_safety_factor": float(sf[start:end].min()),
+            }
+            for start, end in zip(starts, ends)
+        ]
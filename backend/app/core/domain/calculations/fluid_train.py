@@ -0,0 +1,156 @@
+# core/domain/calculations/fluid_train.py
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass
+import numpy as np
+
+from .volumes import WellVolumes
+
+@dataclass
+class FluidStage:
+    """One fluid of the pumped train (spacer, slurry, displacement, ...)"""
+    name: str
+    volume: float  # bbl
+    density: float  # ppg
+
+@dataclass
+class FluidTrainResult:
+    pumped_volume: np.ndarray  # bbl, (steps,)
+    strokes: Optional[np.ndarray]  # (steps,)
+    stages: List[str]
+    string_depth: np.ndarray  # ft, leading edge of each stage inside the string, nan elsewhere, (steps, stages)
+    annulus_depth: np.ndarray  # ft, leading edge of each stage in the annulus, nan elsewhere
+    string_hydrostatic: np.ndarray  # psi at the bit, inside the string
+    annulus_hydrostatic: np.ndarray  # psi at the bit, in the annulus
+
+    @property
+    def differential(self) -> np.ndarray:
+        """Annulus minus string hydrostatic at the bit; the surface pressure needed to hold the U-tube"""
+        return self.annulus_hydrostatic - self.string_hydrostatic
+
+    def to_dict(self) -> Dict[str, Any]:
+        def listed(values: np.ndarray):
+            return [[None if np.isnan(v) else float(v) for v in row] for row in values.T]
+
+        return {
+            "pumped_volume": self.pumped_volume.tolist(),
+            "strokes": None if self.strokes is None else self.strokes.tolist(),
+            "stages": self.stages,
+            "string_depth": dict(zip(self.stages, listed(self.string_depth))),
+            "annulus_depth": dict(zip(self.stages, listed(self.annulus_depth))),
+            "string_hydrostatic": self.string_hydrostatic.tolist(),
+            "annulus_hydrostatic": self.annulus_hydrostatic.tolist(),
+            "differential": self.differential.tolist(),
+        }
+
+class FluidTrainSimulator:
+    """
+    Tracks a train of fluids pumped down the string and up the annulus.
+
+    The flow path is a single volume coordinate: 0 at surface in the string,
+    the string volume at the bit, the string plus annular volume back at
+    surface. Depth along each leg is the inverse of the cumulative capacity
+    arrays (piecewise linear per section), so every interface at every step
+    is one interpolation, and hydrostatics are sums over the fluid spans.
+    """
+
+    def __init__(self,
+                 volumes: WellVolumes,
+                 initial_density: float,
+                 trajectory: Optional[Tuple[Sequence[float], Sequence[float]]] = None):
+        bit_depth = volumes.string_bottom
+        if bit_depth <= 0:
+            raise ValueError("No string in the well")
+        self.initial_density = initial_density
+        self.bit_depth = bit_depth
+
+        # Cumulative volume at every section edge down to the bit
+        edges = np.concatenate((volumes.top, [volumes.sections.total_depth]))
+        edges = np.unique(np.clip(edges, 0.0, bit_depth))
+        self._edges = edges
+        self._string_cumulative = volumes.volume_to(edges, "string")
+        self._annulus_cumulative = volumes.volume_to(edges, "annulus")
+        self.string_volume = float(self._string_cumulative[-1])
+        self.annulus_volume = float(self._annulus_cumulative[-1])
+
+        self.trajectory = None
+        if trajectory is not None:
+            md, tvd = (np.asarray(v, dtype=float) for v in trajectory)
+            if md.size:
+                self.trajectory = (md, tvd)
+        self._bit_tvd = float(self.tvd(np.array([bit_depth]))[0])
+
+    def tvd(self, md: np.ndarray) -> np.ndarray:
+        if self.trajectory is None:
+            return md
+        return np.interp(md, *self.trajectory)
+
+    def _string_depth(self, position: np.ndarray) -> np.ndarray:
+        """Depth of a path position inside the string (0 ... string volume)"""
+        return np.interp(position, self._string_cumulative, self._edges)
+
+    def _annulus_depth(self, position: np.ndarray) -> np.ndarray:
+        """Depth of a path position in the annulus (string volume ... path end)"""
+        above_bit = self.annulus_volume - (position - self.string_volume)
+        return np.interp(above_bit, self._annulus_cumulative, self._edges)
+
+    def simulate(self,
+                 stages: Sequence[FluidStage],
+                 pumped_volume: Optional[Sequence[float]] = None,
+                 steps: int = 1000,
+                 output_per_stroke: Optional[float] = None) -> FluidTrainResult:
+        """
+        Interface depths and hydrostatics at each pumped volume. The last
+        stage keeps being pumped once its nominal volume is reached.
+        """
+        if not stages:
+            raise ValueError("Fluid train has no stages")
+        path_end = self.string_volume + self.annulus_volume
+        if pumped_volume is None:
+            total = max(sum(s.volume for s in stages), self.string_volume)
+            pumped_volume = np.linspace(0.0, total, steps)
+        pumped = np.asarray(pumped_volume, dtype=float)
+
+        start = np.concatenate(([0.0], np.cumsum([s.volume for s in stages])[:-1]))
+        density = np.array([s.density for s in stages], dtype=float)
+
+        # Path span of each stage per step: leading edge at P - start, trailing at P - end
+        lead = pumped[:, None] - start[None, :]
+        trail = np.concatenate((lead[:, 1:], np.full((pumped.size, 1), 0.0)), axis=1)
+        trail = np.maximum(trail, 0.0)
+        lead = np.maximum(lead, 0.0)
+
+        in_string = (lead > 0) & (lead <= self.string_volume)
+        in_annulus = (lead > self.string_volume) & (lead <= path_end)
+        string_depth = np.where(in_string, self._string_depth(np.minimum(lead, self.string_volume)), np.nan)
+        annulus_depth = np.where(in_annulus, self._annulus_depth(np.clip(lead, self.string_volume, path_end)), np.nan)
+
+        string_hydrostatic = self._hydrostatic(lead, trail, density, 0.0, self.string_volume, self._string_tvd_at)
+        annulus_hydrostatic = self._hydrostatic(lead, trail, density, self.string_volume, path_end, self._annulus_tvd_at)
+
+        return FluidTrainResult(
+            pumped_volume=pumped,
+            strokes=None if not output_per_stroke else pumped / output_per_stroke,
+            stages=[s.name for s in stages],
+            string_depth=string_depth,
+            annulus_depth=annulus_depth,
+            string_hydrostatic=string_hydrostatic,
+            annulus_hydrostatic=annulus_hydrostatic,
+        )
+
+    def _string_tvd_at(self, position: np.ndarray) -> np.ndarray:
+        return self.tvd(self._string_depth(position))
+
+    def _annulus_tvd_at(self, position: np.ndarray) -> np.ndarray:
+        return self.tvd(self._annulus_depth(position))
+
+    def _hydrostatic(self, lead, trail, density, low, high, tvd_at) -> np.ndarray:
+        """Pressure (psi) at the bit from the fluids occupying one leg [low, high] of the path"""
+        lo = np.clip(trail, low, high)
+        hi = np.clip(lead, low, high)
+        span_tvd = np.abs(tvd_at(hi) - tvd_at(lo))
+        pumped_fluid = 0.052 * (density[None, :] * span_tvd).sum(axis=1)
+        # Whatever the train has not reached yet is the original fluid
+        leg_tvd = self._bit_tvd
+        filled_tvd = span_tvd.sum(axis=1)
+        return pumped_fluid + 0.052 * self.initial_density * np.maximum(leg_tvd - filled_tvd, 0.0)
@@ -0,0 +1,146 @@
+# core/domain/calculations/friction.py
+
+from typing import Callable, Dict, Union
+import time
+import numpy as np
+
+# Shared friction-factor correlations. Every function accepts scalars or NumPy
+# arrays of Reynolds numbers and returns the Darcy friction factor as an array;
+# fanning_friction_factor() is the Darcy value / 4 used by the oilfield
+# pressure-loss formulas (dP = f rho v^2 L / (25.8 d) for pipe flow).
+
+ArrayLike = Union[float, np.ndarray]
+
+LAMINAR_LIMIT = 2100.0
+TURBULENT_LIMIT = 4000.0
+
+LAMINAR = 0
+TRANSITIONAL = 1
+TURBULENT = 2
+
+def _inputs(reynolds: ArrayLike, relative_roughness: ArrayLike):
+    re = np.asarray(reynolds, dtype=float)
+    rr = np.asarray(relative_roughness, dtype=float)
+    return np.broadcast_arrays(re, rr)
+
+def flow_regime(reynolds: ArrayLike) -> np.ndarray:
+    """LAMINAR, TRANSITIONAL or TURBULENT for each Reynolds number"""
+    re = np.asarray(reynolds, dtype=float)
+    return np.where(re < LAMINAR_LIMIT, LAMINAR, np.where(re < TURBULENT_LIMIT, TRANSITIONAL, TURBULENT))
+
+def laminar(reynolds: ArrayLike) -> np.ndarray:
+    """Hagen-Poiseuille, f = 64 / Re"""
+    re = np.asarray(reynolds, dtype=float)
+    with np.errstate(divide="ignore"):
+        return 64.0 / re
+
+def haaland(reynolds: ArrayLike, relative_roughness: ArrayLike = 0.0) -> np.ndarray:
+    """Haaland (1983) explicit approximation to Colebrook"""
+    re, rr = _inputs(reynolds, relative_roughness)
+    return (-1.8 * np.log10((rr / 3.7) ** 1.11 + 6.9 / re)) ** -2
+
+def swamee_jain(reynolds: ArrayLike, relative_roughness: ArrayLike = 0.0) -> np.ndarray:
+    """Swamee-Jain (1976) explicit approximation to Colebrook"""
+    re, rr = _inputs(reynolds, relative_roughness)
+    return 0.25 / np.log10(rr / 3.7 + 5.74 / re ** 0.9) ** 2
+
+def serghides(reynolds: ArrayLike, relative_roughness: ArrayLike = 0.0) -> np.ndarray:
+    """Serghides (1984) Steffensen-accelerated approximation to Colebrook"""
+    re, rr = _inputs(reynolds, relative_roughness)
+    a = -2.0 * np.log10(rr / 3.7 + 12.0 / re)
+    b = -2.0 * np.log10(rr / 3.7 + 2.51 * a / re)
+    c = -2.0 * np.log10(rr / 3.7 + 2.51 * b / re)
+    return (a - (b - a) ** 2 / (c - 2.0 * b + a)) ** -2
+
+def colebrook(reynolds: ArrayLike,
+              relative_roughness: ArrayLike = 0.0,
+              tolerance: float = 1e-10,
+              max_iterations: int = 10) -> np.ndarray:
+    """
+    Colebrook-White solved by vectorized Newton iteration on x = 1/sqrt(f),
+    starting from Swamee-Jain. Converges in 2-3 iterations for Re > 4000.
+    """
+    re, rr = _inputs(reynolds, relative_roughness)
+    a = rr / 3.7
+    b = 2.51 / re
+    x = 1.0 / np.sqrt(swamee_jain(re, rr))
+    for _ in range(max_iterations):
+        inner = a + b * x
+        residual = x + 2.0 * np.log10(inner)
+        derivative = 1.0 + 2.0 * b / (np.log(10.0) * inner)
+        step = residual / derivative
+        x = x - step
+        if np.all(np.abs(step) <= tolerance * np.abs(x)):
+            break
+    return x ** -2
+
+CORRELATIONS: Dict[str, Callable[..., np.ndarray]] = {
+    "colebrook": colebrook,
+    "haaland": haaland,
+    "swamee_jain": swamee_jain,
+    "serghides": serghides,
+}
+
+def darcy_friction_factor(reynolds: ArrayLike,
+                          relative_roughness: ArrayLike = 0.0,
+                          method: str = "colebrook") -> np.ndarray:
+    """
+    Darcy friction factor over all regimes: 64/Re below 2100, the chosen
+    turbulent correlation above 4000, and linear interpolation in Re between
+    the two in the transitional band. Re <= 0 gives 0.
+    """
+    if method not in CORRELATIONS:
+        raise ValueError(f"Unknown friction factor method: {method}")
+    re, rr = _inputs(reynolds, relative_roughness)
+    shape = re.shape
+    re = np.atleast_1d(re)
+    rr = np.atleast_1d(rr)
+    f = np.zeros_like(re)
+
+    flowing = re > 0
+    lam = flowing & (re < LAMINAR_LIMIT)
+    f[lam] = laminar(re[lam])
+
+    turb = re >= TURBULENT_LIMIT
+    if np.any(turb):
+        f[turb] = CORRELATIONS[method](re[turb], rr[turb])
+
+    trans = (re >= LAMINAR_LIMIT) & ~turb
+    if np.any(trans):
+        f_lam = laminar(LAMINAR_LIMIT)
+        f_turb = CORRELATIONS[method](np.full(np.count_nonzero(trans), TURBULENT_LIMIT), rr[trans])
+        weight = (re[trans] - LAMINAR_LIMIT) / (TURBULENT_LIMIT - LAMINAR_LIMIT)
+        f[trans] = f_lam + weight * (f_turb - f_lam)
+    return f.reshape(shape)
+
+def fanning_friction_factor(reynolds: ArrayLike,
+                            relative_roughness: ArrayLike = 0.0,
+                            method: str = "colebrook") -> np.ndarray:
+    """Fanning friction factor (Darcy / 4) over all regimes"""
+    return darcy_friction_factor(reynolds, relative_roughness, method) / 4.0
+
+def benchmark(size: int = 100000, repeat: int = 5, seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """
+    Accuracy and speed of each correlation against a tightly converged
+    Colebrook solution over random turbulent (Re, e/D) pairs.
+    """
+    rng = np.random.default_rng(seed)
+    re = 10 ** rng.uniform(np.log10(TURBULENT_LIMIT), 8, size)
+    rr = 10 ** rng.uniform(-6, -1.5, size)
+    reference = colebrook(re, rr, tolerance=1e-14, max_iterations=50)
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name, func in CORRELATIONS.items():
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            value = func(re, rr)
+            timings.append(time.perf_counter() - start)
+        error = np.abs(value - reference) / reference
+        results[name] = {
+            "max_relative_error": float(error.max()),
+            "mean_relative_error": float(error.mean()),
+            "best_time_ms": min(timings) * 1000.0,
+            "ns_per_value": min(timings) / size * 1e9,
+        }
+    return results
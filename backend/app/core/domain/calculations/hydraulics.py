@@ -0,0 +1,294 @@
+# core/domain/calculations/hydraulics.py
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+import numpy as np
+
+from .friction import LAMINAR_LIMIT, fanning_friction_factor
+from .rheology import rheology_service
+
+# Oilfield units throughout: depths in ft, diameters in in, flow rate in gpm,
+# density in ppg, viscosity in cP, yield point in lbf/100ft2, pressure in psi.
+
+# Surface equipment constants (Bourgoyne et al.) for combination cases 1-4
+SURFACE_EQUIPMENT_CONSTANTS = {1: 2.5e-4, 2: 9.6e-5, 3: 5.3e-5, 4: 4.2e-5}
+
+@dataclass
+class Conduit:
+    """A tubular or open-hole interval, as used to build flow geometry"""
+    name: str
+    top: float
+    bottom: float
+    inner_diameter: float
+    outer_diameter: float = 0.0
+
+@dataclass
+class PipeSection:
+    """Flow path inside the string"""
+    name: str
+    top: float
+    bottom: float
+    inner_diameter: float
+
+    @property
+    def length(self) -> float:
+        return self.bottom - self.top
+
+@dataclass
+class AnnulusSection:
+    """Annular flow path between the hole/outer string and the string"""
+    name: str
+    top: float
+    bottom: float
+    hole_diameter: float
+    pipe_diameter: float
+
+    @property
+    def length(self) -> float:
+        return self.bottom - self.top
+
+@dataclass
+class FluidProperties:
+    """Bingham plastic fluid description (yield_point = 0 gives a Newtonian fluid)"""
+    density: float
+    plastic_viscosity: float
+    yield_point: float = 0.0
+
+    @classmethod
+    def from_fluid(cls, fluid: Any) -> "FluidProperties":
+        """Build from a Fluid report row, using the Bingham fit of its viscometer readings"""
+        fit = rheology_service.fit_fluid(fluid)
+        return cls(
+            density=fluid.mud_weight,
+            plastic_viscosity=max(fit.plastic_viscosity, 0.0),
+            yield_point=max(fit.yield_point, 0.0)
+        )
+
+@dataclass
+class BitNozzles:
+    """Bit nozzle configuration"""
+    total_flow_area: float  # in2
+    discharge_coefficient: float = 0.95
+
+    @classmethod
+    def from_sizes(cls, sizes_32nds: Sequence[float], discharge_coefficient: float = 0.95) -> "BitNozzles":
+        """Build from nozzle sizes in 32nds of an inch"""
+        sizes = np.asarray(sizes_32nds, dtype=float) / 32.0
+        return cls(float(np.sum(np.pi * sizes ** 2 / 4)), discharge_coefficient)
+
+class FlowGeometry:
+    """
+    Circulating system geometry: string sections from surface to the bit and
+    annular sections from the bit back to surface, stored as arrays so that
+    losses for every section can be computed in one pass.
+    """
+
+    def __init__(self, pipe_sections: List[PipeSection], annulus_sections: List[AnnulusSection]):
+        self.pipe_sections = sorted(pipe_sections, key=lambda s: s.top)
+        self.annulus_sections = sorted(annulus_sections, key=lambda s: s.top)
+
+        self.pipe_id = np.array([s.inner_diameter for s in self.pipe_sections], dtype=float)
+        self.pipe_length = np.array([s.length for s in self.pipe_sections], dtype=float)
+        self.annulus_dh = np.array([s.hole_diameter for s in self.annulus_sections], dtype=float)
+        self.annulus_dp = np.array([s.pipe_diameter for s in self.annulus_sections], dtype=float)
+        self.annulus_length = np.array([s.length for s in self.annulus_sections], dtype=float)
+
+    @property
+    def bit_depth(self) -> float:
+        return max((s.bottom for s in self.pipe_sections), default=0.0)
+
+def conduits_from_tubulars(tubulars: Iterable[Any],
+                           total_depth: Optional[float] = None) -> Tuple[List[Conduit], List[Conduit]]:
+    """
+    Split Tubular rows into outer conduits (casing, liner, open hole) and
+    string components. Open hole is added below the deepest shoe down to
+    total_depth, or to the bottom of the string if not given.
+    """
+    tubulars = list(tubulars)
+    outer: List[Conduit] = []
+    string: List[Conduit] = []
+    for tubular in tubulars:
+        kind = tubular_kind(tubular)
+        top = tubular.start_depth or 0.0
+        bottom = tubular.end_depth or 0.0
+        if kind == "drillstring":
+            string.append(Conduit(
+                getattr(tubular, "component_type", None) or "String",
+                top, bottom, tubular.inner_diameter or 0.0, tubular.outer_diameter or 0.0
+            ))
+        elif kind == "open_hole":
+            hole = tubular.oh_diameter or tubular.open_hole_size or tubular.inner_diameter or 0.0
+            outer.append(Conduit("Open Hole", top, bottom, hole, hole))
+        else:
+            outer.append(Conduit(
+                kind.title(), top, bottom, tubular.inner_diameter or 0.0, tubular.outer_diameter or 0.0
+            ))
+    # Open hole below the deepest shoe
+    if total_depth is None:
+        total_depth = max((c.bottom for c in string), default=0.0)
+    shoe = max((c.bottom for c in outer), default=0.0)
+    if total_depth > shoe:
+        deepest = max(
+            (t for t in tubulars if tubular_kind(t) in ("casing", "liner")),
+            key=lambda t: t.end_depth or 0.0,
+            default=None
+        )
+        hole = (deepest.oh_diameter or deepest.open_hole_size) if deepest is not None else None
+        if hole:
+            outer.append(Conduit("Open Hole", shoe, total_depth, hole, hole))
+    return outer, string
+
+def tubular_kind(tubular: Any) -> str:
+    """Classify a Tubular row as casing, liner, drillstring or open_hole"""
+    for value in (
+        type(tubular).__name__,
+        getattr(tubular, "tubulartype_id", None),
+        getattr(getattr(tubular, "tubular_type", None), "tubular_type", None),
+    ):
+        if not isinstance(value, str):
+            continue
+        value = value.lower().replace(" ", "_")
+        if "drill" in value or value in ("string", "bha", "workstring"):
+            return "drillstring"
+        if "liner" in value:
+            return "liner"
+        if "hole" in value:
+            return "open_hole"
+        if "casing" in value:
+            return "casing"
+    return "casing"
+
+@dataclass
+class HydraulicsResult:
+    flow_rates: np.ndarray
+    pipe_losses: np.ndarray  # (pipe sections, rates)
+    annular_losses: np.ndarray  # (annulus sections, rates)
+    bit_loss: np.ndarray
+    surface_loss: np.ndarray
+    pipe_sections: List[PipeSection] = field(default_factory=list)
+    annulus_sections: List[AnnulusSection] = field(default_factory=list)
+
+    @property
+    def total_pipe_loss(self) -> np.ndarray:
+        return self.pipe_losses.sum(axis=0)
+
+    @property
+    def total_annular_loss(self) -> np.ndarray:
+        return self.annular_losses.sum(axis=0)
+
+    @property
+    def standpipe_pressure(self) -> np.ndarray:
+        return self.surface_loss + self.total_pipe_loss + self.bit_loss + self.total_annular_loss
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "flow_rates": self.flow_rates.tolist(),
+            "standpipe_pressure": self.standpipe_pressure.tolist(),
+            "surface_loss": self.surface_loss.tolist(),
+            "pipe_loss": self.total_pipe_loss.tolist(),
+            "bit_loss": self.bit_loss.tolist(),
+            "annular_loss": self.total_annular_loss.tolist(),
+            "pipe_sections": [
+                {"name": s.name, "top": s.top, "bottom": s.bottom, "loss": loss.tolist()}
+                for s, loss in zip(self.pipe_sections, self.pipe_losses)
+            ],
+            "annulus_sections": [
+                {"name": s.name, "top": s.top, "bottom": s.bottom, "loss": loss.tolist()}
+                for s, loss in zip(self.annulus_sections, self.annular_losses)
+            ],
+        }
+
+class HydraulicsEngine:
+    """
+    Vectorized circulating-system hydraulics (Bingham plastic model).
+
+    All section losses are evaluated for a whole vector of flow rates at
+    once, giving (sections x rates) arrays for pressure-vs-rate curves.
+    """
+
+    def __init__(self,
+                 geometry: FlowGeometry,
+                 fluid: FluidProperties,
+                 nozzles: Optional[BitNozzles] = None,
+                 surface_case: int = 3,
+                 relative_roughness: float = 0.0):
+        self.geometry = geometry
+        self.fluid = fluid
+        self.nozzles = nozzles
+        self.surface_constant = SURFACE_EQUIPMENT_CONSTANTS[surface_case]
+        self.relative_roughness = relative_roughness
+
+    def _gradient(self, velocity, diameter, reynolds_const, apparent_const,
+                  laminar_v_const, laminar_y_const, turbulent_const) -> np.ndarray:
+        """Frictional pressure gradient (psi/ft) for a (sections x rates) velocity grid"""
+        pv = self.fluid.plastic_viscosity
+        yp = self.fluid.yield_point
+        rho = self.fluid.density
+        with np.errstate(divide="ignore", invalid="ignore"):
+            apparent_viscosity = pv + apparent_const * yp * diameter / velocity
+            reynolds = reynolds_const * rho * velocity * diameter / apparent_viscosity
+            laminar = pv * velocity / (laminar_v_const * diameter ** 2) + yp / (laminar_y_const * diameter)
+            friction = fanning_friction_factor(np.nan_to_num(reynolds), self.relative_roughness)
+            turbulent = friction * rho * velocity ** 2 / (turbulent_const * diameter)
+            gradient = np.where(
+                reynolds < LAMINAR_LIMIT, laminar, np.maximum(laminar, turbulent)
+            )
+        return np.where(velocity > 0, gradient, 0.0)
+
+    def pipe_losses(self, flow_rates: np.ndarray) -> np.ndarray:
+        """Friction loss per string section, shape (pipe sections, rates)"""
+        q = np.atleast_1d(np.asarray(flow_rates, dtype=float))
+        d = self.geometry.pipe_id[:, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            velocity = np.where(d > 0, q[None, :] / (2.448 * d ** 2), 0.0)
+        gradient = self._gradient(velocity, d, 928.0, 6.66, 1500.0, 225.0, 25.8)
+        return gradient * self.geometry.pipe_length[:, None]
+
+    def annular_losses(self, flow_rates: np.ndarray) -> np.ndarray:
+        """Friction loss per annular section, shape (annulus sections, rates)"""
+        q = np.atleast_1d(np.asarray(flow_rates, dtype=float))
+        dh = self.geometry.annulus_dh[:, None]
+        dp = self.geometry.annulus_dp[:, None]
+        gap = dh - dp
+        with np.errstate(divide="ignore", invalid="ignore"):
+            velocity = np.where(gap > 0, q[None, :] / (2.448 * (dh ** 2 - dp ** 2)), 0.0)
+        gradient = self._gradient(velocity, gap, 757.0, 5.0, 1000.0, 200.0, 21.1)
+        return gradient * self.geometry.annulus_length[:, None]
+
+    def annular_gradient(self, velocity: np.ndarray, hole_diameter: np.ndarray,
+                         pipe_diameter: np.ndarray) -> np.ndarray:
+        """Annular friction gradient (psi/ft) for any broadcastable grid of mean velocities (ft/s)"""
+        gap = np.asarray(hole_diameter, dtype=float) - np.asarray(pipe_diameter, dtype=float)
+        return self._gradient(np.abs(velocity), gap, 757.0, 5.0, 1000.0, 200.0, 21.1)
+
+    def bit_loss(self, flow_rates: np.ndarray) -> np.ndarray:
+        """Pressure drop across the bit nozzles"""
+        q = np.atleast_1d(np.asarray(flow_rates, dtype=float))
+        if self.nozzles is None or self.nozzles.total_flow_area <= 0:
+            return np.zeros_like(q)
+        cd = self.nozzles.discharge_coefficient
+        return self.fluid.density * q ** 2 / (12031.0 * cd ** 2 * self.nozzles.total_flow_area ** 2)
+
+    def surface_loss(self, flow_rates: np.ndarray) -> np.ndarray:
+        """Surface equipment loss (standpipe, hose, swivel, kelly/top drive)"""
+        q = np.atleast_1d(np.asarray(flow_rates, dtype=float))
+        return (self.surface_constant * self.fluid.density ** 0.8 * q ** 1.8
+                * self.fluid.plastic_viscosity ** 0.2)
+
+    def calculate(self, flow_rates: Sequence[float]) -> HydraulicsResult:
+        """Full standpipe-pressure breakdown for a vector of flow rates"""
+        q = np.atleast_1d(np.asarray(flow_rates, dtype=float))
+        return HydraulicsResult(
+            flow_rates=q,
+            pipe_losses=self.pipe_losses(q),
+            annular_losses=self.annular_losses(q),
+            bit_loss=self.bit_loss(q),
+            surface_loss=self.surface_loss(q),
+            pipe_sections=self.geometry.pipe_sections,
+            annulus_sections=self.geometry.annulus_sections,
+        )
+
+    def ecd_at_bit(self, flow_rates: Sequence[float], tvd: float) -> np.ndarray:
+        """Equivalent circulating density at the bit for each flow rate"""
+        annular = self.annular_losses(np.asarray(flow_rates, dtype=float)).sum(axis=0)
+        return self.fluid.density + annular / (0.052 * tvd)
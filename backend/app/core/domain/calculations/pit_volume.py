@@ -0,0 +1,281 @@
+# core/domain/calculations/pit_volume.py
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from threading import Lock
+import numpy as np
+
+from app.models.events import EventType, JobEvent
+
+CUBIC_FT_PER_BBL = 5.615
+STRAPPING_POINTS = 257  # levels per table, bottom and top included
+
+def tank_shape(shape: Optional[str]) -> str:
+    """Normalize the free-text Tank.shape column"""
+    value = (shape or "").lower().replace(" ", "_").replace("-", "_")
+    if "vertical" in value:
+        return "vertical_cylinder"
+    if "cyl" in value or "round" in value:
+        return "cylindrical"
+    if "trap" in value or "slop" in value:
+        return "trapezoidal"
+    return "rectangular"
+
+@dataclass(frozen=True)
+class StrappingTable:
+    """Volume (bbl) at evenly spaced levels (ft) from the tank bottom"""
+    shape: str
+    height: float
+    volumes: np.ndarray  # float32, STRAPPING_POINTS values
+
+    @property
+    def capacity(self) -> float:
+        return float(self.volumes[-1])
+
+    @property
+    def levels(self) -> np.ndarray:
+        return np.linspace(0.0, self.height, self.volumes.size)
+
+    def volume(self, level: float) -> float:
+        """Volume at one level: an index and a linear blend on the uniform grid"""
+        position = min(max(level, 0.0), self.height) / self.height * (self.volumes.size - 1)
+        index = min(int(position), self.volumes.size - 2)
+        fraction = position - index
+        return float(self.volumes[index] * (1.0 - fraction) + self.volumes[index + 1] * fraction)
+
+    def volume_array(self, levels: Any) -> np.ndarray:
+        return np.interp(np.asarray(levels, dtype=float), self.levels, self.volumes.astype(float))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "shape": self.shape,
+            "height": self.height,
+            "capacity": self.capacity,
+            "levels": self.levels.tolist(),
+            "volumes": self.volumes.astype(float).tolist(),
+        }
+
+@lru_cache(maxsize=512)
+def strapping_table(shape: str,
+                    length: float,
+                    height: float,
+                    width_top: float = 0.0,
+                    width_bottom: float = 0.0,
+                    points: int = STRAPPING_POINTS) -> StrappingTable:
+    """Strapping table from tank dimensions (ft), built once per distinct tank"""
+    shape = tank_shape(shape)
+    if height <= 0:
+        raise ValueError("Tank height must be positive")
+    h = np.linspace(0.0, height, points)
+    if shape == "cylindrical":
+        # Horizontal cylinder, diameter = height
+        r = height / 2.0
+        area = r ** 2 * np.arccos(np.clip((r - h) / r, -1.0, 1.0)) - (r - h) * np.sqrt(np.maximum(2 * r * h - h ** 2, 0.0))
+        cubic_ft = length * area
+    elif shape == "vertical_cylinder":
+        diameter = width_top or width_bottom or length
+        cubic_ft = np.pi / 4 * diameter ** 2 * h
+    else:
+        top = width_top or width_bottom
+        bottom = (width_bottom or width_top) if shape == "trapezoidal" else top
+        # Width grows linearly with level; integrate the trapezoid
+        cubic_ft = length * (bottom * h + (top - bottom) * h ** 2 / (2 * height))
+    volumes = (cubic_ft / CUBIC_FT_PER_BBL).astype(np.float32)
+    volumes.setflags(write=False)
+    return StrappingTable(shape, float(height), volumes)
+
+def tank_strapping_table(tank: Any) -> StrappingTable:
+    """Strapping table for a Tank row; scaled to the rated capacity when only that and height are known"""
+    height = tank.height or 0.0
+    shape = tank_shape(tank.shape)
+    has_width = bool(tank.width_top or tank.width_bottom)
+    if tank.length and (has_width or shape == "cylindrical"):
+        return strapping_table(
+            shape, float(tank.length), float(height),
+            float(tank.width_top or 0.0), float(tank.width_bottom or 0.0)
+        )
+    if tank.capacity and height:
+        # Unknown plan dimensions: a prism of the rated capacity
+        side = float(np.sqrt(tank.capacity * CUBIC_FT_PER_BBL / height))
+        return strapping_table("rectangular", side, float(height), side, side)
+    raise ValueError(f"Tank {getattr(tank, 'tank_name', None) or tank.id} has no usable dimensions")
+
+class PitVolumeTotalizer:
+    """
+    Running active-system volume for all tanks of a rig.
+
+    Each reading replaces one tank's volume and adjusts the running total
+    by the difference, so a reading costs one table lookup regardless of
+    the number of tanks. Gain/loss is measured against a baseline, taken
+    automatically once every active tank has reported a level; an ALERT
+    event is emitted when it crosses a threshold and re-armed once it has
+    come back inside half the threshold.
+    """
+
+    def __init__(self,
+                 tables: Dict[str, StrappingTable],
+                 job_id: Any,
+                 active: Optional[Iterable[str]] = None,
+                 gain_threshold: float = 10.0,
+                 loss_threshold: float = 10.0,
+                 user_id: str = "system",
+                 names: Optional[Dict[str, str]] = None):
+        self.tables = dict(tables)
+        self.job_id = job_id
+        self.user_id = user_id
+        self.names = names or {}
+        self.active = set(self.tables if active is None else active)
+        self.gain_threshold = gain_threshold
+        self.loss_threshold = loss_threshold
+        self.volumes: Dict[str, float] = {tank_id: 0.0 for tank_id in self.tables}
+        self.levels: Dict[str, float] = {tank_id: 0.0 for tank_id in self.tables}
+        self.active_volume = 0.0
+        self.total_volume = 0.0
+        self.baseline: Optional[float] = None
+        self.seen: Set[str] = set()  # tanks with at least one reading
+        self.last_reading: Optional[datetime] = None
+        self._alarm: Optional[str] = None
+        self._lock = Lock()
+
+    @property
+    def gain_loss(self) -> float:
+        return 0.0 if self.baseline is None else self.active_volume - self.baseline
+
+    @property
+    def pending_tanks(self) -> Set[str]:
+        """Active tanks still without a reading; the baseline waits for them"""
+        return self.active - self.seen
+
+    def _rebase(self) -> None:
+        # An unread tank counts as empty, so a baseline taken before it reports would be off by its volume
+        self.baseline = None if self.pending_tanks else self.active_volume
+        self._alarm = None
+
+    def reset_baseline(self, volume: Optional[float] = None) -> None:
+        with self._lock:
+            if volume is None:
+                self._rebase()
+            else:
+                self.baseline = volume
+                self._alarm = None
+
+    def set_active(self, tank_ids: Iterable[str]) -> None:
+        """Change the active system (e.g. a pit lined up or isolated) and rebase gain/loss"""
+        with self._lock:
+            self.active = set(tank_ids) & set(self.tables)
+            self.active_volume = sum(self.volumes[t] for t in self.active)
+            self._rebase()
+
+    def ingest(self, tank_id: str, level: float, timestamp: Optional[datetime] = None) -> Optional[JobEvent]:
+        """Apply one level reading (ft); returns an ALERT event when a threshold is crossed"""
+        table = self.tables.get(tank_id)
+        if table is None:
+            raise KeyError(f"Unknown tank: {tank_id}")
+        volume = table.volume(level)
+        with self._lock:
+            delta = volume - self.volumes[tank_id]
+            self.volumes[tank_id] = volume
+            self.levels[tank_id] = level
+            self.total_volume += delta
+            if tank_id in self.active:
+                self.active_volume += delta
+            self.last_reading = timestamp or datetime.utcnow()
+            self.seen.add(tank_id)
+            if self.baseline is None:
+                if not self.pending_tanks:
+                    self._rebase()
+                return None
+            return self._check(tank_id)
+
+    def ingest_many(self, readings: Sequence[Any]) -> List[JobEvent]:
+        """Apply (tank_id, level[, timestamp]) readings in order"""
+        events = []
+        for reading in readings:
+            event = self.ingest(*reading)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def _check(self, tank_id: str) -> Optional[JobEvent]:
+        gain_loss = self.active_volume - self.baseline
+        if self._alarm == "gain" and gain_loss < self.gain_threshold / 2:
+            self._alarm = None
+        elif self._alarm == "loss" and gain_loss > -self.loss_threshold / 2:
+            self._alarm = None
+        if self._alarm is None:
+            if gain_loss >= self.gain_threshold:
+                self._alarm = "gain"
+                return self._event("pit_gain", gain_loss, self.gain_threshold, tank_id)
+            if gain_loss <= -self.loss_threshold:
+                self._alarm = "loss"
+                return self._event("pit_loss", gain_loss, self.loss_threshold, tank_id)
+        return None
+
+    def _event(self, kind: str, gain_loss: float, threshold: float, tank_id: str) -> JobEvent:
+        return JobEvent(
+            type=EventType.ALERT,
+            job_id=self.job_id,
+            user_id=self.user_id,
+            timestamp=self.last_reading,
+            data={
+                "alert": kind,
+                "gain_loss": round(gain_loss, 2),
+                "threshold": threshold,
+                "active_volume": round(self.active_volume, 2),
+                "tank_id": tank_id,
+                "tank_name": self.names.get(tank_id),
+            }
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "active_volume": self.active_volume,
+                "total_volume": self.total_volume,
+                "baseline": self.baseline,
+                "gain_loss": self.gain_loss,
+                "active_tanks": sorted(self.active),
+                "pending_tanks": sorted(self.pending_tanks),
+                "tanks": [
+                    {
+                        "tank_id": tank_id,
+                        "tank_name": self.names.get(tank_id),
+                        "level": self.levels[tank_id],
+                        "volume": self.volumes[tank_id],
+                        "active": tank_id in self.active,
+                    }
+                    for tank_id in self.tables
+                ],
+                "last_reading": self.last_reading,
+            }
+
+class PitVolumeService:
+    """One totalizer per rig, kept in memory for the streaming readings"""
+
+    def __init__(self):
+        self._totalizers: Dict[str, PitVolumeTotalizer] = {}
+        self._lock = Lock()
+
+    def get(self, rig_id: str) -> Optional[PitVolumeTotalizer]:
+        return self._totalizers.get(rig_id)
+
+    def start(self, rig_id: str, tanks: Sequence[Any], job_id: Any, **options: Any) -> PitVolumeTotalizer:
+        """(Re)start the totalizer for a rig from its Tank rows"""
+        totalizer = PitVolumeTotalizer(
+            {t.id: tank_strapping_table(t) for t in tanks},
+            job_id,
+            names={t.id: t.tank_name for t in tanks},
+            **options
+        )
+        with self._lock:
+            self._totalizers[rig_id] = totalizer
+        return totalizer
+
+    def stop(self, rig_id: str) -> None:
+        with self._lock:
+            self._totalizers.pop(rig_id, None)
+
+# Create global instance
+pit_volume_service = PitVolumeService()
@@ -0,0 +1,257 @@
+# core/domain/calculations/pressure_profile.py
+
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+import hashlib
+import numpy as np
+
+from .hydraulics import FluidProperties, HydraulicsEngine
+
+GradientInput = Union[Any, Tuple[Sequence[float], Sequence[float]]]
+
+def minimum_curvature(md: Sequence[float],
+                      inclination: Sequence[float],
+                      azimuth: Sequence[float],
+                      origin: Optional[Tuple[float, float, float]] = None
+                      ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    TVD, north, east (ft) and DLS (deg/100ft) at every survey station by
+    minimum curvature; angles in degrees. origin is the (tvd, north, east)
+    of the first station, by default reached in a straight line from surface.
+    """
+    md = np.asarray(md, dtype=float)
+    if md.size == 0:
+        return md, md, md, md
+    inc = np.radians(np.asarray(inclination, dtype=float))
+    azi = np.radians(np.asarray(azimuth, dtype=float))
+    i1, i2, a1, a2 = inc[:-1], inc[1:], azi[:-1], azi[1:]
+    cos_dogleg = np.cos(i2 - i1) - np.sin(i1) * np.sin(i2) * (1 - np.cos(a2 - a1))
+    dogleg = np.arccos(np.clip(cos_dogleg, -1.0, 1.0))
+    curved = dogleg > 1e-7
+    rf = np.where(curved, 2 / np.where(curved, dogleg, 1.0) * np.tan(dogleg / 2), 1.0)
+    course = np.diff(md)
+    half = course / 2 * rf
+    dtvd = half * (np.cos(i1) + np.cos(i2))
+    dnorth = half * (np.sin(i1) * np.cos(a1) + np.sin(i2) * np.cos(a2))
+    deast = half * (np.sin(i1) * np.sin(a1) + np.sin(i2) * np.sin(a2))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dls = np.where(course > 0, np.degrees(dogleg) * 100 / course, 0.0)
+    if origin is None:
+        # The first station is taken as straight from surface
+        origin = (md[0] * np.cos(inc[0]),
+                  md[0] * np.sin(inc[0]) * np.cos(azi[0]),
+                  md[0] * np.sin(inc[0]) * np.sin(azi[0]))
+    tvd0, north0, east0 = origin
+    return (
+        np.concatenate(([tvd0], tvd0 + np.cumsum(dtvd))),
+        np.concatenate(([north0], north0 + np.cumsum(dnorth))),
+        np.concatenate(([east0], east0 + np.cumsum(deast))),
+        np.concatenate(([0.0], dls)),
+    )
+
+def minimum_curvature_tvd(md: Sequence[float],
+                          inclination: Sequence[float],
+                          azimuth: Sequence[float]) -> np.ndarray:
+    """TVD (ft) at every survey station by minimum curvature; angles in degrees"""
+    return minimum_curvature(md, inclination, azimuth)[0]
+
+def gradient_arrays(profile: Optional[GradientInput]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """(md ft, gradient psi/ft) arrays from a GradientProfile or an (md, gradient) pair"""
+    if profile is None:
+        return None
+    if hasattr(profile, "arrays"):
+        # Sorted profile: reuse its cached arrays
+        data = profile.arrays()
+        if data.shape[0] == 0:
+            return None
+        return data[:, 0], data[:, 1]
+    points = getattr(profile, "points", None)
+    if points is not None:
+        if not points:
+            return None
+        md = np.array([p.md.to_unit("ft") for p in points], dtype=float)
+        gradient = np.array([p.pressure_gradient.to_unit("psi/ft") for p in points], dtype=float)
+    else:
+        md, gradient = (np.asarray(values, dtype=float) for values in profile)
+        if md.size == 0:
+            return None
+    order = np.argsort(md, kind="stable")
+    return md[order], gradient[order]
+
+def geometry_version(*row_groups: Iterable[Any]) -> str:
+    """
+    Version key for a wellbore's geometry: changes whenever any of the given
+    rows (tubulars, survey stations, ...) is added, removed or updated.
+    """
+    digest = hashlib.sha1()
+    for rows in row_groups:
+        for row_id, updated_at in sorted(
+            (str(getattr(row, "id", "")), str(getattr(row, "updated_at", ""))) for row in rows
+        ):
+            digest.update(f"{row_id}:{updated_at};".encode())
+        digest.update(b"|")
+    return digest.hexdigest()
+
+@dataclass
+class PressureProfile:
+    """Pressures along the well at every survey station"""
+    md: np.ndarray
+    tvd: np.ndarray
+    hydrostatic: np.ndarray  # psi
+    annular_friction: np.ndarray  # psi
+    mud_weight: float
+    flow_rate: float
+    pore_pressure: Optional[np.ndarray] = None
+    fracture_pressure: Optional[np.ndarray] = None
+    violations: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def circulating(self) -> np.ndarray:
+        return self.hydrostatic + self.annular_friction
+
+    @property
+    def ecd(self) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.tvd > 0, self.circulating / (0.052 * self.tvd), self.mud_weight)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "flow_rate": self.flow_rate,
+            "mud_weight": self.mud_weight,
+            "md": self.md.tolist(),
+            "tvd": self.tvd.tolist(),
+            "hydrostatic": self.hydrostatic.tolist(),
+            "annular_friction": self.annular_friction.tolist(),
+            "circulating": self.circulating.tolist(),
+            "ecd": self.ecd.tolist(),
+            "pore_pressure": None if self.pore_pressure is None else self.pore_pressure.tolist(),
+            "fracture_pressure": None if self.fracture_pressure is None else self.fracture_pressure.tolist(),
+            "violations": self.violations,
+        }
+
+class PressureProfileEngine:
+    """
+    Hydrostatic, circulating and ECD profiles along the trajectory.
+
+    Annular friction from the hydraulics engine is spread over each annular
+    section as a constant gradient and accumulated down to every station in
+    one (stations x sections) pass. The pressure arrays are cached per
+    (geometry version, fluid, rate); pore/frac comparisons are cheap and are
+    redone on each call.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Hashable, Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _fluid_key(fluid: FluidProperties) -> Tuple[float, float, float]:
+        return (fluid.density, fluid.plastic_viscosity, fluid.yield_point)
+
+    def _pressures(self,
+                   engine: HydraulicsEngine,
+                   flow_rate: float,
+                   md: np.ndarray,
+                   tvd: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        geometry = engine.geometry
+        losses = engine.annular_losses(np.array([flow_rate]))[:, 0]
+        tops = np.array([s.top for s in geometry.annulus_sections], dtype=float)
+        lengths = geometry.annulus_length
+        with np.errstate(divide="ignore", invalid="ignore"):
+            gradients = np.where(lengths > 0, losses / lengths, 0.0)
+
+        # Friction between surface and each station (no circulation below the bit)
+        covered = np.clip(md[:, None] - tops[None, :], 0.0, lengths[None, :])
+        friction = covered @ gradients if tops.size else np.zeros_like(md)
+        hydrostatic = 0.052 * engine.fluid.density * tvd
+        return md, tvd, hydrostatic, friction
+
+    def calculate(self,
+                  engine: HydraulicsEngine,
+                  flow_rate: float,
+                  md: Sequence[float],
+                  tvd: Sequence[float],
+                  version: Optional[str] = None,
+                  pore_gradient: Optional[GradientInput] = None,
+                  fracture_gradient: Optional[GradientInput] = None,
+                  margin: float = 0.0) -> PressureProfile:
+        """
+        Build the profile and flag stations where the circulating pressure is
+        below pore pressure + margin or above fracture pressure - margin (psi).
+        """
+        key = None
+        if version is not None:
+            key = (version, self._fluid_key(engine.fluid), round(float(flow_rate), 6))
+
+        cached = None
+        if key is not None:
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+        if cached is None:
+            cached = self._pressures(
+                engine, float(flow_rate), np.asarray(md, dtype=float), np.asarray(tvd, dtype=float)
+            )
+            if key is not None:
+                with self._lock:
+                    self.misses += 1
+                    self._cache[key] = cached
+                    if len(self._cache) > self.max_entries:
+                        self._cache.popitem(last=False)
+
+        md_arr, tvd_arr, hydrostatic, friction = cached
+        profile = PressureProfile(
+            md=md_arr, tvd=tvd_arr, hydrostatic=hydrostatic, annular_friction=friction,
+            mud_weight=engine.fluid.density, flow_rate=float(flow_rate)
+        )
+        self._check_margins(profile, pore_gradient, fracture_gradient, margin)
+        return profile
+
+    @staticmethod
+    def _check_margins(profile: PressureProfile,
+                       pore_gradient: Optional[GradientInput],
+                       fracture_gradient: Optional[GradientInput],
+                       margin: float) -> None:
+        circulating = profile.circulating
+        pore = gradient_arrays(pore_gradient)
+        if pore is not None:
+            profile.pore_pressure = np.interp(profile.md, *pore) * profile.tvd
+            # Static and circulating both have to stay above pore pressure
+            bottom = np.minimum(profile.hydrostatic, circulating)
+            for i in np.flatnonzero(bottom < profile.pore_pressure + margin):
+                profile.violations.append(_violation("pore", profile, i, bottom[i] - profile.pore_pressure[i]))
+
+        frac = gradient_arrays(fracture_gradient)
+        if frac is not None:
+            profile.fracture_pressure = np.interp(profile.md, *frac) * profile.tvd
+            for i in np.flatnonzero(circulating > profile.fracture_pressure - margin):
+                profile.violations.append(_violation("fracture", profile, i, profile.fracture_pressure[i] - circulating[i]))
+
+    def invalidate(self, version: Optional[str] = None) -> None:
+        """Drop cached profiles for one geometry version, or all of them"""
+        with self._lock:
+            if version is None:
+                self._cache.clear()
+            else:
+                for key in [k for k in self._cache if k[0] == version]:
+                    del self._cache[key]
+
+def _violation(kind: str, profile: PressureProfile, i: int, margin_psi: float) -> Dict[str, Any]:
+    tvd = float(profile.tvd[i])
+    return {
+        "type": kind,
+        "md": float(profile.md[i]),
+        "tvd": tvd,
+        "margin_psi": float(margin_psi),
+        "margin_ppg": float(margin_psi / (0.052 * tvd)) if tvd > 0 else 0.0,
+    }
+
+# Create global instance
+pressure_profile_engine = PressureProfileEngine()
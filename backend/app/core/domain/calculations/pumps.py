@@ -0,0 +1,110 @@
+# core/domain/calculations/pumps.py
+
+from typing import Any, Dict, Optional, Sequence, Tuple
+from dataclasses import dataclass
+import numpy as np
+
+from .volumes import WellVolumes
+
+# Output constants (bbl per stroke per in^2 of liner per in of stroke)
+TRIPLEX_CONSTANT = 0.000243
+DUPLEX_CONSTANT = 0.000162
+GALLONS_PER_BBL = 42.0
+
+def normalized_efficiency(efficiency: Optional[float]) -> float:
+    """Volumetric efficiency as a fraction; stored values may be in percent"""
+    if not efficiency:
+        return 1.0
+    return efficiency / 100.0 if efficiency > 1.0 else efficiency
+
+@dataclass(frozen=True)
+class PumpConfiguration:
+    """A mud pump as set up on the rig: liner, stroke and volumetric efficiency"""
+    liner_size: float  # in
+    stroke_length: float  # in
+    efficiency: float = 1.0  # fraction
+    pump_type: str = "triplex"
+    rod_diameter: float = 0.0  # in, duplex only
+
+    @classmethod
+    def from_mud_pump(cls, pump: Any, liner_size: Optional[float] = None,
+                      rod_diameter: float = 0.0) -> "PumpConfiguration":
+        """Configuration of a MudPump row; liner_size overrides the fitted liner"""
+        if not pump.stroke_length:
+            raise ValueError("Mud pump has no stroke length")
+        liner_size = liner_size or getattr(pump, "liner_size", None)
+        if not liner_size:
+            raise ValueError("Mud pump has no liner size")
+        return cls(
+            liner_size=liner_size,
+            stroke_length=pump.stroke_length,
+            efficiency=normalized_efficiency(pump.efficiency),
+            pump_type=(pump.pump_type or "triplex").lower(),
+            rod_diameter=rod_diameter,
+        )
+
+    @property
+    def output_per_stroke(self) -> float:
+        """Pump output (bbl/stroke) at the configured efficiency"""
+        if "duplex" in self.pump_type:
+            theoretical = DUPLEX_CONSTANT * self.stroke_length * (2 * self.liner_size ** 2 - self.rod_diameter ** 2)
+        else:
+            theoretical = TRIPLEX_CONSTANT * self.stroke_length * self.liner_size ** 2
+        return theoretical * normalized_efficiency(self.efficiency)
+
+@dataclass
+class RunningPump:
+    configuration: PumpConfiguration
+    spm: float
+
+class PumpModelService:
+    """
+    Strokes, volume, rate and lag conversions for pumps running in parallel.
+
+    Output is linear in stroke rate, so each pump's rate is its stroke rate
+    times its output per stroke; the pumps are reduced to one combined rate
+    and each query is vectorized over its volumes or depths.
+    """
+
+    def _rates(self, pumps: Sequence[RunningPump]) -> np.ndarray:
+        if not pumps:
+            raise ValueError("No pumps running")
+        return np.array([p.spm * p.configuration.output_per_stroke for p in pumps], dtype=float)
+
+    def flow_rate(self, pumps: Sequence[RunningPump]) -> float:
+        """Combined flow rate (bbl/min)"""
+        return float(self._rates(pumps).sum())
+
+    def time_for_volume(self, pumps: Sequence[RunningPump], volumes: Any) -> np.ndarray:
+        """Minutes to pump each volume (bbl)"""
+        rate = self.flow_rate(pumps)
+        if rate <= 0:
+            raise ValueError("Pumps are not displacing any volume")
+        return np.asarray(volumes, dtype=float) / rate
+
+    def strokes_for_volume(self, pumps: Sequence[RunningPump], volumes: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """Total strokes, and strokes per pump (volumes, pumps), to pump each volume"""
+        minutes = self.time_for_volume(pumps, volumes)
+        spm = np.array([p.spm for p in pumps], dtype=float)
+        per_pump = minutes[..., None] * spm
+        return per_pump.sum(axis=-1), per_pump
+
+    def lag(self, pumps: Sequence[RunningPump], volumes: WellVolumes, depths: Any) -> Dict[str, np.ndarray]:
+        """Bottoms-up volume, strokes and time from each depth to surface"""
+        lag_volume = volumes.volume_to(depths, "annulus")
+        strokes, _ = self.strokes_for_volume(pumps, lag_volume)
+        return {
+            "lag_volume": lag_volume,
+            "lag_strokes": strokes,
+            "lag_time": self.time_for_volume(pumps, lag_volume),
+        }
+
+    def lag_depth(self, pumps: Sequence[RunningPump], volumes: WellVolumes, minutes: Any) -> np.ndarray:
+        """Depth that returns reach surface from after pumping for the given minutes"""
+        edges = np.concatenate((volumes.top, [volumes.sections.total_depth]))
+        cumulative = volumes.volume_to(edges, "annulus")
+        pumped = np.asarray(minutes, dtype=float) * self.flow_rate(pumps)
+        return np.interp(pumped, cumulative, edges)
+
+# Create global instance
+pump_model_service = PumpModelService()
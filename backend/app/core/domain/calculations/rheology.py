@@ -0,0 +1,207 @@
+# core/domain/calculations/rheology.py
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, asdict
+from threading import Lock
+import numpy as np
+
+# Fann 35 viscometer speeds (rpm) in Fluid column order r600 ... r3.
+# Dial readings are taken as shear stress in lbf/100ft2 (field convention),
+# shear rate is 1.703 x rpm (1/s).
+VISCOMETER_SPEEDS = np.array([600.0, 300.0, 200.0, 100.0, 6.0, 3.0])
+READING_COLUMNS = ("r600", "r300", "r200", "r100", "r6", "r3")
+SHEAR_RATE_PER_RPM = 1.703
+
+# Bingham PV/YP describe the high-shear part of the curve, so the Bingham
+# fit uses 100-600 rpm only; the other models use every reading.
+BINGHAM_MASK = VISCOMETER_SPEEDS >= 100.0
+
+# Flow-behaviour index grid for the Herschel-Bulkley search (coarse pass,
+# then HB_REFINE_POINTS around each sample's best coarse value)
+HB_EXPONENTS = np.arange(0.05, 1.5001, 0.05)
+HB_REFINE_POINTS = 41
+
+@dataclass
+class RheologyFit:
+    """Fitted Bingham, Power-Law and Herschel-Bulkley parameters for one sample"""
+    plastic_viscosity: float  # cP
+    yield_point: float  # lbf/100ft2
+    bingham_r2: float
+    flow_index: float  # n
+    consistency_index: float  # lbf.s^n/100ft2
+    power_law_r2: float
+    hb_yield_stress: float  # lbf/100ft2
+    hb_flow_index: float
+    hb_consistency_index: float  # lbf.s^n/100ft2
+    herschel_bulkley_r2: float
+
+    def to_dict(self) -> Dict[str, float]:
+        return asdict(self)
+
+def _r_squared(readings: np.ndarray, predicted: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    count = np.maximum(weights.sum(axis=-1), 1)
+    mean = (weights * readings).sum(axis=-1) / count
+    total = (weights * (readings - mean[..., None]) ** 2).sum(axis=-1)
+    residual = (weights * (readings - predicted) ** 2).sum(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(total > 0, 1.0 - residual / total, 1.0)
+
+def _linear_fit(x: np.ndarray, y: np.ndarray, w: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Weighted least squares y = a + b x along the last axis, broadcast over the rest"""
+    sw = w.sum(axis=-1)
+    sx = (w * x).sum(axis=-1)
+    sy = (w * y).sum(axis=-1)
+    sxx = (w * x * x).sum(axis=-1)
+    sxy = (w * x * y).sum(axis=-1)
+    det = sw * sxx - sx ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        b = np.where(det != 0, (sw * sxy - sx * sy) / det, 0.0)
+        a = np.where(sw > 0, (sy - b * sx) / sw, 0.0)
+    return a, b
+
+def fit_bingham(readings: np.ndarray) -> Dict[str, np.ndarray]:
+    """Least-squares Bingham plastic fit for an (n_samples, 6) reading array"""
+    theta = np.asarray(readings, dtype=float)
+    w = (np.isfinite(theta) & BINGHAM_MASK).astype(float)
+    theta = np.nan_to_num(theta)
+    intercept, slope = _linear_fit(VISCOMETER_SPEEDS, theta, w)
+    predicted = intercept[:, None] + slope[:, None] * VISCOMETER_SPEEDS
+    return {
+        "plastic_viscosity": slope * 300.0,
+        "yield_point": intercept,
+        "bingham_r2": _r_squared(theta, predicted, w),
+    }
+
+def fit_power_law(readings: np.ndarray) -> Dict[str, np.ndarray]:
+    """Log-space least-squares Power-Law fit for an (n_samples, 6) reading array"""
+    theta = np.asarray(readings, dtype=float)
+    w = (np.isfinite(theta) & (theta > 0)).astype(float)
+    log_theta = np.log(np.where(w > 0, theta, 1.0))
+    log_k, n = _linear_fit(np.log(VISCOMETER_SPEEDS), log_theta, w)
+    k = np.exp(log_k)
+    predicted = k[:, None] * VISCOMETER_SPEEDS ** n[:, None]
+    return {
+        "flow_index": n,
+        "consistency_index": k / SHEAR_RATE_PER_RPM ** n,
+        "power_law_r2": _r_squared(np.where(w > 0, theta, 0.0), predicted, w),
+    }
+
+def _hb_solve(theta: np.ndarray, w: np.ndarray, exponents: np.ndarray):
+    """Closed-form (tau0, k) for each sample and each candidate n, with tau0 >= 0"""
+    x = VISCOMETER_SPEEDS ** exponents[..., None]  # (samples or 1, grid, 6)
+    y = theta[:, None, :]
+    wg = w[:, None, :]
+    tau0, k = _linear_fit(x, y, wg)
+
+    # tau0 < 0 is not physical: refit through the origin
+    sxx = (wg * x * x).sum(axis=-1)
+    sxy = (wg * x * y).sum(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k_origin = np.where(sxx > 0, sxy / sxx, 0.0)
+    negative = tau0 < 0
+    tau0 = np.where(negative, 0.0, tau0)
+    k = np.where(negative, k_origin, k)
+
+    residual = (wg * (y - tau0[..., None] - k[..., None] * x) ** 2).sum(axis=-1)
+    best = np.argmin(residual, axis=1)
+    rows = np.arange(theta.shape[0])
+    n = np.broadcast_to(exponents, residual.shape)[rows, best]
+    return tau0[rows, best], k[rows, best], n
+
+def fit_herschel_bulkley(readings: np.ndarray,
+                         exponents: np.ndarray = HB_EXPONENTS) -> Dict[str, np.ndarray]:
+    """
+    Herschel-Bulkley fit tau = tau0 + k N^n for an (n_samples, 6) reading array.
+
+    For a fixed n the model is linear in (tau0, k), so every sample is solved
+    in closed form for every n on a coarse grid at once, then again on a fine
+    grid around each sample's best n. tau0 is constrained to be non-negative.
+    """
+    theta = np.asarray(readings, dtype=float)
+    w = np.isfinite(theta).astype(float)
+    theta = np.nan_to_num(theta)
+
+    _, _, coarse = _hb_solve(theta, w, exponents[None, :])
+    step = exponents[1] - exponents[0] if len(exponents) > 1 else 0.05
+    offsets = np.linspace(-step, step, HB_REFINE_POINTS)
+    fine = np.clip(coarse[:, None] + offsets[None, :], 1e-3, None)
+    tau0, k, n = _hb_solve(theta, w, fine)
+
+    predicted = tau0[:, None] + k[:, None] * VISCOMETER_SPEEDS ** n[:, None]
+    return {
+        "hb_yield_stress": tau0,
+        "hb_flow_index": n,
+        "hb_consistency_index": k / SHEAR_RATE_PER_RPM ** n,
+        "herschel_bulkley_r2": _r_squared(theta, predicted, w),
+    }
+
+def fit_rheology(readings: np.ndarray) -> Dict[str, np.ndarray]:
+    """Fit all three models for an (n_samples, 6) array of r600 ... r3 readings"""
+    readings = np.atleast_2d(np.asarray(readings, dtype=float))
+    result: Dict[str, np.ndarray] = {}
+    result.update(fit_bingham(readings))
+    result.update(fit_power_law(readings))
+    result.update(fit_herschel_bulkley(readings))
+    return result
+
+def fluid_readings(fluid: Any) -> Tuple[Optional[float], ...]:
+    """Viscometer readings of a Fluid row in VISCOMETER_SPEEDS order"""
+    return tuple(
+        None if getattr(fluid, column, None) is None else float(getattr(fluid, column))
+        for column in READING_COLUMNS
+    )
+
+class RheologyService:
+    """
+    Batch rheology fitting with per-fluid caching.
+
+    Fits are keyed by fluid id and remembered together with the readings they
+    were fitted from, so a fluid whose readings changed is refitted even if the
+    explicit invalidate() on update was bypassed.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._fits: Dict[str, Tuple[Tuple[Optional[float], ...], RheologyFit]] = {}
+        self._lock = Lock()
+
+    def fit_fluids(self, fluids: Sequence[Any]) -> Dict[str, RheologyFit]:
+        """Fitted parameters for every fluid, fitting only the uncached ones in one batch"""
+        result: Dict[str, RheologyFit] = {}
+        pending: List[Tuple[str, Tuple[Optional[float], ...]]] = []
+        with self._lock:
+            for fluid in fluids:
+                readings = fluid_readings(fluid)
+                cached = self._fits.get(fluid.id)
+                if cached is not None and cached[0] == readings:
+                    result[fluid.id] = cached[1]
+                else:
+                    pending.append((fluid.id, readings))
+
+        if pending:
+            fitted = fit_rheology(np.array([readings for _, readings in pending], dtype=float))
+            with self._lock:
+                if len(self._fits) + len(pending) > self.max_entries:
+                    self._fits.clear()
+                for i, (fluid_id, readings) in enumerate(pending):
+                    fit = RheologyFit(**{name: float(values[i]) for name, values in fitted.items()})
+                    self._fits[fluid_id] = (readings, fit)
+                    result[fluid_id] = fit
+        return result
+
+    def fit_fluid(self, fluid: Any) -> RheologyFit:
+        return self.fit_fluids([fluid])[fluid.id]
+
+    def invalidate(self, fluid_id: Optional[str] = None) -> None:
+        """Drop the cached fit for one fluid, or every fit"""
+        with self._lock:
+            if fluid_id is None:
+                self._fits.clear()
+            else:
+                self._fits.pop(fluid_id, None)
+
+    def __len__(self) -> int:
+        return len(self._fits)
+
+# Create global instance
+rheology_service = RheologyService()
@@ -0,0 +1,225 @@
+# core/domain/calculations/sections.py
+
+from typing import Any, Dict, Generic, Hashable, Iterable, List, Optional, Sequence, Tuple, TypeVar
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+import numpy as np
+
+from .hydraulics import AnnulusSection, Conduit, FlowGeometry, PipeSection, conduits_from_tubulars
+
+T = TypeVar("T")
+
+class IntervalTree(Generic[T]):
+    """
+    Static centered interval tree over half-open [top, bottom) intervals.
+
+    Built once in O(n log n); a stabbing query returns every item covering
+    a depth in O(log n + k).
+    """
+
+    def __init__(self, intervals: Iterable[Tuple[float, float, T]]):
+        self._root = self._build([iv for iv in intervals if iv[1] > iv[0]])
+
+    def _build(self, intervals: List[Tuple[float, float, T]]):
+        if not intervals:
+            return None
+        ends = sorted(e for iv in intervals for e in iv[:2])
+        center = ends[len(ends) // 2]
+        left = [iv for iv in intervals if iv[1] <= center]
+        right = [iv for iv in intervals if iv[0] > center]
+        here = [iv for iv in intervals if iv[0] <= center < iv[1]]
+        # Degenerate split (all intervals end at the center): keep them here
+        if not here and (len(left) == len(intervals) or len(right) == len(intervals)):
+            here, left, right = intervals, [], []
+        return (
+            center,
+            sorted(here, key=lambda iv: iv[0]),
+            sorted(here, key=lambda iv: iv[1], reverse=True),
+            self._build(left),
+            self._build(right),
+        )
+
+    def query(self, depth: float) -> List[T]:
+        """Items whose interval contains depth"""
+        found: List[T] = []
+        node = self._root
+        while node is not None:
+            center, by_top, by_bottom, left, right = node
+            if depth < center:
+                for top, bottom, item in by_top:
+                    if top > depth:
+                        break
+                    if depth < bottom:
+                        found.append(item)
+                node = left
+            else:
+                for top, bottom, item in by_bottom:
+                    if bottom <= depth:
+                        break
+                    if top <= depth:
+                        found.append(item)
+                node = right
+        return found
+
+@dataclass
+class WellSection:
+    """A depth interval with one wall and at most one string component"""
+    name: str
+    top: float  # ft
+    bottom: float  # ft
+    hole_diameter: float  # in, wall ID
+    pipe_outer_diameter: float = 0.0  # in, 0 below the bit
+    pipe_inner_diameter: float = 0.0  # in
+
+    @property
+    def length(self) -> float:
+        return self.bottom - self.top
+
+    @property
+    def has_pipe(self) -> bool:
+        return self.pipe_outer_diameter > 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "top": self.top,
+            "bottom": self.bottom,
+            "hole_diameter": self.hole_diameter,
+            "pipe_outer_diameter": self.pipe_outer_diameter,
+            "pipe_inner_diameter": self.pipe_inner_diameter,
+        }
+
+class WellSections:
+    """
+    Contiguous, non-overlapping sections from surface to TD. Depth lookups
+    are a binary search over the section tops; arrays of depths are looked
+    up in one searchsorted call.
+    """
+
+    def __init__(self, sections: Sequence[WellSection]):
+        self.sections = sorted(sections, key=lambda s: s.top)
+        self.top = np.array([s.top for s in self.sections], dtype=float)
+        self.bottom = np.array([s.bottom for s in self.sections], dtype=float)
+        self.hole_diameter = np.array([s.hole_diameter for s in self.sections], dtype=float)
+        self.pipe_outer_diameter = np.array([s.pipe_outer_diameter for s in self.sections], dtype=float)
+        self.pipe_inner_diameter = np.array([s.pipe_inner_diameter for s in self.sections], dtype=float)
+
+    def __len__(self) -> int:
+        return len(self.sections)
+
+    def __iter__(self):
+        return iter(self.sections)
+
+    @property
+    def total_depth(self) -> float:
+        return float(self.bottom[-1]) if self.sections else 0.0
+
+    def index_at(self, depths: Any) -> np.ndarray:
+        """Section index for each depth (ft), -1 outside the well"""
+        depths = np.asarray(depths, dtype=float)
+        index = np.searchsorted(self.top, depths, side="right") - 1
+        inside = (index >= 0) & (depths < self.bottom[np.clip(index, 0, None)]) if self.sections else np.zeros_like(depths, bool)
+        return np.where(inside, index, -1)
+
+    def section_at(self, depth: float) -> Optional[WellSection]:
+        index = int(self.index_at(depth))
+        return self.sections[index] if index >= 0 else None
+
+    def flow_geometry(self) -> FlowGeometry:
+        """Pipe and annular sections along the string, for the hydraulics engine"""
+        pipe: List[PipeSection] = []
+        annulus: List[AnnulusSection] = []
+        for s in self.sections:
+            if not s.has_pipe:
+                continue
+            component = s.name.split("/", 1)[-1]
+            if pipe and pipe[-1].name == component and pipe[-1].bottom == s.top \
+                    and pipe[-1].inner_diameter == s.pipe_inner_diameter:
+                pipe[-1].bottom = s.bottom
+            else:
+                pipe.append(PipeSection(component, s.top, s.bottom, s.pipe_inner_diameter))
+            annulus.append(AnnulusSection(s.name, s.top, s.bottom, s.hole_diameter, s.pipe_outer_diameter))
+        return FlowGeometry(pipe, annulus)
+
+    def to_dict(self) -> List[Dict[str, Any]]:
+        return [s.to_dict() for s in self.sections]
+
+def build_sections(outer: Iterable[Conduit], string: Iterable[Conduit]) -> WellSections:
+    """
+    Overlay outer strings (casing, liner, open hole) and string components.
+    Every interval between consecutive boundaries becomes one section; the
+    wall is the smallest ID covering it, the pipe the component inside it.
+    """
+    outer = [c for c in outer if c.bottom > c.top and c.inner_diameter > 0]
+    string = [c for c in string if c.bottom > c.top]
+    if not outer:
+        return WellSections([])
+    total_depth = max(c.bottom for c in outer)
+    walls = IntervalTree((c.top, c.bottom, c) for c in outer)
+    pipes = IntervalTree((c.top, c.bottom, c) for c in string)
+
+    edges = sorted({0.0, total_depth} | {
+        d for c in outer + string for d in (c.top, c.bottom) if 0.0 <= d <= total_depth
+    })
+    sections: List[WellSection] = []
+    for top, bottom in zip(edges[:-1], edges[1:]):
+        mid = (top + bottom) / 2
+        covering = walls.query(mid)
+        if not covering:
+            continue
+        wall = min(covering, key=lambda c: c.inner_diameter)
+        inside = pipes.query(mid)
+        if inside:
+            pipe = inside[0]
+            sections.append(WellSection(
+                f"{wall.name}/{pipe.name}", top, bottom,
+                wall.inner_diameter, pipe.outer_diameter, pipe.inner_diameter
+            ))
+        else:
+            sections.append(WellSection(wall.name, top, bottom, wall.inner_diameter))
+    return WellSections(sections)
+
+class SectionBuilder:
+    """Well sections built from Tubular rows, cached per geometry version"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Hashable, WellSections]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def build(self,
+              tubulars: Iterable[Any],
+              total_depth: Optional[float] = None,
+              version: Optional[str] = None) -> WellSections:
+        key = None if version is None else (version, total_depth)
+        if key is not None:
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    return cached
+
+        sections = build_sections(*conduits_from_tubulars(tubulars, total_depth))
+        if key is not None:
+            with self._lock:
+                self.misses += 1
+                self._cache[key] = sections
+                if len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+        return sections
+
+    def invalidate(self, version: Optional[str] = None) -> None:
+        """Drop cached sections for one geometry version, or all of them"""
+        with self._lock:
+            if version is None:
+                self._cache.clear()
+            else:
+                for key in [k for k in self._cache if k[0] == version]:
+                    del self._cache[key]
+
+# Create global instance
+section_builder = SectionBuilder()
@@ -0,0 +1,201 @@
+# core/domain/calculations/surge_swab.py
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+import numpy as np
+
+from .hydraulics import Conduit, FlowGeometry, FluidProperties, HydraulicsEngine
+from .pressure_profile import GradientInput, gradient_arrays
+from ...units.validators import OperationalLimits
+
+DEFAULT_CELL_LENGTH = 100.0  # ft
+
+@dataclass
+class RunningComponent:
+    """A component of the string being run; components are listed from the bottom up"""
+    name: str
+    length: float
+    outer_diameter: float
+    inner_diameter: float
+
+def clinging_constant(diameter_ratio: np.ndarray) -> np.ndarray:
+    """
+    Clinging constant Kc for pipe moving through a concentric annulus
+    (laminar drag flow), as a function of pipe OD / hole ID.
+    """
+    alpha = np.clip(np.asarray(diameter_ratio, dtype=float), 1e-6, 1 - 1e-6)
+    return -1.0 / (2.0 * np.log(alpha)) - alpha ** 2 / (1.0 - alpha ** 2)
+
+@dataclass
+class SurgeSwabResult:
+    depths: np.ndarray
+    speeds: np.ndarray  # ft/min
+    surge: np.ndarray  # psi at the string bottom, (depths, speeds)
+    swab: np.ndarray  # psi reduction at the string bottom, (depths, speeds)
+    surge_emw: np.ndarray  # ppg
+    swab_emw: np.ndarray  # ppg
+    max_safe_speed: np.ndarray  # ft/min per depth
+    intervals: List[Dict[str, float]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "depths": self.depths.tolist(),
+            "speeds": self.speeds.tolist(),
+            "surge": self.surge.tolist(),
+            "swab": self.swab.tolist(),
+            "surge_emw": self.surge_emw.tolist(),
+            "swab_emw": self.swab_emw.tolist(),
+            "max_safe_speed": self.max_safe_speed.tolist(),
+            "intervals": self.intervals,
+        }
+
+class SurgeSwabEngine:
+    """
+    Surge and swab pressures while tripping a string, for every
+    (string bottom depth, running speed) pair at once.
+
+    The well is split into cells; for each bottom depth the component
+    occupying each cell is looked up from the bottom-up string, and the
+    annular fluid velocity is the displaced volume plus the clinging drag:
+    closed pipe va = vp (dp^2/(dh^2 - dp^2) + Kc), open pipe displaces only
+    steel, va = vp ((dp^2 - di^2)/(dh^2 - dp^2) + Kc). The annular friction
+    gradient comes from the hydraulics engine's Bingham model.
+    """
+
+    def __init__(self,
+                 hole: Sequence[Conduit],
+                 string: Sequence[RunningComponent],
+                 fluid: FluidProperties,
+                 closed_end: bool = True,
+                 clinging_factor: Optional[float] = None,
+                 trajectory: Optional[Tuple[Sequence[float], Sequence[float]]] = None,
+                 cell_length: float = DEFAULT_CELL_LENGTH):
+        if not string:
+            raise ValueError("Running string has no components")
+        self.hole = [c for c in hole if c.bottom > c.top and c.inner_diameter > 0]
+        if not self.hole:
+            raise ValueError("No hole or casing geometry")
+        self.string = list(string)
+        self.fluid = fluid
+        self.closed_end = closed_end
+        self.clinging_factor = clinging_factor
+        self.cell_length = cell_length
+        self.trajectory = None
+        if trajectory is not None:
+            md, tvd = (np.asarray(v, dtype=float) for v in trajectory)
+            if md.size:
+                self.trajectory = (md, tvd)
+        self.engine = HydraulicsEngine(FlowGeometry([], []), fluid)
+
+        self._od = np.array([c.outer_diameter for c in self.string], dtype=float)
+        self._id = np.array([c.inner_diameter for c in self.string], dtype=float)
+        self._cumulative = np.cumsum([c.length for c in self.string])
+
+    def tvd(self, md: np.ndarray) -> np.ndarray:
+        if self.trajectory is None:
+            return md
+        return np.interp(md, *self.trajectory)
+
+    def _hole_diameter(self, depth: np.ndarray) -> np.ndarray:
+        tops = np.array([c.top for c in self.hole])
+        bottoms = np.array([c.bottom for c in self.hole])
+        ids = np.array([c.inner_diameter for c in self.hole])
+        covering = (depth[:, None] >= tops) & (depth[:, None] < bottoms)
+        diameter = np.where(covering, ids, np.inf).min(axis=1)
+        deepest = ids[np.argmax(bottoms)]
+        return np.where(np.isfinite(diameter), diameter, deepest)
+
+    def pressures(self, depths: Sequence[float], speeds: Sequence[float]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Cumulative friction (psi) from surface down to each cell, shape
+        (depths, cells, speeds), plus cell bottoms and bottom coverage.
+        """
+        depths = np.asarray(depths, dtype=float)
+        speeds = np.asarray(speeds, dtype=float)
+        edges = np.arange(0.0, depths.max() + self.cell_length, self.cell_length)
+        tops, bottoms = edges[:-1], edges[1:]
+        mids = (tops + bottoms) / 2
+
+        # Length of each cell occupied by the string, (depths, cells)
+        covered = np.clip(depths[:, None] - tops[None, :], 0.0, bottoms - tops)
+        # Component in each cell, counted up from the string bottom; the top
+        # component is extended to surface
+        above_bottom = np.maximum(depths[:, None] - mids[None, :], 0.0)
+        index = np.minimum(np.searchsorted(self._cumulative, above_bottom, side="right"), len(self.string) - 1)
+        dp = self._od[index]
+        di = self._id[index]
+        dh = self._hole_diameter(mids)[None, :]
+
+        annulus = dh ** 2 - dp ** 2
+        displaced = dp ** 2 if self.closed_end else dp ** 2 - di ** 2
+        kc = self.clinging_factor if self.clinging_factor is not None else clinging_constant(dp / dh)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(annulus > 0, displaced / annulus + kc, 0.0)
+
+        velocity = ratio[..., None] * speeds[None, None, :] / 60.0  # ft/s
+        gradient = self.engine.annular_gradient(velocity, dh[..., None], dp[..., None])
+        cumulative = np.cumsum(gradient * covered[..., None], axis=1)
+        return cumulative, bottoms, covered
+
+    def calculate(self,
+                  depths: Sequence[float],
+                  speeds: Sequence[float],
+                  pore_gradient: Optional[GradientInput] = None,
+                  fracture_gradient: Optional[GradientInput] = None,
+                  margin: float = OperationalLimits.MIN_SURGE_SAFETY_MARGIN.value) -> SurgeSwabResult:
+        """
+        Surge/swab matrix and the maximum safe running speed per depth.
+
+        A speed is safe at a depth when, at every point above the string
+        bottom, surge EMW stays at least `margin` ppg below the fracture
+        gradient and swab EMW at least `margin` ppg above the pore gradient.
+        """
+        depths = np.sort(np.asarray(depths, dtype=float))
+        speeds = np.sort(np.asarray(speeds, dtype=float))
+        cumulative, cell_bottoms, covered = self.pressures(depths, speeds)
+
+        surge = cumulative[:, -1, :]
+        tvd_bottom = self.tvd(depths)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            emw_delta = np.where(tvd_bottom[:, None] > 0, surge / (0.052 * tvd_bottom[:, None]), 0.0)
+        surge_emw = self.fluid.density + emw_delta
+        swab_emw = self.fluid.density - emw_delta
+
+        safe = np.ones((depths.size, speeds.size), dtype=bool)
+        in_string = (covered > 0)[..., None]
+        cell_depth = np.minimum(cell_bottoms[None, :], depths[:, None])
+        cell_tvd = self.tvd(cell_depth)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cell_delta = np.where(cell_tvd[..., None] > 0, cumulative / (0.052 * cell_tvd[..., None]), 0.0)
+
+        frac = gradient_arrays(fracture_gradient)
+        if frac is not None:
+            limit = np.interp(cell_depth, *frac) / 0.052 - margin
+            over = (self.fluid.density + cell_delta > limit[..., None]) & in_string
+            safe &= ~over.any(axis=1)
+        pore = gradient_arrays(pore_gradient)
+        if pore is not None:
+            limit = np.interp(cell_depth, *pore) / 0.052 + margin
+            under = (self.fluid.density - cell_delta < limit[..., None]) & in_string
+            safe &= ~under.any(axis=1)
+
+        # Surge grows with speed: the safe speeds are the leading run of the sorted grid
+        safe_count = np.cumprod(safe, axis=1).sum(axis=1)
+        max_safe_speed = np.where(safe_count > 0, speeds[np.maximum(safe_count - 1, 0)], 0.0)
+
+        intervals = []
+        tops = np.concatenate(([0.0], depths[:-1]))
+        limits = np.minimum(max_safe_speed, np.concatenate((max_safe_speed[:1], max_safe_speed[:-1])))
+        for top, bottom, speed in zip(tops, depths, limits):
+            intervals.append({"top": float(top), "bottom": float(bottom), "max_speed": float(speed)})
+
+        return SurgeSwabResult(
+            depths=depths,
+            speeds=speeds,
+            surge=surge,
+            swab=surge.copy(),  # same friction, pulling out of hole
+            surge_emw=surge_emw,
+            swab_emw=swab_emw,
+            max_safe_speed=max_safe_speed,
+            intervals=intervals,
+        )
@@ -0,0 +1,204 @@
+# core/domain/calculations/torque_drag.py
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from dataclasses import dataclass
+import numpy as np
+
+from .hydraulics import tubular_kind
+
+STEEL_DENSITY_PPG = 65.5
+
+# mode: (axial friction sign, rotational friction, on bottom)
+# Tension is integrated from the bit up; pulling out adds drag, running in
+# and sliding subtract it, rotation moves all friction into torque.
+MODES: Dict[str, Tuple[float, float, bool]] = {
+    "trip_out": (1.0, 0.0, False),
+    "trip_in": (-1.0, 0.0, False),
+    "rotating": (0.0, 1.0, False),
+    "sliding": (-1.0, 0.0, True),
+    "drilling": (0.0, 1.0, True),
+}
+
+@dataclass
+class StringComponent:
+    """A string component; components are listed from the bit up"""
+    name: str
+    length: float  # ft
+    outer_diameter: float  # in
+    inner_diameter: float  # in
+    weight: float  # lb/ft in air
+
+def string_components_from_tubulars(tubulars: Iterable[Any],
+                                    kinds: Sequence[str] = ("drillstring",)) -> List[StringComponent]:
+    """Tubular rows of the given kinds as components ordered from the bit up"""
+    rows = sorted(
+        (t for t in tubulars if tubular_kind(t) in kinds),
+        key=lambda t: t.end_depth or 0.0,
+        reverse=True
+    )
+    return [
+        StringComponent(
+            getattr(t, "component_type", None) or tubular_kind(t).title(),
+            (t.end_depth or 0.0) - (t.start_depth or 0.0),
+            t.outer_diameter or 0.0,
+            t.inner_diameter or 0.0,
+            t.weight or 0.0
+        )
+        for t in rows
+    ]
+
+@dataclass
+class TorqueDragResult:
+    bit_depths: np.ndarray
+    friction_factors: np.ndarray
+    modes: List[str]
+    hook_load: np.ndarray  # lbf, (bit depths, friction factors, modes)
+    surface_torque: np.ndarray  # ft-lbf, (bit depths, friction factors, modes)
+    station_md: np.ndarray
+    tension: np.ndarray  # lbf along the string with the bit at the deepest depth, (stations, ff, modes)
+    torque: np.ndarray  # ft-lbf, (stations, ff, modes)
+
+    def broomstick(self) -> Dict[str, Dict[str, List[float]]]:
+        """Hook load vs bit depth for each mode and friction factor"""
+        return {
+            mode: {
+                f"{ff:g}": self.hook_load[:, i, m].tolist()
+                for i, ff in enumerate(self.friction_factors)
+            }
+            for m, mode in enumerate(self.modes)
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "bit_depths": self.bit_depths.tolist(),
+            "friction_factors": self.friction_factors.tolist(),
+            "modes": self.modes,
+            "hook_load": self.broomstick(),
+            "surface_torque": {
+                mode: {
+                    f"{ff:g}": self.surface_torque[:, i, m].tolist()
+                    for i, ff in enumerate(self.friction_factors)
+                }
+                for m, mode in enumerate(self.modes)
+            },
+            "station_md": self.station_md.tolist(),
+            "tension": {mode: self.tension[:, :, m].T.tolist() for m, mode in enumerate(self.modes)},
+            "torque": {mode: self.torque[:, :, m].T.tolist() for m, mode in enumerate(self.modes)},
+        }
+
+class TorqueDragEngine:
+    """
+    Soft-string torque and drag (Johancsik) over the survey stations.
+
+    Tension and torque are integrated segment by segment from the bit to
+    surface. The only sequential axis is the station index; every bit depth,
+    friction factor and operating mode is carried along as one array, so a
+    whole broomstick plot costs a single pass over the survey.
+    """
+
+    def __init__(self,
+                 md: Sequence[float],
+                 inclination: Sequence[float],
+                 azimuth: Sequence[float],
+                 string: Sequence[StringComponent],
+                 mud_weight: float):
+        if not string:
+            raise ValueError("String has no components")
+        md = np.asarray(md, dtype=float)
+        if md.size < 2:
+            raise ValueError("At least two survey stations are required")
+        self.md = md
+        self.inc = np.radians(np.asarray(inclination, dtype=float))
+        azi = np.radians(np.asarray(azimuth, dtype=float))
+        self.string = list(string)
+        self.mud_weight = mud_weight
+
+        # Per-segment geometry (segment j lies between stations j and j+1)
+        self.seg_top = md[:-1]
+        self.seg_length = np.diff(md)
+        inc_avg = (self.inc[:-1] + self.inc[1:]) / 2
+        self.d_inc = np.diff(self.inc)
+        d_azi = (np.diff(azi) + np.pi) % (2 * np.pi) - np.pi
+        self.d_azi_sin = d_azi * np.sin(inc_avg)
+        self.sin_inc = np.sin(inc_avg)
+        self.cos_inc = np.cos(inc_avg)
+
+        buoyancy = 1.0 - mud_weight / STEEL_DENSITY_PPG
+        self._weight = np.array([c.weight for c in self.string], dtype=float) * buoyancy
+        self._radius = np.array([c.outer_diameter for c in self.string], dtype=float) / 24.0  # ft
+        self._cumulative = np.cumsum([c.length for c in self.string])
+
+    def _segment_loads(self, bit_depths: np.ndarray):
+        """Buoyed weight, occupied fraction and contact radius per (segment, bit depth)"""
+        covered = np.clip(bit_depths[None, :] - self.seg_top[:, None], 0.0, self.seg_length[:, None])
+        mids = self.seg_top + self.seg_length / 2
+        above_bit = np.maximum(bit_depths[None, :] - mids[:, None], 0.0)
+        index = np.minimum(np.searchsorted(self._cumulative, above_bit, side="right"), len(self.string) - 1)
+        weight = self._weight[index] * covered
+        with np.errstate(divide="ignore", invalid="ignore"):
+            active = np.where(self.seg_length[:, None] > 0, covered / self.seg_length[:, None], 0.0)
+        return weight, active, self._radius[index]
+
+    def calculate(self,
+                  friction_factors: Sequence[float],
+                  modes: Sequence[str] = ("trip_out", "trip_in", "rotating"),
+                  bit_depths: Optional[Sequence[float]] = None,
+                  weight_on_bit: float = 0.0,
+                  bit_torque: float = 0.0,
+                  block_weight: float = 0.0) -> TorqueDragResult:
+        """
+        Hook load and surface torque for every (bit depth, friction factor,
+        mode), plus tension/torque along the string at the deepest bit depth.
+        """
+        modes = list(modes)
+        unknown = [m for m in modes if m not in MODES]
+        if unknown:
+            raise ValueError(f"Unknown torque and drag mode: {', '.join(unknown)}")
+        mu = np.asarray(friction_factors, dtype=float)
+        if bit_depths is None:
+            bit_depths = [self.md[-1]]
+        depths = np.sort(np.clip(np.asarray(bit_depths, dtype=float), self.md[0], self.md[-1]))
+
+        axial = np.array([MODES[m][0] for m in modes])
+        rotational = np.array([MODES[m][1] for m in modes])
+        on_bottom = np.array([MODES[m][2] for m in modes])
+
+        # Columns are (friction factor, mode) pairs flattened
+        columns = (mu.size, len(modes))
+        axial_mu = (mu[:, None] * axial[None, :]).ravel()
+        rotational_mu = (mu[:, None] * rotational[None, :]).ravel()
+        start_tension = np.broadcast_to(np.where(on_bottom, -weight_on_bit, 0.0), columns).ravel()
+        start_torque = np.broadcast_to(np.where(on_bottom & (rotational > 0), bit_torque, 0.0), columns).ravel()
+
+        weight, active, radius = self._segment_loads(depths)
+        w_cos = (weight * self.cos_inc[:, None])[..., None]
+        w_sin = (weight * self.sin_inc[:, None])[..., None]
+        active = active[..., None]
+        radius = radius[..., None]
+
+        tension = np.tile(start_tension, (depths.size, 1))
+        torque = np.tile(start_torque, (depths.size, 1))
+        segments = self.seg_length.size
+        tension_profile = np.empty((segments + 1, axial_mu.size))
+        torque_profile = np.empty((segments + 1, axial_mu.size))
+        tension_profile[segments] = tension[-1]
+        torque_profile[segments] = torque[-1]
+
+        for j in range(segments - 1, -1, -1):
+            normal = np.hypot(tension * self.d_azi_sin[j], tension * self.d_inc[j] + w_sin[j]) * active[j]
+            tension = tension + w_cos[j] + axial_mu * normal
+            torque = torque + rotational_mu * normal * radius[j]
+            tension_profile[j] = tension[-1]
+            torque_profile[j] = torque[-1]
+
+        shape = (depths.size,) + columns
+        return TorqueDragResult(
+            bit_depths=depths,
+            friction_factors=mu,
+            modes=modes,
+            hook_load=tension.reshape(shape) + block_weight,
+            surface_torque=torque.reshape(shape),
+            station_md=self.md,
+            tension=tension_profile.reshape((segments + 1,) + columns),
+            torque=torque_profile.reshape((segments + 1,) + columns),
+        )
@@ -0,0 +1,150 @@
+# core/domain/calculations/volumes.py
+
+from typing import Any, Dict, Hashable, Iterable, Optional
+from collections import OrderedDict
+from threading import Lock
+import numpy as np
+
+from .sections import WellSections, section_builder
+
+BBL_PER_FT_FACTOR = 1029.4  # d(in)^2 / 1029.4 = bbl/ft
+
+# Capacity kinds along the well (per section) and along the string (from the bit up)
+WELL_CAPACITIES = ("hole", "annulus", "string", "steel", "closed_end")
+STRING_CAPACITIES = ("string", "steel", "closed_end")
+
+class WellVolumes:
+    """
+    Cumulative capacity arrays for one set of well sections.
+
+    Along the well, C(x) is the volume from surface to depth x; inside a
+    section it grows linearly, so any depth costs one binary search over the
+    section tops. Along the string the same is done from the bit up, so the
+    displacement of whatever length of string is in the hole (tripping) is
+    also one lookup.
+    """
+
+    def __init__(self, sections: WellSections):
+        self.sections = sections
+        dh, od, pid = sections.hole_diameter, sections.pipe_outer_diameter, sections.pipe_inner_diameter
+        self.top = sections.top
+        self.capacity = {
+            "hole": dh ** 2 / BBL_PER_FT_FACTOR,
+            "annulus": (dh ** 2 - od ** 2) / BBL_PER_FT_FACTOR,
+            "string": pid ** 2 / BBL_PER_FT_FACTOR,
+            "steel": (od ** 2 - pid ** 2) / BBL_PER_FT_FACTOR,
+            "closed_end": od ** 2 / BBL_PER_FT_FACTOR,
+        }
+        lengths = sections.bottom - sections.top
+        self.cumulative = {
+            kind: np.concatenate(([0.0], np.cumsum(cap * lengths))) for kind, cap in self.capacity.items()
+        }
+
+        # String components from the bit up
+        piped = sections.pipe_outer_diameter > 0
+        order = np.flatnonzero(piped)[::-1]
+        string_lengths = lengths[order]
+        self.string_length = float(string_lengths.sum())
+        self.string_bottom = float(sections.bottom[order[0]]) if order.size else 0.0
+        self.string_edges = np.concatenate(([0.0], np.cumsum(string_lengths)))
+        self.string_capacity = {kind: self.capacity[kind][order] for kind in STRING_CAPACITIES}
+        self.string_cumulative = {
+            kind: np.concatenate(([0.0], np.cumsum(cap * string_lengths)))
+            for kind, cap in self.string_capacity.items()
+        }
+
+    @staticmethod
+    def _integral(x: Any, starts: np.ndarray, cumulative: np.ndarray,
+                  capacity: np.ndarray, end: float) -> np.ndarray:
+        x = np.clip(np.asarray(x, dtype=float), 0.0, end)
+        if starts.size == 0:
+            return np.zeros_like(x)
+        index = np.clip(np.searchsorted(starts, x, side="right") - 1, 0, starts.size - 1)
+        return cumulative[index] + capacity[index] * (x - starts[index])
+
+    def volume_to(self, depth: Any, kind: str = "hole") -> np.ndarray:
+        """Volume (bbl) from surface to depth (ft)"""
+        if kind not in self.capacity:
+            raise ValueError(f"Unknown volume kind: {kind}")
+        return self._integral(
+            depth, self.top, self.cumulative[kind], self.capacity[kind], self.sections.total_depth
+        )
+
+    def volume_between(self, top: Any, bottom: Any, kind: str = "hole") -> np.ndarray:
+        """Volume (bbl) between two depths (ft); arrays are evaluated element-wise"""
+        return self.volume_to(bottom, kind) - self.volume_to(top, kind)
+
+    def string_volume(self, length: Any, kind: str = "steel") -> np.ndarray:
+        """Volume (bbl) of the bottom `length` ft of the string"""
+        if kind not in self.string_capacity:
+            raise ValueError(f"Unknown string volume kind: {kind}")
+        return self._integral(
+            length, self.string_edges[:-1], self.string_cumulative[kind],
+            self.string_capacity[kind], self.string_length
+        )
+
+    def displacement(self, bit_depth: Any, closed_end: bool = False) -> np.ndarray:
+        """Pipe displacement (bbl) with the bit at bit_depth (ft)"""
+        return self.string_volume(bit_depth, "closed_end" if closed_end else "steel")
+
+    def annular_volume_at(self, bit_depth: Any) -> np.ndarray:
+        """Annular volume (bbl) above the bit with the bit at bit_depth (ft)"""
+        return self.volume_to(bit_depth, "hole") - self.string_volume(bit_depth, "closed_end")
+
+    def totals(self) -> Dict[str, float]:
+        """Whole-well volumes (bbl) with the string where it is"""
+        total_depth = self.sections.total_depth
+        open_hole = np.array([s.name.startswith("Open Hole") for s in self.sections], dtype=bool)
+        lengths = self.sections.bottom - self.sections.top
+        return {
+            "total_depth": total_depth,
+            "bit_depth": self.string_bottom,
+            "hole_volume": float(self.volume_to(total_depth, "hole")),
+            "open_hole_volume": float((self.capacity["hole"] * lengths)[open_hole].sum()),
+            "cased_hole_volume": float((self.capacity["hole"] * lengths)[~open_hole].sum()),
+            "annular_volume": float(self.volume_to(self.string_bottom, "annulus")),
+            "string_volume": float(self.string_cumulative["string"][-1]),
+            "steel_displacement": float(self.string_cumulative["steel"][-1]),
+            "closed_end_displacement": float(self.string_cumulative["closed_end"][-1]),
+            "below_bit_volume": float(self.volume_between(self.string_bottom, total_depth, "hole")),
+        }
+
+class VolumeService:
+    """Cumulative volume arrays per wellbore, cached until the geometry version changes"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Hashable, WellVolumes]" = OrderedDict()
+        self._lock = Lock()
+
+    def volumes(self,
+                tubulars: Iterable[Any],
+                total_depth: Optional[float] = None,
+                version: Optional[str] = None) -> WellVolumes:
+        key = None if version is None else (version, total_depth)
+        if key is not None:
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    return cached
+
+        result = WellVolumes(section_builder.build(tubulars, total_depth, version))
+        if key is not None:
+            with self._lock:
+                self._cache[key] = result
+                if len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+        return result
+
+    def invalidate(self, version: Optional[str] = None) -> None:
+        """Drop cached volumes for one geometry version, or all of them"""
+        with self._lock:
+            if version is None:
+                self._cache.clear()
+            else:
+                for key in [k for k in self._cache if k[0] == version]:
+                    del self._cache[key]
+
+# Create global instance
+volume_service = VolumeService()
@@ -3,6 +3,7 @@
 from typing import List, Tuple, Optional
 from math import cos, log10, sin, radians, sqrt, pi
 from dataclasses import dataclass
+from .friction import fanning_friction_factor
 from ...units.quantity import (
     Length, Angle, Pressure, Temperature, Weight, Density, 
     Depth, Area, Volume, LinearDensity
@@ -191,26 +192,22 @@ class PressureCalculator:
                                   roughness: float = 0.0001) -> Pressure:
         """
         Calculate friction pressure loss using Fanning friction factor
+        (roughness in ft)
         """
         # Convert units
-        d_ft = pipe_diameter.to_unit("ft")
+        d_in = pipe_diameter.to_unit("in")
         l_ft = length.to_unit("ft")
         density_ppg = fluid_density.to_unit("lb/gal")
-        
+
         # Calculate Reynolds number
-        velocity = flow_rate / (2.448 * (d_ft**2))  # ft/s
-        re = (928 * density_ppg * velocity * d_ft) / fluid_viscosity
-        
-        # Calculate friction factor (Colebrook correlation)
-        f = 0.02  # Initial guess
-        for _ in range(20):  # Iterate to converge
-            f_new = (-2 * log10(roughness/(3.7*d_ft) + 2.51/(re*sqrt(f))))**(-2)
-            if abs(f - f_new) < 0.0001:
-                break
-            f = f_new
-        
+        velocity = flow_rate / (2.448 * (d_in**2))  # ft/s
+        re = (928 * density_ppg * velocity * d_in) / fluid_viscosity
+
+        # Fanning friction factor over laminar/transitional/turbulent regimes
+        f = float(fanning_friction_factor(re, roughness / (d_in / 12)))
+
         # Calculate pressure loss
-        pressure_psi = (f * density_ppg * velocity**2 * l_ft) / (25.8 * d_ft)
+        pressure_psi = (f * density_ppg * velocity**2 * l_ft) / (25.8 * d_in)
         return Pressure(pressure_psi, "psi")
 
 class TemperatureCalculator:
@@ -0,0 +1,286 @@
+# File: backend/app/core/downsampling.py
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+
+from app.core.timeseries import TimeSeriesStore, get_timeseries_store, to_millis
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_WIDTHS = (1000, 60_000, 3_600_000)  # ms: 1 s, 1 min, 1 h
+ROLLUP_STATS = ("min", "max", "sum", "count")
+DOWNSAMPLE_METHODS = ("minmax", "avg", "lttb")
+
+# An aggregate column set: bucket start (ms), min, max, sum, count
+Aggregate = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+def _raw_aggregate(t: np.ndarray, v: np.ndarray) -> Aggregate:
+    return t, v, v, v, np.ones(v.size)
+
+def _combine(groups: np.ndarray, keys: np.ndarray, agg: Aggregate) -> Aggregate:
+    """Reduce consecutive runs of equal group numbers; keys gives each run's time"""
+    t, mn, mx, sm, ct = agg
+    if t.size == 0:
+        return agg
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    return (
+        keys[starts],
+        np.minimum.reduceat(mn, starts),
+        np.maximum.reduceat(mx, starts),
+        np.add.reduceat(sm, starts),
+        np.add.reduceat(ct, starts),
+    )
+
+def rollup(agg: Aggregate, width: int) -> Aggregate:
+    """Aggregate sorted samples (or finer aggregates) into epoch-aligned buckets of width ms"""
+    buckets = agg[0] // width
+    return _combine(buckets, buckets * width, agg)
+
+def aggregate_buckets(agg: Aggregate, start: int, end: int, buckets: int) -> Aggregate:
+    """
+    Split [start, end] into equal buckets and reduce sorted samples or
+    aggregates into them. Empty buckets are left out.
+    """
+    t = agg[0]
+    span = max(end - start, 1)
+    index = np.clip(((t - start) * buckets) // span, 0, buckets - 1)
+    return _combine(index, start + (index * span) // buckets, agg)
+
+def lttb(t: np.ndarray, v: np.ndarray, threshold: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets: keep threshold points that preserve the
+    visual shape of the line. One vectorized area per bucket.
+    """
+    n = t.size
+    if threshold >= n or threshold < 3:
+        return t, v
+    x = t.astype(np.float64)
+    every = (n - 2) / (threshold - 2)
+    picked = np.empty(threshold, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo = int(i * every) + 1
+        hi = int((i + 1) * every) + 1
+        next_hi = min(int((i + 2) * every) + 1, n)
+        avg_x, avg_y = x[hi:next_hi].mean(), v[hi:next_hi].mean()
+        area = np.abs((x[a] - avg_x) * (v[lo:hi] - v[a]) - (x[a] - x[lo:hi]) * (avg_y - v[a]))
+        a = lo + int(np.argmax(area))
+        picked[i + 1] = a
+    return t[picked], v[picked]
+
+def event_timeline(timestamps: Sequence[Any],
+                   categories: Sequence[Any],
+                   start: Any,
+                   end: Any,
+                   buckets: int,
+                   weights: Optional[Sequence[Optional[float]]] = None) -> Dict[str, Any]:
+    """Counts (and optional summed weights) of discrete events per time bucket and category"""
+    t = to_millis(list(timestamps)) if len(timestamps) else np.empty(0, np.int64)
+    lo, hi = int(to_millis([start])[0]), int(to_millis([end])[0])
+    span = max(hi - lo, 1)
+    inside = (t >= lo) & (t <= hi)
+    index = np.clip(((t[inside] - lo) * buckets) // span, 0, buckets - 1)
+    labels = np.asarray([str(c) for c in categories], dtype=object)[inside]
+    w = None if weights is None else np.asarray([x or 0.0 for x in weights], dtype=float)[inside]
+
+    result: Dict[str, Any] = {
+        "t": (lo + (np.arange(buckets) * span) // buckets).tolist(),
+        "total": np.bincount(index, minlength=buckets).tolist(),
+        "by_category": {},
+    }
+    if w is not None:
+        result["weight"] = np.bincount(index, weights=w, minlength=buckets).tolist()
+    for label in sorted(set(labels)):
+        mask = labels == label
+        result["by_category"][label] = np.bincount(index[mask], minlength=buckets).tolist()
+    return result
+
+@dataclass
+class _OpenBucket:
+    start: int
+    min: float
+    max: float
+    sum: float
+    count: float
+
+class RollupService:
+    """
+    Multi-resolution rollups (1 s, 1 min, 1 h) of every sensor channel.
+
+    Completed buckets are stored as min/max/sum/count series in their own
+    time-series stores under <store>/_rollups/<width>/; each level is fed
+    by the buckets the finer level completes, so ingestion pays a few
+    reduceat calls per batch. The open bucket of every level is kept in
+    memory and rebuilt from the stored data after a restart.
+    """
+
+    def __init__(self, store: TimeSeriesStore, widths: Sequence[int] = ROLLUP_WIDTHS):
+        self.store = store
+        self.widths = tuple(sorted(widths))
+        self.levels = {
+            width: TimeSeriesStore(
+                path=str(store.path / "_rollups" / str(width)),
+                chunk_size=store.chunk_size,
+                retention=store.retention,
+                cache_chunks=store.cache_chunks,
+            )
+            for width in self.widths
+        }
+        self._open: Dict[Tuple[str, str], List[Optional[_OpenBucket]]] = {}
+        self._locks: Dict[Tuple[str, str], Lock] = {}
+        self._lock = Lock()
+
+    def _channel_lock(self, key: Tuple[str, str]) -> Lock:
+        with self._lock:
+            return self._locks.setdefault(key, Lock())
+
+    def last_complete(self, job_id: str, channel: str, width: int) -> Optional[int]:
+        """Start of the last stored bucket at a level"""
+        series = self.levels[width].series(job_id, f"{channel}.count", create=False)
+        return None if series is None else series.last_timestamp
+
+    def update(self, job_id: str, channel: str, t: np.ndarray, v: np.ndarray) -> None:
+        """Feed newly stored raw samples (strictly after everything fed before)"""
+        if t.size == 0:
+            return
+        key = (str(job_id), channel)
+        with self._channel_lock(key):
+            if key not in self._open:
+                self._open[key] = [None] * len(self.widths)
+                self._recover(key, before=int(t[0]))
+            self._feed(key, 0, _raw_aggregate(t, v))
+
+    def _recover(self, key: Tuple[str, str], before: int) -> None:
+        """
+        Rebuild the open buckets from stored data, coarsest level first so
+        buckets completed while catching up are only cascaded once.
+        """
+        job_id, channel = key
+        for level in reversed(range(len(self.widths))):
+            last = self.last_complete(job_id, channel, self.widths[level])
+            resume = None if last is None else last + self.widths[level]
+            if level == 0:
+                t, v = self.store.scan(job_id, channel, resume, before - 1)
+                agg = _raw_aggregate(t, v)
+            else:
+                agg = self._scan_level(job_id, channel, self.widths[level - 1], resume, None)
+            if agg[0].size:
+                self._feed(key, level, agg)
+
+    def _feed(self, key: Tuple[str, str], level: int, agg: Aggregate) -> None:
+        width = self.widths[level]
+        bt, bmn, bmx, bsm, bct = rollup(agg, width)
+        if bt.size == 0:
+            return
+        state = self._open[key]
+        current = state[level]
+        if current is not None:
+            if current.start == bt[0]:
+                bmn[0] = min(bmn[0], current.min)
+                bmx[0] = max(bmx[0], current.max)
+                bsm[0] += current.sum
+                bct[0] += current.count
+            else:
+                bt, bmn, bmx, bsm, bct = (
+                    np.r_[current.start, bt], np.r_[current.min, bmn], np.r_[current.max, bmx],
+                    np.r_[current.sum, bsm], np.r_[current.count, bct],
+                )
+        state[level] = _OpenBucket(int(bt[-1]), float(bmn[-1]), float(bmx[-1]), float(bsm[-1]), float(bct[-1]))
+        done = (bt[:-1], bmn[:-1], bmx[:-1], bsm[:-1], bct[:-1])
+        if done[0].size == 0:
+            return
+        job_id, channel = key
+        store = self.levels[width]
+        # Count last: it marks a bucket as stored
+        for stat, values in zip(ROLLUP_STATS, done[1:]):
+            series = store.series(job_id, f"{channel}.{stat}")
+            last = series.last_timestamp
+            newer = done[0] > last if last is not None else np.ones(done[0].size, bool)
+            series.append(done[0][newer], values[newer])
+        if level + 1 < len(self.widths):
+            self._feed(key, level + 1, done)
+
+    def apply_retention(self, now: Optional[float] = None) -> int:
+        """Apply the raw store's retention policy to every rollup level"""
+        return sum(store.apply_retention(now) for store in self.levels.values())
+
+    def _scan_level(self, job_id: str, channel: str, width: int, start: Any, end: Any) -> Aggregate:
+        store = self.levels[width]
+        columns = [store.scan(job_id, f"{channel}.{stat}", start, end) for stat in ROLLUP_STATS]
+        n = min(c[0].size for c in columns)
+        t = columns[-1][0][:n]
+        return (t,) + tuple(c[1][:n] for c in columns)
+
+    def query(self,
+              job_id: Any,
+              channel: str,
+              start: Any = None,
+              end: Any = None,
+              points: int = 1000,
+              method: str = "minmax") -> Dict[str, Any]:
+        """
+        Chart-sized series for [start, end]: about `points` buckets from the
+        coarsest rollup finer than a bucket, plus raw samples after its last
+        completed bucket.
+        """
+        if method not in DOWNSAMPLE_METHODS:
+            raise ValueError(f"Unknown downsampling method: {method}")
+        job_id = str(job_id)
+        points = max(points, 3)
+        stats = self.store.series(job_id, channel, create=False)
+        if stats is None:
+            return {"level": None, "t": []}
+        info = stats.stats()
+        if info["points"] == 0:
+            return {"level": None, "t": []}
+        lo = info["first"] if start is None else int(to_millis([start])[0])
+        hi = info["last"] if end is None else int(to_millis([end])[0])
+
+        level = None
+        for width in self.widths:
+            if width * points <= hi - lo:
+                level = width
+        if level is None:
+            t, v = self.store.scan(job_id, channel, lo, hi)
+            agg = _raw_aggregate(t, v)
+        else:
+            agg = self._scan_level(job_id, channel, level, lo, hi)
+            tail_start = lo if agg[0].size == 0 else int(agg[0][-1]) + level
+            t, v = self.store.scan(job_id, channel, tail_start, hi)
+            tail = rollup(_raw_aggregate(t, v), level)
+            agg = tuple(np.concatenate((a, b)) for a, b in zip(agg, tail))
+
+        if method == "lttb":
+            mean = agg[3] / agg[4]
+            t, v = lttb(agg[0], mean, points)
+            return {"level": level, "t": t.tolist(), "v": v.tolist()}
+        bt, bmn, bmx, bsm, bct = aggregate_buckets(agg, lo, hi, points)
+        result = {"level": level, "t": bt.tolist(), "avg": (bsm / bct).tolist(), "count": bct.astype(int).tolist()}
+        if method == "minmax":
+            result["min"] = bmn.tolist()
+            result["max"] = bmx.tolist()
+        return result
+
+    def drop_job(self, job_id: Any) -> None:
+        with self._lock:
+            for key in [k for k in self._open if k[0] == str(job_id)]:
+                del self._open[key]
+        for store in self.levels.values():
+            store.drop_job(job_id)
+
+    def close(self) -> None:
+        for store in self.levels.values():
+            store.close()
+
+_rollup_service: Optional[RollupService] = None
+
+def get_rollup_service() -> RollupService:
+    """Process-wide rollups over the shared time-series store"""
+    global _rollup_service
+    if _rollup_service is None:
+        _rollup_service = RollupService(get_timeseries_store())
+    return _rollup_service
@@ -2,8 +2,8 @@
 from fastapi_mail import ConnectionConfig, FastMail, MessageSchema
 from pydantic import EmailStr
 from typing import List, Optional, Dict
-from jinja2 import Environment, select_autoescape, PackageLoader
 from app.core.config import settings
+from app.core.mail_queue import TemplateRenderer
 import os
 from pathlib import Path
 from datetime import datetime
@@ -31,13 +31,14 @@ email_conf = ConnectionConfig(
     TEMPLATE_FOLDER=str(TEMPLATE_FOLDER)
 )
 
+# Templates are compiled once and shared by every EmailService instance
+template_renderer = TemplateRenderer(TEMPLATE_FOLDER)
+
 class EmailService:
     def __init__(self):
         self.fastmail = FastMail(email_conf)
-        self.env = Environment(
-            loader=PackageLoader('app', 'templates/email'),
-            autoescape=select_autoescape(['html', 'xml'])
-        )
+        self.renderer = template_renderer
+        self.env = template_renderer.env
 
     async def send_email(
         self,
@@ -0,0 +1,405 @@
+# File: backend/app/core/ingestion.py
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import asyncio
+import json
+import logging
+import time
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.timeseries import TimeSeriesStore, get_timeseries_store, to_millis, valid_name
+from app.core.downsampling import RollupService, get_rollup_service
+from app.core.alerts import AlertEngine, get_alert_engine
+from app.models.events import JobEvent
+
+try:
+    import msgpack
+except ImportError:  # Optional; msgpack frames are rejected without it
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+MSGPACK_CONTENT_TYPES = ("application/msgpack", "application/x-msgpack")
+LINE_PROTOCOL_CONTENT_TYPE = "text/plain"
+
+class FrameError(ValueError):
+    """A frame that cannot be parsed"""
+
+class IngestBackpressure(Exception):
+    """The ingestion buffer is full; the client should retry later"""
+
+@dataclass
+class SensorFrame:
+    """Samples of many channels sharing one time column; NaN marks a missing sample"""
+    job_id: str
+    timestamps: np.ndarray  # epoch ms
+    columns: Dict[str, np.ndarray]
+
+    @property
+    def samples(self) -> int:
+        return self.timestamps.size * len(self.columns)
+
+@dataclass
+class _Pending:
+    seq: int
+    frame: SensorFrame
+    ack: Optional[asyncio.Future] = None
+
+def _check_channels(names: Iterable[str], where: str = "") -> None:
+    for name in names:
+        if not valid_name(name):
+            raise FrameError(f"{where}Invalid channel name: {name!r}")
+
+def frame_from_dict(job_id: str, data: Dict[str, Any]) -> SensorFrame:
+    """Columnar frame: {"timestamps": [...], "channels": {"hookload": [...], ...}}"""
+    try:
+        timestamps = to_millis(data["timestamps"]).ravel()
+        channels = data["channels"]
+        columns = {str(name): np.asarray(values, dtype=np.float64).ravel() for name, values in channels.items()}
+    except (KeyError, TypeError, AttributeError, ValueError) as e:
+        raise FrameError(f"Invalid frame: {str(e)}")
+    _check_channels(columns)
+    for name, values in columns.items():
+        if values.size != timestamps.size:
+            raise FrameError(f"Channel {name} has {values.size} samples for {timestamps.size} timestamps")
+    return SensorFrame(str(job_id), timestamps, columns)
+
+def _frames_from_object(job_id: str, payload: Any) -> List[SensorFrame]:
+    items = payload if isinstance(payload, list) else [payload]
+    if not all(isinstance(item, dict) for item in items):
+        raise FrameError("Expected a frame object or a list of frames")
+    return [frame_from_dict(job_id, item) for item in items]
+
+def parse_line_protocol(job_id: str, text: str) -> List[SensorFrame]:
+    """
+    Line protocol: `<source> <channel>=<value>[,<channel>=<value>...] <epoch ms>`.
+    The source label is informational; the job comes from the endpoint.
+    Lines are gathered into one frame with NaN where a channel is absent.
+    """
+    timestamps: List[int] = []
+    rows: List[Dict[str, float]] = []
+    for number, line in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        parts = line.split()
+        if len(parts) != 3:
+            raise FrameError(f"Line {number}: expected '<source> <fields> <timestamp>'")
+        try:
+            fields = {name: float(value) for name, value in (f.split("=", 1) for f in parts[1].split(","))}
+            timestamps.append(int(parts[2]))
+        except ValueError:
+            raise FrameError(f"Line {number}: invalid field or timestamp")
+        _check_channels(fields, f"Line {number}: ")
+        rows.append(fields)
+    if not rows:
+        return []
+    channels = sorted({name for row in rows for name in row})
+    columns = {name: np.array([row.get(name, np.nan) for row in rows], dtype=np.float64) for name in channels}
+    return [SensorFrame(str(job_id), np.array(timestamps, dtype=np.int64), columns)]
+
+def parse_frames(job_id: str, body: bytes, content_type: str = "application/json") -> List[SensorFrame]:
+    content_type = (content_type or "").split(";")[0].strip().lower()
+    if content_type in MSGPACK_CONTENT_TYPES:
+        if msgpack is None:
+            raise FrameError("msgpack frames are not supported on this server")
+        try:
+            payload = msgpack.unpackb(body, raw=False)
+        except Exception as e:
+            raise FrameError(f"Invalid msgpack: {str(e)}")
+        return _frames_from_object(job_id, payload)
+    if content_type == LINE_PROTOCOL_CONTENT_TYPE:
+        return parse_line_protocol(job_id, body.decode("utf-8", errors="replace"))
+    try:
+        payload = json.loads(body)
+    except ValueError as e:
+        raise FrameError(f"Invalid JSON: {str(e)}")
+    return _frames_from_object(job_id, payload)
+
+@dataclass
+class IngestionStats:
+    accepted_frames: int = 0
+    accepted_samples: int = 0
+    written_samples: int = 0
+    dropped_samples: int = 0  # duplicates, stale or NaN samples
+    rejected_frames: int = 0  # refused under backpressure
+    failed_batches: int = 0
+    failed_channels: int = 0  # (job, channel) writes that raised within a batch
+    batches: int = 0
+    alerts: int = 0
+    last_flush_seconds: float = 0.0
+
+class IngestionService:
+    """
+    In-memory buffer between the ingestion endpoints and the time-series store.
+
+    Frames are accepted on the event loop and given a sequence number; a
+    single worker merges everything pending into one batch per job and
+    channel and writes it from a thread, so the event loop never touches
+    the disk. The buffer is bounded in samples: HTTP callers are refused
+    when it is full, WebSocket callers wait for space. The same worker
+    applies the retention policy to the raw store and its rollups every
+    retention_interval seconds.
+    """
+
+    def __init__(self,
+                 store: Optional[TimeSeriesStore] = None,
+                 rollups: Optional[RollupService] = None,
+                 alerts: Optional[AlertEngine] = None,
+                 max_buffered_samples: int = 1_000_000,
+                 batch_samples: int = 50_000,
+                 flush_interval: float = 0.5,
+                 retention_interval: float = 3600.0):
+        self._store = store
+        self._rollups = rollups
+        self._alerts = alerts
+        self.max_buffered_samples = max_buffered_samples
+        self.batch_samples = batch_samples
+        self.flush_interval = flush_interval
+        self.retention_interval = retention_interval
+        self._next_retention = 0.0
+        self.stats = IngestionStats()
+        self._pending: List[_Pending] = []
+        self._pending_samples = 0
+        self._buffered = 0  # samples pending or being written
+        self._seq = 0
+        self.flushed_seq = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._space: Optional[asyncio.Condition] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    @property
+    def store(self) -> TimeSeriesStore:
+        if self._store is None:
+            self._store = get_timeseries_store()
+        return self._store
+
+    @property
+    def rollups(self) -> RollupService:
+        if self._rollups is None:
+            self._rollups = RollupService(self.store)
+        return self._rollups
+
+    @property
+    def alerts(self) -> AlertEngine:
+        if self._alerts is None:
+            self._alerts = AlertEngine()
+        return self._alerts
+
+    @property
+    def buffered_samples(self) -> int:
+        return self._buffered
+
+    def _ensure_loop_state(self) -> None:
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+            self._space = asyncio.Condition()
+            self._flush_lock = asyncio.Lock()
+
+    def submit(self, frame: SensorFrame, want_ack: bool = False) -> Tuple[int, Optional[asyncio.Future]]:
+        """
+        Buffer a frame without waiting. Returns its sequence number and, when
+        asked for, a future resolved with the samples written once its batch
+        is on disk. Raises IngestBackpressure when the buffer is full.
+        """
+        self._ensure_loop_state()
+        if self._buffered and self._buffered + frame.samples > self.max_buffered_samples:
+            self.stats.rejected_frames += 1
+            raise IngestBackpressure(f"{self._buffered} samples buffered")
+        self._seq += 1
+        ack = asyncio.get_running_loop().create_future() if want_ack else None
+        self._pending.append(_Pending(self._seq, frame, ack))
+        self._buffered += frame.samples
+        self._pending_samples += frame.samples
+        self.stats.accepted_frames += 1
+        self.stats.accepted_samples += frame.samples
+        if self._pending_samples >= self.batch_samples:
+            self._wakeup.set()
+        return self._seq, ack
+
+    async def put(self, frame: SensorFrame, timeout: Optional[float] = None) -> int:
+        """Buffer a frame, waiting for space instead of refusing it"""
+        self._ensure_loop_state()
+        async with self._space:
+            await asyncio.wait_for(
+                self._space.wait_for(
+                    lambda: not self._buffered or self._buffered + frame.samples <= self.max_buffered_samples
+                ),
+                timeout
+            )
+            seq, _ = self.submit(frame)
+        return seq
+
+    async def flush(self) -> int:
+        """Write everything pending now; returns samples written"""
+        self._ensure_loop_state()
+        # One batch at a time keeps each channel's appends in order
+        async with self._flush_lock:
+            return await self._flush_pending()
+
+    async def _flush_pending(self) -> int:
+        batch, self._pending = self._pending, []
+        samples, self._pending_samples = self._pending_samples, 0
+        if not batch:
+            return 0
+        started = time.monotonic()
+        try:
+            loop = asyncio.get_running_loop()
+            written, dropped, events, failures = await loop.run_in_executor(
+                None, self._write, [p.frame for p in batch]
+            )
+            error = None
+        except Exception as e:
+            logger.error(f"Sensor ingestion batch of {samples} samples failed: {str(e)}")
+            written, dropped, events, failures, error = 0, 0, [], {}, e
+            self.stats.failed_batches += 1
+        self.stats.failed_channels += len(failures)
+        self.stats.batches += 1
+        self.stats.written_samples += written
+        self.stats.dropped_samples += dropped
+        self.stats.last_flush_seconds = time.monotonic() - started
+        self.flushed_seq = batch[-1].seq
+        for pending in batch:
+            if pending.ack is not None and not pending.ack.done():
+                frame = pending.frame
+                failed = error or next(
+                    (failures[key] for key in ((frame.job_id, c) for c in frame.columns) if key in failures), None
+                )
+                if failed is None:
+                    pending.ack.set_result(frame.samples)
+                else:
+                    pending.ack.set_exception(failed)
+        async with self._space:
+            self._buffered -= samples
+            self._space.notify_all()
+        if events:
+            self.stats.alerts += len(events)
+            await self.alerts.publish(events)
+        return written
+
+    def _write(
+        self, frames: List[SensorFrame]
+    ) -> Tuple[int, int, List[JobEvent], Dict[Tuple[str, str], Exception]]:
+        """
+        Merge frames per job and channel, append them and evaluate the alert
+        rules on the new samples; runs in a worker thread. A failing job and
+        channel is reported in the returned failures and does not stop the
+        rest of the batch.
+        """
+        merged: Dict[Tuple[str, str], Tuple[List[np.ndarray], List[np.ndarray]]] = {}
+        for frame in frames:
+            for channel, values in frame.columns.items():
+                ts, vs = merged.setdefault((frame.job_id, channel), ([], []))
+                ts.append(frame.timestamps)
+                vs.append(values)
+        written = dropped = 0
+        events: List[JobEvent] = []
+        failures: Dict[Tuple[str, str], Exception] = {}
+        for (job_id, channel), (ts, vs) in merged.items():
+            try:
+                t, v = np.concatenate(ts), np.concatenate(vs)
+                total = t.size
+                present = ~np.isnan(v)
+                t, v = t[present], v[present]
+                # Frames may overlap or arrive out of order: sort, keep the latest sample per timestamp
+                order = np.argsort(t, kind="stable")
+                t, v = t[order], v[order]
+                last_of_run = np.append(t[1:] != t[:-1], True)
+                t, v = t[last_of_run], v[last_of_run]
+                series = self.store.series(job_id, channel)
+                last = series.last_timestamp
+                if last is not None:
+                    newer = t > last
+                    t, v = t[newer], v[newer]
+                written += series.append(t, v)
+                dropped += total - t.size
+                self.rollups.update(job_id, channel, t, v)
+                events.extend(self.alerts.evaluate(job_id, channel, t, v))
+            except Exception as e:
+                logger.error(f"Sensor ingestion of {job_id}/{channel} failed: {str(e)}")
+                failures[(job_id, channel)] = e
+        return written, dropped, events, failures
+
+    def _apply_retention(self, now: Optional[float] = None) -> int:
+        return self.store.apply_retention(now) + self.rollups.apply_retention(now)
+
+    async def apply_retention(self, now: Optional[float] = None) -> int:
+        """Drop raw and rollup chunks outside the retention policy; returns chunks removed"""
+        self._ensure_loop_state()
+        # Between batches, so no append races a chunk being dropped
+        async with self._flush_lock:
+            return await asyncio.get_running_loop().run_in_executor(None, self._apply_retention, now)
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+                if self.retention_interval and time.monotonic() >= self._next_retention:
+                    self._next_retention = time.monotonic() + self.retention_interval
+                    await self.apply_retention()
+            except Exception as e:
+                logger.error(f"Sensor ingestion worker error: {str(e)}")
+
+    async def start(self) -> None:
+        """Start the per-process flush worker"""
+        self._ensure_loop_state()
+        self._stopping = False
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        # Stopped by flag rather than cancel(): a cancel racing the wakeup can be lost in wait_for
+        if self._worker is not None:
+            self._stopping = True
+            self._wakeup.set()
+            try:
+                await self._worker
+            except Exception:
+                pass
+            self._worker = None
+        # Nothing accepted is left behind
+        await self.flush()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "buffered_samples": self._buffered,
+            "max_buffered_samples": self.max_buffered_samples,
+            "last_seq": self._seq,
+            "flushed_seq": self.flushed_seq,
+            "accepted_frames": self.stats.accepted_frames,
+            "accepted_samples": self.stats.accepted_samples,
+            "written_samples": self.stats.written_samples,
+            "dropped_samples": self.stats.dropped_samples,
+            "rejected_frames": self.stats.rejected_frames,
+            "failed_batches": self.stats.failed_batches,
+            "failed_channels": self.stats.failed_channels,
+            "batches": self.stats.batches,
+            "alerts": self.stats.alerts,
+            "last_flush_seconds": self.stats.last_flush_seconds,
+        }
+
+_ingestion_service: Optional[IngestionService] = None
+
+def get_ingestion_service() -> IngestionService:
+    """Process-wide ingestion buffer"""
+    global _ingestion_service
+    if _ingestion_service is None:
+        _ingestion_service = IngestionService(
+            store=get_timeseries_store(),
+            rollups=get_rollup_service(),
+            alerts=get_alert_engine(),
+            max_buffered_samples=settings.INGEST_MAX_BUFFERED_SAMPLES,
+            batch_samples=settings.INGEST_BATCH_SAMPLES,
+            flush_interval=settings.INGEST_FLUSH_INTERVAL,
+            retention_interval=settings.TIMESERIES_RETENTION_INTERVAL,
+        )
+    return _ingestion_service
@@ -0,0 +1,384 @@
+# File: backend/app/core/mail_queue.py
+from dataclasses import dataclass
+from datetime import datetime
+from email.message import EmailMessage
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+import asyncio
+import logging
+import smtplib
+import sqlite3
+import time
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+TEMPLATE_FOLDER = BASE_DIR / "templates"
+OFFLINE_DB_DIR = BASE_DIR / "offline_db"
+
+# Errors that mean the SMTP server itself is unavailable, not just one message
+CONNECTION_ERRORS = (
+    smtplib.SMTPConnectError,
+    smtplib.SMTPServerDisconnected,
+    smtplib.SMTPAuthenticationError,
+)
+
+def is_connection_error(error: Exception) -> bool:
+    """SMTPException subclasses OSError, so only bare socket errors count as connection-level"""
+    if isinstance(error, CONNECTION_ERRORS):
+        return True
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+class TemplateRenderer:
+    """
+    Shared Jinja environment with templates compiled once per process.
+
+    auto_reload is off so a cached template is never re-stat'ed, and
+    warm() compiles every template up front at startup.
+    """
+
+    def __init__(self, folder: Path = TEMPLATE_FOLDER):
+        self.folder = folder
+        self.env = Environment(
+            loader=FileSystemLoader([str(folder), str(folder / "email")]),
+            autoescape=select_autoescape(['html', 'xml']),
+            auto_reload=False,
+            cache_size=-1
+        )
+        # base_email.html stamps the footer with now().year
+        self.env.globals["now"] = datetime.utcnow
+
+    def warm(self) -> int:
+        """Compile all templates so the first email does not pay for it"""
+        names = self.env.list_templates(extensions=["html"])
+        for name in names:
+            try:
+                self.env.get_template(name)
+            except Exception as e:
+                logger.error(f"Error compiling template {name}: {str(e)}")
+        return len(names)
+
+    def render(self, template_name: str, data: Dict) -> str:
+        return self.env.get_template(template_name).render(**data)
+
+@dataclass
+class QueuedMail:
+    id: int
+    recipient: str
+    subject: str
+    body: str
+    subtype: str
+    attempts: int
+
+class SMTPConnection:
+    """One persistent SMTP connection, reopened lazily after errors"""
+
+    def __init__(
+        self,
+        host: str = settings.MAIL_SERVER,
+        port: int = settings.MAIL_PORT,
+        username: str = settings.MAIL_USERNAME,
+        password: str = settings.MAIL_PASSWORD,
+        starttls: bool = settings.MAIL_STARTTLS,
+        use_credentials: bool = settings.MAIL_USE_CREDENTIALS,
+        timeout: float = 30.0
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.use_credentials = use_credentials
+        self.timeout = timeout
+        self._server: Optional[smtplib.SMTP] = None
+        self.connects = 0
+
+    def _open(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.starttls:
+            server.starttls()
+        if self.use_credentials and self.username:
+            server.login(self.username, self.password)
+        self.connects += 1
+        return server
+
+    def get(self) -> smtplib.SMTP:
+        if self._server is not None:
+            try:
+                if self._server.noop()[0] == 250:
+                    return self._server
+            except smtplib.SMTPException:
+                pass
+            except OSError:
+                pass
+            self.close()
+        self._server = self._open()
+        return self._server
+
+    def close(self) -> None:
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except Exception:
+                pass
+            self._server = None
+
+class MailQueue:
+    """
+    Durable outbound mail queue backed by a local SQLite file.
+
+    Messages are enqueued from request handlers and delivered by one worker
+    task per process, which drains due messages in batches over a single
+    pooled SMTP connection. Failed sends are retried with exponential
+    backoff until max_attempts, after which they are marked dead.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        connection: Optional[SMTPConnection] = None,
+        renderer: Optional[TemplateRenderer] = None,
+        sender: str = settings.MAIL_FROM,
+        batch_size: int = 50,
+        max_attempts: int = 5,
+        backoff_base: float = 30.0,
+        backoff_max: float = 3600.0,
+        poll_interval: float = 5.0
+    ):
+        if path is None:
+            OFFLINE_DB_DIR.mkdir(parents=True, exist_ok=True)
+            path = str(OFFLINE_DB_DIR / "mail_queue.db")
+        self.path = path
+        self.connection = connection or SMTPConnection()
+        self.renderer = renderer or TemplateRenderer()
+        self.sender = sender
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.poll_interval = poll_interval
+        self._db_lock = Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS outbound_mail (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                recipient TEXT NOT NULL,
+                subject TEXT NOT NULL,
+                body TEXT NOT NULL,
+                subtype TEXT NOT NULL DEFAULT 'html',
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                last_error TEXT,
+                created_at REAL NOT NULL,
+                sent_at REAL
+            )
+            """
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS ix_outbound_mail_due ON outbound_mail (status, next_attempt_at)"
+        )
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    # Enqueueing
+
+    def _insert(self, rows: List[Tuple]) -> int:
+        with self._db_lock:
+            self._db.execute("BEGIN")
+            self._db.executemany(
+                "INSERT INTO outbound_mail (recipient, subject, body, subtype, next_attempt_at, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._db.execute("COMMIT")
+        self.wake()
+        return len(rows)
+
+    def enqueue(
+        self,
+        recipients: Iterable[str],
+        subject: str,
+        body: str,
+        subtype: str = "html"
+    ) -> int:
+        """Queue one message per recipient; returns the number queued"""
+        now = time.time()
+        rows = [(r, subject, body, subtype, now, now) for r in recipients]
+        return self._insert(rows)
+
+    def enqueue_template(
+        self,
+        template_name: str,
+        subject: str,
+        messages: Iterable[Tuple[str, Dict]]
+    ) -> int:
+        """Render a template per (recipient, data) pair and queue the results"""
+        template = self.renderer.env.get_template(template_name)
+        now = time.time()
+        rows = [
+            (recipient, subject, template.render(**data), "html", now, now)
+            for recipient, data in messages
+        ]
+        return self._insert(rows)
+
+    # Delivery
+
+    def _due(self, now: float) -> List[QueuedMail]:
+        with self._db_lock:
+            rows = self._db.execute(
+                "SELECT id, recipient, subject, body, subtype, attempts FROM outbound_mail "
+                "WHERE status = 'pending' AND next_attempt_at <= ? ORDER BY next_attempt_at LIMIT ?",
+                (now, self.batch_size)
+            ).fetchall()
+        return [QueuedMail(*row) for row in rows]
+
+    def _build(self, mail: QueuedMail) -> EmailMessage:
+        message = EmailMessage()
+        message["Subject"] = mail.subject
+        message["From"] = self.sender
+        message["To"] = mail.recipient
+        message.set_content(mail.body, subtype=mail.subtype)
+        return message
+
+    def _backoff(self, attempts: int) -> float:
+        return min(self.backoff_base * (2 ** (attempts - 1)), self.backoff_max)
+
+    def process_batch(self) -> int:
+        """Deliver one batch of due messages; returns the number sent"""
+        now = time.time()
+        batch = self._due(now)
+        if not batch:
+            return 0
+
+        sent: List[Tuple[float, int]] = []
+        failed: List[Tuple[str, int, float, str, int]] = []
+        for position, mail in enumerate(batch):
+            try:
+                self.connection.get().send_message(self._build(mail))
+                sent.append((time.time(), mail.id))
+                continue
+            except Exception as e:
+                error, unreachable = e, is_connection_error(e)
+            if unreachable:
+                # The server is unreachable: drop the connection and back off the rest of the batch
+                self.connection.close()
+                pending = batch[position:]
+            else:
+                # Refused recipient, bad data, ... smtplib has already reset the session
+                pending = [mail]
+            for failed_mail in pending:
+                attempts = failed_mail.attempts + 1
+                status = "dead" if attempts >= self.max_attempts else "pending"
+                failed.append((status, attempts, now + self._backoff(attempts), str(error)[:500], failed_mail.id))
+            logger.error(f"Error sending email to {mail.recipient}: {str(error)}")
+            if unreachable:
+                break
+
+        with self._db_lock:
+            self._db.execute("BEGIN")
+            self._db.executemany(
+                "UPDATE outbound_mail SET status = 'sent', sent_at = ? WHERE id = ?", sent
+            )
+            self._db.executemany(
+                "UPDATE outbound_mail SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ? "
+                "WHERE id = ?",
+                failed
+            )
+            self._db.execute("COMMIT")
+        return len(sent)
+
+    def drain(self) -> int:
+        """Send everything that is currently due (blocking)"""
+        total = 0
+        while True:
+            sent = self.process_batch()
+            total += sent
+            if sent < self.batch_size:
+                return total
+
+    def stats(self) -> Dict[str, int]:
+        with self._db_lock:
+            rows = self._db.execute(
+                "SELECT status, COUNT(*) FROM outbound_mail GROUP BY status"
+            ).fetchall()
+        return {status: count for status, count in rows}
+
+    def purge_sent(self, older_than: float = 7 * 86400) -> int:
+        with self._db_lock:
+            cursor = self._db.execute(
+                "DELETE FROM outbound_mail WHERE status = 'sent' AND sent_at < ?",
+                (time.time() - older_than,)
+            )
+        return cursor.rowcount
+
+    # Worker lifecycle
+
+    def wake(self) -> None:
+        """Nudge the worker; safe to call from any thread"""
+        if self._wakeup is None or self._loop is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._wakeup.set()
+        else:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self.drain)
+            except Exception as e:
+                logger.error(f"Mail queue worker error: {str(e)}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def start(self) -> None:
+        """Start the per-process delivery worker"""
+        self.renderer.warm()
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._worker = None
+        await asyncio.get_running_loop().run_in_executor(None, self.connection.close)
+
+    def close(self) -> None:
+        self.connection.close()
+        with self._db_lock:
+            self._db.close()
+
+_mail_queue: Optional[MailQueue] = None
+
+def get_mail_queue() -> MailQueue:
+    """Process-wide mail queue, created on first use"""
+    global _mail_queue
+    if _mail_queue is None:
+        _mail_queue = MailQueue(
+            path=settings.MAIL_QUEUE_PATH or None,
+            batch_size=settings.MAIL_QUEUE_BATCH_SIZE,
+            max_attempts=settings.MAIL_QUEUE_MAX_ATTEMPTS
+        )
+    return _mail_queue
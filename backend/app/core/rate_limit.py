@@ -1,68 +1,189 @@
 # File: backend/app/core/rate_limit.py
-from fastapi import HTTPException, Request
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from threading import Lock
+from typing import List, Optional, Pattern, Tuple
+import logging
+import math
+import re
 import time
-from typing import Dict, Tuple
-from collections import defaultdict
-import asyncio
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class RateLimitRule:
+    """
+    Rate limit applied to every path matching a route pattern.
+
+    Patterns use route syntax: "{param}" matches one path segment and a
+    trailing "*" matches any suffix, e.g. "/api/v1/jobs/{job_id}/sync" or
+    "/api/v1/auth/*".
+    """
+    pattern: str
+    max_requests: int
+    window: int  # seconds
+    methods: Optional[Tuple[str, ...]] = None
+    regex: Pattern = field(init=False, repr=False)
+
+    def __post_init__(self):
+        expr = re.escape(self.pattern.rstrip("*"))
+        expr = re.sub(r"\\\{[^/]+?\\\}", r"[^/]+", expr)
+        if self.pattern.endswith("*"):
+            expr += ".*"
+        self.regex = re.compile(f"^{expr}$")
+        if self.methods:
+            self.methods = tuple(m.upper() for m in self.methods)
+
+    def matches(self, path: str, method: str) -> bool:
+        if self.methods and method not in self.methods:
+            return False
+        return self.regex.match(path) is not None
+
+DEFAULT_RULES: List[RateLimitRule] = [
+    RateLimitRule("/api/v1/login*", 5, 300),  # 5 requests per 5 minutes
+    RateLimitRule("/api/v1/token", 5, 300),
+    RateLimitRule("/api/v1/users/forgot-password", 3, 3600),  # 3 requests per hour
+    RateLimitRule("/api/v1/users/reset-password", 3, 3600),
+    RateLimitRule("/api/v1/auth/password-reset/*", 3, 3600),
+    RateLimitRule("/api/v1/users/verify-email", 5, 3600),  # 5 requests per hour
+]
+
+class MemoryRateLimitStorage:
+    """
+    Per-process sliding-window counters.
+
+    Each key holds two integers (current and previous fixed window), and the
+    number of keys is capped with LRU eviction, so a scan across many IPs or
+    paths cannot grow memory without bound.
+    """
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._counters: "OrderedDict[str, List[int]]" = OrderedDict()  # key -> [window_index, current, previous]
+        self._lock = Lock()
+
+    async def hit(self, key: str, window: int, now: float) -> float:
+        """Record a request and return the approximate count in the sliding window"""
+        index = int(now // window)
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is None:
+                counter = [index, 0, 0]
+                self._counters[key] = counter
+                if len(self._counters) > self.max_keys:
+                    self._counters.popitem(last=False)
+            else:
+                self._counters.move_to_end(key)
+                if counter[0] != index:
+                    counter[2] = counter[1] if counter[0] == index - 1 else 0
+                    counter[1] = 0
+                    counter[0] = index
+            counter[1] += 1
+            elapsed = (now % window) / window
+            return counter[1] + counter[2] * (1.0 - elapsed)
+
+    async def undo(self, key: str, window: int, now: float) -> None:
+        """Forget a rejected request so it does not count against the client"""
+        with self._lock:
+            counter = self._counters.get(key)
+            if counter is not None and counter[0] == int(now // window) and counter[1] > 0:
+                counter[1] -= 1
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+class RedisRateLimitStorage:
+    """Sliding-window counters shared by all workers through Redis"""
+
+    def __init__(self, redis, prefix: str = "fieldtrax-ratelimit:"):
+        self.redis = redis
+        self.prefix = prefix
+
+    async def hit(self, key: str, window: int, now: float) -> float:
+        index = int(now // window)
+        current_key = f"{self.prefix}{key}:{index}"
+        previous_key = f"{self.prefix}{key}:{index - 1}"
+        pipe = self.redis.pipeline()
+        pipe.incr(current_key)
+        pipe.expire(current_key, window * 2)
+        pipe.get(previous_key)
+        current, _, previous = await pipe.execute()
+        elapsed = (now % window) / window
+        return int(current) + int(previous or 0) * (1.0 - elapsed)
+
+    async def undo(self, key: str, window: int, now: float) -> None:
+        """Forget a rejected request so it does not count against the client"""
+        await self.redis.decr(f"{self.prefix}{key}:{int(now // window)}")
 
 class RateLimiter:
-    def __init__(self):
-        self.requests: Dict[str, Dict[str, Tuple[int, float]]] = defaultdict(dict)
-        self.cleanup_task = None
-
-    async def cleanup(self):
-        """Remove old request records"""
-        while True:
-            current_time = time.time()
-            for ip in list(self.requests.keys()):
-                for path in list(self.requests[ip].keys()):
-                    count, timestamp = self.requests[ip][path]
-                    if current_time - timestamp > 3600:  # Clean after 1 hour
-                        del self.requests[ip][path]
-                if not self.requests[ip]:
-                    del self.requests[ip]
-            await asyncio.sleep(3600)  # Run cleanup every hour
-
-    def is_allowed(self, ip: str, path: str, max_requests: int, window: int) -> bool:
+    def __init__(self, storage=None):
+        self.storage = storage if storage is not None else MemoryRateLimitStorage()
+
+    async def check(self, client: str, rule: RateLimitRule) -> Tuple[bool, int]:
+        """
+        Check a request against a rule.
+        Returns (allowed, retry_after_seconds).
+        """
+        now = time.time()
+        key = f"{client}:{rule.pattern}"
+        try:
+            count = await self.storage.hit(key, rule.window, now)
+        except Exception as e:
+            # Fail open: a storage outage must not lock everyone out
+            logger.error(f"Rate limit storage error: {str(e)}")
+            return True, 0
+        if count <= rule.max_requests:
+            return True, 0
+        try:
+            await self.storage.undo(key, rule.window, now)
+        except Exception as e:
+            logger.error(f"Rate limit storage error: {str(e)}")
+        retry_after = int(math.ceil(rule.window - (now % rule.window)))
+        return False, max(retry_after, 1)
+
+    async def is_allowed(self, ip: str, path: str, max_requests: int, window: int) -> bool:
         """Check if request is allowed under rate limit"""
-        current_time = time.time()
-        if path in self.requests[ip]:
-            count, timestamp = self.requests[ip][path]
-            if current_time - timestamp > window:
-                # Reset if window has passed
-                self.requests[ip][path] = (1, current_time)
-                return True
-            if count >= max_requests:
-                return False
-            self.requests[ip][path] = (count + 1, timestamp)
-        else:
-            self.requests[ip][path] = (1, current_time)
-        return True
-
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, limiter: RateLimiter):
-        super().__init__(app)
-        self.limiter = limiter
-
-    async def dispatch(self, request: Request, call_next):
-        # Define rate limits for different endpoints
-        rate_limits = {
-            "/api/v1/auth/login": (5, 300),  # 5 requests per 5 minutes
-            "/api/v1/auth/forgot-password": (3, 3600),  # 3 requests per hour
-            "/api/v1/auth/reset-password": (3, 3600),  # 3 requests per hour
-            "/api/v1/auth/verify-email": (5, 3600),  # 5 requests per hour
-        }
-
-        path = request.url.path
-        if path in rate_limits:
-            max_requests, window = rate_limits[path]
-            if not self.limiter.is_allowed(request.client.host, path, max_requests, window):
-                return JSONResponse(
+        allowed, _ = await self.check(ip, RateLimitRule(path, max_requests, window))
+        return allowed
+
+class RateLimitMiddleware:
+    """Pure ASGI rate limiting middleware with route-pattern rules"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: Optional[RateLimiter] = None,
+        rules: Optional[List[RateLimitRule]] = None
+    ):
+        self.app = app
+        self.limiter = limiter or RateLimiter()
+        self.rules = rules if rules is not None else DEFAULT_RULES
+
+    def _match(self, path: str, method: str) -> Optional[RateLimitRule]:
+        for rule in self.rules:
+            if rule.matches(path, method):
+                return rule
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        rule = self._match(scope["path"], scope["method"])
+        if rule is not None:
+            client = scope.get("client")
+            host = client[0] if client else "unknown"
+            allowed, retry_after = await self.limiter.check(host, rule)
+            if not allowed:
+                response = JSONResponse(
                     status_code=429,
-                    content={"detail": "Too many requests, please try again later."}
+                    content={"detail": "Too many requests, please try again later."},
+                    headers={"Retry-After": str(retry_after)}
                 )
+                await response(scope, receive, send)
+                return
 
-        response = await call_next(request)
-        return response
\ No newline at end of file
+        await self.app(scope, receive, send)
@@ -0,0 +1,225 @@
+# File: backend/app/core/revocation.py
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Dict, Iterable, Optional
+import asyncio
+import hashlib
+import json
+import logging
+import math
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.models.authsystem.user_session import UserSession
+
+logger = logging.getLogger(__name__)
+
+REVOCATION_CHANNEL = "fieldtrax:token-revocations"
+# Backoff between reconnects of the revocation listener
+LISTEN_RETRY_SECONDS = 1.0
+LISTEN_MAX_RETRY_SECONDS = 60.0
+
+def token_fingerprint(token: str) -> str:
+    """Short, stable fingerprint of a token so raw JWTs are never kept or published"""
+    return hashlib.sha256(token.encode()).hexdigest()[:32]
+
+class BloomFilter:
+    """Fixed-size Bloom filter over token fingerprints"""
+
+    def __init__(self, capacity: int = 10000, error_rate: float = 0.001):
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.size / self.capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, fingerprint: str) -> Iterable[int]:
+        # Double hashing: the fingerprint is already a uniform hex digest
+        h1 = int(fingerprint[:16], 16)
+        h2 = int(fingerprint[16:32], 16) | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, fingerprint: str) -> None:
+        for pos in self._positions(fingerprint):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(fingerprint))
+
+class TokenRevocationList:
+    """
+    In-memory revoked-token registry.
+
+    A Bloom filter answers the common "not revoked" case without touching the
+    exact set; positives are confirmed against a dict of fingerprint -> expiry.
+    The registry is rebuilt from user_session at startup and kept in sync
+    across workers through the Redis pub/sub channel.
+    """
+
+    def __init__(self, capacity: int = 10000, error_rate: float = 0.001,
+                 retry_delay: float = LISTEN_RETRY_SECONDS, max_retry_delay: float = LISTEN_MAX_RETRY_SECONDS):
+        self.error_rate = error_rate
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self._revoked: Dict[str, float] = {}
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._lock = Lock()
+        self._redis = None
+        self._listener: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    @staticmethod
+    def _expiry(expires_at: Optional[datetime]) -> float:
+        if expires_at is None:
+            return math.inf
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return expires_at.timestamp()
+
+    def _add(self, fingerprint: str, expiry: float) -> None:
+        with self._lock:
+            self._revoked[fingerprint] = expiry
+            if len(self._revoked) > self._bloom.capacity:
+                self._rebuild_bloom()
+            else:
+                self._bloom.add(fingerprint)
+
+    def _rebuild_bloom(self) -> None:
+        """Drop expired entries and resize the filter (caller holds the lock)"""
+        now = datetime.now(timezone.utc).timestamp()
+        self._revoked = {fp: exp for fp, exp in self._revoked.items() if exp > now}
+        bloom = BloomFilter(max(self._bloom.capacity, 2 * len(self._revoked)), self.error_rate)
+        for fp in self._revoked:
+            bloom.add(fp)
+        self._bloom = bloom
+
+    def is_revoked(self, token: str) -> bool:
+        """O(1) revocation check for a raw token"""
+        fingerprint = token_fingerprint(token)
+        if fingerprint not in self._bloom:
+            return False
+        expiry = self._revoked.get(fingerprint)
+        return expiry is not None and expiry > datetime.now(timezone.utc).timestamp()
+
+    def revoke_local(self, token: str, expires_at: Optional[datetime] = None) -> str:
+        """Revoke a token in this worker only"""
+        fingerprint = token_fingerprint(token)
+        self._add(fingerprint, self._expiry(expires_at))
+        return fingerprint
+
+    async def revoke(self, token: Optional[str], expires_at: Optional[datetime] = None) -> None:
+        """Revoke a token here and broadcast it to the other workers"""
+        if not token:
+            return
+        fingerprint = self.revoke_local(token, expires_at)
+        if self._redis is None:
+            return
+        try:
+            await self._redis.publish(
+                REVOCATION_CHANNEL,
+                json.dumps({"fp": fingerprint, "exp": self._expiry(expires_at)})
+            )
+        except Exception as e:
+            logger.error(f"Error publishing token revocation: {str(e)}")
+
+    async def revoke_session(self, session: UserSession) -> None:
+        """Revoke both tokens belonging to a session"""
+        await self.revoke(session.access_token, session.expires_at)
+        await self.revoke(session.refresh_token, session.expires_at)
+
+    def load_from_db(self, db: Session) -> int:
+        """Rebuild the registry from revoked or deactivated, unexpired sessions"""
+        now = datetime.now(timezone.utc)
+        rows = db.query(
+            UserSession.access_token, UserSession.refresh_token, UserSession.expires_at
+        ).filter(
+            or_(UserSession.revoked == True, UserSession.is_active == False),
+            UserSession.expires_at > now
+        ).all()
+
+        revoked: Dict[str, float] = {}
+        for access_token, refresh_token, expires_at in rows:
+            expiry = self._expiry(expires_at)
+            for token in (access_token, refresh_token):
+                if token:
+                    revoked[token_fingerprint(token)] = expiry
+
+        with self._lock:
+            self._revoked = revoked
+            self._bloom = BloomFilter(max(self._bloom.capacity, 2 * len(revoked)), self.error_rate)
+            for fp in revoked:
+                self._bloom.add(fp)
+        logger.info(f"Loaded {len(revoked)} revoked tokens")
+        return len(revoked)
+
+    def _resync(self) -> None:
+        from app.db.session import SessionLocal
+        db = SessionLocal()
+        try:
+            self.load_from_db(db)
+        finally:
+            db.close()
+
+    async def _consume(self, pubsub) -> None:
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                try:
+                    payload = json.loads(message["data"])
+                    self._add(payload["fp"], float(payload["exp"]))
+                except Exception as e:
+                    logger.error(f"Invalid revocation message: {str(e)}")
+        finally:
+            try:
+                await pubsub.unsubscribe(REVOCATION_CHANNEL)
+            except Exception:
+                pass
+
+    async def _listen(self) -> None:
+        """Listen for revocations, reconnecting with backoff when Redis drops"""
+        delay = self.retry_delay
+        reconnecting = False
+        try:
+            while True:
+                try:
+                    pubsub = self._redis.pubsub()
+                    await pubsub.subscribe(REVOCATION_CHANNEL)
+                    # Connected again: the next failure starts the backoff over
+                    delay = self.retry_delay
+                    if reconnecting:
+                        # Pick up revocations published while disconnected
+                        await asyncio.get_running_loop().run_in_executor(None, self._resync)
+                    reconnecting = True
+                    await self._consume(pubsub)
+                    logger.warning("Token revocation subscription ended")
+                except Exception as e:
+                    reconnecting = True
+                    logger.error(f"Token revocation listener error: {str(e)}")
+                logger.info(f"Reconnecting token revocation listener in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_retry_delay)
+        finally:
+            logger.info("Token revocation listener stopped")
+
+    async def start(self, redis) -> None:
+        """Attach the shared cache backend and start listening for revocations"""
+        self._redis = redis
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener = None
+        self._redis = None
+
+# Create global instance
+token_revocation = TokenRevocationList()
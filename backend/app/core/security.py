@@ -9,6 +9,7 @@ from jose import jwt, JWTError
 from passlib.context import CryptContext
 from app.core.config import settings
 from app.core.email import EmailService
+from app.core.revocation import token_revocation
 from pydantic import EmailStr
 import secrets
 import string
@@ -115,6 +116,11 @@ class TokenService:
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail=f"Invalid token type. Expected {token_type}"
                 )
+            if token_revocation.is_revoked(token):
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Token has been revoked"
+                )
             return payload
         except jwt.ExpiredSignatureError:
             raise HTTPException(
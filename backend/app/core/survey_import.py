@@ -0,0 +1,473 @@
+# File: backend/app/core/survey_import.py
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import asyncio
+import codecs
+import csv
+import logging
+import math
+import re
+import uuid
+
+import numpy as np
+
+from app.core.domain.calculations.pressure_profile import minimum_curvature
+from app.core.units.validators import (
+    BatchValidationResult, Depth, SurveyBatchValidator, as_column, column_to_unit
+)
+
+try:
+    import openpyxl
+except ImportError:  # pragma: no cover - optional dependency
+    openpyxl = None
+
+logger = logging.getLogger(__name__)
+
+SURVEY_FORMATS = ("csv", "las", "xlsx")
+READ_BYTES = 256 * 1024
+CHUNK_ROWS = 5000
+
+DEPTH_UNITS = {
+    "ft": "ft", "f": "ft", "feet": "ft", "foot": "ft", "usft": "ft",
+    "m": "m", "meter": "m", "meters": "m", "metre": "m", "metres": "m",
+}
+ANGLE_UNITS = {"deg": 1.0, "degree": 1.0, "degrees": 1.0, "dega": 1.0,
+               "rad": math.degrees(1.0), "radian": math.degrees(1.0), "radians": math.degrees(1.0)}
+COLUMN_ALIASES = {
+    "md": ("md", "depth", "dept", "measured depth", "measured depth md", "mdepth", "dmea"),
+    "inclination": ("inc", "incl", "inclination", "dev", "devi", "deviation"),
+    "azimuth": ("azi", "azim", "azimuth", "az", "hazi", "hole azimuth"),
+}
+_HEADER = re.compile(r"^\s*(?P<name>[^(\[]*?)\s*(?:[(\[]\s*(?P<unit>[^)\]]*?)\s*[)\]])?\s*$")
+_LAS_LINE = re.compile(r"^\s*(?P<mnem>[^.\s]+)\s*\.(?P<unit>\S*)\s*(?P<data>[^:]*?)\s*:")
+
+class SurveyFileError(ValueError):
+    """The uploaded file is not a readable survey"""
+
+def survey_format(filename: Optional[str], content_type: Optional[str] = None) -> str:
+    """csv, las or xlsx from the file name, falling back to the content type"""
+    suffix = filename.rsplit(".", 1)[-1].lower() if filename and "." in filename else ""
+    if suffix in ("csv", "txt", "tsv", "dat"):
+        return "csv"
+    if suffix == "las":
+        return "las"
+    if suffix in ("xlsx", "xlsm"):
+        return "xlsx"
+    content_type = (content_type or "").lower()
+    if "spreadsheetml" in content_type:
+        return "xlsx"
+    if content_type.startswith("text/"):
+        return "csv"
+    raise SurveyFileError(f"Unsupported survey file: {filename}")
+
+def _column_key(label: str) -> Tuple[Optional[str], Optional[str]]:
+    """Which survey column a header cell names, and the unit it carries"""
+    match = _HEADER.match(str(label))
+    if not match:
+        return None, None
+    name = re.sub(r"[\s_\-]+", " ", match.group("name")).strip().lower()
+    unit = (match.group("unit") or "").strip().lower() or None
+    if unit is None and " " in name:
+        # "MD ft" / "INC_deg"
+        head, _, tail = name.rpartition(" ")
+        if tail in DEPTH_UNITS or tail in ANGLE_UNITS:
+            name, unit = head, tail
+    for key, aliases in COLUMN_ALIASES.items():
+        if name in aliases:
+            return key, unit
+    return None, unit
+
+Columns = Tuple[List[Any], List[Any], List[Any]]
+
+class _SurveyReader:
+    """Common state of the format readers: units found in the file"""
+
+    def __init__(self):
+        self.md_unit: Optional[str] = None
+        self.angle_factor = {"inclination": 1.0, "azimuth": 1.0}
+
+    def _set_unit(self, key: str, unit: Optional[str]) -> None:
+        if not unit:
+            return
+        if key == "md":
+            if unit not in DEPTH_UNITS:
+                raise SurveyFileError(f"Unknown depth unit: {unit}")
+            self.md_unit = DEPTH_UNITS[unit]
+        elif unit in ANGLE_UNITS:
+            self.angle_factor[key] = ANGLE_UNITS[unit]
+
+class TableReader(_SurveyReader):
+    """
+    Survey tables (delimited text or spreadsheet rows). Anything before the
+    header row naming MD, inclination and azimuth is skipped; a units row
+    right after the header is recognised.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.index: Optional[Dict[str, int]] = None
+        self._expect_units = False
+
+    def _find_header(self, row: Sequence[Any]) -> bool:
+        found, units = {}, {}
+        for i, cell in enumerate(row):
+            if cell is None:
+                continue
+            key, unit = _column_key(cell)
+            if key and key not in found:
+                found[key], units[key] = i, unit
+        if len(found) < 3:
+            return False
+        self.index = found
+        for key, unit in units.items():
+            self._set_unit(key, unit)
+        self._expect_units = True
+        return True
+
+    def _units_row(self, row: Sequence[Any]) -> bool:
+        cells = {key: str(row[i]).strip().strip("()[]").strip().lower() if i < len(row) and row[i] is not None else ""
+                 for key, i in self.index.items()}
+        if cells["md"] not in DEPTH_UNITS:
+            return False
+        for key, unit in cells.items():
+            self._set_unit(key, unit)
+        return True
+
+    def feed(self, rows: Iterable[Sequence[Any]]) -> Columns:
+        md, inc, azi = [], [], []
+        for row in rows:
+            if not row or all(c is None or c == "" for c in row):
+                continue
+            if self.index is None:
+                self._find_header(row)
+                continue
+            if self._expect_units:
+                self._expect_units = False
+                if self._units_row(row):
+                    continue
+            get = lambda key: row[self.index[key]] if self.index[key] < len(row) else None
+            md.append(get("md"))
+            inc.append(get("inclination"))
+            azi.append(get("azimuth"))
+        return md, inc, azi
+
+class CsvReader(TableReader):
+    """Comma, semicolon, tab or whitespace separated survey tables"""
+
+    def __init__(self):
+        super().__init__()
+        self.delimiter: Optional[str] = None
+
+    def _split(self, lines: List[str]) -> List[Sequence[str]]:
+        if self.delimiter is None:
+            return [next(csv.reader([line]), []) for line in lines]
+        if self.delimiter == " ":
+            return [line.split() for line in lines]
+        return list(csv.reader(lines, delimiter=self.delimiter))
+
+    def feed_lines(self, lines: List[str]) -> Columns:
+        lines = [line for line in lines if line.strip() and not line.lstrip().startswith("#")]
+        columns: Columns = ([], [], [])
+        while lines and self.index is None:
+            line = lines.pop(0)
+            for delimiter in ("\t", ";", ",", " "):
+                row = line.split() if delimiter == " " else next(csv.reader([line], delimiter=delimiter), [])
+                if len(row) >= 3 and self._find_header([c.strip() for c in row]):
+                    self.delimiter = delimiter
+                    break
+        if self.index is None:
+            return columns
+        rows = [[c.strip() for c in row] for row in self._split(lines)]
+        return self.feed(rows)
+
+class LasReader(_SurveyReader):
+    """LAS 2.0 (unwrapped) deviation surveys: ~Curve for the columns, ~ASCII for the data"""
+
+    def __init__(self):
+        super().__init__()
+        self.section = ""
+        self.curves: List[str] = []
+        self.null: Optional[float] = None
+        self.index: Optional[Dict[str, int]] = None
+
+    def _header_line(self, line: str) -> None:
+        match = _LAS_LINE.match(line)
+        if not match:
+            return
+        mnem = match.group("mnem").upper()
+        unit = match.group("unit").lower()
+        data = match.group("data").strip()
+        if self.section == "V":
+            if mnem == "VERS" and data and not data.startswith("2"):
+                raise SurveyFileError(f"Only LAS 2.0 is supported, got version {data}")
+            if mnem == "WRAP" and data.upper().startswith("Y"):
+                raise SurveyFileError("Wrapped LAS files are not supported")
+        elif self.section == "W" and mnem == "NULL":
+            try:
+                self.null = float(data)
+            except ValueError:
+                pass
+        elif self.section == "C":
+            self.curves.append(mnem)
+            key, _ = _column_key(mnem)
+            if key and (self.index is None or key not in self.index):
+                self.index = dict(self.index or {}, **{key: len(self.curves) - 1})
+                self._set_unit(key, unit)
+
+    def feed_lines(self, lines: List[str]) -> Columns:
+        md, inc, azi = [], [], []
+        for line in lines:
+            stripped = line.strip()
+            if not stripped or stripped.startswith("#"):
+                continue
+            if stripped.startswith("~"):
+                self.section = stripped[1:2].upper()
+                if self.section == "A" and (self.index is None or len(self.index) < 3):
+                    raise SurveyFileError("LAS curves must include depth, inclination and azimuth")
+                continue
+            if self.section != "A":
+                self._header_line(stripped)
+                continue
+            values = stripped.split()
+            if len(values) != len(self.curves):
+                values = [None] * len(self.curves)
+            md.append(values[self.index["md"]])
+            inc.append(values[self.index["inclination"]])
+            azi.append(values[self.index["azimuth"]])
+        return md, inc, azi
+
+def _xlsx_rows(file: Any) -> Iterator[Sequence[Any]]:
+    if openpyxl is None:
+        raise SurveyFileError("Excel import needs the openpyxl package")
+    try:
+        workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    except Exception as e:
+        raise SurveyFileError(f"Unreadable workbook: {str(e)}")
+    try:
+        yield from workbook.worksheets[0].iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+@dataclass
+class SurveyImportProgress:
+    import_id: str
+    filename: Optional[str]
+    state: str = "running"  # running, done, failed
+    bytes_read: int = 0
+    total_bytes: Optional[int] = None
+    rows: int = 0
+    accepted: int = 0
+    rejected: int = 0
+    inserted: int = 0
+    error: Optional[str] = None
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+
+    def finish(self, inserted: int) -> None:
+        self.state, self.inserted, self.finished_at = "done", inserted, datetime.utcnow()
+
+    def fail(self, error: str) -> None:
+        self.state, self.error, self.finished_at = "failed", error, datetime.utcnow()
+
+    def to_dict(self) -> Dict[str, Any]:
+        percent = None
+        if self.total_bytes:
+            percent = round(100.0 * min(self.bytes_read, self.total_bytes) / self.total_bytes, 1)
+        return {**self.__dict__, "percent": 100.0 if self.state == "done" else percent}
+
+_imports: "OrderedDict[str, SurveyImportProgress]" = OrderedDict()
+MAX_TRACKED_IMPORTS = 200
+
+def start_import(import_id: Optional[str], filename: Optional[str], total_bytes: Optional[int] = None) -> SurveyImportProgress:
+    """Register an import so its progress can be polled by id"""
+    progress = SurveyImportProgress(import_id or str(uuid.uuid4()), filename, total_bytes=total_bytes)
+    _imports[progress.import_id] = progress
+    while len(_imports) > MAX_TRACKED_IMPORTS:
+        _imports.popitem(last=False)
+    return progress
+
+def get_import_progress(import_id: str) -> Optional[SurveyImportProgress]:
+    return _imports.get(import_id)
+
+class SurveyImporter:
+    """
+    Streams a survey file into insert mappings for the trajectory table.
+
+    The upload is read and parsed in chunks of CHUNK_ROWS stations; each
+    chunk is converted to ft/deg, validated as columns and run through
+    minimum curvature together with the last accepted station of the
+    previous chunk (or the last stored station when appending), so the
+    file is never held in memory as a whole.
+    """
+
+    def __init__(self,
+                 fmt: str,
+                 depth_unit: Optional[str] = None,
+                 chunk_rows: int = CHUNK_ROWS,
+                 error_limit: int = 100):
+        if fmt not in SURVEY_FORMATS:
+            raise SurveyFileError(f"Unknown survey format: {fmt}")
+        if depth_unit is not None and depth_unit.lower() not in DEPTH_UNITS:
+            raise SurveyFileError(f"Unknown depth unit: {depth_unit}")
+        self.format = fmt
+        self.depth_unit = DEPTH_UNITS[depth_unit.lower()] if depth_unit else None
+        self.chunk_rows = chunk_rows
+        self.error_limit = error_limit
+        self.reader = {"csv": CsvReader, "las": LasReader, "xlsx": TableReader}[fmt]()
+        self.rows = 0
+        self.rejected = 0
+        self.flagged = 0
+        self.errors: List[Dict[str, Any]] = []
+        self.warnings: List[Dict[str, Any]] = []
+        self.summary: Dict[str, Dict[str, int]] = {}
+        self.last: Optional[Tuple[float, float, float]] = None  # md ft, inc, azi of the last accepted station
+        self.position: Optional[Tuple[float, float, float]] = None  # its tvd, north, east
+        self.max_dls = 0.0
+        self.accepted = 0
+
+    # Reading
+
+    async def _lines(self, upload: Any, progress: Optional[SurveyImportProgress]) -> AsyncIterator[List[str]]:
+        decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+        tail = ""
+        while True:
+            data = await upload.read(READ_BYTES)
+            if progress is not None:
+                progress.bytes_read += len(data)
+            text = tail + decoder.decode(data, final=not data)
+            lines = text.split("\n")
+            tail = lines.pop() if data else ""
+            yield [line.rstrip("\r") for line in lines if line]
+            if not data:
+                return
+
+    async def _columns(self, upload: Any, progress: Optional[SurveyImportProgress]) -> AsyncIterator[Columns]:
+        if self.format == "xlsx":
+            rows = _xlsx_rows(upload.file)
+            loop = asyncio.get_running_loop()
+            while True:
+                batch = await loop.run_in_executor(None, lambda: [r for _, r in zip(range(self.chunk_rows), rows)])
+                if not batch:
+                    if self.reader.index is None:
+                        raise SurveyFileError("No header with measured depth, inclination and azimuth columns found")
+                    return
+                if progress is not None and progress.total_bytes:
+                    progress.bytes_read = upload.file.tell()
+                yield self.reader.feed(batch)
+                if self.reader.index is None:
+                    raise SurveyFileError("No header with measured depth, inclination and azimuth columns found")
+        pending: Columns = ([], [], [])
+        async for lines in self._lines(upload, progress):
+            for target, values in zip(pending, self.reader.feed_lines(lines)):
+                target.extend(values)
+            while len(pending[0]) >= self.chunk_rows:
+                yield tuple(p[:self.chunk_rows] for p in pending)
+                pending = tuple(p[self.chunk_rows:] for p in pending)
+        if self.reader.index is None or len(self.reader.index) < 3:
+            raise SurveyFileError("No header with measured depth, inclination and azimuth columns found")
+        if pending[0]:
+            yield pending
+
+    # Processing
+
+    def _collect(self, result: BatchValidationResult, offset: int, rows: int) -> None:
+        for found, target in ((result.describe(self.error_limit), self.errors),
+                              (result.describe(self.error_limit, warnings=True), self.warnings)):
+            room = self.error_limit - len(target)
+            target.extend({**item, "row": item["row"] - offset + self.rows} for item in found[:max(room, 0)])
+        for column, counts in result.summary().items():
+            merged = self.summary.setdefault(column, {})
+            for name, n in counts.items():
+                merged[name] = merged.get(name, 0) + n
+
+    def process(self, md: Sequence[Any], inc: Sequence[Any], azi: Sequence[Any], **constants: Any) -> List[Dict[str, Any]]:
+        """Validate and position one chunk; returns insert mappings of the accepted stations"""
+        n = len(md)
+        md, inc, azi = as_column(md), as_column(inc), as_column(azi)
+        null = getattr(self.reader, "null", None)
+        if null is not None:
+            for column in (md, inc, azi):
+                column[column == null] = np.nan
+        md_ft, unit_codes = column_to_unit(md, Depth, self.depth_unit or self.reader.md_unit or "ft", "ft")
+        inc = inc * self.reader.angle_factor["inclination"]
+        azi = azi * self.reader.angle_factor["azimuth"]
+        offset = 0
+        if self.last is not None:
+            # Validate against the last accepted station: ordering and dogleg carry over
+            md_ft, inc, azi = (np.r_[prev, col] for prev, col in zip(self.last, (md_ft, inc, azi)))
+            unit_codes = np.r_[np.int16(0), unit_codes]
+            offset = 1
+        result = SurveyBatchValidator.validate(md_ft, inc, azi, "ft")
+        result.add("measured_depth", unit_codes)
+        valid = result.valid
+        if offset:
+            for codes in list(result.errors.values()) + list(result.warnings.values()):
+                codes[0] = 0
+            valid[0] = False
+        self._collect(result, offset, n)
+        self.rows += n
+        self.rejected += int(np.count_nonzero(~valid[offset:]))
+        self.flagged += int(np.count_nonzero(result.flagged[offset:]))
+
+        keep = np.flatnonzero(valid)
+        if keep.size == 0:
+            return []
+        if offset:
+            keep = np.r_[0, keep]
+        tvd, north, east, dls = minimum_curvature(md_ft[keep], inc[keep], azi[keep], origin=self.position)
+        if offset:
+            keep, tvd, north, east, dls = keep[1:], tvd[1:], north[1:], east[1:], dls[1:]
+        if keep.size == 0:
+            return []
+        self.max_dls = max(self.max_dls, float(np.max(dls)))
+        self.last = (float(md_ft[keep[-1]]), float(inc[keep[-1]]), float(azi[keep[-1]]))
+        self.position = (float(tvd[-1]), float(north[-1]), float(east[-1]))
+        self.accepted += keep.size
+        rows = np.column_stack((md_ft[keep], inc[keep], azi[keep])).tolist()
+        return [{"measured_depth": m, "inclination": i, "azimuth": a, **constants} for m, i, a in rows]
+
+    def seed(self, md_ft: float, inclination: float, azimuth: float,
+             position: Optional[Tuple[float, float, float]] = None) -> None:
+        """Continue after an existing station; its position defaults to straight from surface"""
+        self.last = (md_ft, inclination, azimuth)
+        self.position = position or tuple(
+            float(x[0]) for x in minimum_curvature([md_ft], [inclination], [azimuth])[:3]
+        )
+
+    async def stations(self, upload: Any, progress: Optional[SurveyImportProgress] = None,
+                       **constants: Any) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Insert mappings, one list per chunk"""
+        async for md, inc, azi in self._columns(upload, progress):
+            rows = self.process(md, inc, azi, **constants)
+            if progress is not None:
+                progress.rows, progress.accepted, progress.rejected = self.rows, self.accepted, self.rejected
+            yield rows
+
+    def report(self, inserted: int) -> Dict[str, Any]:
+        """Import outcome in the shape of SurveyImportResponse"""
+        trajectory = None
+        if self.position is not None:
+            tvd, north, east = self.position
+            trajectory = {
+                "stations": self.accepted,
+                "measured_depth": self.last[0],
+                "tvd": tvd,
+                "north": north,
+                "east": east,
+                "closure": math.hypot(north, east),
+                "max_dls": self.max_dls,
+            }
+        return {
+            "format": self.format,
+            "depth_unit": self.depth_unit or self.reader.md_unit or "ft",
+            "received": self.rows,
+            "inserted": inserted,
+            "rejected": self.rejected,
+            "flagged": self.flagged,
+            "errors": self.errors,
+            "warnings": self.warnings,
+            "summary": self.summary,
+            "trajectory": trajectory,
+        }
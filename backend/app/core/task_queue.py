@@ -0,0 +1,346 @@
+# File: backend/app/core/task_queue.py
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import inspect
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import sqlite3
+import time
+import uuid
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+OFFLINE_DB_DIR = Path(__file__).resolve().parent.parent / "offline_db"
+
+class TaskStatus:
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+@dataclass
+class TaskDefinition:
+    name: str
+    func: Callable[..., Any]
+    concurrency: int = 1
+    max_attempts: int = 3
+    retry_delay: float = 30.0
+
+# Task registry, filled by the @task decorator in app/core/tasks.py
+_registry: Dict[str, TaskDefinition] = {}
+
+def task(name: str, *, concurrency: int = 1, max_attempts: int = 3, retry_delay: float = 30.0):
+    """
+    Register a function as a queued task type.
+    The function receives the payload as keyword arguments and may be sync or async;
+    its return value must be JSON serializable and is stored as the task result.
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        _registry[name] = TaskDefinition(name, func, concurrency, max_attempts, retry_delay)
+        return func
+    return decorator
+
+def get_task_definition(name: str) -> Optional[TaskDefinition]:
+    return _registry.get(name)
+
+class TaskQueue:
+    """
+    SQLite-backed durable task queue.
+
+    Tasks survive restarts, are claimed in priority order, respect a per-type
+    concurrency limit across all worker processes, and an active task with
+    the same dedup key is reused instead of queued twice. Results and errors
+    are stored on the task row.
+    """
+
+    def __init__(self, path: Optional[str] = None, lease_timeout: float = 300.0):
+        if path is None:
+            OFFLINE_DB_DIR.mkdir(parents=True, exist_ok=True)
+            path = str(OFFLINE_DB_DIR / "task_queue.db")
+        self.path = path
+        self.lease_timeout = lease_timeout
+        self._lock = Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tasks (
+                id TEXT PRIMARY KEY,
+                task_type TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                priority INTEGER NOT NULL DEFAULT 0,
+                status TEXT NOT NULL DEFAULT 'queued',
+                dedup_key TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL DEFAULT 3,
+                run_after REAL NOT NULL,
+                heartbeat_at REAL,
+                worker_id TEXT,
+                result TEXT,
+                error TEXT,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL
+            )
+            """
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS ix_tasks_claim ON tasks (status, priority DESC, created_at)"
+        )
+        self._db.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS ux_tasks_dedup ON tasks (dedup_key) "
+            "WHERE dedup_key IS NOT NULL AND status IN ('queued', 'running')"
+        )
+
+    def enqueue(
+        self,
+        task_type: str,
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        priority: int = 0,
+        dedup_key: Optional[str] = None,
+        delay: float = 0.0,
+        max_attempts: Optional[int] = None
+    ) -> str:
+        """Queue a task and return its id (or the id of the active duplicate)"""
+        definition = get_task_definition(task_type)
+        if max_attempts is None:
+            max_attempts = definition.max_attempts if definition else 3
+        now = time.time()
+        task_id = str(uuid.uuid4())
+        with self._lock:
+            try:
+                self._db.execute(
+                    "INSERT INTO tasks (id, task_type, payload, priority, dedup_key, max_attempts, run_after, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (task_id, task_type, json.dumps(payload or {}, default=str), priority,
+                     dedup_key, max_attempts, now + delay, now)
+                )
+            except sqlite3.IntegrityError:
+                row = self._db.execute(
+                    "SELECT id FROM tasks WHERE dedup_key = ? AND status IN ('queued', 'running')",
+                    (dedup_key,)
+                ).fetchone()
+                if row is None:
+                    raise
+                return row["id"]
+        return task_id
+
+    def claim(self, worker_id: str, task_types: Optional[List[str]] = None) -> Optional[sqlite3.Row]:
+        """Atomically claim the highest-priority runnable task for a worker"""
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                running = dict(self._db.execute(
+                    "SELECT task_type, COUNT(*) FROM tasks WHERE status = 'running' GROUP BY task_type"
+                ).fetchall())
+                full = [
+                    name for name, definition in _registry.items()
+                    if running.get(name, 0) >= definition.concurrency
+                ]
+                query = "SELECT * FROM tasks WHERE status = 'queued' AND run_after <= ?"
+                params: List[Any] = [now]
+                if full:
+                    query += f" AND task_type NOT IN ({','.join('?' * len(full))})"
+                    params.extend(full)
+                if task_types is not None:
+                    query += f" AND task_type IN ({','.join('?' * len(task_types))})"
+                    params.extend(task_types)
+                query += " ORDER BY priority DESC, created_at LIMIT 1"
+                row = self._db.execute(query, params).fetchone()
+                if row is not None:
+                    self._db.execute(
+                        "UPDATE tasks SET status = 'running', worker_id = ?, attempts = attempts + 1, "
+                        "started_at = ?, heartbeat_at = ? WHERE id = ?",
+                        (worker_id, now, now, row["id"])
+                    )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+        return row
+
+    def heartbeat(self, task_id: str) -> None:
+        with self._lock:
+            self._db.execute("UPDATE tasks SET heartbeat_at = ? WHERE id = ?", (time.time(), task_id))
+
+    def complete(self, task_id: str, result: Any) -> None:
+        with self._lock:
+            self._db.execute(
+                "UPDATE tasks SET status = 'succeeded', result = ?, error = NULL, finished_at = ? WHERE id = ?",
+                (json.dumps(result, default=str), time.time(), task_id)
+            )
+
+    def fail(self, task_id: str, error: str, retry_delay: float = 30.0) -> None:
+        """Record a failure; the task is requeued with backoff until max_attempts"""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT attempts, max_attempts FROM tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+            if row is None:
+                return
+            if row["attempts"] < row["max_attempts"]:
+                self._db.execute(
+                    "UPDATE tasks SET status = 'queued', worker_id = NULL, error = ?, run_after = ? WHERE id = ?",
+                    (error, now + retry_delay * (2 ** (row["attempts"] - 1)), task_id)
+                )
+            else:
+                self._db.execute(
+                    "UPDATE tasks SET status = 'failed', error = ?, finished_at = ? WHERE id = ?",
+                    (error, now, task_id)
+                )
+
+    def requeue_stale(self) -> int:
+        """Return tasks whose worker stopped heart-beating (e.g. after a restart) to the queue"""
+        cutoff = time.time() - self.lease_timeout
+        with self._lock:
+            cursor = self._db.execute(
+                "UPDATE tasks SET status = 'queued', worker_id = NULL "
+                "WHERE status = 'running' AND heartbeat_at < ?",
+                (cutoff,)
+            )
+        if cursor.rowcount:
+            logger.warning(f"Requeued {cursor.rowcount} stale tasks")
+        return cursor.rowcount
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Task status, result and error as a dict"""
+        with self._lock:
+            row = self._db.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        if row is None:
+            return None
+        task_info = dict(row)
+        task_info["payload"] = json.loads(task_info["payload"])
+        task_info["result"] = json.loads(task_info["result"]) if task_info["result"] else None
+        return task_info
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT task_type, status, COUNT(*) FROM tasks GROUP BY task_type, status"
+            ).fetchall()
+        stats: Dict[str, Dict[str, int]] = {}
+        for task_type, status, count in rows:
+            stats.setdefault(task_type, {})[status] = count
+        return stats
+
+    def purge_finished(self, older_than: float = 7 * 86400) -> int:
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM tasks WHERE status IN ('succeeded', 'failed') AND finished_at < ?",
+                (time.time() - older_than,)
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+class TaskWorker:
+    """Claims and executes tasks in a loop; run one per worker process"""
+
+    def __init__(self, queue: TaskQueue, poll_interval: float = 1.0, task_types: Optional[List[str]] = None):
+        self.queue = queue
+        self.poll_interval = poll_interval
+        self.task_types = task_types
+        self.worker_id = f"{os.uname().nodename if hasattr(os, 'uname') else 'worker'}:{os.getpid()}"
+        self._running = True
+
+    def stop(self, *args) -> None:
+        self._running = False
+
+    def _execute(self, definition: TaskDefinition, payload: Dict[str, Any]) -> Any:
+        if inspect.iscoroutinefunction(definition.func):
+            return asyncio.run(definition.func(**payload))
+        return definition.func(**payload)
+
+    def run_once(self) -> bool:
+        """Claim and run a single task; returns False if nothing was runnable"""
+        row = self.queue.claim(self.worker_id, self.task_types)
+        if row is None:
+            return False
+        definition = get_task_definition(row["task_type"])
+        if definition is None:
+            self.queue.fail(row["id"], f"Unknown task type: {row['task_type']}", retry_delay=0)
+            return True
+        # Keep the lease alive while long tasks run so they are not requeued
+        done = Event()
+        beat = Thread(target=self._heartbeat, args=(row["id"], done), daemon=True)
+        beat.start()
+        try:
+            result = self._execute(definition, json.loads(row["payload"]))
+            self.queue.complete(row["id"], result)
+        except Exception as e:
+            logger.error(f"Task {row['task_type']} ({row['id']}) failed: {str(e)}")
+            self.queue.fail(row["id"], str(e)[:2000], retry_delay=definition.retry_delay)
+        finally:
+            done.set()
+            beat.join()
+        return True
+
+    def _heartbeat(self, task_id: str, done: Event) -> None:
+        while not done.wait(self.queue.lease_timeout / 3):
+            self.queue.heartbeat(task_id)
+
+    def run(self) -> None:
+        signal.signal(signal.SIGTERM, self.stop)
+        last_sweep = 0.0  # sweep stale leases on the first pass
+        while self._running:
+            try:
+                if time.time() - last_sweep > self.queue.lease_timeout:
+                    self.queue.requeue_stale()
+                    last_sweep = time.time()
+                if not self.run_once():
+                    time.sleep(self.poll_interval)
+            except Exception as e:
+                # e.g. the queue database is locked or briefly unavailable; keep the worker alive
+                logger.error(f"Task worker error: {str(e)}")
+                time.sleep(self.poll_interval)
+
+_task_queue: Optional[TaskQueue] = None
+
+def get_task_queue() -> TaskQueue:
+    """Process-wide task queue handle"""
+    global _task_queue
+    if _task_queue is None:
+        # Register the task types so enqueue() picks up their declared max_attempts
+        import app.core.tasks  # noqa: F401
+        _task_queue = TaskQueue(path=settings.TASK_QUEUE_PATH or None)
+    return _task_queue
+
+def enqueue_task(task_type: str, payload: Optional[Dict[str, Any]] = None, **kwargs) -> str:
+    return get_task_queue().enqueue(task_type, payload, **kwargs)
+
+def _worker_main(task_types: Optional[List[str]] = None) -> None:
+    TaskWorker(get_task_queue(), task_types=task_types).run()
+
+def run_workers(count: int = 2, task_types: Optional[List[str]] = None) -> None:
+    """Start worker processes and wait for them; stops all on SIGINT/SIGTERM"""
+    processes = [
+        multiprocessing.Process(target=_worker_main, args=(task_types,), daemon=False)
+        for _ in range(count)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+
+if __name__ == "__main__":
+    run_workers(settings.TASK_WORKERS)
@@ -0,0 +1,44 @@
+# File: backend/app/core/tasks.py
+"""Task types executed by the durable task queue workers (see app/core/task_queue.py)"""
+from typing import Any, Dict
+from uuid import UUID
+
+from app.core.task_queue import task
+
+@task("sync.synchronize", concurrency=1, max_attempts=5, retry_delay=60.0)
+async def synchronize() -> Dict[str, Any]:
+    """Push offline changes to the online database"""
+    from app.db.session import SessionLocal
+    from app.db.sync_manager import sync_manager
+
+    db = SessionLocal()
+    try:
+        results = await sync_manager.synchronize(db)
+    finally:
+        db.close()
+    if not results.get('success') and results.get('message'):
+        # Offline: let the queue retry with backoff
+        raise RuntimeError(results['message'])
+    return results
+
+@task("email.password_reset", concurrency=4)
+async def password_reset_email(email: str, reset_token: str) -> bool:
+    from app.core.email import send_password_reset_email
+
+    if not await send_password_reset_email(email=email, reset_token=reset_token):
+        raise RuntimeError(f"Could not send password reset email to {email}")
+    return True
+
+@task("email.verification", concurrency=4)
+async def verification_email(email: str, verification_token: str) -> bool:
+    from app.core.email import send_verification_email
+
+    if not await send_verification_email(email=email, verification_token=verification_token):
+        raise RuntimeError(f"Could not send verification email to {email}")
+    return True
+
+@task("notify.job_created", concurrency=2)
+async def job_created(job_id: str) -> None:
+    from app.core.background import notify_job_creation
+
+    await notify_job_creation(UUID(job_id))
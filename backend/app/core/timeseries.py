@@ -0,0 +1,494 @@
+# File: backend/app/core/timeseries.py
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+import os
+import re
+import shutil
+import struct
+import time
+import zlib
+
+import numpy as np
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+OFFLINE_DB_DIR = Path(__file__).resolve().parent.parent / "offline_db"
+
+CHUNK_MAGIC = b"FTTS"
+CHUNK_VERSION = 1
+CHUNK_SUFFIX = ".tsc"
+WAL_NAME = "head.wal"
+# magic, version, delta dtype, count, first, last, min, max, timestamp payload length
+_HEADER = struct.Struct("<4sBBIqqddI")
+_DELTA_DTYPES = (np.dtype("<i1"), np.dtype("<i2"), np.dtype("<i4"), np.dtype("<i8"))
+_WAL_DTYPE = np.dtype([("t", "<i8"), ("v", "<f8")])
+# Names starting with "_" are reserved for derived data such as rollups
+_NAME = re.compile(r"^[A-Za-z0-9\-][A-Za-z0-9_.\-]*$")
+
+def valid_name(name: str) -> bool:
+    """Job ids and channel names double as directory names"""
+    return bool(_NAME.match(name))
+
+def to_millis(timestamps: Any) -> np.ndarray:
+    """Epoch milliseconds from datetimes, datetime64 or numbers (already epoch ms)"""
+    t = np.asarray(timestamps)
+    if np.issubdtype(t.dtype, np.datetime64):
+        return t.astype("datetime64[ms]").astype(np.int64)
+    if t.dtype == object:
+        return np.array([_datetime_millis(x) if isinstance(x, datetime) else int(x) for x in t.ravel()],
+                        dtype=np.int64).reshape(t.shape)
+    return t.astype(np.int64)
+
+def _datetime_millis(value: datetime) -> int:
+    # Naive datetimes are taken as UTC, like datetime.utcnow() values elsewhere
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(round(value.timestamp() * 1000))
+
+def _millis(value: Any) -> int:
+    return int(to_millis([value])[0])
+
+def encode_chunk(t: np.ndarray, v: np.ndarray) -> bytes:
+    """
+    Compress one column chunk.
+
+    Timestamps are stored as delta-of-delta in the narrowest integer type
+    (all zeros for a fixed sample rate); values as the XOR of each float's
+    bits with the previous one, byte-shuffled so the mostly-zero high bytes
+    of slowly changing signals sit together before zlib.
+    """
+    t = np.asarray(t, dtype=np.int64)
+    v = np.asarray(v, dtype="<f8")
+    deltas = np.diff(t, prepend=t[:1])
+    dod = np.diff(deltas, prepend=0)
+    code = next(i for i, dtype in enumerate(_DELTA_DTYPES)
+                if dod.size == 0 or (np.iinfo(dtype).min <= dod.min() and dod.max() <= np.iinfo(dtype).max))
+    ts_payload = zlib.compress(dod.astype(_DELTA_DTYPES[code]).tobytes())
+
+    bits = v.view("<u8")
+    xored = bits ^ np.concatenate((np.zeros(1, dtype="<u8"), bits[:-1]))
+    shuffled = xored.view(np.uint8).reshape(-1, 8).T.tobytes()
+    value_payload = zlib.compress(shuffled)
+
+    finite = v[np.isfinite(v)]
+    vmin, vmax = (float(finite.min()), float(finite.max())) if finite.size else (np.nan, np.nan)
+    header = _HEADER.pack(CHUNK_MAGIC, CHUNK_VERSION, code, t.size, int(t[0]), int(t[-1]),
+                          vmin, vmax, len(ts_payload))
+    return header + ts_payload + value_payload
+
+def decode_chunk(data: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    magic, version, code, count, first, _, _, _, ts_length = _HEADER.unpack_from(data)
+    if magic != CHUNK_MAGIC or version != CHUNK_VERSION:
+        raise ValueError("Not a time-series chunk")
+    offset = _HEADER.size
+    dod = np.frombuffer(zlib.decompress(data[offset:offset + ts_length]), dtype=_DELTA_DTYPES[code])
+    t = first + np.cumsum(np.cumsum(dod.astype(np.int64)))
+
+    shuffled = np.frombuffer(zlib.decompress(data[offset + ts_length:]), dtype=np.uint8)
+    xored = np.ascontiguousarray(shuffled.reshape(8, count).T).view("<u8").reshape(count)
+    v = np.bitwise_xor.accumulate(xored).view("<f8")
+    return t, v
+
+@dataclass
+class ChunkInfo:
+    first: int  # epoch ms
+    last: int
+    count: int
+    path: Path
+    size: int  # bytes on disk
+
+    @classmethod
+    def from_path(cls, path: Path) -> "ChunkInfo":
+        first, last, count = (int(part) for part in path.stem.split("_"))
+        return cls(first, last, count, path, path.stat().st_size)
+
+@dataclass
+class RetentionPolicy:
+    max_age_days: float = 0  # 0 = keep
+    max_job_bytes: int = 0  # 0 = no limit
+
+def _list_chunks(path: Path) -> List[ChunkInfo]:
+    """Sealed chunks in a channel directory, oldest first"""
+    return sorted((ChunkInfo.from_path(p) for p in path.glob(f"*{CHUNK_SUFFIX}")), key=lambda c: c.first)
+
+def _read_head(path: Path, chunks: List[ChunkInfo]) -> Tuple[np.ndarray, np.ndarray]:
+    """Points in a channel's write-ahead file that are not sealed yet"""
+    wal = path / WAL_NAME
+    if not wal.exists():
+        return np.empty(0, np.int64), np.empty(0, np.float64)
+    raw = wal.read_bytes()
+    records = np.frombuffer(raw[:len(raw) - len(raw) % _WAL_DTYPE.itemsize], dtype=_WAL_DTYPE)
+    if chunks:
+        # Points already sealed before a crash between chunk write and WAL rewrite
+        records = records[records["t"] > chunks[-1].last]
+    return records["t"].copy(), records["v"].copy()
+
+def _series_stats(chunks: List[ChunkInfo], head_t: np.ndarray) -> Dict[str, Any]:
+    head = int(head_t.size)
+    return {
+        "points": sum(c.count for c in chunks) + head,
+        "chunks": len(chunks),
+        "head_points": head,
+        "bytes": sum(c.size for c in chunks) + head * _WAL_DTYPE.itemsize,
+        "first": chunks[0].first if chunks else (int(head_t[0]) if head else None),
+        "last": int(head_t[-1]) if head else (chunks[-1].last if chunks else None),
+    }
+
+class TimeSeries:
+    """
+    One channel of one job: sealed chunks on disk plus an open head.
+
+    Appended points go to a write-ahead file and an in-memory head; every
+    chunk_size points the head is sealed into an immutable compressed
+    chunk. Chunks are named by their time span, so a range scan only
+    opens the chunks that overlap it.
+    """
+
+    def __init__(self, path: Path, chunk_size: int):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.lock = Lock()
+        path.mkdir(parents=True, exist_ok=True)
+        for stale in path.glob("*.tmp"):
+            stale.unlink()
+        self.chunks: List[ChunkInfo] = _list_chunks(path)
+        self._firsts = [c.first for c in self.chunks]
+        self._lasts = [c.last for c in self.chunks]
+        self._head_t, self._head_v = _read_head(path, self.chunks)
+        self._wal = open(path / WAL_NAME, "ab")
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        if self._head_t.size:
+            return int(self._head_t[-1])
+        return self.chunks[-1].last if self.chunks else None
+
+    def append(self, t: np.ndarray, v: np.ndarray) -> int:
+        if t.size == 0:
+            return 0
+        if np.any(np.diff(t) <= 0):
+            raise ValueError(f"Timestamps must be strictly increasing for channel {self.path.name}")
+        with self.lock:
+            last = self.last_timestamp
+            if last is not None and t[0] <= last:
+                raise ValueError(f"Out-of-order append to channel {self.path.name}")
+            records = np.empty(t.size, dtype=_WAL_DTYPE)
+            records["t"] = t
+            records["v"] = v
+            self._wal.write(records.tobytes())
+            self._wal.flush()
+            self._head_t = np.concatenate((self._head_t, t))
+            self._head_v = np.concatenate((self._head_v, v))
+            if self._head_t.size >= self.chunk_size:
+                self._seal(self._head_t.size // self.chunk_size * self.chunk_size)
+        return t.size
+
+    def seal(self) -> None:
+        """Seal the whole head, even a partial chunk"""
+        with self.lock:
+            if self._head_t.size:
+                self._seal(self._head_t.size)
+
+    def _seal(self, count: int) -> None:
+        for start in range(0, count, self.chunk_size):
+            stop = min(start + self.chunk_size, count)
+            self._write_chunk(self._head_t[start:stop], self._head_v[start:stop])
+        self._head_t, self._head_v = self._head_t[count:], self._head_v[count:]
+        self._rewrite_wal()
+
+    def _write_chunk(self, t: np.ndarray, v: np.ndarray) -> None:
+        path = self.path / f"{int(t[0])}_{int(t[-1])}_{t.size}{CHUNK_SUFFIX}"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(encode_chunk(t, v))
+        os.replace(tmp, path)
+        self.chunks.append(ChunkInfo(int(t[0]), int(t[-1]), t.size, path, path.stat().st_size))
+        self._firsts.append(int(t[0]))
+        self._lasts.append(int(t[-1]))
+
+    def _rewrite_wal(self) -> None:
+        self._wal.close()
+        wal = self.path / WAL_NAME
+        tmp = wal.with_suffix(".tmp")
+        records = np.empty(self._head_t.size, dtype=_WAL_DTYPE)
+        records["t"] = self._head_t
+        records["v"] = self._head_v
+        tmp.write_bytes(records.tobytes())
+        os.replace(tmp, wal)
+        self._wal = open(wal, "ab")
+
+    def overlapping(self, start: int, end: int) -> Tuple[List[ChunkInfo], np.ndarray, np.ndarray]:
+        """Chunks overlapping [start, end] and a snapshot of the head"""
+        with self.lock:
+            lo = bisect_left(self._lasts, start)
+            hi = bisect_right(self._firsts, end)
+            return self.chunks[lo:hi], self._head_t, self._head_v
+
+    def drop_chunks(self, chunks: Iterable[ChunkInfo]) -> int:
+        with self.lock:
+            dropped = {c.path for c in chunks}
+            kept = []
+            for chunk in self.chunks:
+                if chunk.path in dropped:
+                    chunk.path.unlink(missing_ok=True)
+                else:
+                    kept.append(chunk)
+            removed = len(self.chunks) - len(kept)
+            self.chunks = kept
+            self._firsts = [c.first for c in kept]
+            self._lasts = [c.last for c in kept]
+            return removed
+
+    def sync(self) -> None:
+        with self.lock:
+            self._wal.flush()
+            os.fsync(self._wal.fileno())
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return _series_stats(self.chunks, self._head_t)
+
+    def close(self) -> None:
+        with self.lock:
+            self._wal.close()
+
+class TimeSeriesStore:
+    """
+    Embedded columnar store for high-frequency rig sensor data.
+
+    Data lives under <path>/<job_id>/<channel>/ as compressed, immutable
+    chunks plus a small write-ahead head per channel, so a job's data can be
+    copied or deleted as a directory and nothing runs outside the process.
+    Appends are append-only and strictly increasing in time per channel;
+    scans return (timestamps in epoch ms, values) NumPy arrays. One
+    process owns the store for writing.
+    """
+
+    def __init__(self,
+                 path: Optional[str] = None,
+                 chunk_size: int = 4096,
+                 retention: Optional[RetentionPolicy] = None,
+                 cache_chunks: int = 64):
+        if path is None:
+            path = str(OFFLINE_DB_DIR / "timeseries")
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.chunk_size = chunk_size
+        self.retention = retention or RetentionPolicy()
+        self.cache_chunks = cache_chunks
+        self._series: Dict[Tuple[str, str], TimeSeries] = {}
+        self._decoded: "OrderedDict[Path, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _name(value: Any) -> str:
+        name = str(value)
+        if not valid_name(name):
+            raise ValueError(f"Invalid job or channel name: {name!r}")
+        return name
+
+    def series(self, job_id: Any, channel: str, create: bool = True) -> Optional[TimeSeries]:
+        key = (self._name(job_id), self._name(channel))
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                path = self.path.joinpath(*key)
+                if not create and not path.is_dir():
+                    return None
+                series = self._series[key] = TimeSeries(path, self.chunk_size)
+            return series
+
+    def append(self, job_id: Any, channel: str, timestamps: Any, values: Any) -> int:
+        """Append points to one channel; returns the number of points written"""
+        t = to_millis(timestamps).ravel()
+        v = np.asarray(values, dtype=np.float64).ravel()
+        if t.size != v.size:
+            raise ValueError("Timestamps and values differ in length")
+        return self.series(job_id, channel).append(t, v)
+
+    def append_columns(self, job_id: Any, timestamps: Any, columns: Dict[str, Any]) -> int:
+        """Append a block of channels sharing one time column; returns points written"""
+        t = to_millis(timestamps).ravel()
+        written = 0
+        for channel, values in columns.items():
+            v = np.asarray(values, dtype=np.float64).ravel()
+            if v.size != t.size:
+                raise ValueError(f"Channel {channel} differs in length from the timestamps")
+            # NaN marks a missing sample in a shared-time block
+            present = ~np.isnan(v)
+            written += self.series(job_id, channel).append(t[present], v[present])
+        return written
+
+    def _decode(self, chunk: ChunkInfo) -> Tuple[np.ndarray, np.ndarray]:
+        with self._lock:
+            cached = self._decoded.get(chunk.path)
+            if cached is not None:
+                self._decoded.move_to_end(chunk.path)
+                return cached
+        t, v = decode_chunk(chunk.path.read_bytes())
+        with self._lock:
+            self._decoded[chunk.path] = (t, v)
+            if len(self._decoded) > self.cache_chunks:
+                self._decoded.popitem(last=False)
+        return t, v
+
+    def scan(self,
+             job_id: Any,
+             channel: str,
+             start: Any = None,
+             end: Any = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Points with start <= t <= end (either bound optional)"""
+        series = self.series(job_id, channel, create=False)
+        if series is None:
+            return np.empty(0, np.int64), np.empty(0, np.float64)
+        lo = np.iinfo(np.int64).min if start is None else _millis(start)
+        hi = np.iinfo(np.int64).max if end is None else _millis(end)
+        chunks, head_t, head_v = series.overlapping(lo, hi)
+        parts = []
+        for chunk in chunks:
+            try:
+                parts.append(self._decode(chunk))
+            except FileNotFoundError:
+                # Dropped by retention while scanning
+                continue
+        parts.append((head_t, head_v))
+        t = np.concatenate([p[0] for p in parts])
+        v = np.concatenate([p[1] for p in parts])
+        i, j = np.searchsorted(t, lo, side="left"), np.searchsorted(t, hi, side="right")
+        return t[i:j], v[i:j]
+
+    def scan_columns(self,
+                     job_id: Any,
+                     channels: Optional[Iterable[str]] = None,
+                     start: Any = None,
+                     end: Any = None) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        channels = self.channels(job_id) if channels is None else channels
+        return {channel: self.scan(job_id, channel, start, end) for channel in channels}
+
+    def jobs(self) -> List[str]:
+        return sorted(p.name for p in self.path.iterdir() if p.is_dir() and not p.name.startswith("_"))
+
+    def channels(self, job_id: Any) -> List[str]:
+        job_path = self.path / self._name(job_id)
+        if not job_path.is_dir():
+            return []
+        return sorted(p.name for p in job_path.iterdir() if p.is_dir())
+
+    def stats(self, job_id: Any) -> Dict[str, Dict[str, Any]]:
+        job_id = self._name(job_id)
+        return {channel: self._channel_stats(job_id, channel) for channel in self.channels(job_id)}
+
+    def seal(self, job_id: Any = None) -> None:
+        """Seal open heads into chunks, e.g. when a job is closed out"""
+        for series in self._matching(job_id):
+            series.seal()
+
+    def sync(self) -> None:
+        """fsync every open head"""
+        for series in self._matching(None):
+            series.sync()
+
+    def _matching(self, job_id: Any) -> List[TimeSeries]:
+        with self._lock:
+            if job_id is None:
+                return list(self._series.values())
+            return [s for (job, _), s in self._series.items() if job == str(job_id)]
+
+    # Stats and retention read channels that are not open straight from disk,
+    # so a pass over the whole history does not open a head file per channel
+
+    def _open_series(self, job_id: str, channel: str) -> Optional[TimeSeries]:
+        with self._lock:
+            return self._series.get((job_id, channel))
+
+    def _channel_stats(self, job_id: str, channel: str) -> Dict[str, Any]:
+        series = self._open_series(job_id, channel)
+        if series is not None:
+            return series.stats()
+        path = self.path / job_id / channel
+        chunks = _list_chunks(path)
+        return _series_stats(chunks, _read_head(path, chunks)[0])
+
+    def _chunks(self, job_id: str, channel: str) -> List[ChunkInfo]:
+        series = self._open_series(job_id, channel)
+        if series is not None:
+            with series.lock:
+                return list(series.chunks)
+        return _list_chunks(self.path / job_id / channel)
+
+    def _drop_chunks(self, job_id: str, channel: str, chunks: List[ChunkInfo]) -> int:
+        if not chunks:
+            return 0
+        with self._lock:
+            series = self._series.get((job_id, channel))
+            if series is None:
+                # Holding the store lock keeps the channel from being opened meanwhile
+                for chunk in chunks:
+                    chunk.path.unlink(missing_ok=True)
+                return len(chunks)
+        return series.drop_chunks(chunks)
+
+    def apply_retention(self, now: Optional[float] = None) -> int:
+        """Drop sealed chunks outside the retention policy; returns chunks removed"""
+        policy = self.retention
+        removed = 0
+        now_ms = int((time.time() if now is None else now) * 1000)
+        for job_id in self.jobs():
+            chunks = {channel: self._chunks(job_id, channel) for channel in self.channels(job_id)}
+            if policy.max_age_days:
+                cutoff = now_ms - int(policy.max_age_days * 86400 * 1000)
+                for channel, listed in chunks.items():
+                    removed += self._drop_chunks(job_id, channel, [c for c in listed if c.last < cutoff])
+                    chunks[channel] = [c for c in listed if c.last >= cutoff]
+            if policy.max_job_bytes:
+                excess = sum(self._channel_stats(job_id, channel)["bytes"] for channel in chunks) - policy.max_job_bytes
+                oldest = sorted(((c, channel) for channel, listed in chunks.items() for c in listed),
+                                key=lambda cc: cc[0].last)
+                doomed: Dict[str, List[ChunkInfo]] = {}
+                for chunk, channel in oldest:
+                    if excess <= 0:
+                        break
+                    excess -= chunk.size
+                    doomed.setdefault(channel, []).append(chunk)
+                for channel, listed in doomed.items():
+                    removed += self._drop_chunks(job_id, channel, listed)
+        if removed:
+            logger.info(f"Time-series retention removed {removed} chunks")
+        return removed
+
+    def drop_job(self, job_id: Any) -> None:
+        """Delete all data of a job"""
+        name = self._name(job_id)
+        with self._lock:
+            for key in [k for k in self._series if k[0] == name]:
+                self._series.pop(key).close()
+            for path in [p for p in self._decoded if p.parent.parent.name == name]:
+                del self._decoded[path]
+        shutil.rmtree(self.path / name, ignore_errors=True)
+
+    def close(self) -> None:
+        with self._lock:
+            for series in self._series.values():
+                series.close()
+            self._series.clear()
+            self._decoded.clear()
+
+_timeseries_store: Optional[TimeSeriesStore] = None
+
+def get_timeseries_store() -> TimeSeriesStore:
+    """Process-wide time-series store handle"""
+    global _timeseries_store
+    if _timeseries_store is None:
+        _timeseries_store = TimeSeriesStore(
+            path=settings.TIMESERIES_PATH or None,
+            chunk_size=settings.TIMESERIES_CHUNK_SIZE,
+            retention=RetentionPolicy(settings.TIMESERIES_RETENTION_DAYS, settings.TIMESERIES_MAX_JOB_BYTES),
+        )
+    return _timeseries_store
@@ -10,6 +10,7 @@ from app.core.units.quantity import (
     WeightPerLength, FluidVolume, DLS, Azimuth,
     MudWeight, PhysicalQuantity
 )
+from app.core.domain.calculations.friction import fanning_friction_factor
 
 class HydraulicsCalculator:
     """Utility class for hydraulics calculations."""
@@ -68,11 +69,8 @@ class HydraulicsCalculator:
         velocity = (4 * q) / (math.pi * d**2)
         re = (rho * velocity * d) / mu
         
-        # Calculate friction factor
-        if re < 2100:  # Laminar flow
-            f = 16 / re
-        else:  # Turbulent flow (using approximate Blasius equation)
-            f = 0.0791 / (re**0.25)
+        # Calculate friction factor (shared correlation, smooth pipe)
+        f = float(fanning_friction_factor(re))
         
         # Calculate pressure loss
         dp = (2 * f * rho * velocity**2 * l) / d
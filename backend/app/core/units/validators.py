@@ -1,8 +1,11 @@
 # app/core/units/validators.py
-from typing import Dict, List, Optional, Union, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Type, Union, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 import math
-from enum import Enum
+from enum import Enum, IntFlag
+
+import numpy as np
 
 from app.core.units.quantity import (
     Length, Depth, Volume, Weight, Pressure,
@@ -24,6 +27,7 @@ class OperationalLimits(Enum):
     MIN_ANNULAR_VELOCITY = 120  # Minimum annular velocity in ft/min
     MAX_ANNULAR_VELOCITY = 600  # Maximum annular velocity in ft/min
     MIN_SURGE_SAFETY_MARGIN = 0.5  # Minimum surge/swab safety margin in ppg
+    MAX_CIRCULATION_RATE = 180  # Maximum mud pump stroke rate in spm
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
@@ -289,6 +293,330 @@ def validate_quantity_combination(
     except Exception as e:
         raise ValidationError(f"{error_message}: {str(e)}")
 
+# Vectorized bulk validation
+#
+# The validators above check one value and raise. Imports validate whole
+# columns instead: every check returns a per-row array of Violation bits,
+# so rejecting the bad rows of a batch is a mask, not a loop of try/excepts.
+
+class Violation(IntFlag):
+    """Reason codes for a rejected value; several may be set on one row."""
+    MISSING = 1
+    BELOW_MIN = 2
+    ABOVE_MAX = 4
+    NOT_INCREASING = 8
+    INCONSISTENT = 16  # contradicts another column of the same row
+    INVALID_UNIT = 32
+
+VIOLATION_NAMES = {flag: flag.name.lower() for flag in Violation}
+
+def as_column(values: Any) -> np.ndarray:
+    """Float column with None (and unparseable text) as NaN"""
+    if isinstance(values, np.ndarray) and values.dtype.kind == "f":
+        return values.astype(np.float64, copy=False)
+    column = np.asarray(values, dtype=object)
+    try:
+        return np.where(column == None, np.nan, column).astype(np.float64)  # noqa: E711
+    except (TypeError, ValueError):
+        return np.array([_to_float(v) for v in column], dtype=np.float64)
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+def column_to_unit(
+    values: Any,
+    quantity: Type[PhysicalQuantity],
+    unit: Union[str, Sequence[Optional[str]], None],
+    target_unit: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert a column to target_unit. unit is one unit for the column or one
+    per row (None = target_unit). Conversions are affine (temperatures have
+    offsets), so each distinct unit costs two scalar conversions. Returns
+    the converted column and the Violation.INVALID_UNIT bits.
+    """
+    column = as_column(values)
+    codes = np.zeros(column.size, dtype=np.int16)
+    if unit is None or isinstance(unit, str):
+        labels, inverse = np.array([unit or target_unit], dtype=object), np.zeros(column.size, dtype=np.intp)
+    else:
+        rows = np.asarray([u or target_unit for u in unit], dtype=object)
+        labels, inverse = np.unique(rows.astype(str), return_inverse=True)
+    offset = np.full(labels.size, np.nan)
+    scale = np.full(labels.size, np.nan)
+    for i, label in enumerate(labels):
+        if label == target_unit:
+            offset[i], scale[i] = 0.0, 1.0
+        elif label in quantity._valid_units:
+            zero = quantity(0, label).to_unit(target_unit)
+            offset[i], scale[i] = zero, quantity(1, label).to_unit(target_unit) - zero
+    converted = offset[inverse] + scale[inverse] * column
+    codes[np.isnan(scale)[inverse]] |= Violation.INVALID_UNIT
+    return converted, codes
+
+class BulkValidator:
+    """Column-wise checks mirroring the scalar validators."""
+
+    @staticmethod
+    def range_violations(
+        values: np.ndarray,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None,
+        required: bool = True,
+        inclusive: bool = True
+    ) -> np.ndarray:
+        """Array form of validate_within_range: Violation bits per value"""
+        codes = np.zeros(values.size, dtype=np.int16)
+        missing = np.isnan(values)
+        if required:
+            codes[missing] |= Violation.MISSING
+        with np.errstate(invalid="ignore"):
+            if min_value is not None:
+                low = values < min_value if inclusive else values <= min_value
+                codes[low] |= Violation.BELOW_MIN
+            if max_value is not None:
+                codes[values > max_value] |= Violation.ABOVE_MAX
+        return codes
+
+    @staticmethod
+    def increasing_violations(
+        values: np.ndarray,
+        strict: bool = True,
+        ignore: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Rows not greater than every value before them, except ignored (already rejected) rows"""
+        codes = np.zeros(values.size, dtype=np.int16)
+        if values.size < 2:
+            return codes
+        reference = values if ignore is None else np.where(ignore, np.nan, values)
+        previous = np.fmax.accumulate(np.r_[-np.inf, reference[:-1]])
+        with np.errstate(invalid="ignore"):
+            bad = values <= previous if strict else values < previous
+        codes[bad] |= Violation.NOT_INCREASING
+        return codes
+
+    @staticmethod
+    def depth_violations(depths: Any, unit: Union[str, Sequence[Optional[str]], None] = "ft") -> np.ndarray:
+        depth_ft, codes = column_to_unit(depths, Depth, unit, "ft")
+        return codes | BulkValidator.range_violations(depth_ft, 0, OperationalLimits.MAX_DEPTH.value)
+
+    @staticmethod
+    def pressure_violations(pressures: Any, unit: Union[str, Sequence[Optional[str]], None] = "psi") -> np.ndarray:
+        pressure_psi, codes = column_to_unit(pressures, Pressure, unit, "psi")
+        return codes | BulkValidator.range_violations(pressure_psi, 0, OperationalLimits.MAX_PRESSURE.value)
+
+    @staticmethod
+    def mud_weight_violations(weights: Any, unit: Union[str, Sequence[Optional[str]], None] = "ppg") -> np.ndarray:
+        weight_ppg, codes = column_to_unit(weights, MudWeight, unit, "ppg")
+        return codes | BulkValidator.range_violations(weight_ppg, 8.33, OperationalLimits.MAX_MUD_WEIGHT.value)
+
+    @staticmethod
+    def temperature_violations(temperatures: Any, unit: Union[str, Sequence[Optional[str]], None] = "F") -> np.ndarray:
+        temp_f, codes = column_to_unit(temperatures, Temperature, unit, "F")
+        return codes | BulkValidator.range_violations(temp_f, 32, OperationalLimits.MAX_TEMPERATURE.value)
+
+    @staticmethod
+    def dogleg_violations(dls: np.ndarray) -> np.ndarray:
+        """dls in deg/100ft"""
+        return BulkValidator.range_violations(dls, 0, OperationalLimits.MAX_DLS.value, required=False)
+
+    @staticmethod
+    def annular_velocity_violations(flow_gpm: Any, hole_in: Any, pipe_in: Any) -> np.ndarray:
+        """Array form of HydraulicsValidator.validate_flow_rate"""
+        hole_area = np.pi * (as_column(hole_in) ** 2 - as_column(pipe_in) ** 2) / 4
+        with np.errstate(divide="ignore", invalid="ignore"):
+            velocity = (as_column(flow_gpm) * 144) / (hole_area * 7.48052)
+        codes = BulkValidator.range_violations(
+            velocity,
+            OperationalLimits.MIN_ANNULAR_VELOCITY.value,
+            OperationalLimits.MAX_ANNULAR_VELOCITY.value
+        )
+        codes[hole_area <= 0] |= Violation.INCONSISTENT
+        return codes
+
+@dataclass
+class BatchValidationResult:
+    """Violation bits per column for a batch of rows"""
+    rows: int
+    errors: Dict[str, np.ndarray] = field(default_factory=dict)  # reject the row
+    warnings: Dict[str, np.ndarray] = field(default_factory=dict)  # reported only
+
+    def add(self, column: str, codes: np.ndarray, warning: bool = False) -> None:
+        target = self.warnings if warning else self.errors
+        if column in target:
+            target[column] = target[column] | codes
+        else:
+            target[column] = codes
+
+    @staticmethod
+    def _mask(columns: Dict[str, np.ndarray], rows: int) -> np.ndarray:
+        mask = np.zeros(rows, dtype=bool)
+        for codes in columns.values():
+            mask |= codes != 0
+        return mask
+
+    @property
+    def invalid(self) -> np.ndarray:
+        return self._mask(self.errors, self.rows)
+
+    @property
+    def valid(self) -> np.ndarray:
+        return ~self.invalid
+
+    @property
+    def flagged(self) -> np.ndarray:
+        return self._mask(self.warnings, self.rows)
+
+    def describe(self, limit: int = 100, warnings: bool = False) -> List[Dict[str, Any]]:
+        """Row, column and reason names of the first `limit` violations"""
+        columns = self.warnings if warnings else self.errors
+        found = []
+        for row in np.flatnonzero(self._mask(columns, self.rows))[:limit]:
+            for column, codes in columns.items():
+                code = int(codes[row])
+                if code:
+                    found.append({
+                        "row": int(row),
+                        "column": column,
+                        "reasons": [name for flag, name in VIOLATION_NAMES.items() if code & flag],
+                    })
+        return found
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """Rows per column and reason"""
+        result: Dict[str, Dict[str, int]] = {}
+        for column, codes in self.errors.items():
+            counts = {name: int(np.count_nonzero(codes & flag)) for flag, name in VIOLATION_NAMES.items()}
+            counts = {name: n for name, n in counts.items() if n}
+            if counts:
+                result[column] = counts
+        return result
+
+    def report(self, inserted: int, limit: int = 100) -> Dict[str, Any]:
+        """Import outcome in the shape of BatchImportResponse"""
+        return {
+            "received": self.rows,
+            "inserted": inserted,
+            "rejected": int(np.count_nonzero(self.invalid)),
+            "flagged": int(np.count_nonzero(self.flagged)),
+            "errors": self.describe(limit),
+            "warnings": self.describe(limit, warnings=True),
+            "summary": self.summary(),
+        }
+
+def select_rows(columns: Dict[str, Any], mask: np.ndarray, **constants: Any) -> List[Dict[str, Any]]:
+    """
+    Insert mappings for the rows where mask is set. Float columns give None
+    for NaN; a column of None (or a scalar) is repeated for every row.
+    """
+    picked: Dict[str, List[Any]] = {}
+    n = int(np.count_nonzero(mask))
+    for name, values in columns.items():
+        if values is None or isinstance(values, str):
+            picked[name] = [values] * n
+            continue
+        column = np.asarray(values, dtype=object if not isinstance(values, np.ndarray) else None)[mask]
+        if column.dtype.kind == "f":
+            column = np.where(np.isnan(column), None, column).astype(object)
+        picked[name] = column.tolist()
+    for name, value in constants.items():
+        picked[name] = [value] * n
+    return [dict(zip(picked, row)) for row in zip(*picked.values())]
+
+class SurveyBatchValidator(BulkValidator):
+    """Directional survey stations: MD, inclination, azimuth."""
+
+    @staticmethod
+    def dogleg_severity(md_ft: np.ndarray, inclination: np.ndarray, azimuth: np.ndarray) -> np.ndarray:
+        """Minimum-curvature DLS (deg/100ft) from the previous station; NaN for the first"""
+        inc, azi = np.radians(inclination), np.radians(azimuth)
+        cos_dl = (np.cos(inc[1:] - inc[:-1])
+                  - np.sin(inc[:-1]) * np.sin(inc[1:]) * (1 - np.cos(azi[1:] - azi[:-1])))
+        dogleg = np.degrees(np.arccos(np.clip(cos_dl, -1.0, 1.0)))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dls = np.where(np.diff(md_ft) > 0, dogleg * 100 / np.diff(md_ft), np.nan)
+        return np.r_[np.nan, dls]
+
+    @classmethod
+    def validate(cls,
+                 measured_depth: Any,
+                 inclination: Any,
+                 azimuth: Any,
+                 depth_unit: Union[str, Sequence[Optional[str]], None] = "ft") -> BatchValidationResult:
+        md_ft, unit_codes = column_to_unit(measured_depth, Depth, depth_unit, "ft")
+        inc, azi = as_column(inclination), as_column(azimuth)
+        result = BatchValidationResult(md_ft.size)
+        md_codes = unit_codes | cls.range_violations(md_ft, 0, OperationalLimits.MAX_DEPTH.value)
+        result.add("measured_depth", md_codes)
+        # A mistyped depth must not reject every station after it
+        result.add("measured_depth", cls.increasing_violations(md_ft, ignore=md_codes != 0))
+        result.add("inclination", cls.range_violations(inc, 0, 180))
+        azimuth_codes = cls.range_violations(azi, 0, None)
+        with np.errstate(invalid="ignore"):
+            azimuth_codes[azi >= 360] |= Violation.ABOVE_MAX
+        result.add("azimuth", azimuth_codes)
+        # Sharp doglegs are real data; they are reported, not rejected
+        result.add("dls", cls.dogleg_violations(cls.dogleg_severity(md_ft, inc, azi)), warning=True)
+        return result
+
+class TallyBatchValidator(BulkValidator):
+    """Pipe tally joints: length, OD, ID and weight with per-row units."""
+
+    @classmethod
+    def validate(cls,
+                 length: Any,
+                 outer_diameter: Any,
+                 inner_diameter: Any,
+                 weight_per_unit: Any,
+                 length_unit: Union[str, Sequence[Optional[str]], None] = "ft",
+                 outer_diameter_unit: Union[str, Sequence[Optional[str]], None] = "in",
+                 inner_diameter_unit: Union[str, Sequence[Optional[str]], None] = "in",
+                 weight_unit: Union[str, Sequence[Optional[str]], None] = "lb/ft") -> BatchValidationResult:
+        length_ft, length_codes = column_to_unit(length, Length, length_unit, "ft")
+        od_in, od_codes = column_to_unit(outer_diameter, Diameter, outer_diameter_unit, "in")
+        id_in, id_codes = column_to_unit(inner_diameter, Diameter, inner_diameter_unit, "in")
+        weight, weight_codes = column_to_unit(weight_per_unit, WeightPerLength, weight_unit, "lb/ft")
+        result = BatchValidationResult(length_ft.size)
+        result.add("length", length_codes | cls.range_violations(length_ft, 0, None, inclusive=False))
+        result.add("outer_diameter", od_codes | cls.range_violations(od_in, 0, None, inclusive=False))
+        id_codes |= cls.range_violations(id_in, 0, None, required=False, inclusive=False)
+        with np.errstate(invalid="ignore"):
+            id_codes[id_in >= od_in] |= Violation.INCONSISTENT
+        result.add("inner_diameter", id_codes)
+        result.add("weight_per_unit", weight_codes | cls.range_violations(weight, 0, None, inclusive=False))
+        return result
+
+class FluidBatchValidator(BulkValidator):
+    """Mud checks: density, viscosities, gels, pH and viscometer dial readings."""
+
+    READINGS = ("r600", "r300", "r200", "r100", "r6", "r3")
+
+    @classmethod
+    def validate(cls,
+                 columns: Dict[str, Any],
+                 mud_weight_unit: Union[str, Sequence[Optional[str]], None] = "ppg") -> BatchValidationResult:
+        weight = columns["mud_weight"]
+        result = BatchValidationResult(len(weight))
+        result.add("mud_weight", cls.mud_weight_violations(weight, mud_weight_unit))
+        for name in ("funnel_viscosity", "plastic_viscosity", "yield_point", "gel_strength_10s", "gel_strength_10m"):
+            if name in columns:
+                result.add(name, cls.range_violations(as_column(columns[name]), 0, None))
+        if "pH" in columns:
+            result.add("pH", cls.range_violations(as_column(columns["pH"]), 0, 14))
+        readings = [(name, as_column(columns[name])) for name in cls.READINGS if name in columns]
+        for name, values in readings:
+            result.add(name, cls.range_violations(values, 0, None))
+        # Dial readings fall with shear rate
+        for (_, faster), (name, slower) in zip(readings, readings[1:]):
+            codes = np.zeros(result.rows, dtype=np.int16)
+            with np.errstate(invalid="ignore"):
+                codes[slower > faster] |= Violation.INCONSISTENT
+            result.add(name, codes)
+        return result
+
 # Example usage:
 """
 # Validate depth
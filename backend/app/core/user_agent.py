@@ -0,0 +1,118 @@
+# File: backend/app/core/user_agent.py
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, Optional, Tuple
+import logging
+
+from user_agents import parse
+
+from app.schemas.authsystem.user_session import DeviceInfo
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class UserAgentCacheStats:
+    """Hit/miss counters for the user-agent cache"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    failures: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "failures": self.failures,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+class UserAgentCache:
+    """
+    Bounded LRU cache of parsed user-agent strings.
+
+    Each entry keeps the parsed DeviceInfo together with its pre-rendered
+    enhanced string, so a repeat device costs one dict lookup and no regex work.
+    Parsing is deterministic, so each worker process keeps its own copy and
+    nothing needs to be shared or invalidated.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[Optional[DeviceInfo], Optional[str]]]" = OrderedDict()
+        self._lock = Lock()
+        self.stats = UserAgentCacheStats()
+
+    def _parse(self, user_agent: str) -> Tuple[Optional[DeviceInfo], Optional[str]]:
+        try:
+            ua = parse(user_agent)
+            info = DeviceInfo(
+                device_type=ua.device.family,
+                os=f"{ua.os.family} {ua.os.version_string}",
+                browser=f"{ua.browser.family} {ua.browser.version_string}",
+                is_mobile=ua.is_mobile,
+                is_tablet=ua.is_tablet,
+                is_pc=ua.is_pc
+            )
+            return info, info.to_str()
+        except Exception as e:
+            # Cache the failure too, so a bad UA is not re-parsed on every login
+            logger.warning(f"Could not parse user agent: {str(e)}")
+            self.stats.failures += 1
+            return None, None
+
+    def lookup(self, user_agent: str) -> Tuple[Optional[DeviceInfo], Optional[str]]:
+        """Return (DeviceInfo, enhanced string) for a raw user-agent string"""
+        with self._lock:
+            entry = self._entries.get(user_agent)
+            if entry is not None:
+                self._entries.move_to_end(user_agent)
+                self.stats.hits += 1
+                return entry
+            self.stats.misses += 1
+
+        entry = self._parse(user_agent)
+
+        with self._lock:
+            self._entries[user_agent] = entry
+            self._entries.move_to_end(user_agent)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+        return entry
+
+    def get_device_info(self, user_agent: str) -> Optional[DeviceInfo]:
+        """Parsed device info, or None if the user agent could not be parsed"""
+        info, _ = self.lookup(user_agent)
+        return info.model_copy() if info is not None else None
+
+    def enhance(self, device_info: Optional[str]) -> Optional[str]:
+        """
+        Convert a raw user-agent string to the enhanced 'type|os|browser' format.
+        Values already in enhanced format, and unparseable ones, are returned unchanged.
+        """
+        if not device_info or '|' in device_info:
+            return device_info
+        _, enhanced = self.lookup(device_info)
+        return enhanced if enhanced is not None else device_info
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.stats = UserAgentCacheStats()
+
+    def metrics(self) -> Dict[str, float]:
+        with self._lock:
+            return {**self.stats.to_dict(), "size": len(self._entries), "maxsize": self.maxsize}
+
+# Create global instance
+user_agent_cache = UserAgentCache()
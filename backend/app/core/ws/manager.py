@@ -85,7 +85,7 @@ class ConnectionManager:
             disconnected = []
             for connection in self.active_connections[job_id]:
                 try:
-                    await connection.send_json(event.dict())
+                    await connection.send_json(event.model_dump(mode="json"))
                 except Exception as e:
                     logger.error(f"Error broadcasting to client: {str(e)}")
                     disconnected.append(connection)
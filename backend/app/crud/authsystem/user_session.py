@@ -6,12 +6,12 @@ from app.models.authsystem.user_session import UserSession
 from app.models.authsystem.user import User
 from app.schemas.authsystem.user_session import (
     UserSessionCreate,
-    UserSessionUpdate,
-    DeviceInfo
+    UserSessionUpdate
 )
 from app.core.security import generate_device_id, verify_password
+from app.core.user_agent import user_agent_cache
+from app.core.revocation import token_revocation
 from app.crud.base import CRUDBase
-from user_agents import parse
 
 class CRUDUserSession(CRUDBase[UserSession, UserSessionCreate, UserSessionUpdate]):
     async def authenticate(self, db: Session, *, email: str, password: str) -> Optional[User]:
@@ -34,21 +34,9 @@ class CRUDUserSession(CRUDBase[UserSession, UserSessionCreate, UserSessionUpdate
         ip_address: Optional[str] = None
     ) -> UserSession:
         """Create new user session"""
-        # Enhanced device info while maintaining compatibility
-        enhanced_device_info = device_info
-        if device_info and '|' not in device_info:  # Not already in enhanced format
-            try:
-                ua = parse(device_info)
-                enhanced_device_info = DeviceInfo(
-                    device_type=ua.device.family,
-                    os=f"{ua.os.family} {ua.os.version_string}",
-                    browser=f"{ua.browser.family} {ua.browser.version_string}",
-                    is_mobile=ua.is_mobile,
-                    is_tablet=ua.is_tablet,
-                    is_pc=ua.is_pc
-                ).to_str()
-            except:
-                pass  # Keep original device_info if parsing fails
+        # Enhanced device info while maintaining compatibility; repeat devices
+        # are served from the parsed user-agent cache
+        enhanced_device_info = user_agent_cache.enhance(device_info)
 
         db_obj = UserSession(
             user_id=user_id,
@@ -107,6 +95,29 @@ class CRUDUserSession(CRUDBase[UserSession, UserSessionCreate, UserSessionUpdate
             db.add(session)
             db.commit()
             db.refresh(session)
+            await token_revocation.revoke_session(session)
+        return session
+
+    async def revoke_session(
+        self,
+        db: Session,
+        *,
+        session_id: str,
+        reason: Optional[str] = None
+    ) -> Optional[UserSession]:
+        """Revoke a session and propagate the revocation to all workers"""
+        session = await self.get(db=db, id=session_id)
+        if session:
+            now = datetime.now(timezone.utc)
+            session.is_active = False
+            session.revoked = True
+            session.revoked_at = now
+            session.revocation_reason = reason
+            session.last_activity = now
+            db.add(session)
+            db.commit()
+            db.refresh(session)
+            await token_revocation.revoke_session(session)
         return session
 
     async def deactivate_all_sessions(
@@ -121,6 +132,8 @@ class CRUDUserSession(CRUDBase[UserSession, UserSessionCreate, UserSessionUpdate
             session.is_active = False
             session.last_activity = datetime.now(timezone.utc)
         db.commit()
+        for session in sessions:
+            await token_revocation.revoke_session(session)
 
     async def get_by_token(
         self,
@@ -3,7 +3,7 @@ from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from sqlalchemy import insert, select, func
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException, status
 from app.db.base_class import Base
@@ -96,6 +96,21 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 detail=str(e)
             )
 
+    async def create_many(self, db: Session, *, rows: List[Dict[str, Any]]) -> int:
+        """Insert many rows in one executemany; returns the number inserted"""
+        if not rows:
+            return 0
+        try:
+            db.execute(insert(self.model), rows)
+            db.commit()
+            return len(rows)
+        except SQLAlchemyError as e:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+
     async def update(
         self,
         db: Session,
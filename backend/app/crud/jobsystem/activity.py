@@ -172,6 +172,28 @@ class CRUDActivity(CRUDBase[Activity, ActivityCreate, ActivityUpdate]):
                 detail=str(e)
             )
 
+    async def get_timeline_rows(
+        self,
+        db: Session,
+        *,
+        job_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[Any]:
+        """Timestamp and type of a job's activities, oldest first, for timeline charts"""
+        try:
+            query = db.query(Activity.timestamp, Activity.type).filter(Activity.job_id == job_id)
+            if start_date:
+                query = query.filter(Activity.timestamp >= start_date)
+            if end_date:
+                query = query.filter(Activity.timestamp <= end_date)
+            return query.order_by(Activity.timestamp).all()
+        except SQLAlchemyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=str(e)
+            )
+
     def _count_status(self, reports: List[Activity]) -> Dict[str, int]:
         """Helper method to count reports by status"""
         status_counts = {}
@@ -1,7 +1,8 @@
 # File: backend/app/crud/jobsystem/crud_fluid.py
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 from sqlalchemy.orm import Session
 from app.crud.base import CRUDBase
+from app.core.domain.calculations.rheology import RheologyFit, rheology_service
 from app.models.jobsystem.fluid import Fluid
 from app.schemas.jobsystem.fluid import FluidCreate, FluidUpdate
 
@@ -23,6 +24,31 @@ class CRUDFluid(CRUDBase[Fluid, FluidCreate, FluidUpdate]):
             Fluid.fluid_type == fluid_type
         ).all()
 
+    async def update(
+        self,
+        db: Session,
+        *,
+        db_obj: Fluid,
+        obj_in: Union[FluidUpdate, Dict[str, Any]]
+    ) -> Fluid:
+        """Update a fluid and drop its cached rheology fit"""
+        fluid = await super().update(db=db, db_obj=db_obj, obj_in=obj_in)
+        rheology_service.invalidate(fluid.id)
+        return fluid
+
+    async def remove(self, db: Session, *, id: Any, soft_delete: bool = True) -> Fluid:
+        """Delete a fluid and drop its cached rheology fit"""
+        fluid = await super().remove(db=db, id=id, soft_delete=soft_delete)
+        rheology_service.invalidate(id)
+        return fluid
+
+    async def get_rheology_by_wellbore(
+        self, db: Session, *, wellbore_id: str
+    ) -> Dict[str, RheologyFit]:
+        """Fitted rheology for every fluid sample of a wellbore, fitted in one batch"""
+        fluids = await self.get_by_wellbore(db=db, wellbore_id=wellbore_id)
+        return rheology_service.fit_fluids(fluids)
+
 crud_fluid = CRUDFluid(Fluid)
 
 # from app.models.jobsystem.fluid import Fluid
@@ -3,6 +3,7 @@ from datetime import datetime
 from sqlalchemy.orm import Session
 from app.crud.base import CRUDBase
 from app.models.jobsystem.job import Job
+from app.models.jobsystem.wellbore import Wellbore
 from app.schemas.jobsystem.job import JobCreate, JobUpdate
 
 class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
@@ -10,6 +11,13 @@ class CRUDJob(CRUDBase[Job, JobCreate, JobUpdate]):
         """Get all jobs for a specific well"""
         return db.query(Job).filter(Job.well_id == well_id).all()
     
+    async def get_open_by_wellbore(self, db: Session, *, wellbore_id: str) -> List[Job]:
+        """Get jobs not closed on the well of a wellbore"""
+        return db.query(Job).join(Wellbore, Wellbore.well_id == Job.well_id).filter(
+            Wellbore.id == wellbore_id,
+            Job.job_closed.isnot(True)
+        ).all()
+
     async def get_active_jobs(self, db: Session) -> List[Job]:
         """Get all active jobs"""
         return db.query(Job).filter(Job.job_closed == False).all()
@@ -0,0 +1,35 @@
+# File: backend/app/crud/jobsystem/job_log.py
+from typing import Any, List, Optional
+from datetime import datetime
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException, status
+from app.crud.base import CRUDBase
+from app.models.jobsystem.job_log import JobLog
+from app.schemas.jobsystem.job_log import JobLogCreate, JobLogUpdate
+
+class CRUDJobLog(CRUDBase[JobLog, JobLogCreate, JobLogUpdate]):
+    async def get_timeline_rows(
+        self,
+        db: Session,
+        *,
+        job_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[Any]:
+        """Timestamp, type and duration of a job's log entries, oldest first"""
+        try:
+            query = db.query(JobLog.timestamp, JobLog.activity_type, JobLog.duration)\
+                      .filter(JobLog.job_id == job_id)
+            if start_date:
+                query = query.filter(JobLog.timestamp >= start_date)
+            if end_date:
+                query = query.filter(JobLog.timestamp <= end_date)
+            return query.order_by(JobLog.timestamp).all()
+        except SQLAlchemyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=str(e)
+            )
+
+crud_job_log = CRUDJobLog(JobLog)
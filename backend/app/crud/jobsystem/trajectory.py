@@ -1,6 +1,9 @@
 # File: backend/app/crud/jobsystem/crud_trajectory.py
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+from fastapi import HTTPException, status
 from app.crud.base import CRUDBase
 from app.models.jobsystem.trajectory import Trajectory
 from app.schemas.jobsystem.trajectory import TrajectoryCreate, TrajectoryUpdate
@@ -31,7 +34,41 @@ class CRUDTrajectory(CRUDBase[Trajectory, TrajectoryCreate, TrajectoryUpdate]):
             Trajectory.measured_depth >= min_depth,
             Trajectory.measured_depth <= max_depth
         ).order_by(Trajectory.measured_depth).all()
-        
+
+    async def import_stations(
+        self,
+        db: Session,
+        *,
+        wellbore_id: str,
+        chunks: AsyncIterator[List[Dict[str, Any]]],
+        replace: bool = False
+    ) -> int:
+        """
+        Insert streamed chunks of stations in one transaction, optionally
+        replacing the wellbore's survey. Nothing is kept if any chunk fails.
+        """
+        inserted = 0
+        try:
+            if replace:
+                db.query(Trajectory).filter(
+                    Trajectory.wellbore_id == wellbore_id
+                ).delete(synchronize_session=False)
+            async for rows in chunks:
+                if rows:
+                    db.execute(insert(Trajectory), rows)
+                    inserted += len(rows)
+            db.commit()
+            return inserted
+        except SQLAlchemyError as e:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Survey import failed: {str(e)}"
+            )
+        except Exception:
+            db.rollback()
+            raise
+
 crud_trajectory = CRUDTrajectory(Trajectory)
 
 # from app.models.jobsystem.trajectory import Trajectory
@@ -2,6 +2,7 @@ from typing import List, Optional, Any
 from sqlalchemy.orm import Session
 from app.crud.base import CRUDBase
 from app.models.jobsystem.tubular import Casing, Liner, Drillstring, Tubular
+from app.models.jobsystem.wellbore_geometry import WellboreGeometry
 from app.schemas.jobsystem.tubular import (
     TubularCreate,
     TubularUpdate,
@@ -40,6 +41,16 @@ class CRUDTubular(CRUDBase[Tubular, TubularCreate, TubularUpdate]):
         """Get tubulars within depth range"""
         return db.query(Tubular).filter(Tubular.start_depth >= min_depth, Tubular.end_depth <= max_depth).all()
 
+    async def get_by_wellbore(
+        self, db: Session, *, wellbore_id: str
+    ) -> List[Tubular]:
+        """Get tubulars installed in a wellbore, ordered by start depth"""
+        return db.query(Tubular).join(
+            WellboreGeometry, WellboreGeometry.tubular_id == Tubular.id
+        ).filter(
+            WellboreGeometry.wellbore_id == wellbore_id
+        ).order_by(Tubular.start_depth).all()
+
 def create_crud_tubular(model: Any) -> CRUDTubular:
     return CRUDTubular(model)
 
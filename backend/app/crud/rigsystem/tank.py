@@ -0,0 +1,20 @@
+# File: backend/app/crud/rigsystem/tank.py
+from typing import List
+from sqlalchemy.orm import Session
+from app.crud.base import CRUDBase
+from app.models.rigsystem.tank import Tank
+from app.schemas.rigsystem.tank import TankCreate, TankUpdate
+
+class CRUDTank(CRUDBase[Tank, TankCreate, TankUpdate]):
+    async def get_by_rig(
+        self,
+        db: Session,
+        *,
+        rig_id: str
+    ) -> List[Tank]:
+        """Get all tanks for a rig"""
+        return db.query(Tank).filter(
+            Tank.rig_id == rig_id
+        ).all()
+
+crud_tank = CRUDTank(Tank)
@@ -1,20 +1,136 @@
 # app/models/gradients.py
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from abc import abstractmethod
+from bisect import bisect_right
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from typing import Any, Iterable, List, Optional, Tuple
+import numpy as np
 from ..core.units.quantity import Length, Pressure, Temperature
 
 class PressurePoint(BaseModel):
     """Pressure gradient point model"""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     md: Length
     pressure_gradient: Pressure
 
-class GradientProfile(BaseModel):
+class SortedProfile(BaseModel):
+    """
+    Base for depth-indexed profiles.
+
+    Points are kept sorted by depth (ft) with a parallel key list, so a
+    single insert finds its place by bisect instead of re-sorting; the
+    list.insert itself still shifts the tail, so each insert is O(n), not
+    O(log n). Use extend() for bulk loads. The numpy arrays used for lookups
+    are built once and reused until the points change.
+    Subclasses define the points field and the three abstract hooks below.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    _keys: List[float] = PrivateAttr(default_factory=list)
+    _arrays: Optional[np.ndarray] = PrivateAttr(default=None)
+
+    @staticmethod
+    @abstractmethod
+    def _depth(point: Any) -> float:
+        """Depth of a point in ft"""
+
+    @staticmethod
+    @abstractmethod
+    def _values(point: Any) -> Tuple[float, ...]:
+        """Values of a point in canonical units"""
+
+    @classmethod
+    @abstractmethod
+    def _make_point(cls, depth: float, values: np.ndarray) -> Any:
+        """Point from a depth (ft) and its values"""
+
+    def model_post_init(self, __context: Any) -> None:
+        self._resort()
+
+    def _resort(self) -> None:
+        self.points.sort(key=self._depth)
+        self._keys = [self._depth(p) for p in self.points]
+        self._arrays = None
+
+    def add_point(self, point: Any) -> None:
+        """Insert one point in depth order (after any point at the same depth)"""
+        if len(self._keys) != len(self.points):
+            self._resort()
+        depth = self._depth(point)
+        index = bisect_right(self._keys, depth)
+        self._keys.insert(index, depth)
+        self.points.insert(index, point)
+        self._arrays = None
+
+    def extend(self, points: Iterable[Any]) -> None:
+        """Bulk load: append every point and sort once"""
+        self.points.extend(points)
+        self._resort()
+
+    def arrays(self) -> np.ndarray:
+        """(points, 1 + values) float array: depth in ft, then the point values"""
+        if self._arrays is None or self._arrays.shape[0] != len(self.points):
+            if len(self._keys) != len(self.points):
+                self._resort()
+            width = 1 + len(self._values(self.points[0])) if self.points else 1
+            self._arrays = np.array(
+                [(self._depth(p),) + tuple(self._values(p)) for p in self.points], dtype=float
+            ).reshape(-1, width)
+        return self._arrays
+
+    def interpolate(self, depths: Any, column: int = 1) -> np.ndarray:
+        """Linear interpolation of one value column at arbitrary depths (ft), held constant past the ends"""
+        data = self.arrays()
+        if data.shape[0] == 0:
+            raise ValueError("Profile has no points")
+        return np.interp(np.asarray(depths, dtype=float), data[:, 0], data[:, column])
+
+    def to_bytes(self) -> bytes:
+        """Compact float64 dump of the sorted arrays, e.g. for a cache"""
+        return self.arrays().tobytes()
+
+    @classmethod
+    def from_arrays(cls, data: np.ndarray) -> "SortedProfile":
+        """Rebuild a profile from arrays() output (points in canonical units)"""
+        data = np.asarray(data, dtype=float)
+        profile = cls(points=[cls._make_point(float(row[0]), row[1:]) for row in data])
+        profile._arrays = data
+        return profile
+
+    @classmethod
+    def from_bytes(cls, payload: bytes, values: int) -> "SortedProfile":
+        return cls.from_arrays(np.frombuffer(payload, dtype=float).reshape(-1, 1 + values))
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+class GradientProfile(SortedProfile):
     """Base pressure gradient profile model"""
     points: List[PressurePoint] = Field(default_factory=list)
-    
-    def add_point(self, point: PressurePoint):
-        self.points.append(point)
-        self.points.sort(key=lambda x: x.md.value)
+
+    @staticmethod
+    def _depth(point: PressurePoint) -> float:
+        return point.md.to_unit("ft")
+
+    @staticmethod
+    def _values(point: PressurePoint) -> Tuple[float, ...]:
+        return (point.pressure_gradient.to_unit("psi/ft"),)
+
+    @classmethod
+    def _make_point(cls, depth: float, values: np.ndarray) -> PressurePoint:
+        return PressurePoint(md=Length(depth, "ft"), pressure_gradient=Pressure(float(values[0]), "psi/ft"))
+
+    @classmethod
+    def from_bytes(cls, payload: bytes, values: int = 1) -> "GradientProfile":
+        return super().from_bytes(payload, values)
+
+    def gradient_at(self, md: Any) -> np.ndarray:
+        """Pressure gradient (psi/ft) at measured depths (ft)"""
+        return self.interpolate(md)
+
+    def pressure_at(self, md: Any, tvd: Any) -> np.ndarray:
+        """Pressure (psi) at measured depths with their TVDs (ft)"""
+        return self.gradient_at(md) * np.asarray(tvd, dtype=float)
 
 class CollapsePressureGradient(GradientProfile):
     """Collapse pressure gradient profile"""
@@ -30,14 +146,37 @@ class FracturePressureGradient(GradientProfile):
 
 class TemperaturePoint(BaseModel):
     """Temperature gradient point model"""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     tvd: Length
     temperature: Temperature
     gradient: Temperature  # Temperature gradient per unit length
 
-class GeothermalGradient(BaseModel):
+class GeothermalGradient(SortedProfile):
     """Geothermal gradient profile model"""
     points: List[TemperaturePoint] = Field(default_factory=list)
-    
-    def add_point(self, point: TemperaturePoint):
-        self.points.append(point)
-        self.points.sort(key=lambda x: x.tvd.value)
+
+    @staticmethod
+    def _depth(point: TemperaturePoint) -> float:
+        return point.tvd.to_unit("ft")
+
+    @staticmethod
+    def _values(point: TemperaturePoint) -> Tuple[float, ...]:
+        # The gradient is a temperature difference: scale it to F without the offset
+        return (point.temperature.to_unit("F"), point.gradient.value * Temperature._units[point.gradient.unit])
+
+    @classmethod
+    def _make_point(cls, depth: float, values: np.ndarray) -> TemperaturePoint:
+        return TemperaturePoint(
+            tvd=Length(depth, "ft"),
+            temperature=Temperature(float(values[0]), "F"),
+            gradient=Temperature(float(values[1]), "F")
+        )
+
+    @classmethod
+    def from_bytes(cls, payload: bytes, values: int = 2) -> "GeothermalGradient":
+        return super().from_bytes(payload, values)
+
+    def temperature_at(self, tvd: Any) -> np.ndarray:
+        """Temperature (F) at true vertical depths (ft)"""
+        return self.interpolate(tvd)
@@ -9,6 +9,7 @@ class MudPump(BaseDBModel):
     rig_id = Column(String(50), ForeignKey('rigs.id'), nullable=False)
     serial_number = Column(String(25), nullable=True)
     stroke_length = Column(Float, nullable=True)
+    liner_size = Column(Float, nullable=True)
     max_pressure = Column(Float, nullable=True)
     power_rating = Column(Float, nullable=True)
     manufacturer = Column(String(25), nullable=True)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict
-from typing import Optional, TypeVar, Generic, List
+from typing import Dict, Optional, TypeVar, Generic, List
 from datetime import datetime
 
 class BaseSchema(BaseModel):
@@ -38,4 +38,20 @@ class ErrorResponse(BaseSchema):
     """Standard error response schema"""
     error: str
     detail: Optional[str] = None
-    status_code: int = 400
\ No newline at end of file
+    status_code: int = 400
+
+class BatchRowError(BaseSchema):
+    """One rejected (or flagged) cell of a bulk import"""
+    row: int
+    column: str
+    reasons: List[str]
+
+class BatchImportResponse(BaseSchema):
+    """Outcome of a bulk import; errors and warnings list the first rows only"""
+    received: int
+    inserted: int
+    rejected: int
+    flagged: int = 0
+    errors: List[BatchRowError] = []
+    warnings: List[BatchRowError] = []
+    summary: Dict[str, Dict[str, int]] = {}
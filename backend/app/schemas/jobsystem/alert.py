@@ -0,0 +1,31 @@
+#alert
+from pydantic import BaseModel, Field
+from typing import Any, Dict, Optional
+from datetime import datetime
+
+class AlertRuleBase(BaseModel):
+    channel: str
+    kind: str = Field("threshold", description="threshold, rate (change per minute) or window_avg")
+    above: Optional[float] = None
+    below: Optional[float] = None
+    window: float = Field(0.0, ge=0, description="Window in seconds for rate and window_avg rules")
+    deadband: float = Field(0.0, ge=0, description="How far back inside the limit before the alert clears")
+    job_id: Optional[str] = Field(None, description="Limit the rule to one job; empty applies to all jobs")
+    severity: str = "warning"
+    message: str = ""
+
+class AlertRuleCreate(AlertRuleBase):
+    id: str
+
+class AlertRuleResponse(AlertRuleCreate):
+    pass
+
+class AlertEventResponse(BaseModel):
+    job_id: str
+    timestamp: datetime
+    data: Dict[str, Any]
+
+class ActiveAlertResponse(BaseModel):
+    rule_id: str
+    channel: str
+    severity: str
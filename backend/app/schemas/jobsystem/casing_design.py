@@ -0,0 +1,61 @@
+#casing_design
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from app.schemas.jobsystem.hydraulics import GradientPoint
+
+
+class CasingStringIn(BaseModel):
+    name: str
+    top: float = Field(..., ge=0, description="Top / hanger depth (ft MD)")
+    bottom: float = Field(..., gt=0, description="Shoe depth (ft MD)")
+    outer_diameter: float = Field(..., gt=0, description="OD (in)")
+    inner_diameter: float = Field(..., gt=0, description="ID (in)")
+    weight: float = Field(..., gt=0, description="Weight in air (lb/ft)")
+    burst: Optional[float] = Field(None, gt=0, description="Burst rating (psi)")
+    collapse: Optional[float] = Field(None, gt=0, description="Collapse rating (psi)")
+    yield_strength: Optional[float] = Field(None, gt=0, description="Minimum yield strength (psi)")
+
+
+class CasingDesignRequest(BaseModel):
+    mud_weight: float = Field(..., gt=0, description="Mud weight (ppg)")
+    strings: List[CasingStringIn] = Field(
+        default_factory=list,
+        description="Strings to check; defaults to the wellbore casings and liners"
+    )
+    pore_gradient: List[GradientPoint] = Field(default_factory=list)
+    fracture_gradient: List[GradientPoint] = Field(default_factory=list)
+    collapse_gradient: List[GradientPoint] = Field(default_factory=list)
+    minimum_safety_factor: Optional[float] = Field(
+        None, gt=0, description="Defaults to the operational casing safety factor"
+    )
+    gas_gradient: float = Field(0.1, ge=0, description="Gas gradient for the burst load (psi/ft)")
+    grid_step: float = Field(50.0, gt=0, description="Depth grid spacing (ft)")
+
+
+class CasingStringResult(BaseModel):
+    name: str
+    md: List[float]
+    tvd: List[float]
+    burst_load: List[float]
+    burst_safety_factor: List[Optional[float]]
+    min_burst_safety_factor: Optional[float] = None
+    collapse_load: List[float]
+    collapse_safety_factor: List[Optional[float]]
+    min_collapse_safety_factor: Optional[float] = None
+    tension_load: List[float]
+    tension_safety_factor: List[Optional[float]]
+    min_tension_safety_factor: Optional[float] = None
+
+
+class CasingDesignViolation(BaseModel):
+    string: str
+    load: str
+    top: float
+    bottom: float
+    min_safety_factor: float
+
+
+class CasingDesignResponse(BaseModel):
+    minimum_safety_factor: float
+    strings: List[CasingStringResult]
+    violations: List[CasingDesignViolation]
@@ -1,7 +1,7 @@
 # #daily_report.py
-from pydantic import BaseModel
-from typing import Optional
-from datetime import datetime
+from pydantic import BaseModel, EmailStr, Field
+from typing import List, Optional
+from datetime import date, datetime
 
 from app.models.base import TimeStampSchema
 
@@ -31,4 +31,16 @@ class DailyReportResponse(DailyReportBase):
         from_attributes = True
 
 class DailyReportView(DailyReportResponse):
-    pass
\ No newline at end of file
+    pass
+
+class CrewMember(BaseModel):
+    email: EmailStr
+    name: Optional[str] = None
+
+class DailyReportReminderCreate(BaseModel):
+    report_date: date
+    due_time: str = "18:00"
+    crew: List[CrewMember] = Field(..., min_length=1)
+
+class DailyReportReminderResponse(BaseModel):
+    queued: int
@@ -1,6 +1,6 @@
 #fluid
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import datetime
 
 from app.models.base import TimeStampSchema
@@ -59,3 +59,39 @@ class FluidResponse(FluidBase):
 
 class FluidView(FluidResponse):
     pass
+
+class FluidRheologyResponse(BaseModel):
+    fluid_id: str
+    plastic_viscosity: float
+    yield_point: float
+    bingham_r2: float
+    flow_index: float
+    consistency_index: float
+    power_law_r2: float
+    hb_yield_stress: float
+    hb_flow_index: float
+    hb_consistency_index: float
+    herschel_bulkley_r2: float
+
+class FluidBatchCreate(BaseModel):
+    """Mud checks of one wellbore as columns, one entry per check"""
+    wellbore_id: str
+    report_date: List[datetime]
+    sample_from: List[str]
+    fluid_type: List[str]
+    mud_weight: List[Optional[float]]
+    mud_weight_unit: str = Field("ppg", description="Unit of mud_weight; stored in ppg")
+    funnel_viscosity: List[Optional[float]]
+    plastic_viscosity: List[Optional[float]]
+    yield_point: List[Optional[float]]
+    gel_strength_10s: List[Optional[float]]
+    gel_strength_10m: List[Optional[float]]
+    pH: List[Optional[float]]
+    r600: List[Optional[float]]
+    r300: List[Optional[float]]
+    r200: List[Optional[float]]
+    r100: List[Optional[float]]
+    r6: List[Optional[float]]
+    r3: List[Optional[float]]
+    test_number: List[int]
+    all_or_nothing: bool = Field(False, description="Reject the whole batch if any check is invalid")
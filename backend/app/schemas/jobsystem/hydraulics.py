@@ -0,0 +1,184 @@
+#hydraulics
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+
+
+class HydraulicsFluid(BaseModel):
+    mud_weight: float = Field(..., gt=0, description="Mud weight (ppg)")
+    plastic_viscosity: float = Field(..., ge=0, description="Plastic viscosity (cP)")
+    yield_point: float = Field(0.0, ge=0, description="Yield point (lbf/100ft2)")
+
+
+class HydraulicsRequest(BaseModel):
+    flow_rates: List[float] = Field(..., min_length=1, description="Flow rates (gpm)")
+    fluid_id: Optional[str] = Field(None, description="Fluid report to take rheology from")
+    fluid: Optional[HydraulicsFluid] = None
+    nozzles: List[float] = Field(default_factory=list, description="Nozzle sizes (1/32 in)")
+    total_flow_area: Optional[float] = Field(None, gt=0, description="Bit TFA (in2), overrides nozzles")
+    surface_case: int = Field(3, ge=1, le=4)
+    tvd: Optional[float] = Field(None, gt=0, description="Bit TVD (ft) for ECD")
+
+
+class HydraulicsSectionResponse(BaseModel):
+    name: str
+    top: float
+    bottom: float
+    loss: List[float]
+
+
+class HydraulicsResponse(BaseModel):
+    flow_rates: List[float]
+    standpipe_pressure: List[float]
+    surface_loss: List[float]
+    pipe_loss: List[float]
+    bit_loss: List[float]
+    annular_loss: List[float]
+    ecd: Optional[List[float]] = None
+    pipe_sections: List[HydraulicsSectionResponse]
+    annulus_sections: List[HydraulicsSectionResponse]
+
+
+class GradientPoint(BaseModel):
+    md: float = Field(..., ge=0, description="Measured depth (ft)")
+    gradient: float = Field(..., gt=0, description="Pressure gradient (psi/ft)")
+
+
+class PressureProfileRequest(BaseModel):
+    flow_rate: float = Field(..., ge=0, description="Flow rate (gpm)")
+    fluid_id: Optional[str] = Field(None, description="Fluid report to take rheology from")
+    fluid: Optional[HydraulicsFluid] = None
+    pore_gradient: List[GradientPoint] = Field(default_factory=list)
+    fracture_gradient: List[GradientPoint] = Field(default_factory=list)
+    margin: float = Field(0.0, ge=0, description="Required margin to pore/frac pressure (psi)")
+
+
+class PressureViolation(BaseModel):
+    type: str
+    md: float
+    tvd: float
+    margin_psi: float
+    margin_ppg: float
+
+
+class PressureProfileResponse(BaseModel):
+    flow_rate: float
+    mud_weight: float
+    md: List[float]
+    tvd: List[float]
+    hydrostatic: List[float]
+    annular_friction: List[float]
+    circulating: List[float]
+    ecd: List[float]
+    pore_pressure: Optional[List[float]] = None
+    fracture_pressure: Optional[List[float]] = None
+    violations: List[PressureViolation]
+
+
+class RunningComponentIn(BaseModel):
+    name: str
+    length: float = Field(..., gt=0, description="Component length (ft)")
+    outer_diameter: float = Field(..., gt=0, description="OD (in)")
+    inner_diameter: float = Field(0.0, ge=0, description="ID (in)")
+
+
+class SurgeSwabRequest(BaseModel):
+    depths: List[float] = Field(..., min_length=1, description="String bottom depths (ft MD)")
+    speeds: List[float] = Field(..., min_length=1, description="Running speeds (ft/min)")
+    string: List[RunningComponentIn] = Field(
+        default_factory=list,
+        description="String being run, bottom component first; defaults to the wellbore drillstring"
+    )
+    closed_end: bool = True
+    clinging_factor: Optional[float] = Field(None, gt=0, lt=1)
+    fluid_id: Optional[str] = None
+    fluid: Optional[HydraulicsFluid] = None
+    pore_gradient: List[GradientPoint] = Field(default_factory=list)
+    fracture_gradient: List[GradientPoint] = Field(default_factory=list)
+    margin: Optional[float] = Field(None, ge=0, description="Safety margin (ppg), defaults to the operational limit")
+
+
+class SurgeSwabInterval(BaseModel):
+    top: float
+    bottom: float
+    max_speed: float
+
+
+class SurgeSwabResponse(BaseModel):
+    depths: List[float]
+    speeds: List[float]
+    surge: List[List[float]]
+    swab: List[List[float]]
+    surge_emw: List[List[float]]
+    swab_emw: List[List[float]]
+    max_safe_speed: List[float]
+    intervals: List[SurgeSwabInterval]
+
+
+class PumpSetup(BaseModel):
+    mud_pump_id: Optional[str] = Field(None, description="Mud pump to take stroke length/efficiency from")
+    liner_size: Optional[float] = Field(None, gt=0, description="Liner size (in)")
+    stroke_length: Optional[float] = Field(None, gt=0, description="Stroke length (in), overrides the pump record")
+    efficiency: Optional[float] = Field(None, gt=0, description="Volumetric efficiency (fraction or %)")
+    pump_type: Optional[str] = None
+    output_per_stroke: Optional[float] = Field(None, gt=0, description="Pump output (bbl/stk), overrides the above")
+
+
+class FluidStageIn(BaseModel):
+    name: str
+    volume: float = Field(..., gt=0, description="Stage volume (bbl)")
+    density: float = Field(..., gt=0, description="Density (ppg)")
+
+
+class FluidTrainRequest(BaseModel):
+    stages: List[FluidStageIn] = Field(..., min_length=1, description="Fluids in pumping order")
+    initial_density: Optional[float] = Field(None, gt=0, description="Density of the fluid in the well (ppg)")
+    fluid_id: Optional[str] = Field(None, description="Fluid report for the fluid in the well")
+    pump: Optional[PumpSetup] = None
+    pumped_volume: List[float] = Field(default_factory=list, description="Pumped volumes to report (bbl)")
+    steps: int = Field(1000, ge=2, le=100000)
+
+
+class FluidTrainResponse(BaseModel):
+    pumped_volume: List[float]
+    strokes: Optional[List[float]] = None
+    stages: List[str]
+    string_depth: Dict[str, List[Optional[float]]]
+    annulus_depth: Dict[str, List[Optional[float]]]
+    string_hydrostatic: List[float]
+    annulus_hydrostatic: List[float]
+    differential: List[float]
+
+
+class RunningPumpIn(PumpSetup):
+    spm: float = Field(..., gt=0, description="Stroke rate (strokes/min)")
+
+
+class LagRequest(BaseModel):
+    pumps: List[RunningPumpIn] = Field(default_factory=list)
+    report_id: Optional[str] = Field(
+        None, description="Take the pumps on hole from a daily report (circulation rate in spm)"
+    )
+    depths: List[float] = Field(default_factory=list, description="Depths for bottoms-up/lag (ft MD)")
+    volumes: List[float] = Field(default_factory=list, description="Volumes to convert to strokes/time (bbl)")
+    minutes: List[float] = Field(default_factory=list, description="Pumping times to convert to lag depth (min)")
+
+
+class PumpOutput(BaseModel):
+    output_per_stroke: float
+    spm: float
+    flow_rate: float
+
+
+class LagResponse(BaseModel):
+    flow_rate: float
+    flow_rate_gpm: float
+    pumps: List[PumpOutput]
+    depths: List[float]
+    lag_volume: List[float]
+    lag_strokes: List[float]
+    lag_time: List[float]
+    volumes: List[float]
+    strokes: List[float]
+    time: List[float]
+    minutes: List[float]
+    lag_depth: List[float]
@@ -1,6 +1,6 @@
 #tally_item#
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional, Union
 from datetime import datetime
 
 from app.models.base import TimeStampSchema
@@ -45,4 +45,18 @@ class TallyItemResponse(TallyItemBase):
         from_attributes = True
 
 class TallyItewmView(TallyItemBase):
-    pass
\ No newline at end of file
+    pass
+
+class TallyItemBatchCreate(BaseModel):
+    """Tally joints as columns; a unit is one value for the column or one per joint"""
+    length_value: List[Optional[float]]
+    length_unit: Union[str, List[Optional[str]], None] = "ft"
+    outer_diameter_value: List[Optional[float]]
+    outer_diameter_unit: Union[str, List[Optional[str]], None] = "in"
+    inner_diameter_value: Optional[List[Optional[float]]] = None
+    inner_diameter_unit: Union[str, List[Optional[str]], None] = "in"
+    weight_per_unit_value: List[Optional[float]]
+    weight_per_unit_unit: Union[str, List[Optional[str]], None] = "lb/ft"
+    description: Optional[List[Optional[str]]] = None
+    serial_number: Optional[List[Optional[str]]] = None
+    all_or_nothing: bool = Field(False, description="Reject the whole batch if any joint is invalid")
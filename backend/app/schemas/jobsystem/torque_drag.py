@@ -0,0 +1,70 @@
+#torque_drag
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+
+
+class StringComponentIn(BaseModel):
+    name: str
+    length: float = Field(..., gt=0, description="Component length (ft)")
+    outer_diameter: float = Field(..., gt=0, description="OD (in)")
+    inner_diameter: float = Field(0.0, ge=0, description="ID (in)")
+    weight: float = Field(..., gt=0, description="Weight in air (lb/ft)")
+
+
+class TorqueDragRequest(BaseModel):
+    friction_factors: List[float] = Field(..., min_length=1)
+    modes: List[str] = Field(default_factory=lambda: ["trip_out", "trip_in", "rotating"])
+    bit_depths: List[float] = Field(default_factory=list, description="Bit depths for broomstick plots (ft MD)")
+    string: List[StringComponentIn] = Field(
+        default_factory=list,
+        description="String from the bit up; defaults to the wellbore drillstring"
+    )
+    mud_weight: Optional[float] = Field(None, gt=0, description="Mud weight (ppg)")
+    fluid_id: Optional[str] = None
+    weight_on_bit: float = Field(0.0, ge=0, description="WOB for sliding/drilling (lbf)")
+    bit_torque: float = Field(0.0, ge=0, description="Bit torque while drilling (ft-lbf)")
+    block_weight: float = Field(0.0, ge=0, description="Travelling block weight (lbf)")
+
+
+class TorqueDragResponse(BaseModel):
+    bit_depths: List[float]
+    friction_factors: List[float]
+    modes: List[str]
+    hook_load: Dict[str, Dict[str, List[float]]]
+    surface_torque: Dict[str, Dict[str, List[float]]]
+    station_md: List[float]
+    tension: Dict[str, List[List[float]]]
+    torque: Dict[str, List[List[float]]]
+
+
+class BucklingRequest(BaseModel):
+    tubular_ids: List[str] = Field(
+        default_factory=list,
+        description="Tubulars forming the string (e.g. a casing or liner run); defaults to the drillstring"
+    )
+    string: List[StringComponentIn] = Field(default_factory=list, description="String from the bit up")
+    mud_weight: Optional[float] = Field(None, gt=0, description="Mud weight (ppg)")
+    fluid_id: Optional[str] = None
+    bit_depth: Optional[float] = Field(None, gt=0, description="String bottom depth (ft MD)")
+    weight_on_bit: float = Field(0.0, ge=0, description="Compressive load at the bottom (lbf)")
+    friction_factors: List[float] = Field(
+        default_factory=list,
+        description="Use torque & drag axial loads with these friction factors; empty for frictionless loads"
+    )
+    modes: List[str] = Field(default_factory=lambda: ["sliding"])
+
+
+class BucklingInterval(BaseModel):
+    top: float
+    bottom: float
+    mode: str
+    max_compression: float
+
+
+class BucklingResponse(BaseModel):
+    md: List[float]
+    compression: List[float]
+    sinusoidal_limit: List[float]
+    helical_limit: List[float]
+    status: List[str]
+    intervals: List[BucklingInterval]
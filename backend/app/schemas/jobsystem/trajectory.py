@@ -1,9 +1,10 @@
 #trajectory
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import datetime
 
 from app.models.base import TimeStampSchema
+from app.schemas.base import BatchImportResponse
 
 class TrajectoryBase(TimeStampSchema):
     wellbore_id: str
@@ -32,4 +33,43 @@ class TrajectoryResponse(TrajectoryBase):
         from_attributes = True
 
 class TrajectoryView(TrajectoryResponse):
-    pass
\ No newline at end of file
+    pass
+
+class TrajectoryBatchCreate(BaseModel):
+    """Survey stations as columns, one entry per station"""
+    measured_depth: List[Optional[float]]
+    inclination: List[Optional[float]]
+    azimuth: List[Optional[float]]
+    depth_unit: str = Field("ft", description="Unit of measured_depth; stored in ft")
+    all_or_nothing: bool = Field(False, description="Reject the whole batch if any station is invalid")
+
+class SurveySummary(BaseModel):
+    """Minimum-curvature position of the last imported station (ft, deg/100ft)"""
+    stations: int
+    measured_depth: float
+    tvd: float
+    north: float
+    east: float
+    closure: float
+    max_dls: float
+
+class SurveyImportResponse(BatchImportResponse):
+    import_id: str
+    format: str
+    depth_unit: str
+    trajectory: Optional[SurveySummary] = None
+
+class SurveyImportProgressResponse(BaseModel):
+    import_id: str
+    filename: Optional[str] = None
+    state: str
+    bytes_read: int
+    total_bytes: Optional[int] = None
+    percent: Optional[float] = None
+    rows: int
+    accepted: int
+    rejected: int
+    inserted: int
+    error: Optional[str] = None
+    started_at: datetime
+    finished_at: Optional[datetime] = None
@@ -56,4 +56,27 @@ class WellboreResponse(WellboreBase):
         from_attributes = True
 
 class WellboreView(WellboreResponse):
-    pass
\ No newline at end of file
+    pass
+
+class WellSectionResponse(BaseModel):
+    name: str
+    top: float
+    bottom: float
+    hole_diameter: float
+    pipe_outer_diameter: float
+    pipe_inner_diameter: float
+
+class WellVolumeResponse(BaseModel):
+    total_depth: float
+    bit_depth: float
+    hole_volume: float
+    open_hole_volume: float
+    cased_hole_volume: float
+    annular_volume: float
+    string_volume: float
+    steel_displacement: float
+    closed_end_displacement: float
+    below_bit_volume: float
+    interval_volume: Optional[float] = None
+    displacement_at_bit: Optional[float] = None
+    annular_volume_at_bit: Optional[float] = None
@@ -9,6 +9,7 @@ class MudPumpBase(TimeStampSchema):
     rig_id: str
     serial_number: Optional[str] = None
     stroke_length: Optional[float] = None
+    liner_size: Optional[float] = None
     max_pressure: Optional[float] = None
     power_rating: Optional[float] = None
     manufacturer: Optional[str] = None
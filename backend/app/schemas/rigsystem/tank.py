@@ -1,6 +1,7 @@
 #tank
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from uuid import UUID
 from datetime import datetime
 
 from app.models.base import TimeStampSchema
@@ -36,3 +37,47 @@ class TankResponse(TankBase):
 
 class TankView(TankResponse):
     pass
+
+class StrappingTableResponse(BaseModel):
+    tank_id: str
+    shape: str
+    height: float = Field(..., description="Tank height (ft)")
+    capacity: float = Field(..., description="Volume when full (bbl)")
+    levels: List[float] = Field(..., description="Levels from the tank bottom (ft)")
+    volumes: List[float] = Field(..., description="Volume at each level (bbl)")
+
+class PitVolumeStart(BaseModel):
+    job_id: UUID = Field(..., description="Job that receives the pit alerts")
+    active_tanks: Optional[List[str]] = Field(None, description="Tanks in the active system; all tanks when omitted")
+    gain_threshold: float = Field(10.0, gt=0, description="Pit gain that raises an alert (bbl)")
+    loss_threshold: float = Field(10.0, gt=0, description="Pit loss that raises an alert (bbl)")
+
+class TankLevelReading(BaseModel):
+    tank_id: str
+    level: float = Field(..., ge=0, description="Fluid level from the tank bottom (ft)")
+    timestamp: Optional[datetime] = None
+
+class PitVolumeReadings(BaseModel):
+    readings: List[TankLevelReading]
+
+class PitVolumeBaseline(BaseModel):
+    active_tanks: Optional[List[str]] = Field(None, description="New active system; unchanged when omitted")
+    volume: Optional[float] = Field(None, description="Baseline volume (bbl); the current active volume when omitted")
+
+class TankVolume(BaseModel):
+    tank_id: str
+    tank_name: Optional[str] = None
+    level: float
+    volume: float
+    active: bool
+
+class PitVolumeResponse(BaseModel):
+    active_volume: float = Field(..., description="Active system volume (bbl)")
+    total_volume: float = Field(..., description="Volume in all tanks (bbl)")
+    baseline: Optional[float] = None
+    gain_loss: float = Field(..., description="Active volume change since the baseline (bbl)")
+    active_tanks: List[str]
+    pending_tanks: List[str] = Field([], description="Active tanks without a reading yet; no baseline until they report")
+    tanks: List[TankVolume]
+    last_reading: Optional[datetime] = None
+    alerts: List[dict] = []
@@ -13,6 +13,15 @@ from app.db.base import Base
 # Import configurations and core modules
 from app.core.config import settings
 from app.core.cache import init_cache
+from app.core.caching import redis_cache
+from app.core.revocation import token_revocation
+from app.core.mail_queue import get_mail_queue
+from app.core.timeseries import get_timeseries_store
+from app.core.ingestion import get_ingestion_service
+from app.core.downsampling import get_rollup_service
+from app.core.rate_limit import (
+    RateLimiter, RateLimitMiddleware, MemoryRateLimitStorage, RedisRateLimitStorage
+)
 from app.db.init_db import init_db
 from fastapi.openapi.utils import get_openapi
 
@@ -68,6 +77,16 @@ async def lifespan(app: FastAPI):
         
         # Initialize cache
         await init_cache()
+
+        # Rebuild the revoked-token registry and follow revocations from other workers
+        token_revocation.load_from_db(db)
+        await token_revocation.start(redis_cache.redis)
+
+        # Start the outbound mail worker for this process
+        await get_mail_queue().start()
+
+        # Start the sensor ingestion worker; it also applies the retention policy
+        await get_ingestion_service().start()
         
         # Initialize database with test data if in development
         if settings.ENVIRONMENT == "development":
@@ -81,6 +100,12 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    await token_revocation.stop()
+    await get_mail_queue().stop()
+    await get_ingestion_service().stop()
+    get_rollup_service().close()
+    get_timeseries_store().close()
+
 # Initialize FastAPI app
 app = FastAPI(
     title="FieldTrax API",
@@ -100,6 +125,14 @@ app.add_middleware(
     max_age=3600,
 )
 
+# Configure rate limiting (shared through Redis when configured)
+if settings.RATE_LIMIT_REDIS_URL:
+    from redis import asyncio as aioredis
+    rate_limit_storage = RedisRateLimitStorage(aioredis.from_url(settings.RATE_LIMIT_REDIS_URL))
+else:
+    rate_limit_storage = MemoryRateLimitStorage(max_keys=settings.RATE_LIMIT_MAX_KEYS)
+app.add_middleware(RateLimitMiddleware, limiter=RateLimiter(rate_limit_storage))
+
 # Set custom OpenAPI schema
 app.openapi = custom_openapi
 
@@ -0,0 +1,23 @@
+"""Add mud pump liner size
+
+Revision ID: 3b7e9c2d41a6
+Revises: fa75a259d4f3
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '3b7e9c2d41a6'
+down_revision = 'fa75a259d4f3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('mud_pumps', sa.Column('liner_size', sa.Float(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('mud_pumps', 'liner_size')
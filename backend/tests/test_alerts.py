@@ -0,0 +1,128 @@
+# tests/test_alerts.py
+import asyncio
+import uuid
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+
+from app.core.alerts import AlertEngine, AlertRule, default_rules
+from app.core.ingestion import IngestionService, SensorFrame
+from app.core.timeseries import TimeSeriesStore
+from app.models.events import EventType
+
+T0 = 1_700_000_000_000
+JOB = str(uuid.UUID(int=1))
+
+def _states(events):
+    return [(e.data["rule_id"], e.data["state"]) for e in events]
+
+def test_threshold_alerts_once_with_deadband():
+    engine = AlertEngine([AlertRule("spp_high", "spp", above=5000, deadband=100)])
+    v = np.array([4000, 5100, 5200, 4950, 5050, 4800, 4850, 5300], dtype=float)
+    t = T0 + np.arange(v.size) * 1000
+    events = engine.evaluate(JOB, "spp", t, v)
+    # 4950 and 5050 sit inside the deadband: no flapping
+    assert _states(events) == [("spp_high", "active"), ("spp_high", "cleared"), ("spp_high", "active")]
+    assert events[0].type == EventType.ALERT
+    assert events[0].timestamp.timestamp() * 1000 == t[1]
+    assert events[0].data["value"] == 5100 and events[0].data["limit"] == 5000
+    assert engine.active_alerts(JOB) == [{"rule_id": "spp_high", "channel": "spp", "severity": "warning"}]
+
+def test_state_carries_across_batches():
+    engine = AlertEngine([AlertRule("low", "rpm", below=10)])
+    events = []
+    for start in range(0, 100, 7):
+        t = T0 + np.arange(start, start + 7) * 1000
+        events += engine.evaluate(JOB, "rpm", t, np.where((t - T0) // 1000 < 50, 60.0, 5.0))
+    assert _states(events) == [("low", "active")]
+    assert engine.evaluate(JOB, "rpm", np.array([T0 + 200_000]), np.array([5.0])) == []
+
+def test_batched_records_match_single_records():
+    rules = [AlertRule("mw_high", "mud_weight", above=14.0), AlertRule("ph_low", "pH", below=9.0)]
+    day = datetime(2024, 5, 1)
+    dates = [day + timedelta(hours=h) for h in (12, 0, 6, 18)]
+    columns = {"mud_weight": [15.0, 12.0, None, 13.0], "pH": [9.5, 8.5, 10.0, None]}
+
+    single = AlertEngine(rules)
+    expected = []
+    for i in sorted(range(4), key=lambda i: dates[i]):
+        expected += single.observe(JOB, {c: v[i] for c, v in columns.items()}, dates[i])
+    batched = AlertEngine(rules)
+    events = batched.observe_many(JOB, dates, columns)
+    # Batches come out channel by channel rather than record by record
+    key = lambda e: (e.timestamp, e.data["rule_id"], e.data["state"])
+    assert sorted(map(key, events)) == sorted(map(key, expected))
+    assert sorted(_states(events)) == [
+        ("mw_high", "active"), ("mw_high", "cleared"), ("ph_low", "active"), ("ph_low", "cleared")
+    ]
+
+def test_window_average_matches_direct_computation():
+    engine = AlertEngine([AlertRule("avg", "flow", kind="window_avg", above=100, window=10)])
+    t = T0 + np.arange(60) * 1000
+    v = np.where((t - T0) // 1000 >= 30, 130.0, 90.0)
+    events = []
+    for i in range(0, 60, 9):
+        events += engine.evaluate(JOB, "flow", t[i:i + 9], v[i:i + 9])
+    # The 10 s mean first exceeds 100 once 3 of its 10 samples are 130
+    assert _states(events) == [("avg", "active")]
+    assert events[0].timestamp.timestamp() * 1000 == t[32]
+    assert events[0].data["value"] == pytest.approx(102.0)
+
+def test_rate_of_change():
+    engine = AlertEngine([AlertRule("gain", "pit_volume", kind="rate", above=5, window=60)])
+    t = T0 + np.arange(300) * 1000
+    v = np.full(t.size, 500.0)
+    v[120:] += np.arange(180) * 0.2  # 12 bbl/min
+    events = engine.evaluate(JOB, "pit_volume", t, v)
+    assert _states(events) == [("gain", "active")]
+    assert 120 < (events[0].timestamp.timestamp() * 1000 - T0) / 1000 < 150
+
+def test_job_scoped_rules_and_rule_changes(tmp_path):
+    other = str(uuid.UUID(int=2))
+    path = tmp_path / "rules.json"
+    engine = AlertEngine([AlertRule("mw", "mud_weight", above=12, job_id=other)], path=str(path))
+    assert engine.observe(JOB, {"mud_weight": 14.0}) == []
+    assert _states(engine.observe(other, {"mud_weight": 14.0})) == [("mw", "active")]
+
+    engine.upsert_rule(AlertRule("mw_all", "mud_weight", above=13))
+    assert sorted(r.id for r in AlertEngine(path=str(path)).rules) == ["mw", "mw_all"]
+    assert engine.delete_rule("mw") and not engine.delete_rule("mw")
+    later = datetime.utcnow() + timedelta(minutes=1)
+    assert _states(engine.observe(JOB, {"mud_weight": 14.0}, later)) == [("mw_all", "active")]
+    with pytest.raises(ValueError):
+        AlertRule("bad", "spp", kind="rate", above=1)
+
+def test_many_rules_are_evaluated_together():
+    rules = [AlertRule(f"r{i}", "hookload", above=float(i)) for i in range(2000)]
+    engine = AlertEngine(rules + default_rules())
+    t = T0 + np.arange(1000) * 1000
+    events = engine.evaluate(JOB, "hookload", t, np.linspace(0, 999.5, t.size))
+    assert len(events) == 1000
+    assert len({e.data["rule_id"] for e in events}) == 1000
+
+def test_default_rules_cover_pump_rates():
+    engine = AlertEngine(default_rules())
+    start = datetime.utcnow()
+    assert engine.observe(JOB, {"circulation_rate": 120.0}, start) == []
+    events = engine.observe(JOB, {"circulation_rate": 190.0}, start + timedelta(minutes=1))
+    assert _states(events) == [("max_circulation_rate", "active")]
+
+def test_ingestion_publishes_alerts(tmp_path):
+    engine = AlertEngine([AlertRule("spp_high", "spp", above=5000)])
+    published = []
+
+    async def publish(events):
+        published.extend(events)
+
+    engine.publish = publish
+    service = IngestionService(store=TimeSeriesStore(path=str(tmp_path)), alerts=engine)
+
+    async def run():
+        for start in (0, 100):
+            t = T0 + np.arange(start, start + 100) * 1000
+            service.submit(SensorFrame(JOB, t, {"spp": np.full(100, 3000.0 + start * 30)}))
+            await service.flush()
+
+    asyncio.run(run())
+    assert _states(published) == [("spp_high", "active")]
+    assert service.stats.alerts == 1
@@ -0,0 +1,54 @@
+# tests/test_buckling.py
+import numpy as np
+import pytest
+
+from app.core.domain.calculations.buckling import (
+    BucklingEngine, HELICAL, NONE, section_properties
+)
+from app.core.domain.calculations.hydraulics import Conduit
+from app.core.domain.calculations.torque_drag import StringComponent, TorqueDragEngine
+
+DP = StringComponent("DP", 20000, 5.0, 4.276, 19.5)
+HOLE = [Conduit("Casing", 0, 6000, 8.681), Conduit("Open Hole", 6000, 15000, 8.5)]
+
+def build_well(stations=1501):
+    md = np.linspace(0, 15000, stations)
+    inc = np.clip((md - 2000) / 100 * 3, 0, 88)
+    azi = np.zeros_like(md)
+    return md, inc, azi
+
+def test_section_properties_are_cached():
+    section_properties.cache_clear()
+    first = section_properties(5.0, 4.276)
+    assert section_properties(5.0, 4.276) is first
+    assert first.moment_of_inertia == pytest.approx(np.pi / 64 * (5.0 ** 4 - 4.276 ** 4))
+    assert section_properties.cache_info().hits == 1
+
+def test_hanging_string_is_not_buckled():
+    md, inc, _ = build_well()
+    result = BucklingEngine(md, inc, [DP], HOLE, mud_weight=10.0).check()
+    assert np.all(result.status == NONE)
+    assert result.intervals == []
+
+def test_limits_grow_with_inclination():
+    md, inc, _ = build_well()
+    engine = BucklingEngine(md, inc, [DP], HOLE, mud_weight=10.0)
+    assert np.all(engine.helical_limit >= engine.sinusoidal_limit)
+    vertical = engine.sinusoidal_limit[md < 2000]
+    np.testing.assert_allclose(vertical, vertical[0])
+    assert engine.sinusoidal_limit[-1] > 5 * vertical[0]
+
+def test_sliding_loads_give_intervals_at_risk():
+    md, inc, azi = build_well()
+    loads = TorqueDragEngine(md, inc, azi, [DP], mud_weight=10.0).calculate(
+        [0.2, 0.4], modes=["sliding"], weight_on_bit=40000
+    )
+    result = BucklingEngine(md, inc, [DP], HOLE, mud_weight=10.0).check(loads.tension)
+    assert result.intervals
+    assert np.any(result.status == HELICAL)
+    for interval in result.intervals:
+        assert interval["top"] <= interval["bottom"]
+        assert interval["mode"] in ("sinusoidal", "helical")
+    # More friction can only add compression
+    low = BucklingEngine(md, inc, [DP], HOLE, mud_weight=10.0).check(loads.tension[:, :1])
+    assert np.all(result.compression >= low.compression - 1e-6)
@@ -0,0 +1,102 @@
+# tests/test_bulk_validators.py
+import numpy as np
+import pytest
+from datetime import datetime
+
+from app.core.units.quantity import Length, Temperature
+from app.core.units.validators import (
+    BulkValidator, FluidBatchValidator, SurveyBatchValidator, TallyBatchValidator,
+    Violation, column_to_unit, select_rows
+)
+
+def test_column_to_unit_per_row_units_and_offsets():
+    temp_f, codes = column_to_unit([0, 100, None], Temperature, "C", "F")
+    np.testing.assert_allclose(temp_f[:2], [32, 212])
+    assert np.isnan(temp_f[2]) and not codes.any()
+
+    length_ft, codes = column_to_unit([1, 2, 3], Length, ["m", None, "furlong"], "ft")
+    assert length_ft[0] == pytest.approx(3.28084) and length_ft[1] == 2
+    assert list(codes) == [0, 0, Violation.INVALID_UNIT]
+
+def test_range_and_increasing_violations():
+    values = np.array([5.0, np.nan, -1.0, 20.0])
+    codes = BulkValidator.range_violations(values, 0, 10)
+    assert list(codes) == [0, Violation.MISSING, Violation.BELOW_MIN, Violation.ABOVE_MAX]
+    # A bad row does not make the rows after it look out of order
+    codes = BulkValidator.increasing_violations(np.array([0, 100, 90, np.nan, 150, 150]))
+    assert list(codes) == [0, 0, Violation.NOT_INCREASING, 0, 0, Violation.NOT_INCREASING]
+
+def test_survey_batch():
+    result = SurveyBatchValidator.validate(
+        [0, 100, 90, 300, None, 400],
+        [0, 5, 5, 40, 10, 30],
+        [0, 10, 10, 10, 360, 20]
+    )
+    assert list(result.invalid) == [False, False, True, False, True, False]
+    assert result.summary() == {
+        "measured_depth": {"missing": 1, "not_increasing": 1},
+        "azimuth": {"above_max": 1},
+    }
+    # 35 deg over 200 ft is a dogleg warning, not a rejection
+    assert result.describe(warnings=True) == [{"row": 3, "column": "dls", "reasons": ["above_max"]}]
+    report = result.report(inserted=4)
+    assert (report["received"], report["rejected"], report["flagged"]) == (6, 2, 1)
+
+def test_survey_batch_in_meters():
+    result = SurveyBatchValidator.validate([0, 11000], [0, 1], [0, 0], "m")
+    assert result.errors["measured_depth"][1] & Violation.ABOVE_MAX
+
+def test_large_survey_is_one_pass():
+    n = 50_000
+    rng = np.random.default_rng(3)
+    md = np.cumsum(rng.uniform(0.1, 0.5, n))
+    inc, azi = rng.uniform(0, 90, n), rng.uniform(0, 359, n)
+    md[100], inc[200], azi[300] = -5, 190, np.nan
+    result = SurveyBatchValidator.validate(md, inc, azi)
+    assert list(np.flatnonzero(result.invalid)) == [100, 200, 300]
+
+def test_tally_batch():
+    result = TallyBatchValidator.validate(
+        [31.2, 30, -1, 9.5],
+        [5, 5, 5, 5],
+        [4.276, 5.5, None, 4.0],
+        [19.5, 19.5, 19.5, 19.5],
+        length_unit=["ft", "m", "ft", "yd"],
+    )
+    assert list(result.invalid) == [False, True, True, False]
+    assert result.describe() == [
+        {"row": 1, "column": "inner_diameter", "reasons": ["inconsistent"]},
+        {"row": 2, "column": "length", "reasons": ["below_min"]},
+    ]
+
+def test_fluid_batch():
+    result = FluidBatchValidator.validate({
+        "mud_weight": [10.5, 30, 1.2],
+        "pH": [9.5, 15, 9],
+        "r600": [60, 40, 60],
+        "r300": [40, 50, 40],
+        "r3": [4, 3, None],
+    }, mud_weight_unit=["ppg", "ppg", "sg"])
+    assert list(result.invalid) == [False, True, True]
+    assert result.summary() == {
+        "mud_weight": {"above_max": 1},
+        "pH": {"above_max": 1},
+        "r300": {"inconsistent": 1},
+        "r3": {"missing": 1},
+    }
+
+def test_select_rows():
+    when = datetime(2024, 1, 1)
+    rows = select_rows(
+        {"md": np.array([1.0, np.nan, 3.0]), "unit": "ft", "note": None, "at": [when, when, when]},
+        np.array([True, True, False]),
+        wellbore_id="wb1"
+    )
+    assert rows == [
+        {"md": 1.0, "unit": "ft", "note": None, "at": when, "wellbore_id": "wb1"},
+        {"md": None, "unit": "ft", "note": None, "at": when, "wellbore_id": "wb1"},
+    ]
+
+def test_out_of_range_depth_does_not_reject_following_stations():
+    result = SurveyBatchValidator.validate([100, 99999, 200, 300], [0, 0, 0, 0], [0, 0, 0, 0])
+    assert list(result.invalid) == [False, True, False, False]
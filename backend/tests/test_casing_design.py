@@ -0,0 +1,41 @@
+# tests/test_casing_design.py
+import numpy as np
+import pytest
+
+from app.core.domain.calculations.casing_design import CasingDesignEngine, CasingString
+
+SURFACE = CasingString("Surface", 0, 3000, 13.375, 12.415, 68, 3450, 1950, 55000)
+INTERMEDIATE = CasingString("Intermediate", 0, 10000, 9.625, 8.681, 47, 6870, 4750, 80000)
+LINER = CasingString("Liner", 9500, 15000, 7.0, 6.184, 26, 7240, 5410, 80000)
+PORE = ([0, 15000], [0.465, 0.65])
+FRAC = ([0, 15000], [0.7, 0.9])
+
+def test_strings_share_one_grid():
+    engine = CasingDesignEngine([SURFACE, INTERMEDIATE, LINER], mud_weight=12.0)
+    assert engine.covered.shape == (3, engine.md.size)
+    assert {3000.0, 9500.0, 10000.0, 15000.0} <= set(engine.md.tolist())
+    assert not engine.covered[2, engine.md < 9500].any()
+
+def test_tension_is_buoyed_hanging_weight():
+    engine = CasingDesignEngine([INTERMEDIATE], mud_weight=10.0)
+    tension = engine.loads()["tension"][0]
+    assert tension[0] == pytest.approx(47 * 10000 * (1 - 10.0 / 65.5))
+    assert tension[-1] == pytest.approx(0.0)
+
+def test_violations_are_merged_intervals():
+    result = CasingDesignEngine([SURFACE, INTERMEDIATE, LINER], mud_weight=12.0).check(PORE, FRAC)
+    collapse = [v for v in result.violations if v["load"] == "collapse"]
+    assert {v["string"] for v in collapse} == {"Intermediate", "Liner"}
+    for v in result.violations:
+        assert v["min_safety_factor"] < 1.2
+        assert v["top"] <= v["bottom"]
+    relaxed = CasingDesignEngine([SURFACE], mud_weight=12.0).check(PORE, FRAC, minimum_safety_factor=1.0)
+    assert relaxed.violations == []
+
+def test_missing_ratings_are_skipped():
+    unrated = CasingString("Unrated", 0, 5000, 9.625, 8.681, 47)
+    result = CasingDesignEngine([unrated], mud_weight=12.0).check(PORE, FRAC)
+    assert result.violations == []
+    summary = result.to_dict()["strings"][0]
+    assert summary["min_burst_safety_factor"] is None
+    assert all(v is None for v in summary["tension_safety_factor"])
@@ -0,0 +1,133 @@
+# tests/test_downsampling.py
+import asyncio
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+
+from app.core.downsampling import (
+    RollupService, aggregate_buckets, event_timeline, lttb, rollup
+)
+from app.core.ingestion import IngestionService, SensorFrame
+from app.core.timeseries import TimeSeriesStore
+
+T0 = 1_700_000_000_000 // 3_600_000 * 3_600_000  # hour aligned
+
+def _agg(t, v):
+    return t, v, v, v, np.ones(v.size)
+
+def test_rollup_buckets():
+    t = T0 + np.arange(0, 5000, 250)
+    v = np.arange(t.size, dtype=float)
+    bt, mn, mx, sm, ct = rollup(_agg(t, v), 1000)
+    np.testing.assert_array_equal(bt, T0 + np.arange(5) * 1000)
+    np.testing.assert_array_equal(mn, [0, 4, 8, 12, 16])
+    np.testing.assert_array_equal(mx, [3, 7, 11, 15, 19])
+    np.testing.assert_array_equal(ct, [4] * 5)
+    # Rolling up rollups gives the same result as rolling up the raw data
+    coarse = rollup((bt, mn, mx, sm, ct), 2000)
+    direct = rollup(_agg(t, v), 2000)
+    for a, b in zip(coarse, direct):
+        np.testing.assert_array_equal(a, b)
+
+def test_aggregate_buckets_skips_empty():
+    t = np.array([0, 1, 2, 90, 99])
+    v = np.array([1.0, 5.0, 3.0, 7.0, 2.0])
+    bt, mn, mx, sm, ct = aggregate_buckets(_agg(t, v), 0, 100, 10)
+    np.testing.assert_array_equal(bt, [0, 90])
+    np.testing.assert_array_equal(mn, [1.0, 2.0])
+    np.testing.assert_array_equal(mx, [5.0, 7.0])
+    np.testing.assert_array_equal(sm / ct, [3.0, 4.5])
+
+def test_lttb_keeps_extremes():
+    t = np.arange(10_000)
+    v = np.sin(t / 500.0)
+    v[4321] = 50.0
+    ts, vs = lttb(t, v, 200)
+    assert ts.size == 200
+    assert ts[0] == 0 and ts[-1] == 9999
+    assert 4321 in ts
+    assert np.all(np.diff(ts) > 0)
+    assert lttb(t[:10], v[:10], 200)[0].size == 10
+
+def test_event_timeline():
+    start = datetime(2024, 1, 1)
+    times = [start + timedelta(hours=h) for h in (0, 1, 5, 23)]
+    result = event_timeline(times, ["NPT", "incident", "NPT", "NPT"], start, start + timedelta(days=1), 4,
+                            weights=[1.0, None, 2.5, 1.0])
+    assert result["total"] == [3, 0, 0, 1]
+    assert result["by_category"]["NPT"] == [2, 0, 0, 1]
+    assert result["weight"] == [3.5, 0, 0, 1.0]
+
+def _store(tmp_path):
+    store = TimeSeriesStore(path=str(tmp_path), chunk_size=2048)
+    return store, RollupService(store)
+
+def _ingest(store, rollups, t, v, batch=977):
+    for i in range(0, t.size, batch):
+        store.append("job1", "hookload", t[i:i + batch], v[i:i + batch])
+        rollups.update("job1", "hookload", t[i:i + batch], v[i:i + batch])
+
+def test_rollups_match_raw(tmp_path):
+    store, rollups = _store(tmp_path)
+    t = T0 + np.arange(3 * 3600 * 2) * 500  # 3 h at 2 Hz
+    v = np.random.default_rng(1).normal(200, 5, t.size)
+    _ingest(store, rollups, t, v)
+
+    minute = rollups._scan_level("job1", "hookload", 60_000, None, None)
+    expected = rollup(_agg(t, v), 60_000)
+    assert minute[0].size == 179  # last minute still open
+    for a, b in zip(minute, expected):
+        np.testing.assert_allclose(a, b[:179])
+    assert rollups._scan_level("job1", "hookload", 3_600_000, None, None)[0].size == 2
+
+def test_rollups_recover_after_restart(tmp_path):
+    store, rollups = _store(tmp_path)
+    t = T0 + np.arange(7200) * 1000
+    v = np.arange(t.size, dtype=float)
+    _ingest(store, rollups, t[:3000], v[:3000])
+    rollups.close()
+
+    # A new service rebuilds its open buckets from the stored data
+    rollups = RollupService(store)
+    _ingest(store, rollups, t[3000:], v[3000:])
+    minute = rollups._scan_level("job1", "hookload", 60_000, None, None)
+    expected = rollup(_agg(t, v), 60_000)
+    for a, b in zip(minute, expected):
+        np.testing.assert_allclose(a, b[:-1])
+    hour = rollups._scan_level("job1", "hookload", 3_600_000, None, None)
+    np.testing.assert_array_equal(hour[4], [3600])
+
+def test_query_uses_rollups_and_raw_tail(tmp_path):
+    store, rollups = _store(tmp_path)
+    t = T0 + np.arange(6 * 3600) * 1000  # 6 h at 1 Hz
+    v = np.arange(t.size, dtype=float)
+    _ingest(store, rollups, t, v)
+
+    result = rollups.query("job1", "hookload", points=100)
+    assert result["level"] == 60_000
+    assert len(result["t"]) <= 100
+    assert sum(result["count"]) == t.size
+    assert result["min"][0] == 0 and result["max"][-1] == v[-1]
+
+    fine = rollups.query("job1", "hookload", start=int(t[0]), end=int(t[50]), points=100)
+    assert fine["level"] is None and sum(fine["count"]) == 51
+
+    line = rollups.query("job1", "hookload", points=300, method="lttb")
+    assert len(line["t"]) == 300
+    with pytest.raises(ValueError):
+        rollups.query("job1", "hookload", method="median")
+
+def test_ingestion_maintains_rollups(tmp_path):
+    store = TimeSeriesStore(path=str(tmp_path))
+    service = IngestionService(store=store)
+
+    async def run():
+        for i in range(0, 7200, 600):
+            t = T0 + np.arange(i, i + 600) * 1000
+            service.submit(SensorFrame("job1", t, {"spp": np.full(600, 3000.0)}))
+            await service.flush()
+
+    asyncio.run(run())
+    hour = service.rollups._scan_level("job1", "spp", 3_600_000, None, None)
+    np.testing.assert_array_equal(hour[4], [3600])
+    assert store.jobs() == ["job1"]
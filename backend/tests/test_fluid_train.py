@@ -0,0 +1,48 @@
+# tests/test_fluid_train.py
+import numpy as np
+import pytest
+
+from app.core.domain.calculations.fluid_train import FluidStage, FluidTrainSimulator
+from app.core.domain.calculations.hydraulics import Conduit
+from app.core.domain.calculations.pumps import PumpConfiguration
+from app.core.domain.calculations.sections import build_sections
+from app.core.domain.calculations.volumes import WellVolumes
+
+OUTER = [Conduit("Casing", 0, 5000, 8.681, 9.625), Conduit("Open Hole", 5000, 10000, 8.5, 8.5)]
+STRING = [Conduit("String", 0, 10000, 6.184, 7.0)]
+STAGES = [
+    FluidStage("Spacer", 50, 12.0),
+    FluidStage("Lead", 150, 13.5),
+    FluidStage("Tail", 60, 15.8),
+    FluidStage("Displacement", 371, 10.0),
+]
+
+@pytest.fixture
+def simulator():
+    return FluidTrainSimulator(WellVolumes(build_sections(OUTER, STRING)), initial_density=10.0)
+
+def test_static_well_is_balanced(simulator):
+    result = simulator.simulate(STAGES, pumped_volume=[0.0])
+    assert result.string_hydrostatic[0] == pytest.approx(0.052 * 10.0 * 10000)
+    assert result.differential[0] == pytest.approx(0.0)
+
+def test_interfaces_follow_capacity(simulator):
+    capacity = 6.184 ** 2 / 1029.4
+    result = simulator.simulate(STAGES, pumped_volume=[100.0])
+    assert result.string_depth[0, 0] == pytest.approx(100.0 / capacity)
+    assert result.string_depth[0, 1] == pytest.approx(50.0 / capacity)
+    assert np.isnan(result.string_depth[0, 2]) and np.all(np.isnan(result.annulus_depth))
+
+def test_heavy_slurry_in_string_pushes_u_tube(simulator):
+    result = simulator.simulate(STAGES, steps=5000, output_per_stroke=PumpConfiguration(6.5, 12, 0.95).output_per_stroke)
+    assert result.pumped_volume.size == 5000
+    assert result.differential.min() < 0
+    # Once displaced, the cement sits in the annulus
+    assert result.differential[-1] > 0
+    assert not np.isnan(result.annulus_depth[-1, 2])
+    assert result.strokes[-1] == pytest.approx(result.pumped_volume[-1] / (0.000243 * 6.5 ** 2 * 12 * 0.95))
+
+def test_pump_efficiency_in_percent():
+    assert PumpConfiguration(6.0, 12.0, 95).output_per_stroke == pytest.approx(
+        PumpConfiguration(6.0, 12.0, 0.95).output_per_stroke
+    )
@@ -0,0 +1,47 @@
+# tests/test_friction.py
+import numpy as np
+import pytest
+
+from app.core.domain.calculations.friction import (
+    CORRELATIONS, LAMINAR, TRANSITIONAL, TURBULENT, benchmark, colebrook,
+    darcy_friction_factor, fanning_friction_factor, flow_regime, haaland, serghides, swamee_jain
+)
+
+def test_colebrook_matches_moody_chart():
+    # Re = 1e5, e/D = 1e-4 reads f ~ 0.0185 on the Moody chart
+    assert colebrook(1e5, 1e-4) == pytest.approx(0.0185, rel=5e-3)
+
+def test_explicit_correlations_track_colebrook():
+    re = np.logspace(np.log10(4000), 8, 200)
+    rr = np.full_like(re, 1e-4)
+    reference = colebrook(re, rr)
+    assert np.max(np.abs(serghides(re, rr) / reference - 1)) < 1e-4
+    assert np.max(np.abs(haaland(re, rr) / reference - 1)) < 2e-2
+    assert np.max(np.abs(swamee_jain(re, rr) / reference - 1)) < 3e-2
+
+def test_regimes_are_continuous():
+    re = np.array([0.0, 1000.0, 2100.0, 3000.0, 4000.0, 1e6])
+    f = darcy_friction_factor(re)
+    assert f[0] == 0.0
+    assert f[1] == pytest.approx(0.064)
+    assert f[2] == pytest.approx(64 / 2100)
+    assert f[4] == pytest.approx(float(colebrook(4000.0)))
+    assert f[2] < f[3] < f[4] or f[4] < f[3] < f[2]
+    assert flow_regime(re[1:4]).tolist() == [LAMINAR, TRANSITIONAL, TRANSITIONAL]
+    assert flow_regime(re[4]) == TURBULENT
+
+def test_fanning_is_quarter_darcy_and_keeps_shape():
+    re = np.random.default_rng(1).uniform(100, 1e6, (50, 200))
+    fanning = fanning_friction_factor(re, 1e-5)
+    assert fanning.shape == re.shape
+    np.testing.assert_allclose(fanning * 4, darcy_friction_factor(re, 1e-5))
+
+def test_benchmark_reports_every_correlation():
+    # Timings are reported, not asserted; benchmark() with its defaults is the full run
+    results = benchmark(size=20000, repeat=1)
+    assert set(results) == set(CORRELATIONS)
+    assert results["colebrook"]["max_relative_error"] < 1e-10
+    assert results["serghides"]["max_relative_error"] < 1e-4
+    assert results["haaland"]["max_relative_error"] < 2e-2
+    assert results["swamee_jain"]["max_relative_error"] < 5e-2
+    assert all(stats["ns_per_value"] > 0 for stats in results.values())
@@ -0,0 +1,60 @@
+# tests/test_gradients.py
+import numpy as np
+import pytest
+
+from app.core.units.quantity import Length, Pressure, Temperature
+from app.models.gradients import (
+    FracturePressureGradient, GeothermalGradient, PorePressureGradient,
+    PressurePoint, SortedProfile, TemperaturePoint
+)
+
+def point(md, gradient, unit="ft"):
+    return PressurePoint(md=Length(md, unit), pressure_gradient=Pressure(gradient, "psi/ft"))
+
+def test_inserts_stay_sorted():
+    profile = PorePressureGradient()
+    for md in (5000, 1000, 9000, 3000, 1000):
+        profile.add_point(point(md, 0.45 + md / 1e5))
+    depths = profile.arrays()[:, 0]
+    assert depths.tolist() == [1000, 1000, 3000, 5000, 9000]
+    assert [p.md.value for p in profile.points] == depths.tolist()
+
+def test_points_are_sorted_in_feet():
+    profile = FracturePressureGradient(points=[point(1000, 0.8, "m"), point(2000, 0.7)])
+    np.testing.assert_allclose(profile.arrays()[:, 0], [2000, 1000 / 0.3048])
+
+def test_vectorized_queries():
+    profile = PorePressureGradient()
+    profile.extend([point(10000, 0.65), point(0, 0.45)])
+    np.testing.assert_allclose(profile.gradient_at([0, 5000, 20000]), [0.45, 0.55, 0.65])
+    np.testing.assert_allclose(profile.pressure_at([5000], [4000]), [0.55 * 4000])
+
+def test_bytes_round_trip():
+    profile = PorePressureGradient(points=[point(md, 0.45 + md / 1e5) for md in range(0, 10000, 500)])
+    restored = PorePressureGradient.from_bytes(profile.to_bytes())
+    assert isinstance(restored, PorePressureGradient)
+    np.testing.assert_array_equal(restored.arrays(), profile.arrays())
+
+def test_geothermal_profile():
+    profile = GeothermalGradient()
+    for tvd in (10000, 0, 5000):
+        profile.add_point(TemperaturePoint(
+            tvd=Length(tvd, "ft"), temperature=Temperature(60 + tvd * 0.015), gradient=Temperature(1.5)
+        ))
+    np.testing.assert_allclose(profile.temperature_at([2500, 7500]), [97.5, 172.5])
+    restored = GeothermalGradient.from_bytes(profile.to_bytes())
+    np.testing.assert_array_equal(restored.arrays(), profile.arrays())
+
+def test_geothermal_round_trip_converts_celsius_gradients():
+    profile = GeothermalGradient(points=[
+        TemperaturePoint(tvd=Length(1000, "m"), temperature=Temperature(50, "C"), gradient=Temperature(2, "C"))
+    ])
+    restored = GeothermalGradient.from_bytes(profile.to_bytes())
+    (point,) = restored.points
+    assert point.temperature.to_unit("C") == pytest.approx(50)
+    # A 2 C difference is 3.6 F, not 2 F and not 35.6 F
+    assert (point.gradient.value, point.gradient.unit) == (pytest.approx(3.6), "F")
+
+def test_profiles_must_define_the_hooks():
+    with pytest.raises(TypeError):
+        SortedProfile()
@@ -0,0 +1,116 @@
+# tests/test_hydraulics.py
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.core.domain.calculations.hydraulics import (
+    AnnulusSection, BitNozzles, FlowGeometry, FluidProperties, HydraulicsEngine, PipeSection,
+    conduits_from_tubulars
+)
+from app.core.domain.calculations.sections import build_sections
+
+# Reference values are worked by hand from the Bingham plastic field-unit
+# equations in Bourgoyne et al., Applied Drilling Engineering, ch. 4.
+
+def _engine(pipe=(), annulus=(), fluid=None, nozzles=None, surface_case=3):
+    geometry = FlowGeometry(list(pipe), list(annulus))
+    return HydraulicsEngine(geometry, fluid or FluidProperties(10.0, 20.0, 15.0), nozzles, surface_case)
+
+def test_laminar_pipe_loss():
+    # 50 gpm in 4.276 in ID: v = 50 / (2.448 * 4.276^2) = 1.117 ft/s
+    # mu_a = 20 + 6.66 * 15 * 4.276 / 1.117 = 402 cP, NRe = 928 * 10 * 1.117 * 4.276 / 402 = 110
+    # dp/dL = 20 * 1.117 / (1500 * 4.276^2) + 15 / (225 * 4.276) = 0.01641 psi/ft
+    engine = _engine(pipe=[PipeSection("DP", 0.0, 1000.0, 4.276)])
+    assert engine.pipe_losses([50.0])[0, 0] == pytest.approx(16.41, rel=1e-3)
+
+def test_turbulent_pipe_loss():
+    # Newtonian 10 cP, 400 gpm in 3.826 in ID: v = 11.16 ft/s, NRe = 928 * 10 * 11.16 * 3.826 / 10 = 39,630
+    # Smooth pipe (Blasius): f = 0.0791 / NRe^0.25 = 0.00561
+    # dp/dL = f * 10 * 11.16^2 / (25.8 * 3.826) = 0.0708 psi/ft
+    engine = _engine(pipe=[PipeSection("DP", 0.0, 10000.0, 3.826)], fluid=FluidProperties(10.0, 10.0, 0.0))
+    # Colebrook (used by the engine) and Blasius agree within ~2% at this Reynolds number
+    assert engine.pipe_losses([400.0])[0, 0] == pytest.approx(707.6, rel=3e-2)
+
+def test_laminar_annular_loss():
+    # 300 gpm in 8.5 x 5 in: v = 300 / (2.448 * (8.5^2 - 5^2)) = 2.594 ft/s
+    # mu_a = 20 + 5 * 15 * 3.5 / 2.594 = 121 cP, NRe = 757 * 10 * 2.594 * 3.5 / 121 = 567
+    # dp/dL = 20 * 2.594 / (1000 * 3.5^2) + 15 / (200 * 3.5) = 0.02566 psi/ft
+    engine = _engine(annulus=[AnnulusSection("OH", 5000.0, 7000.0, 8.5, 5.0)])
+    assert engine.annular_losses([300.0])[0, 0] == pytest.approx(51.33, rel=1e-3)
+    # annular_gradient is the same correlation driven by velocity
+    assert engine.annular_gradient(np.array([2.594]), 8.5, 5.0)[0] == pytest.approx(0.02566, rel=1e-3)
+
+def test_losses_are_evaluated_for_a_rate_vector():
+    engine = _engine(
+        pipe=[PipeSection("DP", 0.0, 9000.0, 4.276), PipeSection("BHA", 9000.0, 10000.0, 2.8125)],
+        annulus=[AnnulusSection("OH", 0.0, 10000.0, 8.5, 5.0)],
+    )
+    rates = np.array([0.0, 50.0, 300.0, 600.0])
+    losses = engine.pipe_losses(rates)
+    assert losses.shape == (2, 4)
+    assert np.all(losses[:, 0] == 0.0)
+    assert np.all(np.diff(losses, axis=1) > 0)
+    for i, q in enumerate(rates):
+        assert losses[:, i] == pytest.approx(engine.pipe_losses([q])[:, 0])
+
+def test_bit_pressure_drop():
+    # Three 12/32 in nozzles: At = 3 * pi / 4 * 0.375^2 = 0.3313 in2
+    # dPb = 12 * 400^2 / (12031 * 0.95^2 * 0.3313^2) = 1611 psi
+    nozzles = BitNozzles.from_sizes([12, 12, 12])
+    assert nozzles.total_flow_area == pytest.approx(0.3313, rel=1e-3)
+    engine = _engine(fluid=FluidProperties(12.0, 20.0, 15.0), nozzles=nozzles)
+    assert engine.bit_loss([400.0])[0] == pytest.approx(1611, rel=1e-3)
+    assert _engine().bit_loss([400.0])[0] == 0.0
+
+def test_surface_loss_and_standpipe_pressure():
+    # Case 3: E = 5.3e-5, dPs = E * 10^0.8 * 400^1.8 * 20^0.2 = 29.4 psi
+    engine = _engine(
+        pipe=[PipeSection("DP", 0.0, 1000.0, 4.276)],
+        annulus=[AnnulusSection("OH", 0.0, 1000.0, 8.5, 5.0)],
+        nozzles=BitNozzles.from_sizes([12, 12, 12]),
+    )
+    result = engine.calculate([400.0])
+    assert result.surface_loss[0] == pytest.approx(29.39, rel=1e-3)
+    assert result.standpipe_pressure[0] == pytest.approx(
+        result.surface_loss[0] + result.total_pipe_loss[0] + result.bit_loss[0] + result.total_annular_loss[0]
+    )
+
+def test_ecd_at_bit():
+    # Two laminar annular sections of 2000 ft at 300 gpm lose 2 * 51.33 psi
+    # ECD = 10 + 102.66 / (0.052 * 4000) = 10.494 ppg
+    engine = _engine(annulus=[
+        AnnulusSection("Casing", 0.0, 2000.0, 8.5, 5.0),
+        AnnulusSection("OH", 2000.0, 4000.0, 8.5, 5.0),
+    ])
+    ecd = engine.ecd_at_bit([0.0, 300.0], tvd=4000.0)
+    assert ecd[0] == pytest.approx(10.0)
+    assert ecd[1] == pytest.approx(10.494, rel=1e-3)
+
+def _tubular(kind, top, bottom, inner, outer, **extra):
+    fields = dict(tubulartype_id=kind, start_depth=top, end_depth=bottom, inner_diameter=inner,
+                  outer_diameter=outer, oh_diameter=None, open_hole_size=None, component_type=None)
+    fields.update(extra)
+    return SimpleNamespace(**fields)
+
+def test_conduits_from_tubulars():
+    tubulars = [
+        _tubular("Casing", 0.0, 5000.0, 8.835, 9.625, oh_diameter=8.5),
+        _tubular("Drill Pipe", 0.0, 9000.0, 4.276, 5.0, component_type="DP"),
+        _tubular("Drill Pipe", 9000.0, 10000.0, 2.8125, 6.5, component_type="BHA"),
+    ]
+    outer, string = conduits_from_tubulars(tubulars)
+    assert [(c.name, c.top, c.bottom, c.inner_diameter) for c in outer] == [
+        ("Casing", 0.0, 5000.0, 8.835), ("Open Hole", 5000.0, 10000.0, 8.5)
+    ]
+    assert [c.name for c in string] == ["DP", "BHA"]
+    # Open hole can be extended below the bit to total depth
+    assert conduits_from_tubulars(tubulars, total_depth=10500.0)[0][-1].bottom == 10500.0
+
+    geometry = build_sections(outer, string).flow_geometry()
+    assert geometry.bit_depth == 10000.0
+    assert [(s.name, s.top, s.bottom, s.hole_diameter, s.pipe_diameter) for s in geometry.annulus_sections] == [
+        ("Casing/DP", 0.0, 5000.0, 8.835, 5.0),
+        ("Open Hole/DP", 5000.0, 9000.0, 8.5, 5.0),
+        ("Open Hole/BHA", 9000.0, 10000.0, 8.5, 6.5),
+    ]
@@ -0,0 +1,159 @@
+# tests/test_ingestion.py
+import asyncio
+import json
+import numpy as np
+import pytest
+
+from app.core.ingestion import (
+    FrameError, IngestBackpressure, IngestionService, SensorFrame, parse_frames
+)
+from app.core.downsampling import RollupService
+from app.core.timeseries import RetentionPolicy, TimeSeriesStore
+
+T0 = 1_700_000_000_000
+JOB = "job1"
+
+def _frame(start, n, channels=("hookload", "spp")):
+    t = T0 + (start + np.arange(n, dtype=np.int64)) * 1000
+    return SensorFrame(JOB, t, {c: np.arange(start, start + n, dtype=float) for c in channels})
+
+def test_parse_json_frames():
+    body = json.dumps([
+        {"timestamps": [T0, T0 + 1000], "channels": {"rpm": [60, 61], "spp": [3000, None]}},
+        {"timestamps": [T0 + 2000], "channels": {"rpm": [62]}},
+    ]).encode()
+    frames = parse_frames(JOB, body, "application/json")
+    assert [f.samples for f in frames] == [4, 1]
+    assert np.isnan(frames[0].columns["spp"][1])
+    with pytest.raises(FrameError):
+        parse_frames(JOB, b'{"timestamps": [1, 2], "channels": {"rpm": [1]}}')
+
+def test_parse_line_protocol():
+    body = b"rig1 hookload=210.5,spp=3010 1700000000000\n# comment\nrig1 hookload=211 1700000001000\n"
+    (frame,) = parse_frames(JOB, body, "text/plain; charset=utf-8")
+    np.testing.assert_array_equal(frame.timestamps, [T0, T0 + 1000])
+    np.testing.assert_array_equal(frame.columns["hookload"], [210.5, 211.0])
+    assert np.isnan(frame.columns["spp"][1])
+    with pytest.raises(FrameError):
+        parse_frames(JOB, b"rig1 hookload=abc 1", "text/plain")
+
+def test_channel_names_are_checked_at_parse_time():
+    with pytest.raises(FrameError, match="channel name"):
+        parse_frames(JOB, b'{"timestamps": [1], "channels": {"../spp": [1]}}')
+    with pytest.raises(FrameError, match="Line 2"):
+        parse_frames(JOB, b"rig1 rpm=60 1\nrig1 _rollup=1 2", "text/plain")
+
+def test_parse_msgpack():
+    msgpack = pytest.importorskip("msgpack")
+    body = msgpack.packb({"timestamps": [T0], "channels": {"rpm": [60.0]}})
+    (frame,) = parse_frames(JOB, body, "application/msgpack")
+    assert frame.columns["rpm"][0] == 60.0
+
+def test_batches_merge_out_of_order_frames(tmp_path):
+    store = TimeSeriesStore(path=str(tmp_path), chunk_size=1000)
+    service = IngestionService(store=store, batch_samples=10**9)
+
+    async def run():
+        service.submit(_frame(100, 100))
+        service.submit(_frame(0, 120))  # overlaps the first frame
+        _, ack = service.submit(_frame(200, 50), want_ack=True)
+        await service.flush()
+        return await ack
+
+    assert asyncio.run(run()) == 100
+    t, v = store.scan(JOB, "hookload")
+    np.testing.assert_array_equal(t, T0 + np.arange(250) * 1000)
+    np.testing.assert_array_equal(v, np.arange(250, dtype=float))
+    assert service.stats.written_samples == 500
+    assert service.stats.dropped_samples == 40
+    assert service.buffered_samples == 0
+    assert service.flushed_seq == 3
+
+def test_stale_samples_are_dropped_across_batches(tmp_path):
+    store = TimeSeriesStore(path=str(tmp_path), chunk_size=1000)
+    service = IngestionService(store=store)
+
+    async def run():
+        service.submit(_frame(0, 10, ("rpm",)))
+        await service.flush()
+        service.submit(_frame(5, 10, ("rpm",)))
+        await service.flush()
+
+    asyncio.run(run())
+    assert store.scan(JOB, "rpm")[0].size == 15
+    assert service.stats.dropped_samples == 5
+
+def test_backpressure(tmp_path):
+    service = IngestionService(store=TimeSeriesStore(path=str(tmp_path)), max_buffered_samples=300)
+
+    async def run():
+        service.submit(_frame(0, 100))
+        with pytest.raises(IngestBackpressure):
+            service.submit(_frame(100, 100))
+        # put() waits for the flush instead of refusing
+        waiter = asyncio.create_task(service.put(_frame(100, 100)))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        await service.flush()
+        await asyncio.wait_for(waiter, 1)
+        await service.flush()
+
+    asyncio.run(run())
+    assert service.stats.rejected_frames == 1
+    assert service.stats.written_samples == 400
+
+def test_worker_flushes_in_background(tmp_path):
+    store = TimeSeriesStore(path=str(tmp_path), chunk_size=4096)
+    service = IngestionService(store=store, batch_samples=1000, flush_interval=0.05)
+
+    async def run():
+        await service.start()
+        for i in range(20):
+            await service.put(_frame(i * 500, 500))
+        await service.stop()
+
+    asyncio.run(run())
+    assert store.stats(JOB)["spp"]["points"] == 10_000
+    assert service.buffered_samples == 0
+
+def test_failing_channel_does_not_poison_the_batch(tmp_path):
+    store = TimeSeriesStore(path=str(tmp_path), chunk_size=1000)
+    service = IngestionService(store=store, batch_samples=10**9)
+    # Built directly, so it skips the parser's name check and fails in the store
+    bad = SensorFrame(JOB, _frame(0, 10).timestamps, {"bad/name": np.ones(10)})
+
+    async def run():
+        _, good_ack = service.submit(_frame(0, 100), want_ack=True)
+        _, bad_ack = service.submit(bad, want_ack=True)
+        await service.flush()
+        with pytest.raises(ValueError):
+            await bad_ack
+        return await good_ack
+
+    assert asyncio.run(run()) == 200
+    assert store.scan(JOB, "spp")[0].size == 100
+    assert service.stats.written_samples == 200
+    assert service.stats.failed_channels == 1
+    assert service.stats.failed_batches == 0
+
+def test_worker_applies_retention_to_raw_and_rollups(tmp_path):
+    # T0 is years old, so every sealed chunk is past a one-day retention
+    store = TimeSeriesStore(path=str(tmp_path), chunk_size=100, retention=RetentionPolicy(max_age_days=1))
+    rollups = RollupService(store)
+    service = IngestionService(store=store, rollups=rollups, flush_interval=0.01)
+    second = rollups.levels[rollups.widths[0]]
+
+    async def run():
+        await service.put(_frame(0, 7250, channels=("spp",)))
+        await service.flush()
+        assert store.stats(JOB)["spp"]["chunks"] and second.stats(JOB)["spp.count"]["chunks"]
+        # The first pass runs on the worker's first wakeup
+        await service.start()
+        await asyncio.sleep(0.1)
+        await service.stop()
+
+    asyncio.run(run())
+    assert store.stats(JOB)["spp"]["chunks"] == 0
+    assert all(s["chunks"] == 0 for level in rollups.levels.values() for s in level.stats(JOB).values())
+    # The open head is not a chunk and stays
+    assert store.scan(JOB, "spp")[0].size == 50
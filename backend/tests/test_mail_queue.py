@@ -0,0 +1,92 @@
+# tests/test_mail_queue.py
+import asyncio
+
+import pytest
+from app.core.mail_queue import MailQueue, SMTPConnection
+
+aiosmtpd_controller = pytest.importorskip("aiosmtpd.controller")
+
+class CollectingHandler:
+    def __init__(self, refuse=()):
+        self.messages = []
+        self.refuse = set(refuse)
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address in self.refuse:
+            return "550 No such user"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope)
+        return "250 OK"
+
+@pytest.fixture
+def smtp_server():
+    handler = CollectingHandler()
+    controller = aiosmtpd_controller.Controller(handler, hostname="127.0.0.1", port=8025)
+    controller.start()
+    yield controller, handler
+    controller.stop()
+
+def make_queue(tmp_path, port):
+    connection = SMTPConnection(
+        host="127.0.0.1", port=port, username="", password="",
+        starttls=False, use_credentials=False, timeout=5
+    )
+    return MailQueue(path=str(tmp_path / "mail.db"), connection=connection, sender="noreply@fieldtrax.com")
+
+def test_crew_fanout_uses_one_connection(tmp_path, smtp_server):
+    controller, handler = smtp_server
+    queue = make_queue(tmp_path, controller.port)
+
+    crew = [(f"crew{i}@example.com", {"user_name": f"Crew {i}", "job_name": "Well A"}) for i in range(12)]
+    assert queue.enqueue_template("daily_report_reminder.html", "Daily Report Reminder", crew) == 12
+
+    assert queue.drain() == 12
+    assert len(handler.messages) == 12
+    assert queue.connection.connects == 1
+    assert queue.stats() == {"sent": 12}
+    queue.close()
+
+def test_failed_delivery_is_retried_with_backoff(tmp_path):
+    # Nothing listens on this port, so every attempt fails
+    queue = make_queue(tmp_path, 8026)
+    queue.enqueue(["ops@example.com", "hse@example.com"], "New Job Created", "body", subtype="plain")
+
+    assert queue.drain() == 0
+    assert queue.stats() == {"pending": 2}
+    # Both messages were pushed into the future, so nothing is due now
+    assert queue.process_batch() == 0
+    queue.close()
+
+def test_refused_recipient_keeps_the_connection(tmp_path, smtp_server):
+    controller, handler = smtp_server
+    handler.refuse.add("gone@example.com")
+    queue = make_queue(tmp_path, controller.port)
+    queue.enqueue(["ops@example.com", "gone@example.com", "hse@example.com"], "New Job Created", "body", subtype="plain")
+
+    assert queue.drain() == 2
+    assert len(handler.messages) == 2
+    # Only the refused message is retried and the SMTP session was reused
+    assert queue.connection.connects == 1
+    assert queue.stats() == {"pending": 1, "sent": 2}
+    queue.close()
+
+def test_worker_delivers_in_background(tmp_path, smtp_server):
+    controller, handler = smtp_server
+    queue = make_queue(tmp_path, controller.port)
+
+    async def run():
+        await queue.start()
+        queue.enqueue(["ops@example.com"], "New Job Created", "body", subtype="plain")
+        for _ in range(100):
+            if handler.messages:
+                break
+            await asyncio.sleep(0.05)
+        await queue.stop()
+
+    asyncio.run(run())
+    assert len(handler.messages) == 1
+    assert queue.stats() == {"sent": 1}
+    queue.close()
@@ -0,0 +1,98 @@
+# tests/test_pit_volume.py
+import numpy as np
+import pytest
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.core.domain.calculations.pit_volume import (
+    CUBIC_FT_PER_BBL, PitVolumeTotalizer, strapping_table, tank_shape, tank_strapping_table
+)
+from app.models.events import EventType
+
+def test_rectangular_table_is_linear():
+    table = strapping_table("rectangular", 20.0, 8.0, 10.0, 10.0)
+    assert table.capacity == pytest.approx(20 * 10 * 8 / CUBIC_FT_PER_BBL, rel=1e-5)
+    assert table.volume(4.0) == pytest.approx(table.capacity / 2, rel=1e-5)
+    assert table.volume(12.0) == pytest.approx(table.capacity, rel=1e-6)
+    assert table.volume(-1.0) == 0.0
+
+def test_trapezoidal_table_matches_closed_form():
+    table = strapping_table("trapezoidal", 20.0, 8.0, 12.0, 6.0)
+    level = 3.1
+    width = 6.0 + (12.0 - 6.0) * level / 8.0
+    expected = 20.0 * (6.0 + width) / 2 * level / CUBIC_FT_PER_BBL
+    assert table.volume(level) == pytest.approx(expected, rel=1e-4)
+    assert table.capacity == pytest.approx(20.0 * 9.0 * 8.0 / CUBIC_FT_PER_BBL, rel=1e-5)
+
+def test_horizontal_cylinder_is_half_full_at_mid_height():
+    table = strapping_table("cylindrical", 30.0, 6.0)
+    assert table.capacity == pytest.approx(30.0 * np.pi * 9.0 / CUBIC_FT_PER_BBL, rel=1e-5)
+    assert table.volume(3.0) == pytest.approx(table.capacity / 2, rel=1e-4)
+    assert table.volume(1.0) < table.capacity / 6
+
+def test_tables_are_cached_and_read_only():
+    first = strapping_table("rectangular", 20.0, 8.0, 10.0, 10.0)
+    assert strapping_table("rectangular", 20.0, 8.0, 10.0, 10.0) is first
+    assert first.volumes.dtype == np.float32
+    with pytest.raises(ValueError):
+        first.volumes[0] = 1.0
+
+def test_shape_names_and_capacity_fallback():
+    assert tank_shape("Horizontal Cylinder") == "cylindrical"
+    assert tank_shape("Trapezoid") == "trapezoidal"
+    assert tank_shape(None) == "rectangular"
+    tank = SimpleNamespace(id="t", tank_name="T", shape=None, capacity=400.0, height=10.0,
+                           length=None, width_top=None, width_bottom=None)
+    assert tank_strapping_table(tank).capacity == pytest.approx(400.0, rel=1e-5)
+
+def _totalizer(**options):
+    table = strapping_table("rectangular", 20.0, 8.0, 10.0, 10.0)  # ~35.6 bbl/ft
+    tables = {"p1": table, "p2": table, "trip": table}
+    return PitVolumeTotalizer(tables, uuid4(), active=["p1", "p2"], **options)
+
+def test_totalizer_tracks_active_volume_incrementally():
+    totalizer = _totalizer()
+    totalizer.ingest_many([("p1", 4.0), ("p2", 4.0), ("trip", 2.0)])
+    table = totalizer.tables["p1"]
+    assert totalizer.active_volume == pytest.approx(2 * table.volume(4.0))
+    assert totalizer.total_volume == pytest.approx(2 * table.volume(4.0) + table.volume(2.0))
+    totalizer.ingest("p1", 5.0)
+    assert totalizer.active_volume == pytest.approx(table.volume(4.0) + table.volume(5.0))
+
+def test_gain_alert_fires_once_and_rearms():
+    totalizer = _totalizer(gain_threshold=10.0, loss_threshold=10.0)
+    totalizer.ingest_many([("p1", 4.0), ("p2", 4.0)])
+    totalizer.reset_baseline()
+    # Trip tank is not in the active system
+    assert totalizer.ingest("trip", 6.0) is None
+    event = totalizer.ingest("p1", 4.5)  # ~17.8 bbl gain
+    assert event is not None and event.type == EventType.ALERT
+    assert event.data["alert"] == "pit_gain"
+    assert totalizer.ingest("p1", 4.6) is None
+    assert totalizer.ingest("p1", 4.0) is None
+    assert totalizer.ingest("p1", 4.5).data["alert"] == "pit_gain"
+    loss = totalizer.ingest("p2", 3.0)
+    assert loss.data["alert"] == "pit_loss"
+
+def test_baseline_waits_for_every_active_tank():
+    totalizer = _totalizer(gain_threshold=10.0)
+    # Only p1 reports at first; p2 would otherwise read as a ~142 bbl gain when it arrives
+    assert totalizer.ingest_many([("p1", 4.0), ("trip", 2.0)]) == []
+    assert totalizer.baseline is None
+    assert totalizer.pending_tanks == {"p2"}
+    totalizer.reset_baseline()
+    assert totalizer.baseline is None
+    assert totalizer.ingest("p2", 4.0) is None
+    assert totalizer.baseline == pytest.approx(totalizer.active_volume)
+    assert totalizer.snapshot()["pending_tanks"] == []
+    assert totalizer.ingest("p2", 4.5).data["alert"] == "pit_gain"
+
+def test_set_active_rebases():
+    totalizer = _totalizer()
+    totalizer.ingest_many([("p1", 4.0), ("p2", 4.0), ("trip", 2.0)])
+    totalizer.set_active(["p1", "trip"])
+    assert totalizer.gain_loss == 0.0
+    assert totalizer.baseline == pytest.approx(totalizer.active_volume)
+    assert totalizer.active_volume == pytest.approx(totalizer.volumes["p1"] + totalizer.volumes["trip"])
+    with pytest.raises(KeyError):
+        totalizer.ingest("unknown", 1.0)
@@ -0,0 +1,106 @@
+# tests/test_pressure_profile.py
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.core.domain.calculations.hydraulics import (
+    AnnulusSection, FlowGeometry, FluidProperties, HydraulicsEngine, PipeSection
+)
+from app.core.domain.calculations.pressure_profile import (
+    PressureProfileEngine, geometry_version, gradient_arrays, minimum_curvature, minimum_curvature_tvd
+)
+
+def test_minimum_curvature_build_section():
+    # Vertical to a 1000 ft kick-off, then 3 deg/100ft build to 30 deg due east at 2000 ft.
+    # Radius of curvature R = 18000 / (3 pi) = 1909.86 ft, so at the end of the build
+    # TVD = 1000 + R sin 30 = 1954.93 ft and the departure is R (1 - cos 30) = 255.87 ft.
+    md = np.arange(0.0, 2001.0, 100.0)
+    inc = np.clip((md - 1000.0) * 0.03, 0.0, None)
+    azi = np.full_like(md, 90.0)
+    tvd, north, east, dls = minimum_curvature(md, inc, azi)
+    radius = 18000.0 / (3.0 * np.pi)
+    assert tvd[:11] == pytest.approx(md[:11])
+    assert tvd[-1] == pytest.approx(1000.0 + radius * np.sin(np.radians(30.0)), abs=1e-6)
+    assert east[-1] == pytest.approx(radius * (1 - np.cos(np.radians(30.0))), abs=1e-6)
+    assert north == pytest.approx(np.zeros_like(md), abs=1e-9)
+    assert dls[11:] == pytest.approx(3.0)
+    np.testing.assert_array_equal(minimum_curvature_tvd(md, inc, azi), tvd)
+
+def test_minimum_curvature_from_origin():
+    tvd, _, _, _ = minimum_curvature([5000.0, 5100.0], [0.0, 0.0], [0.0, 0.0], origin=(4900.0, 10.0, 0.0))
+    assert tvd.tolist() == [4900.0, 5000.0]
+
+def _rows(*pairs):
+    return [SimpleNamespace(id=row_id, updated_at=updated) for row_id, updated in pairs]
+
+def test_geometry_version():
+    tubulars = _rows(("t1", "2024-01-01"), ("t2", "2024-01-02"))
+    stations = _rows(("s1", "2024-01-01"))
+    version = geometry_version(tubulars, stations)
+    # Row order does not matter
+    assert geometry_version(tubulars[::-1], stations) == version
+    # An update, an addition or a row moving between groups does
+    assert geometry_version(_rows(("t1", "2024-02-01"), ("t2", "2024-01-02")), stations) != version
+    assert geometry_version(tubulars, stations + _rows(("s2", "2024-01-03"))) != version
+    assert geometry_version(tubulars + stations, []) != version
+
+def _engine(density=10.0):
+    geometry = FlowGeometry(
+        [PipeSection("DP", 0.0, 1000.0, 4.276)],
+        [AnnulusSection("OH", 0.0, 1000.0, 8.5, 5.0)]
+    )
+    return HydraulicsEngine(geometry, FluidProperties(density, 20.0, 15.0))
+
+def test_profile_spreads_annular_friction_down_to_the_bit():
+    engine = _engine()
+    md = np.array([0.0, 500.0, 1000.0, 1200.0])
+    profile = PressureProfileEngine().calculate(engine, 300.0, md, md)
+    loss = engine.annular_losses([300.0])[0, 0]
+    # Constant gradient over the section; nothing circulates below the bit
+    assert profile.annular_friction == pytest.approx([0.0, loss / 2, loss, loss])
+    assert profile.hydrostatic == pytest.approx(0.052 * 10.0 * md)
+    assert profile.ecd[2] == pytest.approx(10.0 + loss / (0.052 * 1000.0))
+
+def test_cache_hits_and_misses_on_geometry_changes():
+    cache = PressureProfileEngine(max_entries=2)
+    engine = _engine()
+    md = np.linspace(0.0, 1000.0, 11)
+    first = cache.calculate(engine, 300.0, md, md, version="v1")
+    second = cache.calculate(engine, 300.0, md, md, version="v1")
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert second.annular_friction is first.annular_friction
+    # A new rate, fluid or geometry version is a separate entry
+    cache.calculate(engine, 400.0, md, md, version="v1")
+    cache.calculate(_engine(density=12.0), 300.0, md, md, version="v1")
+    cache.calculate(engine, 300.0, md, md, version="v2")
+    assert (cache.hits, cache.misses) == (1, 4)
+    # Only max_entries are kept, least recently used first out
+    cache.calculate(engine, 300.0, md, md, version="v1")
+    assert (cache.hits, cache.misses) == (1, 5)
+    cache.invalidate("v2")
+    cache.calculate(engine, 300.0, md, md, version="v2")
+    assert (cache.hits, cache.misses) == (1, 6)
+    # Without a version nothing is cached
+    cache.calculate(engine, 300.0, md, md)
+    assert (cache.hits, cache.misses) == (1, 6)
+
+def test_gradient_interpolation_and_margins():
+    # Unsorted (md, psi/ft) pairs are sorted before interpolation
+    md, gradient = gradient_arrays(([2000.0, 0.0, 1000.0], [0.60, 0.45, 0.50]))
+    assert md.tolist() == [0.0, 1000.0, 2000.0]
+    assert gradient.tolist() == [0.45, 0.50, 0.60]
+    assert gradient_arrays(([], [])) is None
+
+    engine = _engine()
+    depths = np.array([500.0, 1000.0, 1500.0])
+    profile = PressureProfileEngine().calculate(
+        engine, 0.0, depths, depths,
+        pore_gradient=([0.0, 2000.0], [0.45, 0.55]),
+        fracture_gradient=([0.0, 2000.0], [0.70, 0.70]),
+    )
+    # 10 ppg = 0.52 psi/ft; pore gradient passes it between 1000 and 1500 ft
+    assert profile.pore_pressure == pytest.approx([0.475 * 500, 0.50 * 1000, 0.525 * 1500])
+    assert profile.fracture_pressure == pytest.approx(0.70 * depths)
+    assert [(v["type"], v["md"]) for v in profile.violations] == [("pore", 1500.0)]
+    assert profile.violations[0]["margin_ppg"] == pytest.approx((0.52 - 0.525) / 0.052)
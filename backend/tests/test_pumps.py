@@ -0,0 +1,47 @@
+# tests/test_pumps.py
+import numpy as np
+import pytest
+
+from app.core.domain.calculations.hydraulics import Conduit
+from app.core.domain.calculations.pumps import (
+    PumpConfiguration, RunningPump, pump_model_service
+)
+from app.core.domain.calculations.sections import build_sections
+from app.core.domain.calculations.volumes import WellVolumes
+
+TRIPLEX = PumpConfiguration(liner_size=6.0, stroke_length=12.0, efficiency=0.95)
+PUMPS = [RunningPump(TRIPLEX, 100), RunningPump(TRIPLEX, 60)]
+
+class MudPumpRow:
+    stroke_length = 12.0
+    liner_size = 6.0
+    efficiency = 95.0
+    pump_type = "Triplex"
+
+def test_output_per_stroke():
+    assert TRIPLEX.output_per_stroke == pytest.approx(0.000243 * 36 * 12 * 0.95)
+    assert PumpConfiguration.from_mud_pump(MudPumpRow()) == TRIPLEX
+    duplex = PumpConfiguration(6.0, 16.0, pump_type="duplex", rod_diameter=2.5)
+    assert duplex.output_per_stroke == pytest.approx(0.000162 * 16 * (2 * 36 - 6.25))
+
+def test_flow_rate_sums_parallel_pumps():
+    assert pump_model_service.flow_rate(PUMPS) == pytest.approx(160 * TRIPLEX.output_per_stroke)
+    # Stroke rates are not limited to whole numbers
+    half = [RunningPump(TRIPLEX, 82.5)]
+    assert pump_model_service.flow_rate(half) == pytest.approx(82.5 * TRIPLEX.output_per_stroke)
+    with pytest.raises(ValueError):
+        pump_model_service.flow_rate([])
+
+def test_strokes_split_across_parallel_pumps():
+    total, per_pump = pump_model_service.strokes_for_volume(PUMPS, [100.0, 200.0])
+    minutes = 100.0 / (160 * TRIPLEX.output_per_stroke)
+    np.testing.assert_allclose(per_pump[0], [100 * minutes, 60 * minutes])
+    np.testing.assert_allclose(total, [160 * minutes, 320 * minutes])
+
+def test_lag_and_lag_depth_are_inverse():
+    outer = [Conduit("Casing", 0, 5000, 8.681, 9.625), Conduit("Open Hole", 5000, 10000, 8.5, 8.5)]
+    volumes = WellVolumes(build_sections(outer, [Conduit("DP", 0, 10000, 4.276, 5.0)]))
+    depths = np.array([1000.0, 5000.0, 9000.0])
+    lag = pump_model_service.lag(PUMPS, volumes, depths)
+    np.testing.assert_allclose(pump_model_service.lag_depth(PUMPS, volumes, lag["lag_time"]), depths)
+    assert lag["lag_volume"][0] == pytest.approx((8.681 ** 2 - 25) / 1029.4 * 1000)
@@ -0,0 +1,122 @@
+# tests/test_rate_limit.py
+import asyncio
+import time
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.core.rate_limit import (
+    DEFAULT_RULES, MemoryRateLimitStorage, RateLimiter, RateLimitMiddleware,
+    RateLimitRule, RedisRateLimitStorage
+)
+
+class FakeRedis:
+    """The few commands RedisRateLimitStorage uses, kept in a dict"""
+
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    async def decr(self, key):
+        self.data[key] = self.data.get(key, 0) - 1
+        return self.data[key]
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def incr(self, key):
+        self.commands.append(("incr", key))
+
+    def expire(self, key, seconds):
+        self.commands.append(("expire", key))
+
+    def get(self, key):
+        self.commands.append(("get", key))
+
+    async def execute(self):
+        results = []
+        for command, key in self.commands:
+            if command == "incr":
+                self.redis.data[key] = self.redis.data.get(key, 0) + 1
+                results.append(self.redis.data[key])
+            elif command == "get":
+                value = self.redis.data.get(key)
+                results.append(None if value is None else str(value).encode())
+            else:
+                results.append(True)
+        return results
+
+def test_route_patterns():
+    rule = RateLimitRule("/api/v1/jobs/{job_id}/sync", 1, 60)
+    assert rule.matches("/api/v1/jobs/abc-123/sync", "POST")
+    assert not rule.matches("/api/v1/jobs/abc/def/sync", "POST")
+    assert not rule.matches("/api/v1/jobs/abc/sync/extra", "POST")
+
+    prefix = RateLimitRule("/api/v1/auth/password-reset/*", 1, 60, methods=("post",))
+    assert prefix.matches("/api/v1/auth/password-reset/request", "POST")
+    assert not prefix.matches("/api/v1/auth/password-reset/request", "GET")
+    assert not prefix.matches("/api/v1/users/forgot-password", "POST")
+
+@pytest.mark.parametrize("path", [
+    "/api/v1/users/forgot-password",
+    "/api/v1/users/reset-password",
+    "/api/v1/users/verify-email",
+    "/api/v1/auth/password-reset/confirm",
+])
+def test_default_rules_cover_account_recovery_routes(path):
+    assert any(rule.matches(path, "POST") for rule in DEFAULT_RULES)
+
+@pytest.mark.parametrize("make_storage", [MemoryRateLimitStorage, lambda: RedisRateLimitStorage(FakeRedis())])
+def test_sliding_window(make_storage):
+    storage = make_storage()
+
+    async def run():
+        counts = [await storage.hit("ip:/login", 60, 600.0 + i) for i in range(4)]
+        # Halfway through the next window half of the previous window still counts
+        counts.append(await storage.hit("ip:/login", 60, 690.0))
+        # Two windows later nothing is carried over
+        counts.append(await storage.hit("ip:/login", 60, 780.0))
+        return counts
+
+    assert asyncio.run(run()) == [1, 2, 3, 4, 1 + 4 * 0.5, 1]
+
+@pytest.mark.parametrize("make_storage", [MemoryRateLimitStorage, lambda: RedisRateLimitStorage(FakeRedis())])
+def test_rejected_requests_are_not_counted(make_storage):
+    storage = make_storage()
+    limiter = RateLimiter(storage)
+    rule = RateLimitRule("/api/v1/token", 2, 3600)
+
+    async def run():
+        results = [(await limiter.check("10.0.0.1", rule))[0] for _ in range(5)]
+        # Only the two allowed requests are in the window
+        count = await storage.hit("10.0.0.1:/api/v1/token", 3600, time.time())
+        return results, count
+
+    results, count = asyncio.run(run())
+    assert results == [True, True, False, False, False]
+    assert count == pytest.approx(3, abs=0.01)
+
+def test_middleware_returns_429_with_retry_after():
+    async def ok(request):
+        return PlainTextResponse("ok")
+
+    app = Starlette(routes=[Route("/api/v1/token", ok, methods=["POST"]), Route("/health", ok)])
+    app.add_middleware(
+        RateLimitMiddleware,
+        limiter=RateLimiter(MemoryRateLimitStorage()),
+        rules=[RateLimitRule("/api/v1/token", 2, 60)]
+    )
+    client = TestClient(app)
+
+    assert [client.post("/api/v1/token").status_code for _ in range(2)] == [200, 200]
+    response = client.post("/api/v1/token")
+    assert response.status_code == 429
+    assert 1 <= int(response.headers["Retry-After"]) <= 60
+    # Unmatched paths are never limited
+    assert all(client.get("/health").status_code == 200 for _ in range(5))
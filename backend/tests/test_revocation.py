@@ -0,0 +1,144 @@
+# tests/test_revocation.py
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from app.core.revocation import REVOCATION_CHANNEL, BloomFilter, TokenRevocationList, token_fingerprint
+
+class FakeBroker:
+    """In-process stand-in for Redis publish/subscribe"""
+
+    def __init__(self):
+        self.subscribers = []
+
+    async def publish(self, channel, data):
+        for pubsub in self.subscribers:
+            if channel in pubsub.channels:
+                pubsub.queue.put_nowait({"type": "message", "channel": channel, "data": data})
+        return len(self.subscribers)
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+    def drop(self):
+        """Cut every subscriber's connection"""
+        for pubsub in self.subscribers:
+            pubsub.queue.put_nowait(None)
+
+class FakePubSub:
+    def __init__(self, broker):
+        self.broker = broker
+        self.channels = set()
+        self.queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.channels.add(channel)
+        self.broker.subscribers.append(self)
+        self.queue.put_nowait({"type": "subscribe", "channel": channel, "data": 1})
+
+    async def unsubscribe(self, channel):
+        self.channels.discard(channel)
+
+    async def listen(self):
+        while True:
+            message = await self.queue.get()
+            if message is None:
+                raise ConnectionError("Connection closed by server")
+            yield message
+
+class FakeQuery:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def filter(self, *criteria):
+        return self
+
+    def all(self):
+        return self.rows
+
+def _future(hours=1):
+    return datetime.now(timezone.utc) + timedelta(hours=hours)
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=5000, error_rate=0.001)
+    added = [token_fingerprint(f"token-{i}") for i in range(5000)]
+    for fp in added:
+        bloom.add(fp)
+    assert all(fp in bloom for fp in added)
+    others = [token_fingerprint(f"other-{i}") for i in range(20000)]
+    false_positives = sum(fp in bloom for fp in others)
+    assert false_positives / len(others) < 0.005
+
+def test_revoked_tokens_and_expiry():
+    revocation = TokenRevocationList(capacity=10)
+    revocation.revoke_local("access-1", _future())
+    revocation.revoke_local("expired", datetime.now(timezone.utc) - timedelta(minutes=1))
+    assert revocation.is_revoked("access-1")
+    assert not revocation.is_revoked("access-2")
+    # Expired entries no longer count and are dropped when the filter grows
+    assert not revocation.is_revoked("expired")
+    for i in range(20):
+        revocation.revoke_local(f"token-{i}", _future())
+    assert all(revocation.is_revoked(f"token-{i}") for i in range(20))
+    assert revocation.is_revoked("access-1")
+    assert len(revocation) == 21
+
+def test_revocations_propagate_between_workers():
+    broker = FakeBroker()
+    first, second = TokenRevocationList(), TokenRevocationList()
+    session = SimpleNamespace(access_token="access", refresh_token="refresh", expires_at=_future())
+
+    async def run():
+        await first.start(broker)
+        await second.start(broker)
+        await asyncio.sleep(0)
+        await first.revoke_session(session)
+        # Malformed messages are ignored without stopping the listener
+        await broker.publish(REVOCATION_CHANNEL, "not json")
+        await broker.publish(REVOCATION_CHANNEL, json.dumps({"fp": token_fingerprint("late"), "exp": _future().timestamp()}))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        revoked = [second.is_revoked(token) for token in ("access", "refresh", "late", "other")]
+        await first.stop()
+        await second.stop()
+        return revoked
+
+    assert asyncio.run(run()) == [True, True, True, False]
+
+def test_listener_reconnects_and_resyncs_after_a_dropped_connection():
+    broker = FakeBroker()
+    revocation = TokenRevocationList(retry_delay=0.01)
+    resyncs = []
+    revocation._resync = lambda: resyncs.append(True)
+
+    async def run():
+        await revocation.start(broker)
+        await asyncio.sleep(0)
+        broker.drop()
+        await asyncio.sleep(0.05)
+        await broker.publish(REVOCATION_CHANNEL, json.dumps({"fp": token_fingerprint("after"), "exp": _future().timestamp()}))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        revoked = revocation.is_revoked("after")
+        await revocation.stop()
+        return revoked
+
+    assert asyncio.run(run())
+    # Subscribed twice; revocations missed while down are reloaded once
+    assert len(broker.subscribers) == 2
+    assert resyncs == [True]
+
+def test_load_from_db_replaces_the_registry():
+    revocation = TokenRevocationList(capacity=4)
+    revocation.revoke_local("stale", _future())
+    rows = [("access-1", "refresh-1", _future())] + [
+        (f"access-{i}", None, _future().replace(tzinfo=None)) for i in range(2, 6)
+    ]
+    db = SimpleNamespace(query=lambda *columns: FakeQuery(rows))
+    assert revocation.load_from_db(db) == 6
+    assert len(revocation) == 6
+    assert revocation.is_revoked("refresh-1")
+    assert all(revocation.is_revoked(f"access-{i}") for i in range(1, 6))
+    # The registry is rebuilt, not merged
+    assert not revocation.is_revoked("stale")
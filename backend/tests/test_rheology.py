@@ -0,0 +1,43 @@
+# tests/test_rheology.py
+from types import SimpleNamespace
+import numpy as np
+import pytest
+
+from app.core.domain.calculations.rheology import (
+    READING_COLUMNS, VISCOMETER_SPEEDS, RheologyService, fit_rheology
+)
+
+def make_fluid(fluid_id, readings):
+    return SimpleNamespace(id=fluid_id, **dict(zip(READING_COLUMNS, readings)))
+
+def test_bingham_fit_matches_two_point_pv_yp():
+    # A straight-line fluid: PV = r600 - r300, YP = 2 r300 - r600
+    readings = 10 + 30 / 300 * VISCOMETER_SPEEDS
+    fit = fit_rheology(readings)
+    assert fit["plastic_viscosity"][0] == pytest.approx(30.0)
+    assert fit["yield_point"][0] == pytest.approx(10.0)
+
+def test_herschel_bulkley_recovers_parameters_in_batch():
+    readings = np.array([
+        5 + 2.0 * VISCOMETER_SPEEDS ** 0.6,
+        0 + 3.0 * VISCOMETER_SPEEDS ** 0.5,
+    ])
+    fit = fit_rheology(readings)
+    np.testing.assert_allclose(fit["hb_yield_stress"], [5.0, 0.0], atol=0.05)
+    np.testing.assert_allclose(fit["hb_flow_index"], [0.6, 0.5], atol=0.005)
+    assert fit["power_law_r2"][1] == pytest.approx(1.0)
+    assert fit["flow_index"][1] == pytest.approx(0.5)
+
+def test_service_caches_until_readings_change():
+    service = RheologyService()
+    fluid = make_fluid("f1", [62, 38, 30, 21, 7, 6])
+    first = service.fit_fluid(fluid)
+    assert service.fit_fluid(fluid) is first
+
+    fluid.r600 = 70
+    refitted = service.fit_fluid(fluid)
+    assert refitted is not first
+    assert refitted.plastic_viscosity > first.plastic_viscosity
+
+    service.invalidate("f1")
+    assert len(service) == 0
@@ -0,0 +1,63 @@
+# tests/test_sections.py
+import random
+
+import numpy as np
+
+from app.core.domain.calculations.hydraulics import Conduit
+from app.core.domain.calculations.sections import IntervalTree, SectionBuilder, build_sections
+
+OUTER = [
+    Conduit("Casing", 0, 5000, 8.681, 9.625),
+    Conduit("Liner", 4800, 9000, 6.184, 7.0),
+    Conduit("Open Hole", 9000, 10000, 6.0, 6.0),
+]
+STRING = [Conduit("DP", 0, 9500, 4.276, 5.0), Conduit("BHA", 9500, 9800, 2.5, 4.75)]
+
+class Row:
+    def __init__(self, kind, start, end, od, id_, **extra):
+        self.tubulartype_id, self.start_depth, self.end_depth = kind, start, end
+        self.outer_diameter, self.inner_diameter = od, id_
+        self.oh_diameter = self.open_hole_size = None
+        self.__dict__.update(extra)
+
+def test_interval_tree_matches_scan():
+    rng = random.Random(7)
+    intervals = [(a, a + rng.uniform(0, 30), i) for i, a in enumerate(rng.uniform(0, 100) for _ in range(300))]
+    tree = IntervalTree(intervals)
+    for depth in (rng.uniform(-5, 135) for _ in range(1000)):
+        assert sorted(tree.query(depth)) == sorted(i for top, bottom, i in intervals if top <= depth < bottom)
+
+def test_sections_cover_the_well():
+    sections = build_sections(OUTER, STRING)
+    assert sections.top[0] == 0 and sections.total_depth == 10000
+    np.testing.assert_array_equal(sections.top[1:], sections.bottom[:-1])
+    assert [s.name for s in sections][-2:] == ["Open Hole/BHA", "Open Hole"]
+    assert sections.section_at(4900).hole_diameter == 6.184
+    assert sections.section_at(10000) is None
+    np.testing.assert_array_equal(sections.index_at([0, 4900, 9799, 9900, -1]), [0, 1, 4, 5, -1])
+
+def test_flow_geometry_follows_the_string():
+    geometry = build_sections(OUTER, STRING).flow_geometry()
+    # Pipe sections of one component are merged; annular ones split at every wall change
+    assert [(s.name, s.top, s.bottom, s.inner_diameter) for s in geometry.pipe_sections] == [
+        ("DP", 0, 9500, 4.276), ("BHA", 9500, 9800, 2.5)
+    ]
+    assert [(s.name, s.top, s.bottom, s.hole_diameter, s.pipe_diameter) for s in geometry.annulus_sections] == [
+        ("Casing/DP", 0, 4800, 8.681, 5.0),
+        ("Liner/DP", 4800, 5000, 6.184, 5.0),
+        ("Liner/DP", 5000, 9000, 6.184, 5.0),
+        ("Open Hole/DP", 9000, 9500, 6.0, 5.0),
+        ("Open Hole/BHA", 9500, 9800, 6.0, 4.75),
+    ]
+    assert geometry.bit_depth == 9800
+
+def test_builder_caches_per_version():
+    rows = [Row("casing", 0, 5000, 9.625, 8.681, oh_diameter=8.5), Row("drillstring", 0, 7000, 5.0, 4.276)]
+    builder = SectionBuilder()
+    first = builder.build(rows, version="v1")
+    assert builder.build(rows, version="v1") is first
+    assert builder.build(rows, version="v2") is not first
+    assert (builder.hits, builder.misses) == (1, 2)
+    assert first.section_at(6000).name == "Open Hole/String"
+    builder.invalidate("v1")
+    assert builder.build(rows, version="v1") is not first
@@ -0,0 +1,42 @@
+# tests/test_surge_swab.py
+import numpy as np
+import pytest
+
+from app.core.domain.calculations.hydraulics import Conduit, FluidProperties
+from app.core.domain.calculations.surge_swab import (
+    RunningComponent, SurgeSwabEngine, clinging_constant
+)
+
+HOLE = [Conduit("Casing", 0, 8000, 8.835, 9.625), Conduit("Open Hole", 8000, 10000, 8.5, 8.5)]
+STRING = [RunningComponent("Liner", 2000, 7.0, 6.276), RunningComponent("DP", 10000, 5.0, 4.276)]
+FLUID = FluidProperties(12.0, 25.0, 15.0)
+
+def test_clinging_constant_tends_to_half_for_narrow_annulus():
+    kc = clinging_constant(np.array([0.3, 0.5, 0.8, 0.99]))
+    assert np.all(np.diff(kc) > 0)
+    assert kc[-1] == pytest.approx(0.5, abs=0.01)
+
+def test_surge_matrix_grows_with_speed_and_depth():
+    engine = SurgeSwabEngine(HOLE, STRING, FLUID)
+    result = engine.calculate([2000, 6000, 10000], [20, 60, 120])
+    assert result.surge.shape == (3, 3)
+    assert np.all(np.diff(result.surge, axis=1) > 0)
+    assert np.all(np.diff(result.surge, axis=0) > 0)
+    np.testing.assert_allclose(result.surge_emw - FLUID.density, FLUID.density - result.swab_emw)
+
+def test_open_end_surges_less_than_closed_end():
+    closed = SurgeSwabEngine(HOLE, STRING, FLUID).calculate([10000], [90])
+    opened = SurgeSwabEngine(HOLE, STRING, FLUID, closed_end=False).calculate([10000], [90])
+    assert opened.surge[0, 0] < closed.surge[0, 0]
+
+def test_max_safe_speed_respects_fracture_margin():
+    frac = ([0, 10000], [0.70, 0.70])  # 13.46 ppg
+    result = SurgeSwabEngine(HOLE, STRING, FLUID).calculate(
+        [10000], np.arange(10, 301, 10), fracture_gradient=frac, margin=0.5
+    )
+    speed = result.max_safe_speed[0]
+    assert 0 < speed < 300
+    safe = list(result.speeds).index(speed)
+    assert result.surge_emw[0, safe] <= 0.70 / 0.052 - 0.5
+    assert result.surge_emw[0, safe + 1] > 0.70 / 0.052 - 0.5
+    assert result.intervals[-1]["max_speed"] == speed
@@ -0,0 +1,137 @@
+# tests/test_survey_import.py
+import asyncio
+import io
+import time
+import numpy as np
+import pytest
+
+from starlette.datastructures import UploadFile
+
+from app.core import survey_import
+from app.core.domain.calculations.pressure_profile import minimum_curvature, minimum_curvature_tvd
+from app.core.survey_import import (
+    SurveyFileError, SurveyImporter, get_import_progress, start_import, survey_format
+)
+
+def _run(importer, data, filename="survey.csv", progress=None):
+    upload = UploadFile(io.BytesIO(data), filename=filename, size=len(data))
+
+    async def run():
+        rows = []
+        async for chunk in importer.stations(upload, progress, wellbore_id="wb1"):
+            rows.extend(chunk)
+        return rows
+
+    return asyncio.run(run())
+
+def _build_section():
+    # Vertical to 1000 ft, then 3 deg/100ft build to 90 deg due north
+    md = np.r_[np.arange(0, 1001, 100), 1000 + np.arange(1, 31) * 100.0]
+    inc = np.r_[np.zeros(11), np.arange(1, 31) * 3.0]
+    return md, inc, np.zeros(md.size)
+
+def test_minimum_curvature_arc_is_exact():
+    md, inc, azi = _build_section()
+    tvd, north, east, dls = minimum_curvature(md, inc, azi)
+    radius = 18000 / (3 * np.pi)
+    assert tvd[-1] == pytest.approx(1000 + radius)
+    assert north[-1] == pytest.approx(radius)
+    assert np.allclose(east, 0)
+    np.testing.assert_allclose(dls[11:], 3.0)
+    np.testing.assert_array_equal(minimum_curvature_tvd(md, inc, azi), tvd)
+
+def test_csv_in_chunks_matches_one_pass(monkeypatch):
+    monkeypatch.setattr(survey_import, "READ_BYTES", 97)  # lines split across reads
+    md, inc, azi = _build_section()
+    lines = ["Well: Test-1", "Company: Example", "", "Measured Depth (m),Inc,Azimuth,Comment"]
+    lines += [f"{m * 0.3048:.6f},{i},{a},ok" for m, i, a in zip(md, inc, azi)]
+    lines.insert(10, "160.0,abc,0,typo")
+    importer = SurveyImporter("csv", chunk_rows=7)
+    rows = _run(importer, "\r\n".join(lines).encode())
+
+    assert len(rows) == md.size and rows[0]["wellbore_id"] == "wb1"
+    np.testing.assert_allclose([r["measured_depth"] for r in rows], md, atol=1e-5)
+    report = importer.report(len(rows))
+    assert report["depth_unit"] == "m"
+    assert report["rejected"] == 1
+    assert report["errors"] == [{"row": 6, "column": "inclination", "reasons": ["missing"]}]
+    tvd, north, _, _ = minimum_curvature(md, inc, azi)
+    assert report["trajectory"]["tvd"] == pytest.approx(tvd[-1], rel=1e-6)
+    assert report["trajectory"]["north"] == pytest.approx(north[-1], rel=1e-6)
+    assert report["trajectory"]["max_dls"] == pytest.approx(3.0, rel=1e-4)
+
+def test_units_row_and_whitespace_columns():
+    data = b"MD  INC  AZI\nft deg  deg\n0 0 0\n100 1.5 45\n200 3 45\n"
+    importer = SurveyImporter("csv")
+    rows = _run(importer, data)
+    assert [r["inclination"] for r in rows] == [0, 1.5, 3]
+
+def test_las_with_null_values():
+    data = b"""~Version Information
+ VERS.          2.0 : CWLS LOG ASCII STANDARD - VERSION 2.0
+ WRAP.          NO  : One line per depth step
+~Well Information
+ NULL.     -999.25  : Null value
+~Curve Information
+ DEPT.F             : Measured depth
+ INCL.DEG           : Inclination
+ AZIM.DEG           : Azimuth
+ TVD .F             : True vertical depth
+~ASCII
+ 0.0     0.0    0.0   0.0
+ 100.0   2.0   30.0   99.98
+ 200.0 -999.25 30.0  199.9
+ 300.0   6.0   30.0  299.5
+"""
+    importer = SurveyImporter("las")
+    rows = _run(importer, data, "survey.las")
+    assert [r["measured_depth"] for r in rows] == [0.0, 100.0, 300.0]
+    assert importer.report(3)["summary"] == {"inclination": {"missing": 1}}
+
+    with pytest.raises(SurveyFileError):
+        _run(SurveyImporter("las"), data.replace(b"2.0 :", b"3.0 :", 1), "survey.las")
+
+def test_append_continues_stored_survey():
+    importer = SurveyImporter("csv")
+    importer.seed(1000.0, 0.0, 0.0)
+    rows = _run(importer, b"MD,INC,AZI\n900,0,0\n1100,3,0\n1200,6,0\n")
+    assert [r["measured_depth"] for r in rows] == [1100.0, 1200.0]
+    assert importer.report(2)["errors"] == [{"row": 0, "column": "measured_depth", "reasons": ["not_increasing"]}]
+    tvd = minimum_curvature([0, 1000, 1100, 1200], [0, 0, 3, 6], [0, 0, 0, 0])[0]
+    assert importer.report(2)["trajectory"]["tvd"] == pytest.approx(tvd[-1])
+
+def test_missing_header_and_formats():
+    with pytest.raises(SurveyFileError):
+        _run(SurveyImporter("csv"), b"1,2,3\n4,5,6\n")
+    assert survey_format("a.LAS") == "las"
+    assert survey_format("upload", "text/csv") == "csv"
+    with pytest.raises(SurveyFileError):
+        survey_format("survey.pdf")
+
+def test_xlsx_import():
+    openpyxl = pytest.importorskip("openpyxl")
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["Survey report"])
+    sheet.append(["MD [ft]", "Incl", "Azim"])
+    for i in range(50):
+        sheet.append([i * 100.0, i * 0.5, 90.0])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    importer = SurveyImporter("xlsx", chunk_rows=16)
+    rows = _run(importer, buffer.getvalue(), "survey.xlsx")
+    assert len(rows) == 50 and rows[-1]["inclination"] == 24.5
+
+def test_progress_and_large_survey():
+    n = 20_000
+    md = np.arange(n) * 1.5
+    inc = np.minimum(np.arange(n) * 0.005, 60)
+    data = ("MD,INC,AZI\n" + "\n".join(f"{m},{i:.3f},135.0" for m, i in zip(md, inc))).encode()
+    progress = start_import("survey-1", "big.csv", len(data))
+    started = time.perf_counter()
+    rows = _run(SurveyImporter("csv"), data, progress=progress)
+    assert time.perf_counter() - started < 5
+    assert len(rows) == n
+    progress.finish(len(rows))
+    assert get_import_progress("survey-1").to_dict()["percent"] == 100.0
+    assert progress.rows == n and progress.bytes_read == len(data)
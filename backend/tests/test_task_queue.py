@@ -0,0 +1,99 @@
+# tests/test_task_queue.py
+import sys
+import time
+import pytest
+
+from app.core import task_queue
+from app.core.task_queue import TaskQueue, TaskStatus, TaskWorker, task
+
+calls = []
+
+@task("test.echo", concurrency=1)
+def echo(value: int) -> int:
+    calls.append(value)
+    return value * 2
+
+@task("test.flaky", max_attempts=2, retry_delay=0.0)
+async def flaky() -> None:
+    raise RuntimeError("flaky failure")
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = TaskQueue(path=str(tmp_path / "tasks.db"), lease_timeout=60)
+    yield queue
+    queue.close()
+
+def test_enqueue_dedup_and_declared_attempts(queue):
+    first = queue.enqueue("test.echo", {"value": 1}, dedup_key="echo")
+    assert queue.enqueue("test.echo", {"value": 2}, dedup_key="echo") == first
+    assert queue.get(first)["payload"] == {"value": 1}
+    assert queue.get(queue.enqueue("test.flaky"))["max_attempts"] == 2
+    # Unregistered types fall back to the default
+    assert queue.get(queue.enqueue("test.unknown"))["max_attempts"] == 3
+
+def test_process_queue_registers_task_types(tmp_path, monkeypatch):
+    # A fresh API process: the task module has not been imported yet
+    monkeypatch.setattr(task_queue, "_registry", {})
+    monkeypatch.delitem(sys.modules, "app.core.tasks", raising=False)
+    monkeypatch.setattr(task_queue, "_task_queue", None)
+    monkeypatch.setattr(task_queue.settings, "TASK_QUEUE_PATH", str(tmp_path / "tasks.db"))
+    task_id = task_queue.enqueue_task("sync.synchronize")
+    assert task_queue.get_task_queue().get(task_id)["max_attempts"] == 5
+    task_queue.get_task_queue().close()
+
+def test_claim_order_and_concurrency(queue):
+    low = queue.enqueue("test.echo", {"value": 1})
+    high = queue.enqueue("test.echo", {"value": 2}, priority=10)
+    queue.enqueue("test.echo", {"value": 3}, delay=3600)
+
+    claimed = queue.claim("w1")
+    assert claimed["id"] == high
+    # test.echo allows one running task, so nothing else is claimable yet
+    assert queue.claim("w2") is None
+    queue.complete(high, 4)
+    assert queue.claim("w2")["id"] == low
+    assert queue.get(high)["status"] == TaskStatus.SUCCEEDED
+    assert queue.get(high)["result"] == 4
+
+def test_stale_lease_is_requeued(queue):
+    task_id = queue.enqueue("test.echo", {"value": 1})
+    queue.claim("w1")
+    queue.heartbeat(task_id)
+    assert queue.requeue_stale() == 0
+    queue.lease_timeout = 0
+    time.sleep(0.01)
+    assert queue.requeue_stale() == 1
+    info = queue.get(task_id)
+    assert info["status"] == TaskStatus.QUEUED and info["worker_id"] is None
+    assert queue.claim("w2")["id"] == task_id
+    assert queue.get(task_id)["attempts"] == 2
+
+def test_worker_retries_then_fails(queue):
+    worker = TaskWorker(queue, poll_interval=0)
+    task_id = queue.enqueue("test.flaky")
+    assert worker.run_once()
+    info = queue.get(task_id)
+    assert info["status"] == TaskStatus.QUEUED and info["attempts"] == 1
+    assert info["error"] == "flaky failure"
+    assert worker.run_once()
+    assert queue.get(task_id)["status"] == TaskStatus.FAILED
+    assert not worker.run_once()
+
+def test_worker_runs_tasks_and_survives_claim_errors(queue, monkeypatch):
+    worker = TaskWorker(queue, poll_interval=0)
+    task_id = queue.enqueue("test.echo", {"value": 21})
+    claim = queue.claim
+    attempts = []
+
+    def unreliable_claim(worker_id, task_types=None):
+        attempts.append(worker_id)
+        if len(attempts) == 1:
+            raise RuntimeError("database is locked")
+        if len(attempts) == 3:
+            worker.stop()
+        return claim(worker_id, task_types)
+
+    monkeypatch.setattr(queue, "claim", unreliable_claim)
+    worker.run()
+    assert len(attempts) == 3
+    assert queue.get(task_id)["result"] == 42
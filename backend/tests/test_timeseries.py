@@ -0,0 +1,119 @@
+# tests/test_timeseries.py
+import numpy as np
+import pytest
+from datetime import datetime, timezone
+
+from app.core.timeseries import (
+    RetentionPolicy, TimeSeriesStore, decode_chunk, encode_chunk, to_millis
+)
+
+T0 = 1_700_000_000_000  # epoch ms
+
+def _signal(n, step=1000):
+    t = T0 + np.arange(n, dtype=np.int64) * step
+    v = 250.0 + np.round(np.sin(np.arange(n) / 50.0) * 10, 1)
+    return t, v
+
+def test_chunk_codec_round_trips_and_compresses():
+    t, v = _signal(4096)
+    v[10] = np.nan
+    data = encode_chunk(t, v)
+    t2, v2 = decode_chunk(data)
+    np.testing.assert_array_equal(t2, t)
+    np.testing.assert_array_equal(v2.view("<u8"), v.view("<u8"))
+    assert len(data) < (t.nbytes + v.nbytes) / 3
+
+def test_chunk_codec_irregular_timestamps():
+    rng = np.random.default_rng(0)
+    t = T0 + np.cumsum(rng.integers(1, 10**7, 500))
+    v = rng.normal(size=500)
+    t2, v2 = decode_chunk(encode_chunk(t, v))
+    np.testing.assert_array_equal(t2, t)
+    np.testing.assert_array_equal(v2, v)
+
+def test_append_and_range_scan(tmp_path):
+    store = TimeSeriesStore(path=str(tmp_path), chunk_size=100)
+    t, v = _signal(1050)
+    for start in range(0, 1050, 70):
+        store.append("job1", "hookload", t[start:start + 70], v[start:start + 70])
+    stats = store.stats("job1")["hookload"]
+    assert stats["points"] == 1050 and stats["chunks"] == 10 and stats["head_points"] == 50
+
+    ts, vs = store.scan("job1", "hookload")
+    np.testing.assert_array_equal(ts, t)
+    np.testing.assert_array_equal(vs, v)
+
+    ts, vs = store.scan("job1", "hookload", t[123], t[1020])
+    np.testing.assert_array_equal(ts, t[123:1021])
+    np.testing.assert_array_equal(vs, v[123:1021])
+    assert store.scan("job1", "missing")[0].size == 0
+
+def test_rejects_out_of_order(tmp_path):
+    store = TimeSeriesStore(path=str(tmp_path), chunk_size=10)
+    store.append("job1", "spp", [T0, T0 + 1000], [1.0, 2.0])
+    with pytest.raises(ValueError):
+        store.append("job1", "spp", [T0 + 500], [3.0])
+    with pytest.raises(ValueError):
+        store.append("job1", "spp", [T0 + 3000, T0 + 2000], [3.0, 4.0])
+    with pytest.raises(ValueError):
+        store.append("../etc", "spp", [T0 + 3000], [3.0])
+
+def test_head_survives_reopen(tmp_path):
+    store = TimeSeriesStore(path=str(tmp_path), chunk_size=100)
+    t, v = _signal(250)
+    store.append("job1", "rpm", t, v)
+    store.close()
+
+    reopened = TimeSeriesStore(path=str(tmp_path), chunk_size=100)
+    ts, vs = reopened.scan("job1", "rpm")
+    np.testing.assert_array_equal(ts, t)
+    np.testing.assert_array_equal(vs, v)
+    reopened.append("job1", "rpm", [t[-1] + 1000], [1.0])
+    assert reopened.stats("job1")["rpm"]["points"] == 251
+
+def test_append_columns_and_timestamps(tmp_path):
+    store = TimeSeriesStore(path=str(tmp_path), chunk_size=100)
+    times = [datetime(2024, 1, 1, 0, 0, s, tzinfo=timezone.utc) for s in range(3)]
+    written = store.append_columns("job1", times, {"spp": [1.0, 2.0, 3.0], "rpm": [60.0, np.nan, 62.0]})
+    assert written == 5
+    assert store.channels("job1") == ["rpm", "spp"]
+    columns = store.scan_columns("job1", start=times[1])
+    np.testing.assert_array_equal(columns["spp"][1], [2.0, 3.0])
+    np.testing.assert_array_equal(columns["rpm"][0], to_millis(times[2:]))
+
+def test_retention_by_age_and_size(tmp_path):
+    store = TimeSeriesStore(path=str(tmp_path), chunk_size=100, retention=RetentionPolicy(max_age_days=1))
+    t, v = _signal(1000, step=600_000)  # 10 min samples, ~7 days
+    store.append("job1", "pit", t, v)
+    removed = store.apply_retention(now=(t[-1] + 1) / 1000)
+    assert removed > 0
+    ts, _ = store.scan("job1", "pit")
+    assert ts[0] >= t[-1] - 2 * 86400 * 1000
+    assert ts[-1] == t[-1]
+
+    store.retention = RetentionPolicy(max_job_bytes=1)
+    store.apply_retention()
+    assert store.stats("job1")["pit"]["chunks"] == 0
+
+    store.drop_job("job1")
+    assert store.jobs() == []
+
+def test_stats_and_retention_do_not_open_channels(tmp_path):
+    t, v = _signal(1050, step=600_000)
+    writer = TimeSeriesStore(path=str(tmp_path), chunk_size=100)
+    writer.append("job1", "pit", t, v)
+    writer.append("job1", "spp", t[:250], v[:250])
+    expected = writer.stats("job1")
+    writer.close()
+
+    store = TimeSeriesStore(path=str(tmp_path), chunk_size=100, retention=RetentionPolicy(max_age_days=1))
+    assert store.stats("job1") == expected
+    # A day is the last 144 points: pit keeps its newest chunk, spp only its head
+    assert store.apply_retention(now=(t[-1] + 1) / 1000) == 9 + 2
+    stats = store.stats("job1")
+    assert (stats["pit"]["chunks"], stats["pit"]["head_points"]) == (1, 50)
+    assert stats["spp"]["points"] == 50
+    # Nothing was opened for writing along the way
+    assert store._series == {}
+    ts, _ = store.scan("job1", "pit")
+    assert ts[0] == t[900]
@@ -0,0 +1,43 @@
+# tests/test_torque_drag.py
+import numpy as np
+import pytest
+
+from app.core.domain.calculations.torque_drag import StringComponent, TorqueDragEngine
+
+DP = StringComponent("DP", 20000, 5.0, 4.276, 21.9)
+
+def build_well(stations=2001):
+    md = np.linspace(0, 15000, stations)
+    inc = np.clip((md - 2000) / 100 * 2, 0, 70)
+    azi = np.full_like(md, 45.0)
+    return md, inc, azi
+
+def test_vertical_well_has_no_drag():
+    engine = TorqueDragEngine([0, 5000, 10000], [0, 0, 0], [0, 0, 0], [DP], mud_weight=10.0)
+    result = engine.calculate([0.2, 0.4], modes=["trip_out", "trip_in", "rotating"])
+    buoyed = 21.9 * 10000 * (1 - 10.0 / 65.5)
+    np.testing.assert_allclose(result.hook_load, buoyed)
+    np.testing.assert_allclose(result.surface_torque, 0.0)
+
+def test_broomstick_spreads_with_friction():
+    engine = TorqueDragEngine(*build_well(), [DP], mud_weight=10.0)
+    result = engine.calculate(
+        [0.1, 0.2, 0.3], modes=["trip_out", "trip_in", "rotating"], bit_depths=[5000, 10000, 15000]
+    )
+    trip_out, trip_in, rotating = (result.hook_load[:, :, m] for m in range(3))
+    assert result.hook_load.shape == (3, 3, 3)
+    assert np.all(trip_out > rotating) and np.all(rotating > trip_in)
+    assert np.all(np.diff(trip_out[-1]) > 0) and np.all(np.diff(trip_in[-1]) < 0)
+    np.testing.assert_allclose(rotating[-1], rotating[-1, 0])
+    assert np.all(np.diff(result.surface_torque[-1, :, 2]) > 0)
+
+def test_tension_profile_ends_at_hook_load():
+    engine = TorqueDragEngine(*build_well(), [DP], mud_weight=10.0)
+    result = engine.calculate([0.25], modes=["sliding"], weight_on_bit=15000)
+    assert result.tension[-1, 0, 0] == pytest.approx(-15000)
+    assert result.tension[0, 0, 0] == pytest.approx(result.hook_load[-1, 0, 0])
+
+def test_unknown_mode_is_rejected():
+    engine = TorqueDragEngine(*build_well(11), [DP], mud_weight=10.0)
+    with pytest.raises(ValueError):
+        engine.calculate([0.2], modes=["reaming"])
@@ -0,0 +1,52 @@
+# tests/test_user_agent.py
+import hashlib
+
+from app.core.security import generate_device_id
+from app.core.user_agent import UserAgentCache
+
+CHROME = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+          "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+IPHONE = ("Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 "
+          "(KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1")
+
+def test_parses_desktop_and_mobile_agents():
+    cache = UserAgentCache()
+    desktop = cache.get_device_info(CHROME)
+    assert (desktop.os, desktop.browser, desktop.is_pc, desktop.is_mobile) == ("Windows 10", "Chrome 120.0.0", True, False)
+    mobile = cache.get_device_info(IPHONE)
+    assert (mobile.device_type, mobile.os, mobile.is_mobile) == ("iPhone", "iOS 17.1", True)
+    assert cache.enhance(IPHONE) == "iPhone|iOS 17.1|Mobile Safari 17.1"
+
+def test_enhance_leaves_enhanced_and_empty_values_alone():
+    cache = UserAgentCache()
+    assert cache.enhance("iPhone|iOS 17.1|Mobile Safari 17.1") == "iPhone|iOS 17.1|Mobile Safari 17.1"
+    assert cache.enhance(None) is None
+    assert cache.enhance("") == ""
+    assert cache.metrics()["misses"] == 0
+
+def test_repeat_agents_are_served_from_the_cache():
+    cache = UserAgentCache(maxsize=2)
+    for _ in range(3):
+        cache.enhance(CHROME)
+    metrics = cache.metrics()
+    assert (metrics["hits"], metrics["misses"], metrics["size"]) == (2, 1, 1)
+    assert metrics["hit_rate"] == round(2 / 3, 4)
+
+    # Callers get a copy, so they cannot change the cached entry
+    info = cache.get_device_info(CHROME)
+    info.browser = "changed"
+    assert cache.get_device_info(CHROME).browser == "Chrome 120.0.0"
+
+    cache.enhance(IPHONE)
+    cache.enhance("curl/8.4.0")
+    assert cache.metrics()["evictions"] == 1
+    assert cache.metrics()["size"] == 2
+    cache.clear()
+    assert (cache.metrics()["size"], cache.metrics()["hits"]) == (0, 0)
+
+def test_device_id_is_stable_per_agent_and_address():
+    device_id = generate_device_id(CHROME, "10.0.0.1")
+    assert device_id == hashlib.sha256(f"{CHROME}:10.0.0.1".encode()).hexdigest()
+    assert generate_device_id(CHROME, "10.0.0.1") == device_id
+    assert generate_device_id(CHROME, "10.0.0.2") != device_id
+    assert generate_device_id(IPHONE, "10.0.0.1") != device_id
@@ -0,0 +1,45 @@
+# tests/test_volumes.py
+import numpy as np
+import pytest
+
+from app.core.domain.calculations.hydraulics import Conduit
+from app.core.domain.calculations.sections import build_sections
+from app.core.domain.calculations.volumes import BBL_PER_FT_FACTOR, WellVolumes
+
+OUTER = [
+    Conduit("Casing", 0, 5000, 8.681, 9.625),
+    Conduit("Liner", 4800, 9000, 6.184, 7.0),
+    Conduit("Open Hole", 9000, 10000, 6.0, 6.0),
+]
+STRING = [Conduit("DP", 0, 9500, 4.276, 5.0), Conduit("BHA", 9500, 9800, 2.5, 4.75)]
+
+def capacity(d):
+    return d ** 2 / BBL_PER_FT_FACTOR
+
+@pytest.fixture
+def volumes():
+    return WellVolumes(build_sections(OUTER, STRING))
+
+def test_volume_between_depths(volumes):
+    assert volumes.volume_between(0, 4800) == pytest.approx(capacity(8.681) * 4800)
+    assert volumes.volume_between(4000, 5000) == pytest.approx(capacity(8.681) * 800 + capacity(6.184) * 200)
+    np.testing.assert_allclose(volumes.volume_between([0, 9000], [100, 9100]), [capacity(8.681) * 100, capacity(6.0) * 100])
+
+def test_totals_are_consistent(volumes):
+    totals = volumes.totals()
+    assert totals["hole_volume"] == pytest.approx(totals["cased_hole_volume"] + totals["open_hole_volume"])
+    assert totals["hole_volume"] == pytest.approx(
+        totals["annular_volume"] + totals["closed_end_displacement"] + totals["below_bit_volume"]
+    )
+    assert totals["bit_depth"] == 9800
+
+def test_displacement_counts_from_the_bit(volumes):
+    bha = capacity(4.75) - capacity(2.5)
+    dp = capacity(5.0) - capacity(4.276)
+    np.testing.assert_allclose(volumes.displacement([0, 300, 1000]), [0, bha * 300, bha * 300 + dp * 700])
+    assert volumes.displacement(20000) == pytest.approx(volumes.totals()["steel_displacement"])
+    assert volumes.displacement(300, closed_end=True) == pytest.approx(capacity(4.75) * 300)
+
+def test_unknown_kind_is_rejected(volumes):
+    with pytest.raises(ValueError):
+        volumes.volume_to(100, "mud")